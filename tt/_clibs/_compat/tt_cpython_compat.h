@@ -17,3 +17,10 @@
 #else
     #define IS_INT(x)  (PyInt_Check(x) || PyLong_Check(x))
 #endif
+
+// the raw allocators are safe to call without holding the GIL
+#ifndef TT_IS_PYTHON_3
+    #define PyMem_RawMalloc  malloc
+    #define PyMem_RawRealloc  realloc
+    #define PyMem_RawFree  free
+#endif
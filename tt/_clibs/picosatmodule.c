@@ -11,9 +11,31 @@
 
 #include <Python.h>
 
+#include <limits.h>
+#include <string.h>
+
+#ifdef _WIN32
+    #include <windows.h>
+#else
+    #include <time.h>
+#endif
+
 #include "picosat.h"
 #include "_compat/tt_cpython_compat.h"
 
+//
+// Struct definition for limits on a single call to picosat_sat
+//
+
+typedef struct {
+    int decision_limit;                 // -1 if unlimited
+    unsigned long long propagation_limit;
+    int has_propagation_limit;
+    double timeout;                     // in seconds; negative if unlimited
+    double _deadline;                   // on the monotonic clock
+} tt_limits;
+
+
 //
 // Struct definition for solution iteration
 //
@@ -22,30 +44,309 @@ typedef struct {
     PyObject_HEAD
     PicoSAT * picosat;
     PyObject * assumptions;
-    signed char _temp_mem;
+    int * project;      // variables solutions are projected onto, or NULL
+    int num_project;
+    int format;         // one of the TT_SOL_FORMAT_* values
+    Py_ssize_t chunk_size;  // models per packed chunk, or 0 if not chunked
+    int exhausted;      // whether all solutions have been returned
+    int limit_reached;  // whether a limit error is pending for the next call
+    int busy;           // whether a thread is getting the next solution
+    tt_limits limits;
+    PyObject * stats_callback;  // called once iteration stops, or NULL
+    double seconds;     // time spent solving so far
+    int * _block_lits;  // scratch space for building blocking clauses
+    int * _assumption_lits;  // zero-terminated copy of assumptions, if chunked
 } soliter_obj;
 
+// the forms in which solutions are returned from an iterator
+#define TT_SOL_FORMAT_LITS  0   // a list of literal ints
+#define TT_SOL_FORMAT_BYTES 1   // a bitmask packed into bytes
+#define TT_SOL_FORMAT_INT   2   // a bitmask packed into an int
+
+// the most models a chunk has room for before any solutions are found; the
+// chunk then grows geometrically, so large chunk sizes cost nothing up front
+#define TT_CHUNK_INITIAL_SIZE 1024
+
 
 //
 // PicoSAT memory manager config methods
 //
+// PicoSAT allocates while solving, which happens without the GIL, so only the
+// raw allocators (which do not require the GIL) may be used here.
+//
 
 inline static void *
 _cpython_malloc(void * mmgr, size_t bytes)
 {
-    return PyMem_Malloc(bytes);
+    return PyMem_RawMalloc(bytes);
 }
 
 inline static void *
 _cpython_realloc(void * mmgr, void * ptr, size_t old, size_t new)
 {
-    return PyMem_Realloc(ptr, new);
+    return PyMem_RawRealloc(ptr, new);
 }
 
 inline static void
 _cpython_free(void * mmgr, void * ptr, size_t bytes)
 {
-    PyMem_Free(ptr);
+    PyMem_RawFree(ptr);
+}
+
+
+//
+// Solving limit methods
+//
+
+/**
+ * Get the current time of a monotonic clock, in seconds.
+ */
+static double
+_tt_monotonic_time(void)
+{
+#ifdef _WIN32
+    return (double)GetTickCount64() / 1000.0;
+#else
+    struct timespec ts;
+
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec / 1e9;
+#endif
+}
+
+/**
+ * PicoSAT interrupt callback, stopping the solver once its deadline passes.
+ * PicoSAT only checks this periodically (every 1024 decisions).
+ */
+static int
+_tt_deadline_passed(void * limits)
+{
+    return _tt_monotonic_time() >= ((tt_limits *)limits)->_deadline;
+}
+
+/**
+ * Parse the (possibly NULL or None) limit arguments of a solving method.
+ *
+ * Returns 0 on success, -1 on error.
+ */
+static int
+_tt_parse_limits(PyObject * decision_limit, PyObject * propagation_limit,
+                 PyObject * timeout, tt_limits * limits)
+{
+    PyObject * zero;
+    long decisions;
+    int is_negative;
+
+    limits->decision_limit = -1;
+    limits->propagation_limit = 0;
+    limits->has_propagation_limit = 0;
+    limits->timeout = -1.0;
+    limits->_deadline = 0.0;
+
+    if (decision_limit != NULL && decision_limit != Py_None)
+    {
+        if (!IS_INT(decision_limit) || PyBool_Check(decision_limit))
+        {
+            PyErr_SetString(PyExc_TypeError, "decision_limit must be an int");
+            return -1;
+        }
+
+        decisions = PyLong_AsLong(decision_limit);
+        if (decisions == -1 && PyErr_Occurred())
+        {
+            if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                return -1;
+            PyErr_Clear();
+            decisions = LONG_MAX;
+        }
+
+        if (decisions < 0)
+        {
+            PyErr_SetString(PyExc_ValueError, "decision_limit must be non-negative");
+            return -1;
+        }
+
+        // larger limits could never be reached by PicoSAT's int counter
+        if (decisions < INT_MAX)
+            limits->decision_limit = (int)decisions;
+    }
+
+    if (propagation_limit != NULL && propagation_limit != Py_None)
+    {
+        if (!IS_INT(propagation_limit) || PyBool_Check(propagation_limit))
+        {
+            PyErr_SetString(PyExc_TypeError, "propagation_limit must be an int");
+            return -1;
+        }
+
+        zero = PyInt_FromLong(0);
+        if (zero == NULL)
+            return -1;
+        is_negative = PyObject_RichCompareBool(propagation_limit, zero, Py_LT);
+        Py_DECREF(zero);
+
+        if (is_negative < 0)
+            return -1;
+        else if (is_negative)
+        {
+            PyErr_SetString(PyExc_ValueError, "propagation_limit must be non-negative");
+            return -1;
+        }
+
+        limits->propagation_limit = PyLong_AsUnsignedLongLong(propagation_limit);
+        if (limits->propagation_limit == (unsigned long long)-1 &&
+                PyErr_Occurred())
+        {
+            if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                return -1;
+            PyErr_Clear();
+        }
+        else
+            limits->has_propagation_limit = 1;
+    }
+
+    if (timeout != NULL && timeout != Py_None)
+    {
+        if (!PyNumber_Check(timeout) || PyBool_Check(timeout) ||
+                PyComplex_Check(timeout))
+        {
+            PyErr_SetString(PyExc_TypeError, "timeout must be a number of seconds");
+            return -1;
+        }
+
+        limits->timeout = PyFloat_AsDouble(timeout);
+        if (limits->timeout == -1.0 && PyErr_Occurred())
+            return -1;
+
+        if (!(limits->timeout >= 0.0))
+        {
+            PyErr_SetString(PyExc_ValueError, "timeout must be non-negative");
+            return -1;
+        }
+    }
+
+    return 0;
+}
+
+/**
+ * Run picosat_sat on a PicoSAT instance within limits, applying each limit
+ * afresh to this call alone, and adding the (wall clock) seconds spent
+ * solving to seconds.
+ *
+ * Does not require the GIL.
+ */
+static int
+_tt_picosat_sat(PicoSAT * picosat, tt_limits * limits, double * seconds)
+{
+    unsigned long long propagations;
+    double start;
+    int picosat_result;
+
+    // PicoSAT's propagation limit applies to its running total
+    if (limits->has_propagation_limit)
+    {
+        propagations = picosat_propagations(picosat);
+        if (limits->propagation_limit > ~0ull - propagations)
+            picosat_set_propagation_limit(picosat, ~0ull);
+        else
+            picosat_set_propagation_limit(
+                picosat, propagations + limits->propagation_limit);
+    }
+
+    if (limits->timeout >= 0.0)
+    {
+        limits->_deadline = _tt_monotonic_time() + limits->timeout;
+        picosat_set_interrupt(picosat, limits, _tt_deadline_passed);
+    }
+
+    start = _tt_monotonic_time();
+    picosat_result = picosat_sat(picosat, limits->decision_limit);
+    *seconds += _tt_monotonic_time() - start;
+
+    // leave the instance unlimited for any later calls
+    if (limits->has_propagation_limit)
+        picosat_set_propagation_limit(picosat, ~0ull);
+    if (limits->timeout >= 0.0)
+        picosat_set_interrupt(picosat, NULL, NULL);
+
+    return picosat_result;
+}
+
+/**
+ * Set an error of one of the exception types of tt.errors, by name.
+ */
+static void
+_tt_set_tt_error(const char * error_name, const char * message)
+{
+    PyObject * errors_module;
+    PyObject * error_type;
+
+    errors_module = PyImport_ImportModule("tt.errors");
+    if (errors_module == NULL)
+        return;
+
+    error_type = PyObject_GetAttrString(errors_module, error_name);
+    Py_DECREF(errors_module);
+    if (error_type == NULL)
+        return;
+
+    PyErr_SetString(error_type, message);
+    Py_DECREF(error_type);
+}
+
+/**
+ * Set the error for PicoSAT stopping at a limit before finding a result,
+ * which is tt's SolverLimitError.
+ */
+static void
+_tt_set_limit_error(void)
+{
+    _tt_set_tt_error("SolverLimitError",
+                     "PicoSAT reached a limit before finding a result");
+}
+
+
+//
+// Solving statistics methods
+//
+
+/**
+ * Call a (possibly NULL or None) stats callback with the statistics of a
+ * PicoSAT instance: a tuple of its variables, original clauses, decisions and
+ * propagations (counted from the given starting totals), seconds spent
+ * solving, and peak bytes allocated.
+ *
+ * Returns 0 on success, -1 on error.
+ */
+static int
+_tt_report_stats(PyObject * stats_callback, PicoSAT * picosat,
+                 unsigned long long decisions,
+                 unsigned long long propagations, double seconds)
+{
+    PyObject * stats;
+    PyObject * result;
+
+    if (stats_callback == NULL || stats_callback == Py_None)
+        return 0;
+
+    stats = Py_BuildValue(
+        "(iiKKdK)",
+        picosat_variables(picosat),
+        picosat_added_original_clauses(picosat),
+        picosat_decisions(picosat) - decisions,
+        picosat_propagations(picosat) - propagations,
+        seconds,
+        (unsigned long long)picosat_max_bytes_allocated(picosat));
+    if (stats == NULL)
+        return -1;
+
+    result = PyObject_CallFunctionObjArgs(stats_callback, stats, NULL);
+    Py_DECREF(stats);
+    if (result == NULL)
+        return -1;
+
+    Py_DECREF(result);
+    return 0;
 }
 
 
@@ -53,6 +354,32 @@ _cpython_free(void * mmgr, void * ptr, size_t bytes)
 // PicoSAT functionality methods
 //
 
+/**
+ * Convert a Python int into a literal, which must fit in an int and have a
+ * negation that does too. Zero is converted as is, for the caller to reject.
+ *
+ * Returns 0 on success, -1 on error.
+ */
+static int
+_tt_int_to_lit(PyObject * literal, int * lit)
+{
+    long l;
+    int overflow;
+
+    l = PyLong_AsLongAndOverflow(literal, &overflow);
+    if (l == -1 && PyErr_Occurred())
+        return -1;
+
+    if (overflow || l <= INT_MIN || l > INT_MAX)
+    {
+        PyErr_SetString(PyExc_ValueError, "All literals must be within the range of int32, excluding its minimum");
+        return -1;
+    }
+
+    *lit = (int)l;
+    return 0;
+}
+
 /**
  * Add a clause to a PicoSAT instance. A clause is a list of non-zero ints.
  *
@@ -91,7 +418,12 @@ _tt_add_picosat_clause(PicoSAT * picosat, PyObject * clause)
             return -1;
         }
 
-        l = PyLong_AsLong(literal);
+        if (_tt_int_to_lit(literal, &l) < 0)
+        {
+            Py_DECREF(literal);
+            Py_DECREF(clause_iterator);
+            return -1;
+        }
         Py_DECREF(literal);
 
         if (l == 0)
@@ -112,9 +444,155 @@ _tt_add_picosat_clause(PicoSAT * picosat, PyObject * clause)
     return 0;
 }
 
+//
+// Clauses may also be passed as a flat buffer of native int32 literals, in
+// which each clause is terminated by a zero (as in the DIMACS format). Such
+// buffers are read directly, without creating any Python objects, and without
+// the GIL.
+//
+
+#define TT_LITS_BUFFER_OK 0
+#define TT_LITS_BUFFER_EMPTY 1
+#define TT_LITS_BUFFER_EMPTY_CLAUSE 2
+#define TT_LITS_BUFFER_UNTERMINATED 3
+#define TT_LITS_BUFFER_OUT_OF_RANGE 4
+
+/**
+ * Get a view of an object's buffer of native int32 literals. Buffers of bytes
+ * are interpreted as holding native int32 literals.
+ *
+ * Returns 0 on success, -1 on error (in which case no view is held).
+ */
+static int
+_tt_get_lits_buffer(PyObject * obj, Py_buffer * view, Py_ssize_t * num_lits)
+{
+    const char * format;
+    int is_bytes, is_ints;
+
+    if (PyObject_GetBuffer(obj, view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) < 0)
+        return -1;
+
+    format = (view->format == NULL) ? "B" : view->format;
+    if (*format == '@' || *format == '=' ||
+#if PY_LITTLE_ENDIAN
+            *format == '<')
+#else
+            *format == '>' || *format == '!')
+#endif
+        ++format;
+
+    is_bytes = view->itemsize == 1 && (strcmp(format, "B") == 0 ||
+                                       strcmp(format, "b") == 0 ||
+                                       strcmp(format, "c") == 0);
+    is_ints = view->itemsize == sizeof(int) && (strcmp(format, "i") == 0 ||
+                                                strcmp(format, "l") == 0);
+    if (!is_bytes && !is_ints)
+    {
+        PyBuffer_Release(view);
+        PyErr_SetString(PyExc_TypeError, "clause buffers must hold native int32 literals");
+        return -1;
+    }
+
+    if (view->len % sizeof(int) != 0)
+    {
+        PyBuffer_Release(view);
+        PyErr_SetString(PyExc_ValueError, "clause buffer size must be a multiple of 4 bytes");
+        return -1;
+    }
+
+    *num_lits = view->len / sizeof(int);
+    return 0;
+}
+
+/**
+ * Check that a buffer of literals holds only complete, non-empty clauses.
+ * Literals are copied out of the buffer, which may not be aligned.
+ *
+ * Returns one of the TT_LITS_BUFFER_* status codes.
+ */
+static int
+_tt_check_lits_buffer(const char * buf, Py_ssize_t num_lits)
+{
+    Py_ssize_t i;
+    int l, prev = 0;
+
+    if (num_lits == 0)
+        return TT_LITS_BUFFER_EMPTY;
+
+    for (i = 0; i < num_lits; ++i)
+    {
+        memcpy(&l, buf + i * sizeof(int), sizeof(int));
+        if (l == 0 && prev == 0)
+            return TT_LITS_BUFFER_EMPTY_CLAUSE;
+        else if (l == INT_MIN)
+            return TT_LITS_BUFFER_OUT_OF_RANGE;
+        prev = l;
+    }
+
+    return (prev == 0) ? TT_LITS_BUFFER_OK : TT_LITS_BUFFER_UNTERMINATED;
+}
+
+/**
+ * Add the clauses of an object holding a buffer of literals to a PicoSAT
+ * instance, extending each by the negation of the activation literal if it is
+ * non-zero. Nothing is added if the buffer is invalid.
+ *
+ * Returns 0 on success, -1 on error.
+ */
+static int
+_tt_add_picosat_clauses_buffer(PicoSAT * picosat, PyObject * clauses,
+                               int activation, int allow_empty)
+{
+    Py_buffer view;
+    Py_ssize_t i, num_lits;
+    const char * buf;
+    int l, status;
+
+    if (_tt_get_lits_buffer(clauses, &view, &num_lits) < 0)
+        return -1;
+
+    buf = (const char *)view.buf;
+
+    Py_BEGIN_ALLOW_THREADS
+    status = _tt_check_lits_buffer(buf, num_lits);
+    if (status == TT_LITS_BUFFER_OK)
+    {
+        for (i = 0; i < num_lits; ++i)
+        {
+            memcpy(&l, buf + i * sizeof(int), sizeof(int));
+            if (l == 0 && activation)
+                picosat_add(picosat, -activation);
+            picosat_add(picosat, l);
+        }
+    }
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&view);
+
+    switch (status)
+    {
+        case TT_LITS_BUFFER_OK:
+            return 0;
+        case TT_LITS_BUFFER_EMPTY:
+            if (allow_empty)
+                return 0;
+            PyErr_SetString(PyExc_ValueError, "clauses must be non-empty");
+            return -1;
+        case TT_LITS_BUFFER_EMPTY_CLAUSE:
+            PyErr_SetString(PyExc_ValueError, "clause must be non-empty");
+            return -1;
+        case TT_LITS_BUFFER_UNTERMINATED:
+            PyErr_SetString(PyExc_ValueError, "clause buffers must end with a zero terminating the last clause");
+            return -1;
+        default:
+            PyErr_SetString(PyExc_ValueError, "All literals must be within the range of int32, excluding its minimum");
+            return -1;
+    }
+}
+
 /**
  * Add clauses to a PicoSAT instance. Clauses are a Python iterator of
- * iterators of non-zero ints.
+ * iterators of non-zero ints, or an object holding a buffer of literals.
  *
  * Returns 0 on success, -1 on error.
  */
@@ -124,6 +602,9 @@ _tt_add_picosat_clauses(PicoSAT * picosat, PyObject * clauses)
     PyObject * clauses_iterator;  // clauses is iterable of iterable of ints
     PyObject * clause;            // each clause is iterable of ints
 
+    if (!PyList_Check(clauses) && PyObject_CheckBuffer(clauses))
+        return _tt_add_picosat_clauses_buffer(picosat, clauses, 0, 0);
+
     if (!PyList_Check(clauses))
     {
         PyErr_SetString(PyExc_TypeError, "clauses must be a list of lists of non-zero ints");
@@ -204,7 +685,12 @@ _tt_assert_picosat_assumptions(PyObject * assumptions)
             return -1;
         }
 
-        a = PyLong_AsLong(assumption);
+        if (_tt_int_to_lit(assumption, &a) < 0)
+        {
+            Py_DECREF(assumption);
+            Py_DECREF(assumptions_iterator);
+            return -1;
+        }
         Py_DECREF(assumption);
 
         if (a == 0)
@@ -264,23 +750,16 @@ _tt_add_picosat_assumptions(PicoSAT * picosat, PyObject * assumptions)
 }
 
 /**
- * Ensures the validity of Python args object, inits PicoSAT object, and adds
- * PicoSAT clauses + assumptions.
+ * Ensures the validity of the clauses and assumptions, inits PicoSAT object,
+ * and adds PicoSAT clauses + assumptions.
  *
  * Returns NULL if an error occurs.
  */
 static PicoSAT *
-_tt_setup_picosat(PyObject * args, PyObject * kwds, soliter_obj * iter)
+_tt_setup_picosat(PyObject * clauses, PyObject * assumptions,
+                  soliter_obj * iter)
 {
-    static char * keywords[] = {"clauses", "assumptions", NULL};
-
     PicoSAT * picosat;
-    PyObject * clauses;             // List[List[int]]
-    PyObject * assumptions = NULL;  // List[int]
-
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|O", keywords,
-                                     &clauses, &assumptions))
-        return NULL;
 
     picosat = picosat_minit(NULL,
                             _cpython_malloc, _cpython_realloc, _cpython_free);
@@ -299,6 +778,8 @@ _tt_setup_picosat(PyObject * args, PyObject * kwds, soliter_obj * iter)
 
     if (iter != NULL)
     {
+        if (assumptions == NULL)
+            assumptions = Py_None;
         iter->assumptions = assumptions;
         Py_INCREF(assumptions);
     }
@@ -315,65 +796,236 @@ _tt_setup_picosat(PyObject * args, PyObject * kwds, soliter_obj * iter)
 
 /**
  * Retrieve the solution from a PicoSAT instance into a Python list of ints.
+ * If project is non-NULL, only the num_project variables it holds are
+ * included in the list, in the same order; otherwise, every variable is.
+ *
+ * Returns NULL if an error occurs; the PicoSAT instance is left as-is.
  */
 static PyObject *
-_tt_picosat_sol_to_py_list(PicoSAT * picosat)
+_tt_picosat_projected_sol_to_py_list(PicoSAT * picosat, int * project,
+                                     int num_project)
 {
     PyObject * list;
     PyObject * literal;
-    int num_vars, i, v;
+    int num_vars, i, var, v;
 
-    num_vars = picosat_variables(picosat);
+    num_vars = (project == NULL) ? picosat_variables(picosat) : num_project;
     list = PyList_New((Py_ssize_t)num_vars);
     if (list == NULL)
-    {
-        picosat_reset(picosat);
         return NULL;
-    }
 
-    for (i = 1; i <= num_vars; ++i)
+    for (i = 0; i < num_vars; ++i)
     {
-        v = picosat_deref(picosat, i);
-        literal = PyInt_FromLong((long) (v * i));
-        if (PyList_SetItem(list, (Py_ssize_t)(i - 1), literal) < 0)
+        var = (project == NULL) ? i + 1 : project[i];
+        v = picosat_deref(picosat, var);
+        literal = PyInt_FromLong((long) (v * var));
+        if (literal == NULL)
         {
-            Py_DECREF(literal);
             Py_DECREF(list);
-            picosat_reset(picosat);
             return NULL;
         }
+
+        // steals the reference to literal
+        PyList_SET_ITEM(list, (Py_ssize_t)i, literal);
     }
 
     return list;
 }
 
+static PyObject *
+_tt_picosat_sol_to_py_list(PicoSAT * picosat)
+{
+    return _tt_picosat_projected_sol_to_py_list(picosat, NULL, 0);
+}
+
 /**
- * Block a solution from being returned again in the passed PicoSAT instance.
- *
- * Returns 0 on success, -1 on error.
+ * Return the number of variables in each solution of an iterator.
  */
 static int
-_tt_block_sol(PicoSAT * picosat, signed char * mem)
+_tt_sol_num_vars(soliter_obj * iter)
 {
-    int num_vars, i;
-
-    num_vars = picosat_variables(picosat);
-    if (mem == NULL)
-    {
-        mem = PyMem_Malloc(num_vars + 1);
-        if (mem == NULL)
-        {
-            PyErr_NoMemory();
-            return -1;
-        }
-    }
-
-    for (i = 1; i <= num_vars; ++i)
-        mem[i] = (picosat_deref(picosat, i) > 0) ? 1 : -1;
-    for (i = 1; i <= num_vars; ++i)
-        picosat_add(picosat, (mem[i] < 0) ? i : -i);
-    picosat_add(picosat, 0);
+    if (iter->project == NULL)
+        return picosat_variables(iter->picosat);
+    return iter->num_project;
+}
 
+/**
+ * Return the number of bytes in each packed solution of an iterator.
+ */
+static Py_ssize_t
+_tt_sol_num_bytes(soliter_obj * iter)
+{
+    return ((Py_ssize_t)_tt_sol_num_vars(iter) + 7) / 8;
+}
+
+/**
+ * Pack the current solution of an iterator's PicoSAT instance into a bitmask
+ * of _tt_sol_num_bytes(iter) bytes at out.
+ *
+ * The bitmask is the big-endian representation of the integer whose bits,
+ * from most to least significant, hold the values of the solution's
+ * variables in order; the first variable therefore lands in the highest bit.
+ *
+ * Does not require the GIL.
+ */
+static void
+_tt_pack_sol(soliter_obj * iter, unsigned char * out)
+{
+    int num_vars, i, var, bit;
+    Py_ssize_t num_bytes;
+
+    num_vars = _tt_sol_num_vars(iter);
+    num_bytes = _tt_sol_num_bytes(iter);
+    memset(out, 0, (size_t)num_bytes);
+
+    for (i = 0; i < num_vars; ++i)
+    {
+        var = (iter->project == NULL) ? i + 1 : iter->project[i];
+        if (picosat_deref(iter->picosat, var) > 0)
+        {
+            bit = num_vars - 1 - i;
+            out[num_bytes - 1 - bit / 8] |= (unsigned char)(1 << (bit % 8));
+        }
+    }
+}
+
+/**
+ * Retrieve the current solution of an iterator's PicoSAT instance in the
+ * iterator's format.
+ *
+ * Returns NULL if an error occurs; the PicoSAT instance is left as-is.
+ */
+static PyObject *
+_tt_soliter_sol(soliter_obj * iter)
+{
+    PyObject * packed;
+    PyObject * ret;
+
+    if (iter->format == TT_SOL_FORMAT_LITS)
+        return _tt_picosat_projected_sol_to_py_list(
+            iter->picosat, iter->project, iter->num_project);
+
+    packed = PyBytes_FromStringAndSize(NULL, _tt_sol_num_bytes(iter));
+    if (packed == NULL)
+        return NULL;
+    _tt_pack_sol(iter, (unsigned char *)PyBytes_AS_STRING(packed));
+
+    if (iter->format == TT_SOL_FORMAT_BYTES)
+        return packed;
+
+    ret = PyObject_CallMethod((PyObject *)&PyLong_Type, "from_bytes", "Os",
+                              packed, "big");
+    Py_DECREF(packed);
+    return ret;
+}
+
+/**
+ * Block the current solution of an iterator's PicoSAT instance from being
+ * returned again. Only the iterator's projected variables (or every variable,
+ * if it has no projection) appear in the blocking clause, so that all other
+ * solutions agreeing on those variables are blocked too.
+ *
+ * The iterator's _block_lits must already be allocated (see
+ * _tt_alloc_block_lits). Does not require the GIL.
+ */
+static void
+_tt_block_sol(soliter_obj * iter)
+{
+    int num_vars, i, var;
+
+    num_vars = _tt_sol_num_vars(iter);
+
+    // the solution must be read in full before any literals are added, as
+    // adding to the PicoSAT instance discards its current solution
+    for (i = 0; i < num_vars; ++i)
+    {
+        var = (iter->project == NULL) ? i + 1 : iter->project[i];
+        iter->_block_lits[i] = (picosat_deref(iter->picosat, var) > 0) ?
+            -var : var;
+    }
+    iter->_block_lits[num_vars] = 0;
+    picosat_add_lits(iter->picosat, iter->_block_lits);
+}
+
+/**
+ * Allocate the scratch space an iterator builds blocking clauses in, if not
+ * already allocated.
+ *
+ * Returns 0 on success, -1 on error.
+ */
+static int
+_tt_alloc_block_lits(soliter_obj * iter)
+{
+    if (iter->_block_lits != NULL)
+        return 0;
+
+    iter->_block_lits = PyMem_Malloc(
+        ((size_t)_tt_sol_num_vars(iter) + 1) * sizeof(int));
+    if (iter->_block_lits == NULL)
+    {
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    return 0;
+}
+
+/**
+ * Convert a Python list of projection variables into a PyMem-allocated array,
+ * ensuring each is a variable of the passed PicoSAT instance.
+ *
+ * Returns 0 on success, -1 on error.
+ */
+static int
+_tt_parse_project(PicoSAT * picosat, PyObject * project, soliter_obj * iter)
+{
+    Py_ssize_t i, n;
+    PyObject * var_obj;
+    long var;
+
+    if (!PyList_Check(project))
+    {
+        PyErr_SetString(PyExc_TypeError, "project must be a list of positive ints");
+        return -1;
+    }
+
+    n = PyList_GET_SIZE(project);
+    if (n < 1)
+    {
+        PyErr_SetString(PyExc_ValueError, "project must be non-empty");
+        return -1;
+    }
+
+    iter->project = PyMem_Malloc(n * sizeof(int));
+    if (iter->project == NULL)
+    {
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    for (i = 0; i < n; ++i)
+    {
+        var_obj = PyList_GET_ITEM(project, i);
+        if (!IS_INT(var_obj))
+        {
+            PyErr_SetString(PyExc_TypeError, "All project variables expected to be ints");
+            return -1;
+        }
+
+        var = PyLong_AsLong(var_obj);
+        if (var == -1 && PyErr_Occurred())
+            return -1;
+
+        if (var < 1 || var > picosat_variables(picosat))
+        {
+            PyErr_SetString(PyExc_ValueError, "All project variables must be positive ints appearing in the clauses or assumptions");
+            return -1;
+        }
+
+        iter->project[i] = (int)var;
+    }
+
+    iter->num_project = (int)n;
     return 0;
 }
 
@@ -384,33 +1036,164 @@ _tt_block_sol(PicoSAT * picosat, signed char * mem)
 
 static PyTypeObject SolIter_Type;
 
-static PyObject * _tt_soliter_next(soliter_obj * iter)
+/**
+ * Find up to chunk_size further solutions of a chunked iterator, packing them
+ * back to back into a single bytes object. If a limit is reached after some
+ * solutions of the chunk are found, they are returned, leaving the limit
+ * error to be raised by the next call.
+ *
+ * Returns NULL with no error set once no solutions remain.
+ */
+static PyObject *
+_tt_soliter_next_chunk(soliter_obj * iter)
+{
+    PyObject * chunk;
+    unsigned char * out;
+    Py_ssize_t num_bytes, num_found, capacity, max_capacity;
+    int picosat_result;
+    int * lit;
+
+    if (_tt_alloc_block_lits(iter) < 0)
+        return NULL;
+
+    num_bytes = _tt_sol_num_bytes(iter);
+    max_capacity = iter->chunk_size;
+    if (num_bytes > 0 && max_capacity > PY_SSIZE_T_MAX / num_bytes)
+        max_capacity = PY_SSIZE_T_MAX / num_bytes;
+
+    capacity = max_capacity < TT_CHUNK_INITIAL_SIZE ?
+        max_capacity : TT_CHUNK_INITIAL_SIZE;
+    chunk = PyBytes_FromStringAndSize(NULL, capacity * num_bytes);
+    if (chunk == NULL)
+        return NULL;
+
+    num_found = 0;
+    picosat_result = PICOSAT_SATISFIABLE;
+    for (;;)
+    {
+        // the chunk is not yet visible to any other thread, so it can be
+        // filled in along with all the solving w/o the GIL
+        out = (unsigned char *)PyBytes_AS_STRING(chunk);
+        Py_BEGIN_ALLOW_THREADS
+        while (num_found < capacity)
+        {
+            picosat_result = _tt_picosat_sat(iter->picosat, &iter->limits,
+                                             &iter->seconds);
+            if (picosat_result != PICOSAT_SATISFIABLE)
+                break;
+
+            _tt_pack_sol(iter, out + num_found * num_bytes);
+            ++num_found;
+
+            _tt_block_sol(iter);
+            if (iter->_assumption_lits != NULL)
+            {
+                for (lit = iter->_assumption_lits; *lit; ++lit)
+                    picosat_assume(iter->picosat, *lit);
+            }
+        }
+        Py_END_ALLOW_THREADS
+
+        if (num_found < capacity || num_found == iter->chunk_size)
+            break;
+
+        if (capacity == max_capacity)
+        {
+            // the chunk cannot be addressed as a single bytes object
+            Py_DECREF(chunk);
+            return PyErr_NoMemory();
+        }
+
+        capacity = capacity > max_capacity / 2 ? max_capacity : 2 * capacity;
+        if (_PyBytes_Resize(&chunk, capacity * num_bytes) < 0)
+            return NULL;
+    }
+
+    if (picosat_result != PICOSAT_SATISFIABLE &&
+            picosat_result != PICOSAT_UNSATISFIABLE &&
+            picosat_result != PICOSAT_UNKNOWN)
+    {
+        Py_DECREF(chunk);
+        PyErr_SetString(PyExc_RuntimeError, "PicoSAT returned unexpected value");
+        return NULL;
+    }
+
+    if (num_found < iter->chunk_size)
+    {
+        // PicoSAT has dropped the assumptions, so solving again could find
+        // solutions violating them
+        iter->exhausted = 1;
+    }
+
+    if (num_found == 0)
+    {
+        Py_DECREF(chunk);
+        if (picosat_result == PICOSAT_UNKNOWN)
+            _tt_set_limit_error();
+
+        // otherwise, exhausted all solutions, so stop iteration
+        return NULL;
+    }
+    else if (picosat_result == PICOSAT_UNKNOWN)
+        iter->limit_reached = 1;
+
+    if (num_found < capacity &&
+            _PyBytes_Resize(&chunk, num_found * num_bytes) < 0)
+        return NULL;
+
+    return chunk;
+}
+
+static PyObject *
+_tt_soliter_next_sol(soliter_obj * iter)
 {
     PyObject * ret = NULL;
     int picosat_result;
 
-    assert(PyObject_TypeCheck(iter, &SolIter_Type));
+    if (iter->limit_reached)
+    {
+        iter->limit_reached = 0;
+        _tt_set_limit_error();
+        return NULL;
+    }
+    else if (iter->exhausted)
+        return NULL;
+    else if (iter->chunk_size > 0)
+        return _tt_soliter_next_chunk(iter);
+
+    if (_tt_alloc_block_lits(iter) < 0)
+        return NULL;
 
     // run PicoSAT w/o the GIL
     Py_BEGIN_ALLOW_THREADS
-    picosat_result = picosat_sat(iter->picosat, -1);
+    picosat_result = _tt_picosat_sat(iter->picosat, &iter->limits,
+                                     &iter->seconds);
     Py_END_ALLOW_THREADS
 
     switch (picosat_result)
     {
         case PICOSAT_SATISFIABLE:
-            ret = _tt_picosat_sol_to_py_list(iter->picosat);
-            if (_tt_block_sol(iter->picosat, iter->_temp_mem) < 0)
+            ret = _tt_soliter_sol(iter);
+            if (ret == NULL)
                 return NULL;
+            _tt_block_sol(iter);
             if (_tt_add_picosat_assumptions(iter->picosat, iter->assumptions) < 0)
+            {
+                Py_DECREF(ret);
                 return NULL;
+            }
             break;
         case PICOSAT_UNSATISFIABLE:
-        case PICOSAT_UNKNOWN:
             // exhausted all solutions, so stop iteration
+            iter->exhausted = 1;
+            break;
+        case PICOSAT_UNKNOWN:
+            // PicoSAT has dropped the assumptions, so cannot carry on
+            iter->exhausted = 1;
+            _tt_set_limit_error();
             break;
         default:
-            picosat_reset(iter->picosat);
+            iter->exhausted = 1;
             PyErr_SetString(PyExc_RuntimeError, "PicoSAT returned unexpected value");
             return NULL;
     }
@@ -418,22 +1201,525 @@ static PyObject * _tt_soliter_next(soliter_obj * iter)
     return ret;
 }
 
-static void _tt_soliter_dealloc(soliter_obj * iter)
+/**
+ * Get the next solution (or chunk of solutions) of an iterator, reporting its
+ * statistics to its stats callback the first time that iteration stops, be it
+ * by exhausting the solutions or by raising an error. An error raised by the
+ * callback takes the place of any error stopping iteration.
+ *
+ * Solving releases the GIL, so another thread may call this meanwhile; as
+ * the iterator's PicoSAT instance is then in use, that call raises a
+ * SolverInUseError rather than touching it.
+ */
+static PyObject *
+_tt_soliter_next(soliter_obj * iter)
+{
+    PyObject * ret;
+    PyObject * stats_callback;
+    PyObject * type, * value, * traceback;
+
+    assert(PyObject_TypeCheck(iter, &SolIter_Type));
+
+    if (iter->busy)
+    {
+        _tt_set_tt_error("SolverInUseError",
+                         "sat_all iterator is in use by another thread");
+        return NULL;
+    }
+
+    iter->busy = 1;
+    ret = _tt_soliter_next_sol(iter);
+    iter->busy = 0;
+    if (ret != NULL || iter->stats_callback == NULL)
+        return ret;
+
+    // only report once, even if iteration is attempted again
+    stats_callback = iter->stats_callback;
+    iter->stats_callback = NULL;
+
+    PyErr_Fetch(&type, &value, &traceback);
+    if (_tt_report_stats(stats_callback, iter->picosat, 0, 0,
+                         iter->seconds) < 0)
+    {
+        Py_XDECREF(type);
+        Py_XDECREF(value);
+        Py_XDECREF(traceback);
+    }
+    else
+        PyErr_Restore(type, value, traceback);
+
+    Py_DECREF(stats_callback);
+    return NULL;
+}
+
+static void _tt_soliter_dealloc(soliter_obj * iter)
+{
+    PyObject_GC_UnTrack(iter);
+    Py_XDECREF(iter->assumptions);
+    Py_XDECREF(iter->stats_callback);
+    if (iter->project != NULL)
+        PyMem_Free(iter->project);
+    if (iter->_block_lits != NULL)
+        PyMem_Free(iter->_block_lits);
+    if (iter->_assumption_lits != NULL)
+        PyMem_Free(iter->_assumption_lits);
+    if (iter->picosat != NULL)
+        picosat_reset(iter->picosat);
+    PyObject_GC_Del(iter);
+}
+
+static int _tt_soliter_traverse(soliter_obj * iter, visitproc visit, void * arg)
+{
+    Py_VISIT(iter->stats_callback);
+    return 0;
+}
+
+static PyTypeObject SolIter_Type = {
+
+#ifdef TT_IS_PYTHON_3
+    PyVarObject_HEAD_INIT(NULL, 0)
+#else
+    PyObject_HEAD_INIT(NULL)
+    0,                                        // ob_size
+#endif
+    "soliter",                                // tp_name
+    sizeof(soliter_obj),                      // tp_basicsize
+    0,                                        // tp_itemsize
+    // methods
+    (destructor) _tt_soliter_dealloc,         // tp_dealloc
+    0,                                        // tp_print
+    0,                                        // tp_getattr
+    0,                                        // tp_setattr
+    0,                                        // tp_compare
+    0,                                        // tp_repr
+    0,                                        // tp_as_number
+    0,                                        // tp_as_sequence
+    0,                                        // tp_as_mapping
+    0,                                        // tp_hash
+    0,                                        // tp_call
+    0,                                        // tp_str
+    PyObject_GenericGetAttr,                  // tp_getattro
+    0,                                        // tp_setattro
+    0,                                        // tp_as_buffer
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,  // tp_flags
+    0,                                        // tp_doc
+    (traverseproc) _tt_soliter_traverse,      // tp_traverse
+    0,                                        // tp_clear
+    0,                                        // tp_richcompare
+    0,                                        // tp_weaklistoffset
+    PyObject_SelfIter,                        // tp_iter
+    (iternextfunc) _tt_soliter_next,          // tp_iternext
+    0                                         // tp_methods
+
+};
+
+
+//
+// New type definition for incremental solver sessions
+//
+
+typedef struct {
+    PyObject_HEAD
+    PicoSAT * picosat;
+    int busy;           // whether a thread is solving w/o the GIL
+    int model_valid;    // whether the last solve found a model still held
+} solver_obj;
+
+static PyTypeObject Solver_Type;
+
+/**
+ * Convert a Python list of non-zero ints into a zero-terminated C array of
+ * literals, with room for one extra literal before the terminating zero.
+ * Nothing is added to any PicoSAT instance, so invalid clauses leave a
+ * solver untouched.
+ *
+ * Returns a PyMem-allocated array on success, NULL on error.
+ */
+static int *
+_tt_clause_to_lits(PyObject * clause, Py_ssize_t * len)
+{
+    Py_ssize_t i, n;
+    PyObject * literal;
+    int * lits;
+
+    if (!PyList_Check(clause))
+    {
+        PyErr_SetString(PyExc_TypeError, "clause must be a list of non-zero ints");
+        return NULL;
+    }
+
+    n = PyList_GET_SIZE(clause);
+    if (n < 1)
+    {
+        PyErr_SetString(PyExc_ValueError, "clause must be non-empty");
+        return NULL;
+    }
+
+    lits = PyMem_Malloc((n + 2) * sizeof(int));
+    if (lits == NULL)
+    {
+        PyErr_NoMemory();
+        return NULL;
+    }
+
+    for (i = 0; i < n; ++i)
+    {
+        literal = PyList_GET_ITEM(clause, i);
+        if (!IS_INT(literal))
+        {
+            PyMem_Free(lits);
+            PyErr_SetString(PyExc_TypeError, "All literals expected to be ints");
+            return NULL;
+        }
+
+        if (_tt_int_to_lit(literal, &lits[i]) < 0)
+        {
+            PyMem_Free(lits);
+            return NULL;
+        }
+
+        if (lits[i] == 0)
+        {
+            PyMem_Free(lits);
+            PyErr_SetString(PyExc_ValueError, "All literals must be non-zero");
+            return NULL;
+        }
+    }
+
+    lits[n] = 0;
+    *len = n;
+    return lits;
+}
+
+/**
+ * Add a clause to a solver's PicoSAT instance, extended by the negation of
+ * the activation literal if it is non-zero.
+ *
+ * Returns 0 on success, -1 on error.
+ */
+static int
+_tt_solver_add_clause(solver_obj * solver, PyObject * clause, int activation)
+{
+    Py_ssize_t n;
+    int * lits;
+
+    lits = _tt_clause_to_lits(clause, &n);
+    if (lits == NULL)
+        return -1;
+
+    if (activation)
+    {
+        lits[n] = -activation;
+        lits[n + 1] = 0;
+    }
+
+    // PicoSAT leaves its SAT state once a clause is added
+    solver->model_valid = 0;
+    picosat_add_lits(solver->picosat, lits);
+    PyMem_Free(lits);
+    return 0;
+}
+
+/**
+ * Check that a solver is neither closed nor being solved by another thread,
+ * which has released the GIL while working on its PicoSAT instance.
+ *
+ * Returns 0 on success, -1 on error.
+ */
+static int
+_tt_solver_check_open(solver_obj * solver)
+{
+    if (solver->picosat == NULL)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Solver has been closed");
+        return -1;
+    }
+    else if (solver->busy)
+    {
+        _tt_set_tt_error("SolverInUseError",
+                         "Solver is in use by another thread");
+        return -1;
+    }
+
+    return 0;
+}
+
+static PyObject *
+_tt_solver_new(PyTypeObject * type, PyObject * args, PyObject * kwds)
+{
+    solver_obj * solver;
+
+    solver = (solver_obj *)type->tp_alloc(type, 0);
+    if (solver == NULL)
+        return NULL;
+
+    solver->picosat = picosat_minit(NULL,
+                                    _cpython_malloc, _cpython_realloc, _cpython_free);
+    solver->busy = 0;
+    solver->model_valid = 0;
+    return (PyObject *)solver;
+}
+
+static void
+_tt_solver_dealloc(solver_obj * solver)
+{
+    if (solver->picosat != NULL)
+        picosat_reset(solver->picosat);
+    Py_TYPE(solver)->tp_free((PyObject *)solver);
+}
+
+/**
+ * Add a single clause, optionally guarded by an activation literal.
+ */
+static PyObject *
+_tt_solver_add_clause_method(solver_obj * solver, PyObject * args, PyObject * kwds)
+{
+    static char * keywords[] = {"clause", "activation", NULL};
+
+    PyObject * clause;
+    int activation = 0;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|i", keywords,
+                                     &clause, &activation))
+        return NULL;
+
+    if (_tt_solver_check_open(solver) < 0)
+        return NULL;
+
+    if (_tt_solver_add_clause(solver, clause, activation) < 0)
+        return NULL;
+
+    Py_RETURN_NONE;
+}
+
+/**
+ * Add a list of clauses, optionally guarded by an activation literal. Every
+ * clause is validated before any is added, so an invalid clause anywhere in
+ * the list leaves the solver untouched.
+ */
+static PyObject *
+_tt_solver_add_clauses_method(solver_obj * solver, PyObject * args, PyObject * kwds)
+{
+    static char * keywords[] = {"clauses", "activation", NULL};
+
+    PyObject * clauses;
+    int activation = 0;
+    int status;
+    int ** all_lits;
+    Py_ssize_t i, j, n, num_clauses;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|i", keywords,
+                                     &clauses, &activation))
+        return NULL;
+
+    if (_tt_solver_check_open(solver) < 0)
+        return NULL;
+
+    if (!PyList_Check(clauses) && PyObject_CheckBuffer(clauses))
+    {
+        // buffers are added w/o the GIL, so keep other threads off the
+        // instance in the meantime, as when solving
+        solver->busy = 1;
+        solver->model_valid = 0;
+        status = _tt_add_picosat_clauses_buffer(solver->picosat, clauses,
+                                                activation, 1);
+        solver->busy = 0;
+        if (status < 0)
+            return NULL;
+        Py_RETURN_NONE;
+    }
+
+    if (!PyList_Check(clauses))
+    {
+        PyErr_SetString(PyExc_TypeError, "clauses must be a list of lists of non-zero ints");
+        return NULL;
+    }
+
+    num_clauses = PyList_GET_SIZE(clauses);
+    all_lits = PyMem_Malloc((num_clauses + 1) * sizeof(int *));
+    if (all_lits == NULL)
+        return PyErr_NoMemory();
+
+    for (i = 0; i < num_clauses; ++i)
+    {
+        all_lits[i] = _tt_clause_to_lits(PyList_GET_ITEM(clauses, i), &n);
+        if (all_lits[i] == NULL)
+        {
+            for (j = 0; j < i; ++j)
+                PyMem_Free(all_lits[j]);
+            PyMem_Free(all_lits);
+            return NULL;
+        }
+
+        if (activation)
+        {
+            all_lits[i][n] = -activation;
+            all_lits[i][n + 1] = 0;
+        }
+    }
+
+    if (num_clauses > 0)
+        solver->model_valid = 0;
+
+    for (i = 0; i < num_clauses; ++i)
+    {
+        picosat_add_lits(solver->picosat, all_lits[i]);
+        PyMem_Free(all_lits[i]);
+    }
+    PyMem_Free(all_lits);
+
+    Py_RETURN_NONE;
+}
+
+/**
+ * Run the solver under a list of assumptions (or None), reporting the
+ * statistics of this call alone to an optional stats callback.
+ *
+ *  Returns:
+ *    The PicoSAT result code, as an int.
+ */
+static PyObject *
+_tt_solver_solve(solver_obj * solver, PyObject * args, PyObject * kwds)
+{
+    static char * keywords[] = {"assumptions", "decision_limit",
+                                "propagation_limit", "timeout",
+                                "stats_callback", NULL};
+
+    PyObject * assumptions = NULL;
+    PyObject * decision_limit = NULL;       // int
+    PyObject * propagation_limit = NULL;    // int
+    PyObject * timeout = NULL;              // float
+    PyObject * stats_callback = NULL;       // callable
+    tt_limits limits;
+    unsigned long long decisions, propagations;
+    double seconds = 0.0;
+    int picosat_result;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|OOOOO", keywords,
+                                     &assumptions, &decision_limit,
+                                     &propagation_limit, &timeout,
+                                     &stats_callback))
+        return NULL;
+
+    if (_tt_solver_check_open(solver) < 0)
+        return NULL;
+
+    if (_tt_parse_limits(decision_limit, propagation_limit, timeout,
+                         &limits) < 0)
+        return NULL;
+
+    if (assumptions != NULL && assumptions != Py_None &&
+            PyList_Check(assumptions) && PyList_GET_SIZE(assumptions) == 0)
+    {
+        // an empty list of assumptions is the same as none at all
+        assumptions = NULL;
+    }
+
+    if (_tt_assert_picosat_assumptions(assumptions) < 0)
+        return NULL;
+
+    // assuming literals also takes PicoSAT out of its SAT state
+    solver->model_valid = 0;
+    if (_tt_add_picosat_assumptions(solver->picosat, assumptions) < 0)
+        return NULL;
+
+    // the solver's counters run over its whole lifetime
+    decisions = picosat_decisions(solver->picosat);
+    propagations = picosat_propagations(solver->picosat);
+
+    // run PicoSAT w/o the GIL, keeping other threads off the instance
+    solver->busy = 1;
+    Py_BEGIN_ALLOW_THREADS
+    picosat_result = _tt_picosat_sat(solver->picosat, &limits, &seconds);
+    Py_END_ALLOW_THREADS
+    solver->busy = 0;
+    solver->model_valid = (picosat_result == PICOSAT_SATISFIABLE);
+
+    if (_tt_report_stats(stats_callback, solver->picosat, decisions,
+                         propagations, seconds) < 0)
+        return NULL;
+
+    return PyInt_FromLong((long)picosat_result);
+}
+
+/**
+ * Get the model found by the last call to solve, as a list of literals, or
+ * None if it found none or the solver has since been changed.
+ */
+static PyObject *
+_tt_solver_model(solver_obj * solver, PyObject * unused)
+{
+    if (_tt_solver_check_open(solver) < 0)
+        return NULL;
+
+    if (!solver->model_valid)
+        Py_RETURN_NONE;
+
+    return _tt_picosat_sol_to_py_list(solver->picosat);
+}
+
+/**
+ * Allocate a new variable, returning its index.
+ */
+static PyObject *
+_tt_solver_new_var(solver_obj * solver, PyObject * unused)
+{
+    if (_tt_solver_check_open(solver) < 0)
+        return NULL;
+
+    // a model found before would not cover the new variable
+    solver->model_valid = 0;
+    return PyInt_FromLong((long)picosat_inc_max_var(solver->picosat));
+}
+
+/**
+ * Get the largest variable index known to the solver.
+ */
+static PyObject *
+_tt_solver_num_vars(solver_obj * solver, PyObject * unused)
 {
-    PyObject_GC_UnTrack(iter);
-    Py_DECREF(iter->assumptions);
-    if (iter->_temp_mem)
-        PyMem_Free(iter->_temp_mem);
-    picosat_reset(iter->picosat);
-    PyObject_GC_Del(iter);
+    if (_tt_solver_check_open(solver) < 0)
+        return NULL;
+
+    return PyInt_FromLong((long)picosat_variables(solver->picosat));
 }
 
-static int _tt_soliter_traverse(soliter_obj * iter, visitproc visit, void * arg)
+/**
+ * Release the solver's PicoSAT instance; closing twice is a no-op.
+ */
+static PyObject *
+_tt_solver_close(solver_obj * solver, PyObject * unused)
 {
-    return 0;
+    if (solver->busy)
+    {
+        // never release an instance another thread is solving with
+        _tt_set_tt_error("SolverInUseError",
+                         "Solver is in use by another thread");
+        return NULL;
+    }
+
+    if (solver->picosat != NULL)
+    {
+        picosat_reset(solver->picosat);
+        solver->picosat = NULL;
+    }
+
+    Py_RETURN_NONE;
 }
 
-static PyTypeObject SolIter_Type = {
+static PyMethodDef
+SolverMethods[] = {
+    {"add_clause", (PyCFunction)_tt_solver_add_clause_method, METH_VARARGS | METH_KEYWORDS, ""},
+    {"add_clauses", (PyCFunction)_tt_solver_add_clauses_method, METH_VARARGS | METH_KEYWORDS, ""},
+    {"solve", (PyCFunction)_tt_solver_solve, METH_VARARGS | METH_KEYWORDS, ""},
+    {"model", (PyCFunction)_tt_solver_model, METH_NOARGS, ""},
+    {"new_var", (PyCFunction)_tt_solver_new_var, METH_NOARGS, ""},
+    {"num_vars", (PyCFunction)_tt_solver_num_vars, METH_NOARGS, ""},
+    {"close", (PyCFunction)_tt_solver_close, METH_NOARGS, ""},
+    {NULL, NULL, 0, NULL}  /* sentinel */
+};
+
+static PyTypeObject Solver_Type = {
 
 #ifdef TT_IS_PYTHON_3
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -441,11 +1727,11 @@ static PyTypeObject SolIter_Type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        // ob_size
 #endif
-    "soliter",                                // tp_name
-    sizeof(soliter_obj),                      // tp_basicsize
+    "tt._clibs.picosat.Solver",               // tp_name
+    sizeof(solver_obj),                       // tp_basicsize
     0,                                        // tp_itemsize
     // methods
-    (destructor) _tt_soliter_dealloc,         // tp_dealloc
+    (destructor) _tt_solver_dealloc,          // tp_dealloc
     0,                                        // tp_print
     0,                                        // tp_getattr
     0,                                        // tp_setattr
@@ -460,15 +1746,25 @@ static PyTypeObject SolIter_Type = {
     PyObject_GenericGetAttr,                  // tp_getattro
     0,                                        // tp_setattro
     0,                                        // tp_as_buffer
-    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,  // tp_flags
+    Py_TPFLAGS_DEFAULT,                       // tp_flags
     0,                                        // tp_doc
-    (traverseproc) _tt_soliter_traverse,      // tp_traverse
+    0,                                        // tp_traverse
     0,                                        // tp_clear
     0,                                        // tp_richcompare
     0,                                        // tp_weaklistoffset
-    PyObject_SelfIter,                        // tp_iter
-    (iternextfunc) _tt_soliter_next,          // tp_iternext
-    0                                         // tp_methods
+    0,                                        // tp_iter
+    0,                                        // tp_iternext
+    SolverMethods,                            // tp_methods
+    0,                                        // tp_members
+    0,                                        // tp_getset
+    0,                                        // tp_base
+    0,                                        // tp_dict
+    0,                                        // tp_descr_get
+    0,                                        // tp_descr_set
+    0,                                        // tp_dictoffset
+    0,                                        // tp_init
+    0,                                        // tp_alloc
+    _tt_solver_new                            // tp_new
 
 };
 
@@ -478,7 +1774,9 @@ static PyTypeObject SolIter_Type = {
 //
 
 /**
- * Module-exposed method for finding a single, satisfiable solution.
+ * Module-exposed method for finding a single, satisfiable solution, within
+ * optional decision, propagation, and time limits. The solver's statistics
+ * are reported to an optional stats callback once solving finishes.
  *
  *  Returns:
  *    List[int] of literals if a solution was found.
@@ -487,23 +1785,52 @@ static PyTypeObject SolIter_Type = {
  *  Raises:
  *    TypeError:  If non-integer are passed as literals.
  *    ValueError: If integers equal to zero are passed as literals.
+ *    tt.errors.SolverLimitError: If a limit is reached before a result.
  */
 static PyObject *
 sat_one(PyObject * self, PyObject * args, PyObject * kwds)
 {
+    static char * keywords[] = {"clauses", "assumptions", "decision_limit",
+                                "propagation_limit", "timeout",
+                                "stats_callback", NULL};
+
     PicoSAT * picosat;
+    PyObject * clauses;             // List[List[int]]
+    PyObject * assumptions = NULL;  // List[int]
+    PyObject * decision_limit = NULL;       // int
+    PyObject * propagation_limit = NULL;    // int
+    PyObject * timeout = NULL;              // float
+    PyObject * stats_callback = NULL;       // callable
     PyObject * ret;
+    tt_limits limits;
+    double seconds = 0.0;
     int picosat_result;
 
-    picosat = _tt_setup_picosat(args, kwds, NULL);
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|OOOOO", keywords,
+                                     &clauses, &assumptions, &decision_limit,
+                                     &propagation_limit, &timeout,
+                                     &stats_callback))
+        return NULL;
+
+    if (_tt_parse_limits(decision_limit, propagation_limit, timeout,
+                         &limits) < 0)
+        return NULL;
+
+    picosat = _tt_setup_picosat(clauses, assumptions, NULL);
     if (picosat == NULL)
         return NULL;
 
     // run PicoSAT w/o the GIL
     Py_BEGIN_ALLOW_THREADS
-    picosat_result = picosat_sat(picosat, -1);
+    picosat_result = _tt_picosat_sat(picosat, &limits, &seconds);
     Py_END_ALLOW_THREADS
 
+    if (_tt_report_stats(stats_callback, picosat, 0, 0, seconds) < 0)
+    {
+        picosat_reset(picosat);
+        return NULL;
+    }
+
     switch (picosat_result)
     {
         case PICOSAT_SATISFIABLE:
@@ -517,7 +1844,7 @@ sat_one(PyObject * self, PyObject * args, PyObject * kwds)
 
         case PICOSAT_UNKNOWN:
             picosat_reset(picosat);
-            PyErr_SetString(PyExc_RuntimeError, "PicoSAT unable to solve");
+            _tt_set_limit_error();
             return NULL;
 
         default:
@@ -527,31 +1854,505 @@ sat_one(PyObject * self, PyObject * args, PyObject * kwds)
     }
 }
 
+static int * _tt_assumptions_to_lits(PyObject * assumptions, int * max_var);
+
+/**
+ * Parse the name of a solution format into one of the TT_SOL_FORMAT_* values.
+ *
+ * Returns -1 on error.
+ */
+static int
+_tt_parse_sol_format(const char * format)
+{
+    if (strcmp(format, "lits") == 0)
+        return TT_SOL_FORMAT_LITS;
+    else if (strcmp(format, "bytes") == 0)
+        return TT_SOL_FORMAT_BYTES;
+    else if (strcmp(format, "int") == 0)
+        return TT_SOL_FORMAT_INT;
+
+    PyErr_SetString(PyExc_ValueError, "format must be one of \"lits\", \"bytes\", or \"int\"");
+    return -1;
+}
+
+/**
+ * Parse the number of models per chunk (or None) into a chunk size, which is
+ * 0 if solutions are not chunked.
+ *
+ * Returns -1 on error.
+ */
+static Py_ssize_t
+_tt_parse_chunk_size(PyObject * chunk_size, int format)
+{
+    Py_ssize_t n;
+
+    if (chunk_size == NULL || chunk_size == Py_None)
+        return 0;
+
+    if (!IS_INT(chunk_size) || PyBool_Check(chunk_size))
+    {
+        PyErr_SetString(PyExc_TypeError, "chunk_size must be an int");
+        return -1;
+    }
+
+    n = PyNumber_AsSsize_t(chunk_size, PyExc_OverflowError);
+    if (n == -1 && PyErr_Occurred())
+    {
+        if (PyErr_ExceptionMatches(PyExc_OverflowError))
+        {
+            PyErr_Clear();
+            PyErr_SetString(PyExc_ValueError, "chunk_size is too large");
+        }
+        return -1;
+    }
+
+    if (n < 1)
+    {
+        PyErr_SetString(PyExc_ValueError, "chunk_size must be positive");
+        return -1;
+    }
+    else if (format != TT_SOL_FORMAT_BYTES)
+    {
+        PyErr_SetString(PyExc_ValueError, "chunk_size requires the \"bytes\" format");
+        return -1;
+    }
+
+    return n;
+}
+
 /**
  * Return an instance of the custom solution iterator type.
  *
- * Accepts the same arguments as the `sat_one` method.
+ * Accepts the same arguments as the `sat_one` method, along with an optional
+ * list of variables to project solutions onto, the name of the format of
+ * each solution ("lits", "bytes", or "int"), and an optional number of
+ * "bytes" solutions to pack into each item returned by the iterator. The
+ * stats callback is called with the statistics of the whole enumeration once
+ * iteration stops.
  */
 static PyObject *
 sat_all(PyObject * self, PyObject * args, PyObject * kwds)
 {
+    static char * keywords[] = {"clauses", "assumptions", "project", "format",
+                                "chunk_size", "decision_limit",
+                                "propagation_limit", "timeout",
+                                "stats_callback", NULL};
+
     soliter_obj * iter;
+    PyObject * clauses;             // List[List[int]]
+    PyObject * assumptions = NULL;  // List[int]
+    PyObject * project = NULL;      // List[int]
+    const char * format_name = "lits";
+    PyObject * chunk_size_obj = NULL;   // int
+    PyObject * decision_limit = NULL;       // int
+    PyObject * propagation_limit = NULL;    // int
+    PyObject * timeout = NULL;              // float
+    PyObject * stats_callback = NULL;       // callable
+    tt_limits limits;
+    int format, max_var;
+    Py_ssize_t chunk_size;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|OOsOOOOO", keywords,
+                                     &clauses, &assumptions, &project,
+                                     &format_name, &chunk_size_obj,
+                                     &decision_limit, &propagation_limit,
+                                     &timeout, &stats_callback))
+        return NULL;
+
+    if (_tt_parse_limits(decision_limit, propagation_limit, timeout,
+                         &limits) < 0)
+        return NULL;
+
+    format = _tt_parse_sol_format(format_name);
+    if (format < 0)
+        return NULL;
+
+    chunk_size = _tt_parse_chunk_size(chunk_size_obj, format);
+    if (chunk_size < 0)
+        return NULL;
 
     iter = PyObject_GC_New(soliter_obj, &SolIter_Type);
     if (iter == NULL)
         return NULL;
 
-    iter->picosat = _tt_setup_picosat(args, kwds, iter);
+    iter->assumptions = NULL;
+    iter->stats_callback = NULL;
+    iter->project = NULL;
+    iter->num_project = 0;
+    iter->format = format;
+    iter->chunk_size = chunk_size;
+    iter->exhausted = 0;
+    iter->limit_reached = 0;
+    iter->busy = 0;
+    iter->limits = limits;
+    iter->seconds = 0.0;
+    iter->_block_lits = NULL;
+    iter->_assumption_lits = NULL;
+
+    iter->picosat = _tt_setup_picosat(clauses, assumptions, iter);
     if (iter->picosat == NULL)
+    {
+        Py_DECREF(iter);
+        return NULL;
+    }
+
+    if (project != NULL && project != Py_None &&
+            _tt_parse_project(iter->picosat, project, iter) < 0)
+    {
+        Py_DECREF(iter);
         return NULL;
+    }
+
+    // chunks are solved w/o the GIL, so need assumptions that can be re-added
+    // without touching Python objects
+    if (chunk_size > 0 && iter->assumptions != Py_None)
+    {
+        max_var = 0;
+        iter->_assumption_lits = _tt_assumptions_to_lits(iter->assumptions,
+                                                         &max_var);
+        if (iter->_assumption_lits == NULL)
+        {
+            Py_DECREF(iter);
+            return NULL;
+        }
+    }
+
+    if (stats_callback != NULL && stats_callback != Py_None)
+    {
+        Py_INCREF(stats_callback);
+        iter->stats_callback = stats_callback;
+    }
 
-    iter->_temp_mem = NULL;
     PyObject_GC_Track(iter);
 
     return (PyObject *)iter;
 }
 
 
+/**
+ * Convert a Python list of assumptions (or None) into a PyMem-allocated,
+ * zero-terminated array of literals, tracking the largest variable seen.
+ *
+ * Returns NULL on error.
+ */
+static int *
+_tt_assumptions_to_lits(PyObject * assumptions, int * max_var)
+{
+    Py_ssize_t i, n;
+    PyObject * literal;
+    int * lits;
+
+    if (assumptions == Py_None)
+        n = 0;
+    else if (PyList_Check(assumptions))
+        n = PyList_GET_SIZE(assumptions);
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "assumption_lists must be a list of lists of non-zero ints");
+        return NULL;
+    }
+
+    lits = PyMem_Malloc((n + 1) * sizeof(int));
+    if (lits == NULL)
+    {
+        PyErr_NoMemory();
+        return NULL;
+    }
+
+    for (i = 0; i < n; ++i)
+    {
+        literal = PyList_GET_ITEM(assumptions, i);
+        if (!IS_INT(literal))
+        {
+            PyMem_Free(lits);
+            PyErr_SetString(PyExc_TypeError, "All assumption literals expected to be ints");
+            return NULL;
+        }
+
+        if (_tt_int_to_lit(literal, &lits[i]) < 0)
+        {
+            PyMem_Free(lits);
+            return NULL;
+        }
+
+        if (lits[i] == 0)
+        {
+            PyMem_Free(lits);
+            PyErr_SetString(PyExc_ValueError, "All assumption literals must be non-zero");
+            return NULL;
+        }
+
+        if (abs(lits[i]) > *max_var)
+            *max_var = abs(lits[i]);
+    }
+
+    lits[n] = 0;
+    return lits;
+}
+
+/**
+ * Module-exposed method for solving one set of clauses under each of a list of
+ * assumption lists.
+ *
+ * The clauses are loaded into a single PicoSAT instance, which then solves
+ * under each list of assumptions in turn, without the GIL for the whole batch.
+ * The statistics of the whole batch are reported to an optional stats
+ * callback.
+ *
+ *  Returns:
+ *    List of, for each list of assumptions, a List[int] of literals if a
+ *    solution was found or None if no solution was found.
+ *
+ *  Raises:
+ *    TypeError:  If non-integer are passed as literals.
+ *    ValueError: If integers equal to zero are passed as literals.
+ */
+static PyObject *
+sat_batch(PyObject * self, PyObject * args, PyObject * kwds)
+{
+    static char * keywords[] = {"clauses", "assumption_lists",
+                                "stats_callback", NULL};
+
+    PicoSAT * picosat;
+    PyObject * clauses;           // List[List[int]]
+    PyObject * assumption_lists;  // List[List[int] or None]
+    PyObject * stats_callback = NULL;  // callable
+    PyObject * ret = NULL;
+    PyObject * model;
+    PyObject * literal;
+    int ** all_lits = NULL;
+    int * results = NULL;
+    signed char * models = NULL;
+    int * lit;
+    int max_var, num_vars, v;
+    Py_ssize_t i, j, num_lists, num_converted = 0;
+    double start, seconds;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OO|O", keywords,
+                                     &clauses, &assumption_lists,
+                                     &stats_callback))
+        return NULL;
+
+    if (!PyList_Check(assumption_lists))
+    {
+        PyErr_SetString(PyExc_TypeError, "assumption_lists must be a list of lists of non-zero ints");
+        return NULL;
+    }
+
+    picosat = _tt_setup_picosat(clauses, NULL, NULL);
+    if (picosat == NULL)
+        return NULL;
+
+    num_lists = PyList_GET_SIZE(assumption_lists);
+    all_lits = PyMem_Malloc((num_lists + 1) * sizeof(int *));
+    results = PyMem_Malloc((num_lists + 1) * sizeof(int));
+    if (all_lits == NULL || results == NULL)
+    {
+        PyErr_NoMemory();
+        goto cleanup;
+    }
+
+    max_var = picosat_variables(picosat);
+    for (num_converted = 0; num_converted < num_lists; ++num_converted)
+    {
+        all_lits[num_converted] = _tt_assumptions_to_lits(
+            PyList_GET_ITEM(assumption_lists, num_converted), &max_var);
+        if (all_lits[num_converted] == NULL)
+            goto cleanup;
+    }
+
+    // make every model the same size, even when assumptions introduce
+    // variables not present in the clauses
+    picosat_adjust(picosat, max_var);
+    num_vars = picosat_variables(picosat);
+    models = PyMem_Malloc(num_lists * num_vars + 1);
+    if (models == NULL)
+    {
+        PyErr_NoMemory();
+        goto cleanup;
+    }
+
+    // run the whole batch w/o the GIL
+    Py_BEGIN_ALLOW_THREADS
+    start = _tt_monotonic_time();
+    for (i = 0; i < num_lists; ++i)
+    {
+        for (lit = all_lits[i]; *lit; ++lit)
+            picosat_assume(picosat, *lit);
+
+        results[i] = picosat_sat(picosat, -1);
+        if (results[i] == PICOSAT_SATISFIABLE)
+        {
+            for (v = 1; v <= num_vars; ++v)
+                models[i * num_vars + v - 1] =
+                    (signed char)picosat_deref(picosat, v);
+        }
+    }
+    seconds = _tt_monotonic_time() - start;
+    Py_END_ALLOW_THREADS
+
+    if (_tt_report_stats(stats_callback, picosat, 0, 0, seconds) < 0)
+        goto cleanup;
+
+    ret = PyList_New(num_lists);
+    if (ret == NULL)
+        goto cleanup;
+
+    for (i = 0; i < num_lists; ++i)
+    {
+        if (results[i] == PICOSAT_UNSATISFIABLE)
+        {
+            Py_INCREF(Py_None);
+            PyList_SET_ITEM(ret, i, Py_None);
+            continue;
+        }
+        else if (results[i] != PICOSAT_SATISFIABLE)
+        {
+            PyErr_SetString(PyExc_RuntimeError, "PicoSAT unable to solve");
+            Py_CLEAR(ret);
+            goto cleanup;
+        }
+
+        model = PyList_New(num_vars);
+        if (model == NULL)
+        {
+            Py_CLEAR(ret);
+            goto cleanup;
+        }
+
+        for (v = 1; v <= num_vars; ++v)
+        {
+            literal = PyInt_FromLong((long)(models[i * num_vars + v - 1] * v));
+            if (literal == NULL)
+            {
+                Py_DECREF(model);
+                Py_CLEAR(ret);
+                goto cleanup;
+            }
+
+            // steals the reference to literal
+            PyList_SET_ITEM(model, v - 1, literal);
+        }
+
+        // steals the reference to model
+        PyList_SET_ITEM(ret, i, model);
+    }
+
+cleanup:
+    if (all_lits != NULL)
+    {
+        for (j = 0; j < num_converted; ++j)
+            PyMem_Free(all_lits[j]);
+        PyMem_Free(all_lits);
+    }
+    PyMem_Free(results);
+    PyMem_Free(models);
+    picosat_reset(picosat);
+    return ret;
+}
+
+/**
+ * Module-exposed method for finding which assumptions make clauses
+ * unsatisfiable, known as the failed assumptions. If minimal is true, they
+ * are then reduced with further solves until none can be dropped without the
+ * clauses becoming satisfiable.
+ *
+ *  Returns:
+ *    List[int] of the failed assumptions, if the clauses are unsatisfiable
+ *    under the assumptions; it is empty if the clauses are unsatisfiable
+ *    without any.
+ *    None, if the clauses are satisfiable under the assumptions.
+ *
+ *  Raises:
+ *    TypeError:  If non-integer are passed as literals.
+ *    ValueError: If integers equal to zero are passed as literals.
+ */
+static PyObject *
+failed_assumptions(PyObject * self, PyObject * args, PyObject * kwds)
+{
+    static char * keywords[] = {"clauses", "assumptions", "minimal",
+                                "stats_callback", NULL};
+
+    PicoSAT * picosat;
+    PyObject * clauses;             // List[List[int]]
+    PyObject * assumptions;         // List[int]
+    PyObject * minimal_obj = NULL;  // bool
+    PyObject * stats_callback = NULL;  // callable
+    PyObject * ret = NULL;
+    PyObject * literal;
+    const int * failed = NULL;
+    int minimal, picosat_result;
+    Py_ssize_t i, n;
+    double start, seconds;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OO|OO", keywords,
+                                     &clauses, &assumptions, &minimal_obj,
+                                     &stats_callback))
+        return NULL;
+
+    minimal = minimal_obj == NULL ? 0 : PyObject_IsTrue(minimal_obj);
+    if (minimal < 0)
+        return NULL;
+
+    picosat = _tt_setup_picosat(clauses, assumptions, NULL);
+    if (picosat == NULL)
+        return NULL;
+
+    // run PicoSAT w/o the GIL, including any further solves for minimizing
+    Py_BEGIN_ALLOW_THREADS
+    start = _tt_monotonic_time();
+    picosat_result = picosat_sat(picosat, -1);
+    if (picosat_result == PICOSAT_UNSATISFIABLE)
+    {
+        if (minimal)
+            failed = picosat_mus_assumptions(picosat, NULL, NULL, 0);
+        else
+            failed = picosat_failed_assumptions(picosat);
+    }
+    seconds = _tt_monotonic_time() - start;
+    Py_END_ALLOW_THREADS
+
+    if (_tt_report_stats(stats_callback, picosat, 0, 0, seconds) < 0)
+        goto cleanup;
+
+    if (picosat_result == PICOSAT_SATISFIABLE)
+    {
+        Py_INCREF(Py_None);
+        ret = Py_None;
+        goto cleanup;
+    }
+    else if (picosat_result != PICOSAT_UNSATISFIABLE)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "PicoSAT returned unexpected value");
+        goto cleanup;
+    }
+
+    for (n = 0; failed[n]; ++n)
+        ;
+
+    ret = PyList_New(n);
+    if (ret == NULL)
+        goto cleanup;
+
+    for (i = 0; i < n; ++i)
+    {
+        literal = PyInt_FromLong((long)failed[i]);
+        if (literal == NULL)
+        {
+            Py_CLEAR(ret);
+            goto cleanup;
+        }
+
+        // steals the reference to literal
+        PyList_SET_ITEM(ret, i, literal);
+    }
+
+cleanup:
+    picosat_reset(picosat);
+    return ret;
+}
+
+
 //
 // Setting up the module
 //
@@ -560,6 +2361,8 @@ static PyMethodDef
 PicosatMethods[] = {
     {"sat_one", (PyCFunction)sat_one, METH_VARARGS | METH_KEYWORDS, ""},
     {"sat_all", (PyCFunction)sat_all, METH_VARARGS | METH_KEYWORDS, ""},
+    {"sat_batch", (PyCFunction)sat_batch, METH_VARARGS | METH_KEYWORDS, ""},
+    {"failed_assumptions", (PyCFunction)failed_assumptions, METH_VARARGS | METH_KEYWORDS, ""},
     {NULL, NULL, 0, NULL}  /* sentinel */
 };
 
@@ -583,6 +2386,13 @@ PyInit_picosat(void)
     if(PyModule_AddIntConstant(m, "VERSION", 965) < 0)
         return NULL;
 
+    if (PyType_Ready(&Solver_Type) < 0)
+        return NULL;
+
+    Py_INCREF(&Solver_Type);
+    if (PyModule_AddObject(m, "Solver", (PyObject *)&Solver_Type) < 0)
+        return NULL;
+
     return m;
 }
 #else
@@ -595,5 +2405,11 @@ initpicosat(void)
     PyObject * m;
     m = Py_InitModule3("picosat", PicosatMethods, "");
     PyModule_AddIntConstant(m, "VERSION", 965);
+
+    if (PyType_Ready(&Solver_Type) < 0)
+        return;
+
+    Py_INCREF(&Solver_Type);
+    PyModule_AddObject(m, "Solver", (PyObject *)&Solver_Type);
 }
 #endif
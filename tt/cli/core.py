@@ -46,7 +46,7 @@ def _tree(opts):
 def _table(opts):
     """Run the ``table`` command."""
     t = TruthTable(opts.expression)
-    print_info(t)
+    t.write(sys.stdout, format=opts.format)
 
 
 def get_parsed_args(args=None):
@@ -103,6 +103,13 @@ def get_parsed_args(args=None):
     parser_table = sub_parsers.add_parser(
         'table',
         help='print the expression\'s truth table')
+    parser_table.add_argument(
+        '--format',
+        action='store',
+        default='grid',
+        choices=['grid', 'csv', 'tsv', 'bits'],
+        help='the format in which to stream the table\'s rows; defaults to\n'
+             'grid')
     _add_expression_arg(parser_table)
     parser_table.set_defaults(func=_table)
 
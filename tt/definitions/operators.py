@@ -12,6 +12,14 @@ class BooleanOperator(object):
         self._default_symbol_str = default_symbol_str
         self._default_plain_english_str = default_plain_english_str
 
+    def __copy__(self):
+        # operators are compared by identity, so copies would never match
+        # the module-level operators
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def __str__(self):
         return self._default_plain_english_str
 
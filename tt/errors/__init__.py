@@ -16,18 +16,23 @@ from .arguments import (  # noqa
     RequiredArgumentError)
 from .evaluation import(  # noqa
     InvalidBooleanValueError,
-    NoEvaluationVariationError)
+    NoEvaluationVariationError,
+    SolverLimitError)
 from .grammar import (  # noqa
     BadParenPositionError,
+    DimacsFormatError,
     EmptyExpressionError,
     ExpressionOrderError,
     InvalidIdentifierError,
     UnbalancedParenError)
 from .state import (  # noqa
+    AlreadyClosedSolverError,
     AlreadyConstrainedSymbolError,
     AlreadyFullTableError,
     RequiresFullTableError,
-    RequiresNormalFormError)
+    RequiresNormalFormError,
+    RequiresSolverContextError,
+    SolverInUseError)
 from .symbols import (  # noqa
     DuplicateSymbolError,
     ExtraSymbolError,
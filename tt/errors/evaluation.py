@@ -44,3 +44,21 @@ class NoEvaluationVariationError(EvaluationError):
 composed only of constant values
 
     """
+
+
+class SolverLimitError(EvaluationError):
+    """An exception for when a SAT solver stops at a limit without a result.
+
+    This is raised when a limit on decisions, propagations, or time given to
+    a satisfiability method is reached before the solver can determine
+    whether a solution exists::
+
+        >>> from tt import BooleanExpression
+        >>> b = BooleanExpression('(A or B) and (not A or C) and (B or not C)')
+        >>> b.sat_one(decision_limit=0)
+        Traceback (most recent call last):
+            ...
+        tt.errors.evaluation.SolverLimitError: PicoSAT reached a limit \
+before finding a result
+
+    """
@@ -55,6 +55,22 @@ class BadParenPositionError(GrammarError):
     """
 
 
+class DimacsFormatError(GrammarError):
+    """An exception type for malformed input in the DIMACS CNF format.
+
+    Here's an example of a clause without its terminating zero::
+
+        >>> import io
+        >>> from tt.satisfiability import dimacs
+        >>> cnf = dimacs.load(io.StringIO('p cnf 2 1\\n1 -2\\n'))
+        Traceback (most recent call last):
+            ...
+        tt.errors.grammar.DimacsFormatError: The last clause is not \
+    terminated by 0
+
+    """
+
+
 class EmptyExpressionError(GrammarError):
     """An exception type for when an empty expression is received.
 
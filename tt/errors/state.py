@@ -25,6 +25,35 @@ constrained multiple times
     """
 
 
+class AlreadyClosedSolverError(StateError):
+    """An exception to be raised when using a SAT solver after closing it.
+
+    .. code-block:: python
+
+        >>> from tt import picosat
+        >>> solver = picosat.Solver()
+        >>> solver.close()
+        >>> solver.solve()
+        Traceback (most recent call last):
+        tt.errors.state.AlreadyClosedSolverError: Cannot use a closed solver
+
+    """
+
+
+class SolverInUseError(StateError):
+    """An exception to be raised when using a SAT solver that is in use.
+
+    PicoSAT solves without holding the GIL, so other threads may run while a
+    :class:`Solver <tt.satisfiability.picosat.Solver>` is solving, or while
+    an iterator from :func:`sat_all <tt.satisfiability.picosat.sat_all>` is
+    finding its next solution. Since a PicoSAT instance can only do one thing
+    at a time, using the same solver or iterator from another thread in the
+    meantime raises this exception, rather than waiting for the solve to
+    finish.
+
+    """
+
+
 class AlreadyFullTableError(StateError):
     """An exception to be raised when attempting to fill an already-full table.
 
@@ -58,6 +87,21 @@ checked on full truth tables
     """
 
 
+class RequiresSolverContextError(StateError):
+    """An exception to be raised when a SAT solver context is required.
+
+    .. code-block:: python
+
+        >>> from tt import picosat
+        >>> solver = picosat.Solver()
+        >>> solver.pop()
+        Traceback (most recent call last):
+        tt.errors.state.RequiresSolverContextError: There is no pushed \
+context to pop
+
+    """
+
+
 class RequiresNormalFormError(StateError):
     """An exception to be raised when expression normal form is required.
 
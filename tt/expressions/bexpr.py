@@ -1,8 +1,11 @@
 """Tools for interacting with Boolean expressions."""
 
+import itertools
 import re
+import sys
 
 from contextlib import contextmanager
+from threading import Lock
 
 from tt._assertions import (
     assert_all_valid_keys,
@@ -26,7 +29,10 @@ from tt.errors import (
     NoEvaluationVariationError,
     UnbalancedParenError)
 from tt.satisfiability import (
+    dimacs,
     picosat)
+from tt.satisfiability._model_counting import count_models
+from tt.satisfiability._tseitin import TseitinEncoder
 from tt.trees import (
     BinaryOperatorExpressionTreeNode,
     ExpressionTreeNode,
@@ -34,6 +40,14 @@ from tt.trees import (
     UnaryOperatorExpressionTreeNode)
 
 
+_SUPPORT_METHODS = ('auto', 'table', 'sat')
+_MAX_AUTO_TABLE_SUPPORT_SYMBOLS = 20
+
+_COUNT_SAT_METHODS = ('auto', 'table', 'sat')
+_SAT_ALL_FORMATS = ('values', 'int', 'bytes', 'bits')
+_MAX_AUTO_TABLE_COUNT_SAT_SYMBOLS = 20
+
+
 class BooleanExpression(object):
 
     """An interface for interacting with a Boolean expression.
@@ -122,6 +136,9 @@ class BooleanExpression(object):
         self._tree = ExpressionTreeNode.build_tree(self._postfix_tokens)
         self._constraints = {}
         self._constrained_symbol_set = set()
+        self._solver = None
+        self._solver_lock = Lock()
+        self._picosat_encoding = None
 
     def _init_from_expr_node(self, expr_node):
         """Initalize this object from an expression node."""
@@ -333,6 +350,48 @@ class BooleanExpression(object):
         """
         return self._tree
 
+    @property
+    def cnf_size(self):
+        """The size of the CNF clauses this expression is solved as.
+
+        This is a tuple of the number of variables and the number of clauses
+        that the satisfiability methods of this expression hand to PicoSAT,
+        to be correlated with the statistics of those solves (see
+        :func:`picosat.add_stats_hook
+        <tt.satisfiability.picosat.add_stats_hook>`). Each constant in the
+        expression takes a variable of its own, and constraints do not add to
+        the size, as they are passed to PicoSAT as assumptions.
+
+        :type: Tuple[:class:`int <python:int>`, :class:`int <python:int>`]
+
+        .. code-block:: python
+
+            >>> from tt import BooleanExpression
+            >>> b = BooleanExpression('A xor B')
+            >>> b.cnf_size
+            (2, 2)
+            >>> b = BooleanExpression('(A or B) and (C or 0)')
+            >>> b.cnf_size
+            (4, 2)
+
+        """
+        clauses, constant_assumptions, symbol_to_index_map, _ = \
+            self._to_picosat_clauses_and_mappings()
+        return (len(symbol_to_index_map) + len(constant_assumptions),
+                len(clauses))
+
+    def __getstate__(self):
+        # a persistent solver (and the lock guarding it) belongs to one
+        # expression and cannot be copied; copies make their own as needed
+        state = self.__dict__.copy()
+        state['_solver'] = None
+        del state['_solver_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._solver_lock = Lock()
+
     def __eq__(self, other):
         if isinstance(other, BooleanExpression):
             return self._tree == other._tree
@@ -401,10 +460,30 @@ class BooleanExpression(object):
             raise InvalidArgumentValueError(
                 'Must specify at least one constraint')
 
-        assert_all_valid_keys(kwargs, self._symbol_set)
+        self._assert_valid_constraints(kwargs)
 
         kwarg_key_set = set(kwargs.keys())
-        conflicts = self._constrained_symbol_set & kwarg_key_set
+        self._constraints.update(kwargs)
+        self._constrained_symbol_set |= kwarg_key_set
+        yield self
+        self._constrained_symbol_set -= kwarg_key_set
+        self._constraints = {}
+
+    def _assert_valid_constraints(self, constraints):
+        """Assert that a dict of constraints may be added to the current
+        constraints.
+
+        :raises AlreadyConstrainedSymbolError: If any of the symbols are
+            already constrained.
+        :raises ExtraSymbolError: If a symbol not in this expression is
+            constrained.
+        :raises InvalidBooleanValueError: If any constrained values are not
+            valid Boolean inputs.
+
+        """
+        assert_all_valid_keys(constraints, self._symbol_set)
+
+        conflicts = self._constrained_symbol_set & set(constraints)
         if conflicts:
             symbols_str = ', '.join('"{}"'.format(s) for s in
                                     sorted(conflicts))
@@ -412,13 +491,8 @@ class BooleanExpression(object):
                 'Symbol' + (' ' if len(conflicts) == 1 else 's ') +
                 symbols_str + ' cannot be constrained multiple times')
 
-        self._constraints.update(kwargs)
-        self._constrained_symbol_set |= kwarg_key_set
-        yield self
-        self._constrained_symbol_set -= kwarg_key_set
-        self._constraints = {}
-
-    def sat_one(self):
+    def sat_one(self, incremental=False, decision_limit=None,
+                propagation_limit=None, timeout=None):
         """Find a combination of inputs that satisfies this expression.
 
         Under the hood, this method is using the functionality exposed in tt's
@@ -447,6 +521,53 @@ class BooleanExpression(object):
             ...
             True
 
+        When satisfying the same expression under many different constraints,
+        pass ``incremental=True``. The expression will then keep a persistent
+        :class:`Solver <tt.satisfiability.picosat.Solver>` loaded with its
+        clauses, so that later incremental calls skip converting the
+        expression to CNF and re-adding its clauses, and can benefit from what
+        the solver learned in earlier calls; only the constraints change from
+        call to call::
+
+            >>> b = BooleanExpression('(A or B) and (B -> C) and (C -> D)')
+            >>> for a in (0, 1):
+            ...     with b.constrain(A=a, D=0):
+            ...         print(b.sat_one(incremental=True))
+            ...
+            None
+            A=1, B=0, C=0, D=0
+
+        For expressions that may be too hard to satisfy in reasonable time,
+        the solver can be limited in the number of decisions or propagations
+        it makes, or in the time it spends. If it reaches a limit before
+        finding a result, :class:`SolverLimitError
+        <tt.errors.evaluation.SolverLimitError>` is raised, rather than
+        ``None`` (which means that no solution exists) being returned::
+
+            >>> from tt.errors import SolverLimitError
+            >>> b = BooleanExpression('(A or B) and (not A or C)')
+            >>> try:
+            ...     b.sat_one(timeout=0.5, decision_limit=0)
+            ... except SolverLimitError:
+            ...     print('Unknown within budget')
+            ...
+            Unknown within budget
+
+        :param incremental: Whether to solve with this expression's persistent
+            solver, creating it on first use.
+        :type incremental: :class:`bool <python:bool>`, optional
+
+        :param decision_limit: The most decisions the solver may make,
+            including those to assume the value of each constrained symbol.
+        :type decision_limit: :class:`int <python:int>`, optional
+
+        :param propagation_limit: The most propagations the solver may make.
+        :type propagation_limit: :class:`int <python:int>`, optional
+
+        :param timeout: The most seconds the solver may spend, which it
+            only checks every 1024 decisions.
+        :type timeout: :class:`float <python:float>`, optional
+
         :returns: :func:`namedtuple <python:collections.namedtuple>`-like
             object representing a satisfying set of values (see
             :func:`boolean_variables_factory \
@@ -456,36 +577,245 @@ class BooleanExpression(object):
         :rtype: :func:`namedtuple <python:collections.namedtuple>`-like object
             or ``None``
 
+        :raises InvalidArgumentTypeError: If any limit is not a number.
+        :raises InvalidArgumentValueError: If any limit is negative.
         :raises NoEvaluationVariationError: If this is an expression of only
             constants.
+        :raises SolverLimitError: If a limit is reached before it is known
+            whether a solution exists.
 
         """
         if not self._symbols:
             raise NoEvaluationVariationError(
                 'Cannot attempt to satisfy an expression of only constants')
 
-        if not (self._symbol_set - self._constrained_symbol_set):
+        if not incremental or not (self._symbol_set -
+                                   self._constrained_symbol_set):
+            return self._sat_one_under(self._constraints,
+                                       decision_limit=decision_limit,
+                                       propagation_limit=propagation_limit,
+                                       timeout=timeout)
+
+        picosat_result, symbol_to_index_map, index_to_symbol_map = \
+            self._incremental_sat_one(decision_limit=decision_limit,
+                                      propagation_limit=propagation_limit,
+                                      timeout=timeout)
+        if picosat_result is None:
+            return None
+
+        result_dict = self._picosat_result_as_dict(
+            picosat_result, symbol_to_index_map, index_to_symbol_map)
+        return self._symbol_vals_factory(**result_dict)
+
+    def _sat_one_under(self, constraints, decision_limit=None,
+                       propagation_limit=None, timeout=None):
+        """Find a solution under the specified constraints and solver limits.
+
+        Unlike :func:`sat_one`, this reads none of this expression's mutable
+        constraint state, so it may be called from several threads at once.
+
+        """
+        if len(constraints) == len(self._symbols):
             # shortcut if all symbols are constrained
-            if self.evaluate_unchecked(**self._constraints):
-                return self._symbol_vals_factory(**self._constraints)
+            if self.evaluate_unchecked(**constraints):
+                return self._symbol_vals_factory(**constraints)
             else:
                 return None
 
-        clauses, assumptions, symbol_to_index_map, index_to_symbol_map = \
-            self._to_picosat_clauses_assumptions_and_symbol_mappings()
+        clauses, constant_assumptions, symbol_to_index_map, \
+            index_to_symbol_map = self._to_picosat_clauses_and_mappings()
+        assumptions = (constant_assumptions +
+                       self._constraint_assumptions(symbol_to_index_map,
+                                                    constraints))
         if not assumptions:
             # cannot pass empty list of assumptions to picosat
             assumptions = None
 
-        picosat_result = picosat.sat_one(clauses, assumptions=assumptions)
+        picosat_result = picosat.sat_one(clauses, assumptions=assumptions,
+                                         decision_limit=decision_limit,
+                                         propagation_limit=propagation_limit,
+                                         timeout=timeout)
         if picosat_result is None:
             return None
 
         result_dict = self._picosat_result_as_dict(
-            picosat_result, symbol_to_index_map, index_to_symbol_map)
+            picosat_result, symbol_to_index_map, index_to_symbol_map,
+            constraints)
         return self._symbol_vals_factory(**result_dict)
 
-    def sat_all(self):
+    def sat_one_many(self, constraint_dicts):
+        """Find a satisfying combination of inputs under each of several sets
+        of constraints.
+
+        The result for each set of constraints is what :func:`sat_one` would
+        return from within a :func:`constrain` context manager imposing those
+        constraints, but all sets are solved in a single batch with
+        :func:`picosat.sat_batch <tt.satisfiability.picosat.sat_batch>`, which
+        is much faster than calling :func:`sat_one` for each of them::
+
+            >>> from tt import BooleanExpression
+            >>> b = BooleanExpression('(A or B) and (B -> C) and (C -> D)')
+            >>> for sol in b.sat_one_many([{'A': 0}, {'A': 0, 'D': 0}, {}]):
+            ...     print(sol)
+            ...
+            A=0, B=1, C=1, D=1
+            None
+            A=0, B=1, C=1, D=1
+
+        Solutions are found incrementally by a single solver, so when there
+        are several solutions under some constraints, the one returned may
+        differ from the one :func:`sat_one` would find.
+
+        Each set of constraints applies in addition to any constraints already
+        imposed with :func:`constrain`::
+
+            >>> with b.constrain(B=0):
+            ...     print(b.sat_one_many([{'C': 0}, {'C': 1}]))
+            ...
+            [<BooleanValues [A=1, B=0, C=0, D=1]>, \
+<BooleanValues [A=1, B=0, C=1, D=1]>]
+
+        :param constraint_dicts: Dicts mapping symbols of this expression to
+            their constrained values, one dict per solve.
+        :type constraint_dicts: List[Dict[:class:`str <python:str>`, \
+            :class:`bool <python:bool>` or :class:`int <python:int>`]]
+
+        :returns: A list holding, for each dict of constraints in order, a
+            :func:`namedtuple <python:collections.namedtuple>`-like object
+            representing a satisfying set of inputs or ``None`` if no solution
+            exists under those constraints.
+        :rtype: List[:func:`namedtuple <python:collections.namedtuple>`-like
+            object or ``None``]
+
+        :raises AlreadyConstrainedSymbolError: If a dict constrains a symbol
+            already constrained with :func:`constrain`.
+        :raises ExtraSymbolError: If a symbol not in this expression appears
+            in a dict.
+        :raises InvalidArgumentTypeError: If ``constraint_dicts`` is not a list
+            of dicts.
+        :raises InvalidBooleanValueError: If any values in a dict are not valid
+            Boolean inputs.
+        :raises NoEvaluationVariationError: If this is an expression of only
+            constants.
+
+        """
+        if not isinstance(constraint_dicts, list) or not all(
+                isinstance(d, dict) for d in constraint_dicts):
+            raise InvalidArgumentTypeError(
+                '`constraint_dicts` must be a list of dicts')
+
+        if not self._symbols:
+            raise NoEvaluationVariationError(
+                'Cannot attempt to satisfy an expression of only constants')
+
+        results = [None] * len(constraint_dicts)
+        pending = []
+        for i, constraint_dict in enumerate(constraint_dicts):
+            self._assert_valid_constraints(constraint_dict)
+
+            constraints = dict(self._constraints, **constraint_dict)
+            if len(constraints) < len(self._symbols):
+                pending.append((i, constraints))
+            elif self.evaluate_unchecked(**constraints):
+                # shortcut if all symbols are constrained
+                results[i] = self._symbol_vals_factory(**constraints)
+
+        if not pending:
+            return results
+
+        clauses, constant_assumptions, symbol_to_index_map, \
+            index_to_symbol_map = self._to_picosat_clauses_and_mappings()
+        assumption_lists = [
+            constant_assumptions +
+            self._constraint_assumptions(symbol_to_index_map, constraints)
+            for _, constraints in pending]
+
+        picosat_results = picosat.sat_batch(clauses, assumption_lists)
+        for (i, constraints), picosat_result in zip(pending,
+                                                    picosat_results):
+            if picosat_result is not None:
+                result_dict = self._picosat_result_as_dict(
+                    picosat_result, symbol_to_index_map, index_to_symbol_map,
+                    constraints)
+                results[i] = self._symbol_vals_factory(**result_dict)
+
+        return results
+
+    def unsat_constraints(self, minimal=False):
+        """Find the constraints responsible for this expression being
+        unsatisfiable.
+
+        When :func:`sat_one` returns ``None`` under constraints imposed with
+        :func:`constrain`, this finds which of the constraints the solver
+        needed to prove that no solution exists, in a single solve (by way of
+        :func:`picosat.failed_assumptions
+        <tt.satisfiability.picosat.failed_assumptions>`)::
+
+            >>> from tt import BooleanExpression
+            >>> b = BooleanExpression('(A or B) and (B -> C) and (C -> D)')
+            >>> with b.constrain(A=0, C=1, D=0):
+            ...     b.sat_one() is None
+            ...
+            True
+            >>> with b.constrain(A=0, C=1, D=0):
+            ...     b.unsat_constraints()
+            ...
+            {'A': 0, 'D': 0}
+
+        The expression remains unsatisfiable under the returned constraints
+        alone. They are not necessarily minimal, however, so pass
+        ``minimal=True`` to have them reduced, with a further solve per
+        constraint, until dropping any one of them would make the expression
+        satisfiable::
+
+            >>> b = BooleanExpression(
+            ...     '(A or B or C) and (A -> D) and (B -> D) and (C -> D)')
+            >>> with b.constrain(A=0, C=0, D=0):
+            ...     print(b.unsat_constraints())
+            ...     print(b.unsat_constraints(minimal=True))
+            ...
+            {'A': 0, 'C': 0, 'D': 0}
+            {'D': 0}
+
+        :param minimal: Whether to reduce the constraints to a minimal set.
+        :type minimal: :class:`bool <python:bool>`, optional
+
+        :returns: If no solution exists under the current constraints, a dict
+            mapping the responsible symbols (in order of appearance in this
+            expression) to their constrained values, which is empty if this
+            expression is unsatisfiable without any constraints. Otherwise,
+            ``None``.
+        :rtype: Dict[:class:`str <python:str>`, :class:`bool <python:bool>`
+            or :class:`int <python:int>`] or ``None``
+
+        :raises NoEvaluationVariationError: If this is an expression of only
+            constants.
+
+        """
+        if not self._symbols:
+            raise NoEvaluationVariationError(
+                'Cannot attempt to satisfy an expression of only constants')
+
+        clauses, constant_assumptions, symbol_to_index_map, \
+            index_to_symbol_map = self._to_picosat_clauses_and_mappings()
+        assumptions = (constant_assumptions +
+                       self._constraint_assumptions(symbol_to_index_map))
+        if not assumptions:
+            return {} if picosat.sat_one(clauses) is None else None
+
+        failed = picosat.failed_assumptions(clauses, assumptions,
+                                            minimal=minimal)
+        if failed is None:
+            return None
+
+        # failed assumptions fixing constants are not constraints
+        failed_symbols = set(index_to_symbol_map.get(abs(literal))
+                             for literal in failed)
+        return {symbol: self._constraints[symbol] for symbol in self._symbols
+                if symbol in failed_symbols}
+
+    def sat_all(self, format='values', chunk_size=None, decision_limit=None,
+                propagation_limit=None, timeout=None):
         """Find all combinations of inputs that satisfy this expression.
 
         Under the hood, this method is using the functionality exposed in tt's
@@ -511,17 +841,94 @@ class BooleanExpression(object):
             ...
             A=1, B=0, C=0, D=1
 
+        Creating an object for each solution is costly when enumerating very
+        many of them, so solutions can instead be packed into a bitmask, whose
+        bits hold the values of the symbols in the order of :attr:`symbols`,
+        from the most significant bit down. The ``'int'`` format gives the
+        bitmask as an :class:`int <python:int>`, which is the index of the
+        solution's row in this expression's :class:`TruthTable
+        <tt.tables.truth_table.TruthTable>`; ``'bits'`` gives it as a string
+        of ``0``s and ``1``s; and ``'bytes'`` gives it as big-endian
+        :class:`bytes <python:bytes>`, one byte per eight symbols::
+
+            >>> b.symbols
+            ['A', 'B', 'C', 'D']
+            >>> for solution in b.sat_all(format='bits'):
+            ...     print(solution)
+            ...
+            1010
+            1001
+            0101
+            0110
+            >>> list(b.sat_all(format='int'))
+            [10, 9, 5, 6]
+
+        With the ``'bytes'`` format, several solutions can be packed back to
+        back into chunks, which are each found in one go by PicoSAT::
+
+            >>> list(b.sat_all(format='bytes', chunk_size=3))
+            [b'\\n\\t\\x05', b'\\x06']
+
+        :param format: One of ``'values'`` (the default), ``'int'``,
+            ``'bits'``, or ``'bytes'``, as described above.
+        :type format: :class:`str <python:str>`, optional
+
+        :param chunk_size: The number of solutions to pack into each item of
+            the iterator with the ``'bytes'`` format (fewer for the last
+            item), rather than one solution per item.
+        :type chunk_size: :class:`int <python:int>`, optional
+
+        :param decision_limit: The most decisions the solver may make in
+            finding each solution, including those to assume the value of
+            each constrained symbol.
+        :type decision_limit: :class:`int <python:int>`, optional
+
+        :param propagation_limit: The most propagations the solver may make in
+            finding each solution.
+        :type propagation_limit: :class:`int <python:int>`, optional
+
+        :param timeout: The most seconds the solver may spend in finding each
+            solution, which it only checks every 1024 decisions.
+        :type timeout: :class:`float <python:float>`, optional
+
         :returns: An iterator of
             :func:`namedtuple <python:collections.namedtuple>`-like objects
-            representing satisfying combinations of inputs; if no satisfying
-            solutions exist, the iterator will be empty.
+            representing satisfying combinations of inputs (or of their
+            packed bitmasks); if no satisfying solutions exist, the iterator
+            will be empty.
         :rtype: Iterator[:func:`namedtuple <python:collections.namedtuple>`
-            -like objects]
-
+            -like objects, :class:`int <python:int>`, :class:`str
+            <python:str>`, or :class:`bytes <python:bytes>`]
+
+        :raises InvalidArgumentTypeError: If ``chunk_size`` is not an int, or
+            any limit is not a number.
+        :raises InvalidArgumentValueError: If ``format`` is not one of the
+            supported formats, ``chunk_size`` is not positive, is larger than
+            :data:`sys.maxsize <python:sys.maxsize>` or is given without the
+            ``'bytes'`` format, or any limit is negative.
         :raises NoEvaluationVariationError: If this is an expression of only
             constants.
+        :raises SolverLimitError: If a limit is reached before the next
+            solution is found or ruled out, after which the iterator ends.
 
         """
+        if format not in _SAT_ALL_FORMATS:
+            raise InvalidArgumentValueError(
+                '`format` must be one of ' +
+                ', '.join('"{}"'.format(f) for f in _SAT_ALL_FORMATS))
+
+        if chunk_size is not None:
+            if not isinstance(chunk_size, int) or isinstance(chunk_size, bool):
+                raise InvalidArgumentTypeError('`chunk_size` must be an int')
+            elif chunk_size < 1:
+                raise InvalidArgumentValueError(
+                    '`chunk_size` must be positive')
+            elif chunk_size > sys.maxsize:
+                raise InvalidArgumentValueError('`chunk_size` is too large')
+            elif format != 'bytes':
+                raise InvalidArgumentValueError(
+                    '`chunk_size` requires the "bytes" format')
+
         if not self._symbols:
             raise NoEvaluationVariationError(
                 'Cannot attempt to satisfy an expression of only constants')
@@ -529,28 +936,349 @@ class BooleanExpression(object):
         if not (self._symbol_set - self._constrained_symbol_set):
             # shortcut if all symbols are constrained
             if self.evaluate_unchecked(**self._constraints):
-                yield self._symbol_vals_factory(**self._constraints)
+                if format == 'values':
+                    yield self._symbol_vals_factory(**self._constraints)
+                else:
+                    yield self._pack_solution(self._constraints, format)
             else:
                 # empty iterator
                 while False:
                     yield None
             return
 
+        limits = dict(decision_limit=decision_limit,
+                      propagation_limit=propagation_limit,
+                      timeout=timeout)
+        if format != 'values':
+            for solution in self._sat_all_packed(format, chunk_size,
+                                                 limits):
+                yield solution
+            return
+
         clauses, assumptions, symbol_to_index_map, index_to_symbol_map = \
             self._to_picosat_clauses_assumptions_and_symbol_mappings()
         if not assumptions:
             # cannot pass empty list of assumptions to picosat
             assumptions = None
 
-        for picosat_sol in picosat.sat_all(clauses, assumptions=assumptions):
+        # only block solutions over the expression's symbols, rather than
+        # over every PicoSAT variable (such as those standing in for
+        # constants), so that each distinct solution is found exactly once
+        project = sorted(index_to_symbol_map) or None
+
+        free_combinations = list(
+            self._free_symbol_combinations(symbol_to_index_map))
+        for picosat_sol in picosat.sat_all(clauses, assumptions=assumptions,
+                                           project=project, **limits):
             result_dict = self._picosat_result_as_dict(
                 picosat_sol, symbol_to_index_map, index_to_symbol_map)
-            yield self._symbol_vals_factory(**result_dict)
+            for free_values in free_combinations:
+                result_dict.update(free_values)
+                yield self._symbol_vals_factory(**result_dict)
+
+    def count_sat(self, method='auto'):
+        """Count the combinations of inputs that satisfy this expression.
+
+        This returns the number of solutions that :func:`sat_all` would
+        yield, without enumerating them, so it remains practical for
+        expressions of many symbols with far too many solutions to iterate
+        over::
+
+            >>> from tt import BooleanExpression
+            >>> b = BooleanExpression('(A xor B) and (C xor D)')
+            >>> b.count_sat()
+            4
+            >>> terms = ['(x{} or x{})'.format(i, i + 1)
+            ...          for i in range(0, 60, 2)]
+            >>> b = BooleanExpression(' and '.join(terms))
+            >>> b.count_sat() == 3**30
+            True
+
+        Just like :func:`sat_all`, only solutions obeying any constraints on
+        this expression are counted::
+
+            >>> with b.constrain(x0=0, x2=0):
+            ...     b.count_sat() == 3**28
+            ...
+            True
+
+        The count can be found in two ways. The ``'table'`` method evaluates
+        the expression over every row of its truth table at once with bitwise
+        operations on packed rows, and counts the true rows; this is fast for
+        expressions of a moderate number of symbols, but its memory use
+        doubles with each symbol. The ``'sat'`` method instead counts the
+        models of a Tseitin encoding of the expression into clauses, with a
+        DPLL-style search that counts independent parts of the clauses
+        separately and caches the counts of parts it has already seen.
+
+        :param method: One of ``'table'``, ``'sat'``, or ``'auto'`` (the
+            default), which uses the table method for expressions of up to 20
+            symbols and the SAT method for larger ones.
+        :type method: :class:`str <python:str>`, optional
+
+        :returns: The number of satisfying combinations of inputs.
+        :rtype: :class:`int <python:int>`
+
+        :raises InvalidArgumentValueError: If ``method`` is not one of the
+            supported methods.
+        :raises NoEvaluationVariationError: If this is an expression of only
+            constants.
+
+        """
+        if method not in _COUNT_SAT_METHODS:
+            raise InvalidArgumentValueError(
+                '`method` must be one of ' +
+                ', '.join('"{}"'.format(m) for m in _COUNT_SAT_METHODS))
+
+        if not self._symbols:
+            raise NoEvaluationVariationError(
+                'Cannot attempt to satisfy an expression of only constants')
+
+        if not (self._symbol_set - self._constrained_symbol_set):
+            # shortcut if all symbols are constrained
+            return int(bool(self.evaluate_unchecked(**self._constraints)))
+
+        if method == 'auto':
+            num_symbols = len(self._symbols)
+            method = ('table'
+                      if num_symbols <= _MAX_AUTO_TABLE_COUNT_SAT_SYMBOLS
+                      else 'sat')
+
+        if method == 'table':
+            # imported here, as tt.tables depends on this module
+            from tt.tables._bit_parallel import BitParallelEvaluator
+            from tt.tables._bitplanes import (
+                all_rows_mask,
+                popcount,
+                row_bit_mask)
+
+            num_symbols = len(self._symbols)
+            num_rows = 2**num_symbols
+            rows = BitParallelEvaluator(self._symbols).evaluate(self._tree)
+            for pos, symbol in enumerate(self._symbols):
+                if symbol in self._constraints:
+                    symbol_rows = row_bit_mask(num_symbols - 1 - pos, num_rows)
+                    if not self._constraints[symbol]:
+                        symbol_rows ^= all_rows_mask(num_rows)
+                    rows &= symbol_rows
+            return popcount(rows)
+
+        # each Tseitin gate variable is fixed by the values of its inputs, so
+        # the encoding has exactly one model per satisfying input combination;
+        # inputs are numbered first, so they are branched on before any gates
+        encoder = TseitinEncoder()
+        literals = {symbol: (bool(self._constraints[symbol])
+                             if symbol in self._constraints else
+                             encoder.new_var())
+                    for symbol in self._symbols}
+        num_free_symbols = encoder.num_vars
+
+        out = encoder.encode(self._tree, literals)
+        if isinstance(out, bool):
+            return (1 << num_free_symbols) if out else 0
+
+        return count_models(encoder.clauses + [[out]], encoder.num_vars)
+
+    def to_dimacs(self, fp):
+        """Write this expression to a file in the DIMACS CNF format.
+
+        The clauses written are those of this expression's conversion to CNF,
+        with any constants simplified away. Each symbol is numbered by its
+        position in :attr:`symbols`, and the numbering is recorded in comments
+        of the form ``symbol <variable> <name>``, which :func:`load
+        <tt.satisfiability.dimacs.load>` reads back into the
+        :attr:`symbol_names <tt.satisfiability.dimacs.DimacsCnf.symbol_names>`
+        of the loaded clauses::
+
+            >>> import io
+            >>> from tt import BooleanExpression
+            >>> from tt.satisfiability import dimacs
+            >>> b = BooleanExpression('(A or B) and (not B or C) and 1')
+            >>> with io.StringIO() as fp:
+            ...     b.to_dimacs(fp)
+            ...     print(fp.getvalue(), end='')
+            ...
+            c symbol 1 A
+            c symbol 2 B
+            c symbol 3 C
+            p cnf 3 2
+            1 2 0
+            -2 3 0
+            >>> with io.StringIO() as fp:
+            ...     b.to_dimacs(fp)
+            ...     _ = fp.seek(0)
+            ...     cnf = dimacs.load(fp)
+            ...
+            >>> print(cnf.to_expression())
+            (A or B) and (not B or C)
+
+        Any constraints on this expression are not written.
+
+        :param fp: The file to write to, opened in text mode.
+        :type fp: file object
+
+        :raises NoEvaluationVariationError: If this is an expression of only
+            constants.
+
+        """
+        if not self._symbols:
+            raise NoEvaluationVariationError(
+                'Cannot write an expression of only constants as DIMACS')
+
+        clauses, constant_assumptions, _, index_to_symbol_map = \
+            self._to_picosat_clauses_and_mappings()
+        true_constants = set(constant_assumptions)
+        false_constants = {-lit for lit in constant_assumptions}
+        symbol_vars = {symbol: var
+                       for var, symbol in enumerate(self._symbols, start=1)}
+
+        dimacs_clauses = []
+        for clause in clauses:
+            if any(lit in true_constants for lit in clause):
+                continue
+
+            dimacs_clause = []
+            for lit in clause:
+                if lit in false_constants:
+                    continue
+                var = symbol_vars[index_to_symbol_map[abs(lit)]]
+                dimacs_clause.append(var if lit > 0 else -var)
+
+            if not dimacs_clause:
+                # a clause of only false constants is unsatisfiable
+                dimacs_clauses = [[1], [-1]]
+                break
+            dimacs_clauses.append(dimacs_clause)
+
+        comments = ['symbol {} {}'.format(var, symbol)
+                    for symbol, var in symbol_vars.items()]
+        dimacs.dump(dimacs_clauses, fp, num_vars=len(self._symbols),
+                    comments=comments)
+
+    def _sat_all_packed(self, format, chunk_size, limits):
+        """Iterate over packed solutions, in any format other than values."""
+        clauses, assumptions, symbol_to_index_map, _ = \
+            self._to_picosat_clauses_assumptions_and_symbol_mappings()
+
+        if len(symbol_to_index_map) == len(self._symbols):
+            # projecting onto the symbols in order has PicoSAT pack each
+            # solution into the expression's own bitmask
+            project = [symbol_to_index_map[symbol]
+                       for symbol in self._symbols]
+            solutions = picosat.sat_all(
+                clauses, assumptions=assumptions or None, project=project,
+                format='int' if format == 'bits' else format,
+                chunk_size=chunk_size, **limits)
+
+            if format == 'bits':
+                num_symbols = len(self._symbols)
+                for solution in solutions:
+                    yield '{:0{}b}'.format(solution, num_symbols)
+            else:
+                for solution in solutions:
+                    yield solution
+            return
+
+        # otherwise, PicoSAT packs solutions over the symbols in the clauses,
+        # whose bits are spread out to their positions in the full bitmask
+        # and combined with each combination of values of the others
+        num_symbols = len(self._symbols)
+        bits = [num_symbols - 1 - pos
+                for pos, symbol in enumerate(self._symbols)
+                if symbol in symbol_to_index_map]
+        free_masks = [self._symbol_values_mask(free_values)
+                      for free_values in
+                      self._free_symbol_combinations(symbol_to_index_map)]
+        project = [symbol_to_index_map[symbol] for symbol in self._symbols
+                   if symbol in symbol_to_index_map] or None
+
+        chunk = []
+        for solution in picosat.sat_all(clauses,
+                                        assumptions=assumptions or None,
+                                        project=project, format='int',
+                                        **limits):
+            mask = 0
+            if project is not None:
+                for i, bit in enumerate(reversed(bits)):
+                    if (solution >> i) & 1:
+                        mask |= 1 << bit
+
+            for free_mask in free_masks:
+                packed = self._format_mask(mask | free_mask, format)
+                if chunk_size is None:
+                    yield packed
+                    continue
+
+                chunk.append(packed)
+                if len(chunk) == chunk_size:
+                    yield b''.join(chunk)
+                    chunk = []
+
+        if chunk:
+            yield b''.join(chunk)
+
+    def _symbol_values_mask(self, symbol_values):
+        """Get the bitmask of the (true) values of some of the symbols."""
+        num_symbols = len(self._symbols)
+        mask = 0
+        for pos, symbol in enumerate(self._symbols):
+            if symbol_values.get(symbol):
+                mask |= 1 << (num_symbols - 1 - pos)
+        return mask
+
+    def _format_mask(self, mask, format):
+        """Convert a bitmask of symbol values into a packed format."""
+        num_symbols = len(self._symbols)
+        if format == 'int':
+            return mask
+        elif format == 'bits':
+            return '{:0{}b}'.format(mask, num_symbols)
+        return mask.to_bytes((num_symbols + 7) // 8, 'big')
+
+    def _pack_solution(self, symbol_values, format):
+        """Pack a dict of symbol values into a bitmask in a packed format."""
+        return self._format_mask(self._symbol_values_mask(symbol_values),
+                                 format)
+
+    def _free_symbol_combinations(self, symbol_to_index_map,
+                                  constraints=None):
+        """Iterate over the combinations of values of the symbols missing
+        from this expression's clauses, under constraints defaulting to the
+        current constraints.
+
+        Conversion to CNF drops symbols on which this expression does not
+        depend, so every solution holds for any values of them. Constrained
+        ones take their constrained values; the rest take each combination
+        of values in turn, starting with all false.
+
+        """
+        if constraints is None:
+            constraints = self._constraints
+
+        fixed = {}
+        unconstrained = []
+        for symbol in self._symbols:
+            if symbol in symbol_to_index_map:
+                continue
+            elif symbol in constraints:
+                fixed[symbol] = bool(constraints[symbol])
+            else:
+                unconstrained.append(symbol)
+
+        for values in itertools.product((False, True),
+                                        repeat=len(unconstrained)):
+            free_values = dict(fixed)
+            free_values.update(zip(unconstrained, values))
+            yield free_values
 
     def _picosat_result_as_dict(self, results, symbol_to_index_map,
-                                index_to_symbol_map):
-        """Convert a PicoSAT result into a BooleanValues tuple."""
-        result_dict = {}
+                                index_to_symbol_map, constraints=None):
+        """Convert a PicoSAT result into a dict of the values of every symbol,
+        giving any symbols missing from the clauses their values under
+        constraints defaulting to the current constraints (or false).
+        """
+        result_dict = next(self._free_symbol_combinations(symbol_to_index_map,
+                                                          constraints))
         signed_symbol_indices = (index for index in results if abs(index) in
                                  index_to_symbol_map)
         for index in signed_symbol_indices:
@@ -559,8 +1287,68 @@ class BooleanExpression(object):
 
         return result_dict
 
+    def _incremental_sat_one(self, decision_limit=None,
+                             propagation_limit=None, timeout=None):
+        """Solve with this expression's persistent solver, within limits.
+
+        :returns: A tuple of the PicoSAT result (as would be returned by
+            :func:`picosat.sat_one <tt.satisfiability.picosat.sat_one>`) and
+            the symbol-to-index and index-to-symbol maps of the solver's
+            clauses.
+
+        """
+        # the solver can only be used by one thread at a time, and its model
+        # must be read before another thread solves again
+        with self._solver_lock:
+            if self._solver is None:
+                clauses, constant_assumptions, symbol_to_index_map, \
+                    index_to_symbol_map = \
+                    self._to_picosat_clauses_and_mappings()
+
+                # constants never change between calls, so they are fixed
+                # with unit clauses rather than assumptions
+                solver = picosat.Solver()
+                solver.add_clauses(clauses)
+                for assumption in constant_assumptions:
+                    solver.add_clause([assumption])
+                self._solver = (solver, symbol_to_index_map,
+                                index_to_symbol_map)
+
+            solver, symbol_to_index_map, index_to_symbol_map = self._solver
+            assumptions = self._constraint_assumptions(symbol_to_index_map)
+            if solver.solve(assumptions=assumptions,
+                            decision_limit=decision_limit,
+                            propagation_limit=propagation_limit,
+                            timeout=timeout):
+                picosat_result = solver.model()
+            else:
+                picosat_result = None
+
+        return picosat_result, symbol_to_index_map, index_to_symbol_map
+
     def _to_picosat_clauses_assumptions_and_symbol_mappings(self):
         """Return a PicoSAT-compatible representation and helpful metadata."""
+        clauses, constant_assumptions, symbol_to_index_map, \
+            index_to_symbol_map = self._to_picosat_clauses_and_mappings()
+        assumptions = (constant_assumptions +
+                       self._constraint_assumptions(symbol_to_index_map))
+        return clauses, assumptions, symbol_to_index_map, index_to_symbol_map
+
+    def _to_picosat_clauses_and_mappings(self):
+        """Return PicoSAT clauses, ignoring any constraints on this expression.
+
+        The returned assumptions are those fixing the values of constants in
+        the expression. Since expressions are immutable, the encoding is only
+        computed on the first call; later calls return the same (shared, and
+        therefore not to be modified) objects.
+
+        """
+        if self._picosat_encoding is None:
+            self._picosat_encoding = self._compute_picosat_encoding()
+        return self._picosat_encoding
+
+    def _compute_picosat_encoding(self):
+        """Convert this expression to PicoSAT clauses and symbol mappings."""
         cnf_tree = self.tree if self.is_cnf else self.tree.to_cnf()
         index = 1
         symbol_to_index_map = {}
@@ -606,14 +1394,27 @@ class BooleanExpression(object):
 
             clauses.append(clause_indices)
 
-        for symbol_str, assumed_val in self._constraints.items():
-            index = symbol_to_index_map[symbol_str]
-            if assumed_val:
+        return clauses, assumptions, symbol_to_index_map, index_to_symbol_map
+
+    def _constraint_assumptions(self, symbol_to_index_map, constraints=None):
+        """Return the PicoSAT assumptions imposed by constraints, defaulting
+        to the current constraints.
+        """
+        if constraints is None:
+            constraints = self._constraints
+
+        assumptions = []
+        for symbol_str, assumed_val in constraints.items():
+            index = symbol_to_index_map.get(symbol_str)
+            if index is None:
+                # symbols missing from the clauses may take any value
+                continue
+            elif assumed_val:
                 assumptions.append(index)
             else:
                 assumptions.append(-index)
 
-        return clauses, assumptions, symbol_to_index_map, index_to_symbol_map
+        return assumptions
 
     def evaluate(self, **kwargs):
         """Evaluate the Boolean expression for the passed keyword arguments.
@@ -670,6 +1471,124 @@ class BooleanExpression(object):
         truthy = self._tree.evaluate(kwargs)
         return bool(truthy)
 
+    def restrict(self, **kwargs):
+        """Get a new expression with some symbols replaced by constants.
+
+        The new expression, sometimes called a *cofactor* of this one, keeps
+        the structure of this expression, with each specified symbol replaced
+        by a ``0`` or ``1`` operand::
+
+            >>> from tt import BooleanExpression
+            >>> b = BooleanExpression('(A or B) and not C')
+            >>> b.restrict(A=0, C=0)
+            <BooleanExpression "(0 or B) and not 0">
+
+        :param kwargs: Keys are names of symbols in this expression; each is
+            replaced by its specified value.
+
+        :returns: The restricted expression.
+        :rtype: :class:`BooleanExpression`
+
+        :raises ExtraSymbolError: If a symbol not in this expression is passed
+            through ``kwargs``.
+        :raises InvalidBooleanValueError: If any values from ``kwargs`` are not
+            valid Boolean inputs.
+
+        """
+        assert_all_valid_keys(kwargs, self._symbol_set)
+
+        postfix_tokens = [('1' if kwargs[token] else '0')
+                          if token in kwargs else token
+                          for token in self._postfix_tokens]
+        return BooleanExpression(
+            ExpressionTreeNode.build_tree(postfix_tokens))
+
+    def support(self, method='auto'):
+        """Get the symbols on which this expression's value actually depends.
+
+        A symbol is in the support of an expression if there is some set of
+        values of the other symbols for which flipping the symbol flips the
+        expression's value. Symbols that are not (sometimes called *vacuous*
+        symbols) can be left out of this expression's truth table without
+        losing any information::
+
+            >>> from tt import BooleanExpression
+            >>> b = BooleanExpression('A or (B and not B) or (C and D)')
+            >>> b.support()
+            ['A', 'C', 'D']
+
+        The support can be found in two ways. The ``'table'`` method evaluates
+        the expression over every row of its truth table at once with bitwise
+        operations on packed rows, and compares the two halves of the table
+        for each symbol; this is fast for expressions of a moderate number of
+        symbols, but its memory use doubles with each symbol. The ``'sat'``
+        method instead checks, for each symbol, whether the expression with
+        that symbol set to ``0`` can ever differ from the expression with it
+        set to ``1``, which is practical for expressions of many symbols::
+
+            >>> terms = ['x{}'.format(i) for i in range(64)]
+            >>> b = BooleanExpression(' and '.join(terms) + ' or (y nor 1)')
+            >>> b.support(method='sat') == terms
+            True
+
+        :param method: One of ``'table'``, ``'sat'``, or ``'auto'`` (the
+            default), which uses the table method for expressions of up to 20
+            symbols and the SAT method for larger ones.
+        :type method: :class:`str <python:str>`, optional
+
+        :returns: The symbols in the support of this expression, in the order
+            they appear in :attr:`symbols`.
+        :rtype: List[:class:`str <python:str>`]
+
+        :raises InvalidArgumentValueError: If ``method`` is not one of the
+            supported methods.
+
+        """
+        if method not in _SUPPORT_METHODS:
+            raise InvalidArgumentValueError(
+                '`method` must be one of ' +
+                ', '.join('"{}"'.format(m) for m in _SUPPORT_METHODS))
+
+        if not self._symbols:
+            return []
+
+        if method == 'auto':
+            method = ('table'
+                      if len(self._symbols) <= _MAX_AUTO_TABLE_SUPPORT_SYMBOLS
+                      else 'sat')
+
+        if method == 'table':
+            # imported here, as tt.tables depends on this module
+            from tt.tables._bit_parallel import BitParallelEvaluator
+            from tt.tables._bitplanes import all_rows_mask, cofactors_differ
+
+            num_symbols = len(self._symbols)
+            num_rows = 2**num_symbols
+            rows = BitParallelEvaluator(self._symbols).evaluate(self._tree)
+            return [symbol for pos, symbol in enumerate(self._symbols)
+                    if cofactors_differ(rows, all_rows_mask(num_rows),
+                                        num_symbols - 1 - pos, num_rows)]
+
+        # encode both cofactors of the expression on each symbol, asking
+        # whether they can differ; parts of the expression not involving the
+        # symbol are shared between the cofactors
+        encoder = TseitinEncoder()
+        literals = {symbol: encoder.new_var() for symbol in self._symbols}
+        support = []
+        for symbol in self._symbols:
+            cofactors = [
+                encoder.encode(self._tree, dict(literals, **{symbol: value}))
+                for value in (False, True)]
+            differs = encoder.xor(*cofactors)
+            if isinstance(differs, int) and not isinstance(differs, bool):
+                differs = (not encoder.clauses or picosat.sat_one(
+                    encoder.clauses, assumptions=[differs]) is not None)
+
+            if differs:
+                support.append(symbol)
+
+        return support
+
     def iter_clauses(self):
         """Iterate over the clauses in this expression.
 
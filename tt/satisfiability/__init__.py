@@ -1 +1,3 @@
 """Functionality for determining logic satisfiasbility."""
+
+from .parallel import solve_many  # noqa
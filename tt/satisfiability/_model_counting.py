@@ -0,0 +1,205 @@
+"""Exact model counting of CNF clauses.
+
+:func:`count_models` counts the satisfying assignments of a set of clauses
+without enumerating them, using a DPLL-style search with two additions that
+make counting practical for clauses of many variables:
+
+* **Component decomposition:** after each assignment, the remaining clauses
+  are split into groups that share no variables. Each group is counted on its
+  own, and the counts are multiplied, rather than counting the cross product
+  of their assignments.
+* **Component caching:** the count of each group of clauses is remembered,
+  so groups reached again through a different series of assignments are not
+  searched again.
+
+The search branches on the lowest-numbered variable of each group. Clauses
+that number variables in the order of the structure they describe (as when
+encoding an expression's symbols in order) are thus assigned along that
+structure, which keeps the number of distinct groups met, and so the size of
+the search, small. In particular, when the inputs of a Tseitin encoding (see
+:mod:`tt.satisfiability._tseitin`) are numbered before its gates, only inputs
+are branched on, since unit propagation assigns each gate once its inputs are
+assigned.
+
+Clauses and literals follow the PicoSAT conventions used throughout
+:mod:`tt.satisfiability`.
+
+"""
+
+
+def count_models(clauses, num_vars):
+    """Count the assignments of variables ``1..num_vars`` satisfying clauses.
+
+    :param clauses: CNF clauses of non-zero ints, none of which may be empty,
+        over variables no greater than ``num_vars``.
+    :type clauses: List[List[:class:`int <python:int>`]]
+
+    :param num_vars: The number of variables to count assignments over.
+        Variables not appearing in any clause are free, doubling the count.
+    :type num_vars: :class:`int <python:int>`
+
+    :rtype: :class:`int <python:int>`
+
+    """
+    # clauses containing both literals of a variable are always satisfied
+    clauses = frozenset(frozenset(clause) for clause in clauses
+                        if not any(-lit in clause for lit in clause))
+    units = [next(iter(clause)) for clause in clauses if len(clause) == 1]
+
+    simplified, num_assigned = _assign(clauses, units)
+    if simplified is None:
+        return 0
+
+    num_free = num_vars - num_assigned - len(_variables(simplified))
+    return _ModelCounter().count_components(simplified) << num_free
+
+
+class _ModelCounter(object):
+
+    """A counter caching the model counts of the components it has seen."""
+
+    def __init__(self):
+        self._cache = {}
+
+    def count_components(self, clauses):
+        """Count the models of clauses by counting each component separately.
+
+        Models are counted over the variables appearing in ``clauses``.
+
+        """
+        count = 1
+        for component in _components(clauses):
+            count *= self._count(component)
+            if not count:
+                break
+        return count
+
+    def _count(self, clauses):
+        """Count the models of a single, non-empty component of clauses.
+
+        Rather than recursing into the sub-components of each component,
+        which would nest a call for every variable branched on (and so run
+        out of stack on long chains of clauses), the search keeps an explicit
+        stack of the components being counted.
+
+        """
+        count = self._cache.get(clauses)
+        if count is not None:
+            return count
+
+        stack = [self._search(clauses)]
+        while stack:
+            try:
+                component = stack[-1].send(count)
+            except StopIteration as e:
+                stack.pop()
+                count = e.value
+                continue
+
+            count = self._cache.get(component)
+            if count is None:
+                stack.append(self._search(component))
+
+        return count
+
+    def _search(self, clauses):
+        """Count the models of a single, non-empty component of clauses by
+        branching on its lowest variable.
+
+        This is a generator, which yields each sub-component whose count it
+        needs and is sent back that count; its count is cached and returned
+        (as the value of :class:`StopIteration <python:StopIteration>`) once
+        it is done.
+
+        """
+        variables = _variables(clauses)
+        var = min(variables)
+
+        count = 0
+        for lit in (var, -var):
+            simplified, num_assigned = _assign(clauses, [lit])
+            if simplified is None:
+                continue
+
+            num_free = (len(variables) - num_assigned -
+                        len(_variables(simplified)))
+            branch_count = 1
+            for component in _components(simplified):
+                branch_count *= yield component
+                if not branch_count:
+                    break
+            count += branch_count << num_free
+
+        self._cache[clauses] = count
+        return count
+
+
+def _assign(clauses, literals):
+    """Assign literals and simplify clauses, propagating unit clauses.
+
+    :returns: A tuple of the simplified clauses and the number of assigned
+        variables, or ``(None, None)`` if the assignment falsifies a clause.
+
+    """
+    # only the clauses a literal falsifies need checking once it is assigned,
+    # keeping long chains of propagations linear in the size of the clauses
+    falsifying = {}
+    for clause in clauses:
+        for lit in clause:
+            falsifying.setdefault(-lit, []).append(clause)
+
+    assigned = set()
+    pending = list(literals)
+    while pending:
+        lit = pending.pop()
+        if lit in assigned:
+            continue
+        elif -lit in assigned:
+            return None, None
+        assigned.add(lit)
+
+        for clause in falsifying.get(lit, ()):
+            if not clause.isdisjoint(assigned):
+                continue
+
+            unassigned = [other for other in clause if -other not in assigned]
+            if not unassigned:
+                return None, None
+            elif len(unassigned) == 1:
+                pending.append(unassigned[0])
+
+    falsified = {-lit for lit in assigned}
+    simplified = frozenset(clause - falsified for clause in clauses
+                           if clause.isdisjoint(assigned))
+    return simplified, len(assigned)
+
+
+def _variables(clauses):
+    """Get the set of variables appearing in clauses."""
+    return {abs(lit) for clause in clauses for lit in clause}
+
+
+def _components(clauses):
+    """Split clauses into frozensets of clauses sharing no variables."""
+    var_clauses = {}
+    for clause in clauses:
+        for lit in clause:
+            var_clauses.setdefault(abs(lit), []).append(clause)
+
+    seen = set()
+    for clause in clauses:
+        if clause in seen:
+            continue
+
+        seen.add(clause)
+        component = [clause]
+        i = 0
+        while i < len(component):
+            for lit in component[i]:
+                for other in var_clauses.pop(abs(lit), ()):
+                    if other not in seen:
+                        seen.add(other)
+                        component.append(other)
+            i += 1
+
+        yield frozenset(component)
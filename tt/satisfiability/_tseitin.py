@@ -0,0 +1,133 @@
+"""Tseitin encoding of expression trees into CNF clauses.
+
+Converting an expression to CNF by distributing its operators (as done by
+:func:`to_cnf <tt.trees.tree_node.ExpressionTreeNode.to_cnf>`) can produce
+exponentially many clauses. The Tseitin encoding instead introduces a new
+variable for the output of each operator, along with a few clauses tying that
+variable to the operator's inputs, so that the number of clauses grows only
+linearly with the size of the expression. The resulting clauses are
+satisfiable exactly when the encoded expression is.
+
+Literals are PicoSAT-style ints. While encoding, constant operands are folded
+away, so that the "literal" of a node may also be a :class:`bool
+<python:bool>`. Nodes with the same operator and input literals share a single
+variable, so structurally identical subtrees are only encoded once.
+
+"""
+
+from tt.definitions import (
+    TT_AND_OP,
+    TT_NAND_OP,
+    TT_NOR_OP,
+    TT_OR_OP,
+    TT_XNOR_OP,
+    TT_XOR_OP)
+from tt.trees import (
+    BinaryOperatorExpressionTreeNode,
+    OperandExpressionTreeNode)
+
+
+class TseitinEncoder(object):
+
+    """An accumulator of the clauses encoding one or more expression trees."""
+
+    def __init__(self):
+        self.clauses = []
+        self.num_vars = 0
+        self._gates = {}
+
+    def new_var(self):
+        """Allocate a new variable, returning its (positive) literal."""
+        self.num_vars += 1
+        return self.num_vars
+
+    def encode(self, node, literals):
+        """Encode an expression tree, returning the literal of its output.
+
+        :param node: The root of the tree to encode.
+        :type node: :class:`ExpressionTreeNode
+            <tt.trees.tree_node.ExpressionTreeNode>`
+
+        :param literals: A dict mapping each symbol of the tree to its
+            literal, which may be a :class:`bool <python:bool>` to substitute
+            a constant value for the symbol.
+        :type literals: Dict[:class:`str <python:str>`, :class:`int
+            <python:int>` or :class:`bool <python:bool>`]
+
+        :returns: The literal of the tree's output, or its value if it is
+            constant.
+        :rtype: :class:`int <python:int>` or :class:`bool <python:bool>`
+
+        """
+        if isinstance(node, OperandExpressionTreeNode):
+            if node.symbol_name == '0':
+                return False
+            elif node.symbol_name == '1':
+                return True
+            return literals[node.symbol_name]
+
+        a = self.encode(node.l_child, literals)
+        if not isinstance(node, BinaryOperatorExpressionTreeNode):
+            return self.negate(a)
+
+        b = self.encode(node.r_child, literals)
+        operator = node.operator
+        if operator == TT_AND_OP:
+            return self.and_(a, b)
+        elif operator == TT_NAND_OP:
+            return self.negate(self.and_(a, b))
+        elif operator == TT_OR_OP:
+            return self.or_(a, b)
+        elif operator == TT_NOR_OP:
+            return self.negate(self.or_(a, b))
+        elif operator == TT_XOR_OP:
+            return self.xor(a, b)
+        elif operator == TT_XNOR_OP:
+            return self.negate(self.xor(a, b))
+        else:
+            # the only remaining operator is TT_IMPL_OP
+            return self.or_(self.negate(a), b)
+
+    @staticmethod
+    def negate(a):
+        """Negate a literal or constant."""
+        return (not a) if isinstance(a, bool) else -a
+
+    def and_(self, a, b):
+        """Get the literal of the conjunction of two literals."""
+        if a is False or b is False:
+            return False
+        elif a is True:
+            return b
+        elif b is True or a == b:
+            return a
+        elif a == -b:
+            return False
+
+        key = (TT_AND_OP, min(a, b), max(a, b))
+        if key not in self._gates:
+            out = self._gates[key] = self.new_var()
+            self.clauses.extend(([-out, a], [-out, b], [out, -a, -b]))
+        return self._gates[key]
+
+    def or_(self, a, b):
+        """Get the literal of the disjunction of two literals."""
+        return self.negate(self.and_(self.negate(a), self.negate(b)))
+
+    def xor(self, a, b):
+        """Get the literal of the exclusive or of two literals."""
+        if isinstance(a, bool):
+            return self.negate(b) if a else b
+        elif isinstance(b, bool):
+            return self.negate(a) if b else a
+        elif a == b:
+            return False
+        elif a == -b:
+            return True
+
+        key = (TT_XOR_OP, min(a, b), max(a, b))
+        if key not in self._gates:
+            out = self._gates[key] = self.new_var()
+            self.clauses.extend(([-out, a, b], [-out, -a, -b],
+                                 [out, -a, b], [out, a, -b]))
+        return self._gates[key]
@@ -0,0 +1,459 @@
+"""Reading and writing clauses in the DIMACS CNF format.
+
+The DIMACS CNF format is the common interchange format for satisfiability
+problems. A file holds any number of comment lines beginning with ``c``, a
+problem line ``p cnf <variables> <clauses>``, and then the clauses, each a
+whitespace-separated list of non-zero literals terminated by a ``0``::
+
+    c an example
+    p cnf 3 2
+    1 -3 0
+    2 3 -1 0
+
+:func:`load` reads such a file into a :class:`DimacsCnf`, whose clauses are
+packed into a flat buffer (see :func:`pack_clauses
+<tt.satisfiability.picosat.pack_clauses>`) that can be passed straight to the
+functions of :mod:`tt.satisfiability.picosat`. :func:`dump` writes clauses
+back out.
+
+"""
+
+import io
+import mmap
+
+from array import array
+
+from tt.definitions import (
+    is_valid_identifier,
+    OPERATOR_MAPPING,
+    TT_AND_OP,
+    TT_NOT_OP,
+    TT_OR_OP)
+from tt.errors.arguments import (
+    InvalidArgumentTypeError,
+    InvalidArgumentValueError)
+from tt.errors.grammar import DimacsFormatError
+from tt.satisfiability.picosat import pack_clauses
+from tt.trees import ExpressionTreeNode
+
+
+# the number of clauses written to a file at a time by dump
+_DUMP_CHUNK_SIZE = 1024
+
+
+class DimacsCnf(object):
+
+    """CNF clauses, as read from or to be written to the DIMACS format.
+
+    :param clauses: The clauses, either as a list of lists of literal ints or
+        as a packed buffer of literals with each clause terminated by a zero.
+    :type clauses: List[List[:class:`int <python:int>`]] or :class:`array
+        <python:array.array>`
+
+    :param num_vars: The number of variables of the problem; defaults to the
+        largest variable appearing in the clauses.
+    :type num_vars: :class:`int <python:int>`, optional
+
+    :param comments: Comment lines, without their leading ``c`` and
+        surrounding whitespace.
+    :type comments: List[:class:`str <python:str>`], optional
+
+    :raises InvalidArgumentTypeError: If any literals are not ints.
+    :raises InvalidArgumentValueError: If any clause is empty, any literals
+        are zero or do not fit in 32 bits, or ``num_vars`` is smaller than the
+        largest variable in the clauses.
+
+    Here's an example::
+
+        >>> from tt.satisfiability.dimacs import DimacsCnf
+        >>> cnf = DimacsCnf([[1, -2], [2, 3]], comments=['symbol 1 A'])
+        >>> cnf.num_vars, cnf.num_clauses
+        (3, 2)
+        >>> cnf.clauses
+        array('i', [1, -2, 0, 2, 3, 0])
+        >>> cnf.symbol_names
+        {1: 'A'}
+
+    """
+
+    def __init__(self, clauses, num_vars=None, comments=None):
+        if isinstance(clauses, array) and clauses.typecode == 'i':
+            if clauses and clauses[-1] != 0:
+                raise InvalidArgumentValueError(
+                    'Packed clauses must end with a 0')
+            elif any(not clause for clause in _split_packed(clauses)):
+                raise InvalidArgumentValueError('clause must be non-empty')
+        else:
+            clauses = pack_clauses(clauses)
+
+        max_var = max((abs(lit) for lit in clauses), default=0)
+        if num_vars is None:
+            num_vars = max_var
+        elif not isinstance(num_vars, int):
+            raise InvalidArgumentTypeError('`num_vars` must be an int')
+        elif num_vars < max_var:
+            raise InvalidArgumentValueError(
+                '`num_vars` is smaller than the largest variable in the '
+                'clauses')
+
+        self._clauses = clauses
+        self._num_vars = num_vars
+        self._num_clauses = clauses.count(0)
+        self._comments = list(comments) if comments is not None else []
+
+    @property
+    def clauses(self):
+        """The packed clauses, with each clause terminated by a zero.
+
+        :type: :class:`array <python:array.array>`
+
+        """
+        return self._clauses
+
+    @property
+    def num_vars(self):
+        """The number of variables of the problem.
+
+        :type: :class:`int <python:int>`
+
+        """
+        return self._num_vars
+
+    @property
+    def num_clauses(self):
+        """The number of clauses of the problem.
+
+        :type: :class:`int <python:int>`
+
+        """
+        return self._num_clauses
+
+    @property
+    def comments(self):
+        """The comment lines, stripped of their leading ``c`` and whitespace.
+
+        :type: List[:class:`str <python:str>`]
+
+        """
+        return self._comments
+
+    @property
+    def symbol_names(self):
+        """A dict mapping variables to the symbol names given in comments.
+
+        Names are given by comments of the form ``symbol <variable> <name>``,
+        as written by :func:`BooleanExpression.to_dimacs
+        <tt.expressions.bexpr.BooleanExpression.to_dimacs>`. Comments of this
+        form naming variables out of range, with names that are not valid
+        symbols, or repeating an earlier variable or name, are ignored.
+
+        :type: Dict[:class:`int <python:int>`, :class:`str <python:str>`]
+
+        """
+        names = {}
+        taken = set()
+        for comment in self._comments:
+            words = comment.split()
+            if (len(words) != 3 or words[0] != 'symbol' or
+                    not words[1].isdigit()):
+                continue
+
+            var, name = int(words[1]), words[2]
+            if (1 <= var <= self._num_vars and var not in names and
+                    name not in taken and is_valid_identifier(name) and
+                    name not in OPERATOR_MAPPING):
+                names[var] = name
+                taken.add(name)
+        return names
+
+    def iter_clauses(self):
+        """Iterate over the clauses as lists of literal ints.
+
+        :rtype: Iterator[List[:class:`int <python:int>`]]
+
+        """
+        return _split_packed(self._clauses)
+
+    def to_expression(self):
+        """Convert the clauses into an equivalent CNF expression.
+
+        The clauses are combined into a balanced tree, so that the depth of
+        the expression grows only logarithmically with the number of clauses
+        and of literals per clause. Variables are named as given by
+        :attr:`symbol_names`; any others are named ``x<variable>``. Only
+        variables appearing in the clauses become symbols of the expression.
+
+        :returns: The expression.
+        :rtype: :class:`BooleanExpression
+            <tt.expressions.bexpr.BooleanExpression>`
+
+        :raises InvalidArgumentValueError: If there are no clauses.
+
+        Here's an example::
+
+            >>> from tt.satisfiability.dimacs import DimacsCnf
+            >>> cnf = DimacsCnf([[1, -2], [2], [-1, 2, 3]],
+            ...                 comments=['symbol 1 A', 'symbol 2 B'])
+            >>> print(cnf.to_expression())
+            (A or not B) and B and (not A or B or x3)
+
+        """
+        # imported here, as tt.expressions depends on this package
+        from tt.expressions import BooleanExpression
+
+        if not self._num_clauses:
+            raise InvalidArgumentValueError(
+                'Cannot build an expression from no clauses')
+
+        names = self.symbol_names
+        taken = set(names.values())
+        for var in sorted(set(abs(lit) for lit in self._clauses) - {0}):
+            if var not in names:
+                name = 'x{}'.format(var)
+                while name in taken:
+                    name += '_'
+                names[var] = name
+                taken.add(name)
+
+        and_str, not_str, or_str = (
+            op.default_plain_english_str
+            for op in (TT_AND_OP, TT_NOT_OP, TT_OR_OP))
+
+        def literal_tokens(lit):
+            if lit < 0:
+                return [names[-lit], not_str]
+            return [names[lit]]
+
+        clause_tokens = [
+            _balanced_postfix([literal_tokens(lit) for lit in clause],
+                              or_str)
+            for clause in self.iter_clauses()]
+        postfix_tokens = _balanced_postfix(clause_tokens, and_str)
+        return BooleanExpression(
+            ExpressionTreeNode.build_tree(postfix_tokens))
+
+
+def load(fp):
+    """Read clauses in the DIMACS CNF format from a file.
+
+    The file is tokenized a line at a time, and the literals are packed
+    straight into a flat buffer of 32-bit ints, without building a list per
+    clause. When ``fp`` is a binary file on disk, it is memory-mapped rather
+    than read into memory. Reading stops at the end of the file or at a line
+    consisting of ``%``, which ends some published benchmark files.
+
+    :param fp: The file to read from, opened in either text or binary mode.
+    :type fp: file object
+
+    :returns: The clauses and comments read from the file.
+    :rtype: :class:`DimacsCnf`
+
+    :raises DimacsFormatError: If the file is not valid DIMACS CNF.
+
+    Here's an example::
+
+        >>> import io
+        >>> from tt import picosat
+        >>> from tt.satisfiability import dimacs
+        >>> cnf = dimacs.load(io.StringIO(
+        ...     'c an example\\n'
+        ...     'p cnf 3 2\\n'
+        ...     '1 -3 0\\n'
+        ...     '2 3 -1 0\\n'))
+        >>> cnf.comments
+        ['an example']
+        >>> cnf.clauses
+        array('i', [1, -3, 0, 2, 3, -1, 0])
+        >>> picosat.sat_one(cnf.clauses)
+        [1, 2, -3]
+
+    """
+    mapped = _mmap_file(fp)
+    if mapped is not None:
+        with mapped:
+            return _parse_lines(iter(mapped.readline, b''))
+    return _parse_lines(fp)
+
+
+def dump(clauses, fp, num_vars=None, comments=None):
+    """Write clauses in the DIMACS CNF format to a file.
+
+    :param clauses: The clauses to write, either as a :class:`DimacsCnf`
+        (whose number of variables and comments are written, unless
+        overridden), as a list of lists of literal ints, or as a packed
+        :class:`array <python:array.array>` of literals.
+    :type clauses: :class:`DimacsCnf`, List[List[:class:`int <python:int>`]],
+        or :class:`array <python:array.array>`
+
+    :param fp: The file to write to, opened in text mode.
+    :type fp: file object
+
+    :param num_vars: The number of variables to declare in the problem line;
+        defaults to the largest variable appearing in the clauses.
+    :type num_vars: :class:`int <python:int>`, optional
+
+    :param comments: Comment lines to write before the problem line, without
+        their leading ``c``.
+    :type comments: List[:class:`str <python:str>`], optional
+
+    :raises InvalidArgumentTypeError: If any literals are not ints.
+    :raises InvalidArgumentValueError: If any clause is empty, any literals
+        are zero or do not fit in 32 bits, any comments span several lines,
+        or ``num_vars`` is smaller than the largest variable in the clauses.
+
+    Here's an example::
+
+        >>> import sys
+        >>> from tt.satisfiability import dimacs
+        >>> dimacs.dump([[1, -3], [2, 3, -1]], sys.stdout,
+        ...             comments=['an example'])
+        c an example
+        p cnf 3 2
+        1 -3 0
+        2 3 -1 0
+
+    """
+    if isinstance(clauses, DimacsCnf):
+        if num_vars is None:
+            num_vars = clauses.num_vars
+        if comments is None:
+            comments = clauses.comments
+        cnf = DimacsCnf(clauses.clauses, num_vars, comments)
+    else:
+        cnf = DimacsCnf(clauses, num_vars, comments)
+
+    for comment in cnf.comments:
+        if '\n' in comment or '\r' in comment:
+            raise InvalidArgumentValueError(
+                'Comments cannot span several lines')
+        fp.write('c {}\n'.format(comment) if comment else 'c\n')
+    fp.write('p cnf {} {}\n'.format(cnf.num_vars, cnf.num_clauses))
+
+    lines = []
+    for clause in cnf.iter_clauses():
+        clause.append(0)
+        lines.append(' '.join(map(str, clause)))
+        if len(lines) == _DUMP_CHUNK_SIZE:
+            fp.write('\n'.join(lines) + '\n')
+            lines = []
+    if lines:
+        fp.write('\n'.join(lines) + '\n')
+
+
+def _mmap_file(fp):
+    """Memory-map a binary file on disk, returning None if not possible."""
+    if isinstance(fp, io.TextIOBase):
+        return None
+
+    try:
+        fileno = fp.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+    try:
+        mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # empty files cannot be mapped, nor can pipes and the like
+        return None
+
+    mapped.seek(fp.tell())
+    return mapped
+
+
+def _parse_lines(lines):
+    """Parse an iterable of DIMACS CNF lines, as str or bytes."""
+    comments = []
+    packed = array('i')
+    num_vars = num_clauses = None
+
+    for line_num, line in enumerate(lines, start=1):
+        if isinstance(line, bytes):
+            try:
+                line = line.decode('ascii')
+            except UnicodeDecodeError:
+                raise DimacsFormatError(
+                    'Line {} is not ASCII text'.format(line_num))
+
+        stripped = line.strip()
+        if stripped.startswith('c'):
+            comments.append(stripped[1:].strip())
+            continue
+        elif stripped == '%':
+            break
+        elif not stripped:
+            continue
+        elif stripped.startswith('p'):
+            if num_vars is not None:
+                raise DimacsFormatError(
+                    'Duplicate problem line on line {}'.format(line_num))
+            num_vars, num_clauses = _parse_problem_line(stripped, line_num)
+            continue
+        elif num_vars is None:
+            raise DimacsFormatError(
+                'Clause on line {} precedes the problem line'.format(line_num))
+
+        try:
+            packed.extend(map(int, stripped.split()))
+        except (ValueError, OverflowError):
+            raise DimacsFormatError(
+                'Invalid literal on line {}'.format(line_num))
+
+    if num_vars is None:
+        raise DimacsFormatError('Missing problem line')
+    elif packed and packed[-1] != 0:
+        raise DimacsFormatError('The last clause is not terminated by 0')
+
+    clause_count = 0
+    for clause in _split_packed(packed):
+        if not clause:
+            raise DimacsFormatError(
+                'Empty clause at clause {}'.format(clause_count + 1))
+        clause_count += 1
+
+    if clause_count != num_clauses:
+        raise DimacsFormatError(
+            'Problem line declares {} clauses, but {} were read'.format(
+                num_clauses, clause_count))
+    elif packed and max(map(abs, packed)) > num_vars:
+        raise DimacsFormatError(
+            'Clauses contain variables larger than the {} declared by the '
+            'problem line'.format(num_vars))
+
+    return DimacsCnf(packed, num_vars, comments)
+
+
+def _parse_problem_line(line, line_num):
+    """Parse the variable and clause counts from a problem line."""
+    words = line.split()
+    if (len(words) != 4 or words[0] != 'p' or words[1] != 'cnf' or
+            not words[2].isdigit() or not words[3].isdigit()):
+        raise DimacsFormatError(
+            'Invalid problem line on line {}'.format(line_num))
+    return int(words[2]), int(words[3])
+
+
+def _split_packed(packed):
+    """Iterate over the zero-terminated clauses of a packed buffer."""
+    clause = []
+    for lit in packed:
+        if lit:
+            clause.append(lit)
+        else:
+            yield clause
+            clause = []
+
+
+def _balanced_postfix(operands, operator_str):
+    """Combine postfix token lists with a binary operator as a balanced tree.
+
+    :param operands: The non-empty list of postfix token lists to combine.
+    :param operator_str: The token of the operator to combine them with.
+
+    """
+    if len(operands) == 1:
+        return operands[0]
+
+    mid = len(operands) // 2
+    return (_balanced_postfix(operands[:mid], operator_str) +
+            _balanced_postfix(operands[mid:], operator_str) +
+            [operator_str])
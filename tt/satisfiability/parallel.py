@@ -0,0 +1,170 @@
+"""Concurrent solving of many independent satisfiability problems."""
+
+from concurrent.futures import (
+    as_completed,
+    ThreadPoolExecutor)
+
+from tt.errors.arguments import (
+    InvalidArgumentTypeError,
+    InvalidArgumentValueError)
+from tt.satisfiability import picosat
+
+
+def solve_many(problems, max_workers=None, ordered=True):
+    """Find a solution to each of many satisfiability problems concurrently.
+
+    Problems are solved by a pool of threads. Since PicoSAT runs without
+    holding the GIL, the solving of separate problems proceeds in parallel,
+    making use of several cores within a single process.
+
+    Each problem may be one of:
+
+    * A :class:`BooleanExpression <tt.expressions.bexpr.BooleanExpression>`
+      (or a :class:`str <python:str>` from which to build one), which is
+      solved as by its :func:`sat_one
+      <tt.expressions.bexpr.BooleanExpression.sat_one>` method, under any
+      constraints imposed on it at the time of this call. The expression's
+      constraints may safely change (and the same expression may appear
+      several times) while the problems are being solved.
+    * A tuple of an expression (or :class:`str <python:str>`) and a dict of
+      constraints, which is solved as by :func:`sat_one
+      <tt.expressions.bexpr.BooleanExpression.sat_one>` from within a
+      :func:`constrain <tt.expressions.bexpr.BooleanExpression.constrain>`
+      context manager imposing those constraints.
+    * A list of clauses, which is solved as by :func:`picosat.sat_one
+      <tt.satisfiability.picosat.sat_one>`.
+    * A tuple of a list of clauses and a list of assumptions, which is solved
+      as by :func:`picosat.sat_one <tt.satisfiability.picosat.sat_one>` with
+      those assumptions.
+
+    Here's a simple example::
+
+        >>> from tt import BooleanExpression
+        >>> from tt.satisfiability import solve_many
+        >>> b = BooleanExpression('A and not B')
+        >>> with b.constrain(B=1):
+        ...     problems = [b, 'C or D', [[1, 2], [-1]], ([[1, 2]], [-2])]
+        ...     for result in solve_many(problems, max_workers=2):
+        ...         print(result)
+        ...
+        None
+        C=1, D=1
+        [-1, 2]
+        [1, -2]
+
+    Results can also be retrieved as soon as each problem is solved, along
+    with the index of its problem::
+
+        >>> b = BooleanExpression('A xor B')
+        >>> problems = [(b, {'A': 0}), (b, {'A': 1}), 'A nor B']
+        >>> for i, result in sorted(solve_many(problems, ordered=False)):
+        ...     print(i, result)
+        ...
+        0 A=0, B=1
+        1 A=1, B=0
+        2 A=0, B=0
+
+    :param problems: The problems to solve.
+    :type problems: List[:class:`BooleanExpression
+        <tt.expressions.bexpr.BooleanExpression>`, :class:`str <python:str>`,
+        Tuple[:class:`BooleanExpression
+        <tt.expressions.bexpr.BooleanExpression>`, Dict],
+        List[List[:class:`int <python:int>`]], or Tuple[List[List[:class:`int
+        <python:int>`]], List[:class:`int <python:int>`]]]
+
+    :param max_workers: The number of threads to solve with; defaults to the
+        default of :class:`ThreadPoolExecutor
+        <python:concurrent.futures.ThreadPoolExecutor>`.
+    :type max_workers: :class:`int <python:int>`, optional
+
+    :param ordered: If ``True`` (the default), the results are returned as a
+        list in the same order as their problems. Otherwise, an iterator is
+        returned that yields a tuple of each problem's index and result as
+        soon as the problem is solved; problems are only submitted for solving
+        once iteration begins.
+    :type ordered: :class:`bool <python:bool>`, optional
+
+    :returns: The result of each problem, as described above.
+    :rtype: List or Iterator[Tuple[:class:`int <python:int>`, result]]
+
+    :raises AlreadyConstrainedSymbolError: If a dict of constraints
+        constrains a symbol already constrained on its expression.
+    :raises ExtraSymbolError: If a dict of constraints contains a symbol not
+        in its expression.
+    :raises InvalidArgumentTypeError: If ``problems`` is not a list, any
+        problem is not of one of the accepted types, or ``max_workers`` is not
+        an int.
+    :raises InvalidArgumentValueError: If ``max_workers`` is not positive.
+    :raises InvalidBooleanValueError: If a dict of constraints contains
+        values that are not valid Boolean inputs.
+
+    Exceptions raised while solving a problem (such as for invalid clauses)
+    are raised when its result is retrieved.
+
+    """
+    if not isinstance(problems, list):
+        raise InvalidArgumentTypeError('`problems` must be a list')
+
+    if max_workers is not None:
+        if not isinstance(max_workers, int) or isinstance(max_workers, bool):
+            raise InvalidArgumentTypeError('`max_workers` must be an int')
+        elif max_workers < 1:
+            raise InvalidArgumentValueError('`max_workers` must be positive')
+
+    tasks = [_solver_task(i, problem) for i, problem in enumerate(problems)]
+    if ordered:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(*task) for task in tasks]
+            return [future.result() for future in futures]
+    else:
+        return _iter_as_completed(tasks, max_workers)
+
+
+def _iter_as_completed(tasks, max_workers):
+    """Yield the index and result of each task as it is completed."""
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    future_indices = {}
+    try:
+        for i, task in enumerate(tasks):
+            future_indices[executor.submit(*task)] = i
+        for future in as_completed(future_indices):
+            yield future_indices[future], future.result()
+    finally:
+        # if iteration stops early, abandon the problems not yet being solved
+        # rather than waiting on them (as cancel_futures=True would do on
+        # Python 3.9+)
+        for future in future_indices:
+            future.cancel()
+        executor.shutdown()
+
+
+def _solver_task(index, problem):
+    """Get a tuple of a function and its arguments that solve a problem."""
+    # imported here, as tt.expressions depends on this package
+    from tt.expressions import BooleanExpression
+
+    constraint_dict = {}
+    if (isinstance(problem, tuple) and len(problem) == 2 and
+            isinstance(problem[1], dict)):
+        problem, constraint_dict = problem
+        if not isinstance(problem, (str, BooleanExpression)):
+            problem = None
+
+    if isinstance(problem, str):
+        problem = BooleanExpression(problem)
+
+    if isinstance(problem, BooleanExpression):
+        problem._assert_valid_constraints(constraint_dict)
+
+        # snapshot the constraints, which may change while solving
+        return (problem._sat_one_under,
+                dict(problem._constraints, **constraint_dict))
+    elif isinstance(problem, list):
+        return picosat.sat_one, problem
+    elif (isinstance(problem, tuple) and len(problem) == 2 and
+            isinstance(problem[0], list)):
+        return picosat.sat_one, problem[0], problem[1]
+
+    raise InvalidArgumentTypeError(
+        'Problem at index {} is not an expression, a list of clauses, or a '
+        'tuple of clauses and assumptions'.format(index))
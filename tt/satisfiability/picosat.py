@@ -2,16 +2,34 @@
 
 import os
 
+from array import array
+from collections import namedtuple
+
 from tt.errors.arguments import (
     InvalidArgumentTypeError,
     InvalidArgumentValueError)
+from tt.errors.evaluation import SolverLimitError
+from tt.errors.state import (
+    AlreadyClosedSolverError,
+    RequiresSolverContextError)
+from tt.satisfiability._model_counting import count_models
 
 if os.environ.get('READTHEDOCS') != 'True':
     from tt._clibs import picosat as _c_picosat
     VERSION = _c_picosat.VERSION
 
 
-def sat_one(clauses, assumptions=None):
+# PicoSAT's result codes for satisfiable clauses and for reaching a limit
+_SATISFIABLE = 10
+_UNKNOWN = 0
+
+# functions called with the statistics of every solve; replaced rather than
+# modified, so solves in other threads can iterate over it safely
+_stats_hooks = ()
+
+
+def sat_one(clauses, assumptions=None, decision_limit=None,
+            propagation_limit=None, timeout=None):
     """Find a solution that satisfies the specified clauses and assumptions.
 
     This provides a light Python wrapper around the same method in the PicoSAT
@@ -22,21 +40,38 @@ def sat_one(clauses, assumptions=None):
     class.
 
     :param clauses: CNF (AND of ORs) clauses; positive integers represent
-        non-negated terms and negative integers represent negated terms.
-    :type clauses: List[List[:class:`int <python:int>`]]
+        non-negated terms and negative integers represent negated terms. The
+        clauses may also be packed into a buffer (see :func:`pack_clauses`).
+    :type clauses: List[List[:class:`int <python:int>`]] or buffer
 
     :param assumptions: Assumed terms; same negation logic from ``clauses``
         applies here. Note that assumptions *cannot* be an empty list; leave it
         as ``None`` if there are no assumptions to include.
     :type assumptions: List[:class:`int <python:int>`]
 
+    :param decision_limit: The most decisions PicoSAT may make, including
+        those to assume each of the ``assumptions``.
+    :type decision_limit: :class:`int <python:int>`, optional
+
+    :param propagation_limit: The most propagations PicoSAT may make.
+    :type propagation_limit: :class:`int <python:int>`, optional
+
+    :param timeout: The most seconds PicoSAT may spend. PicoSAT only checks
+        the time every 1024 decisions, so it may overrun the timeout somewhat,
+        particularly for clauses that take a long time to propagate.
+    :type timeout: :class:`float <python:float>`, optional
+
     :returns: If solution is found, a list of ints representing the terms of
         the solution; otherwise, if no solution found, ``None``.
     :rtype: List[:class:`int <python:int>`] or ``None``
 
     :raises InvalidArgumentTypeError: If ``clauses`` is not a list of lists of
-        ints or ``assumptions`` is not a list of ints.
-    :raises InvalidArgumentValueError: If any literal ints are equal to zero.
+        ints, ``assumptions`` is not a list of ints, or any limit is not a
+        number.
+    :raises InvalidArgumentValueError: If any literal ints are equal to zero
+        or do not fit in 32 bits, or any limit is negative.
+    :raises SolverLimitError: If a limit is reached before it is known
+        whether a solution exists.
 
     Let's look at a simple example with no satisfiable solution::
 
@@ -54,16 +89,32 @@ def sat_one(clauses, assumptions=None):
         >>> picosat.sat_one([[1, 2, 3], [2, 3]], assumptions=[-1, -3])
         [-1, 2, -3]
 
+    Limits keep hard problems from running indefinitely; without enough
+    decisions to find a result, :class:`SolverLimitError
+    <tt.errors.evaluation.SolverLimitError>` is raised::
+
+        >>> picosat.sat_one([[1, 2], [-1, 3], [2, -3]], decision_limit=0)
+        Traceback (most recent call last):
+            ...
+        tt.errors.evaluation.SolverLimitError: PicoSAT reached a limit \
+before finding a result
+
     """
     try:
-        return _c_picosat.sat_one(clauses, assumptions=assumptions)
+        return _c_picosat.sat_one(clauses, assumptions=assumptions,
+                                  decision_limit=decision_limit,
+                                  propagation_limit=propagation_limit,
+                                  timeout=timeout,
+                                  stats_callback=_stats_callback())
     except TypeError as e:
         raise InvalidArgumentTypeError(str(e))
     except ValueError as e:
         raise InvalidArgumentValueError(str(e))
 
 
-def sat_all(clauses, assumptions=None):
+def sat_all(clauses, assumptions=None, project=None, format='lits',
+            chunk_size=None, decision_limit=None, propagation_limit=None,
+            timeout=None):
     """Find all solutions that satisfy the specified clauses and assumptions.
 
     This provides a light Python wrapper around the same method in the PicoSAT
@@ -74,21 +125,72 @@ def sat_all(clauses, assumptions=None):
     class.
 
     :param clauses: CNF (AND of ORs) clauses; positive integers represent
-        non-negated terms and negative integers represent negated terms.
-    :type clauses: List[List[:class:`int <python:int>`]]
+        non-negated terms and negative integers represent negated terms. The
+        clauses may also be packed into a buffer (see :func:`pack_clauses`).
+    :type clauses: List[List[:class:`int <python:int>`]] or buffer
 
     :param assumptions: Assumed terms; same negation logic from ``clauses``
         applies here. Note that assumptions *cannot* be an empty list; leave it
         as ``None`` if there are no assumptions to include.
     :type assumptions: List[:class:`int <python:int>`]
 
+    :param project: Variables to project solutions onto. When specified,
+        each solution contains only the literals of these variables (in the
+        same order), and solutions differing only in other variables are
+        found just once. Like ``assumptions``, this cannot be an empty list.
+    :type project: List[:class:`int <python:int>`]
+
+    :param format: The form of each solution. ``'lits'`` (the default) gives
+        a list of literals, as above. ``'int'`` instead packs the solution
+        into a bitmask, whose bits hold the values of the solution's variables
+        (every variable, or those of ``project``, in order) from the most
+        significant bit down; ``'bytes'`` gives the same bitmask as big-endian
+        :class:`bytes <python:bytes>`, one byte per eight variables. Packed
+        solutions are much cheaper to create than lists when enumerating very
+        many solutions.
+    :type format: :class:`str <python:str>`, optional
+
+    :param chunk_size: With the ``'bytes'`` format, the number of solutions
+        to pack back to back into each item of the iterator (fewer for the
+        last item), rather than one solution per item. The solutions of each
+        chunk are all found in one go without holding the GIL, and room for
+        them is made as they are found, so a chunk size far larger than the
+        number of solutions costs no extra memory.
+    :type chunk_size: :class:`int <python:int>`, optional
+
+    :param decision_limit: The most decisions PicoSAT may make in finding each
+        solution, including those to assume each of the ``assumptions``.
+    :type decision_limit: :class:`int <python:int>`, optional
+
+    :param propagation_limit: The most propagations PicoSAT may make in
+        finding each solution.
+    :type propagation_limit: :class:`int <python:int>`, optional
+
+    :param timeout: The most seconds PicoSAT may spend in finding each
+        solution. PicoSAT only checks the time every 1024 decisions, so it may
+        overrun the timeout somewhat, particularly for clauses that take a
+        long time to propagate.
+    :type timeout: :class:`float <python:float>`, optional
+
     :returns: An iterator of solutions; if no satisfiable solutions exist, the
         iterator will be empty.
-    :rtype: Iterator[List[:class:`int <python:int>`]]
+    :rtype: Iterator[List[:class:`int <python:int>`]], Iterator[:class:`int
+        <python:int>`], or Iterator[:class:`bytes <python:bytes>`]
 
     :raises InvalidArgumentTypeError: If ``clauses`` is not a list of lists of
-        ints or ``assumptions`` is not a list of ints.
-    :raises InvalidArgumentValueError: If any literal ints are equal to zero.
+        ints, ``assumptions`` or ``project`` is not a list of ints,
+        ``chunk_size`` is not an int, or any limit is not a number.
+    :raises InvalidArgumentValueError: If any literal ints are equal to zero
+        or do not fit in 32 bits, ``project`` contains a variable not present
+        in the clauses or assumptions, ``format`` is not one of the supported
+        formats, ``chunk_size`` is not positive, is larger than
+        :data:`sys.maxsize <python:sys.maxsize>` or is given without the
+        ``'bytes'`` format, or any limit is negative.
+    :raises SolverLimitError: From the iterator, if a limit is reached before
+        the next solution is found or ruled out; the iterator then ends. Any
+        solutions already found for a chunk are returned first.
+    :raises SolverInUseError: From the iterator, if another thread is
+        getting its next solution at the same time.
 
     Here's an example showing the basic usage::
 
@@ -112,10 +214,706 @@ def sat_all(clauses, assumptions=None):
         [1, 2, -3, 4]
         [1, 2, -3, -4]
 
+    If we only care about the values of some of the variables, we can project
+    the solutions onto them::
+
+        >>> for solution in picosat.sat_all([[1], [2, 3, 4], [2, 3]],
+        ...                                 project=[3, 2]):
+        ...     print(solution)
+        ...
+        [3, 2]
+        [-3, 2]
+        [3, -2]
+
+    Solutions can also be packed into bitmasks, here over variables ``3``
+    and ``2`` (in that order), and into chunks of several solutions::
+
+        >>> for solution in picosat.sat_all([[1], [2, 3, 4], [2, 3]],
+        ...                                 project=[3, 2], format='int'):
+        ...     print(bin(solution))
+        ...
+        0b11
+        0b1
+        0b10
+        >>> for chunk in picosat.sat_all([[1], [2, 3, 4], [2, 3]],
+        ...                              format='bytes', chunk_size=4):
+        ...     print(list(chunk))
+        ...
+        [15, 14, 13, 12]
+        [11, 10]
+
+    """
+    if not isinstance(format, str):
+        raise InvalidArgumentTypeError('`format` must be a str')
+
+    try:
+        return _c_picosat.sat_all(clauses, assumptions=assumptions,
+                                  project=project, format=format,
+                                  chunk_size=chunk_size,
+                                  decision_limit=decision_limit,
+                                  propagation_limit=propagation_limit,
+                                  timeout=timeout,
+                                  stats_callback=_stats_callback())
+    except TypeError as e:
+        raise InvalidArgumentTypeError(str(e))
+    except ValueError as e:
+        raise InvalidArgumentValueError(str(e))
+
+
+def sat_batch(clauses, assumption_lists):
+    """Find a solution of the specified clauses under each list of assumptions.
+
+    This is equivalent to calling :func:`sat_one` once per list of
+    assumptions, but is much faster when checking the same clauses against
+    many lists of assumptions: the clauses are loaded into PicoSAT only once,
+    and each list of assumptions is then solved incrementally, re-using what
+    was learned about the clauses in earlier solves. The whole batch is solved
+    without holding the GIL.
+
+    :param clauses: CNF (AND of ORs) clauses; positive integers represent
+        non-negated terms and negative integers represent negated terms. The
+        clauses may also be packed into a buffer (see :func:`pack_clauses`).
+    :type clauses: List[List[:class:`int <python:int>`]] or buffer
+
+    :param assumption_lists: Lists of assumed terms, with the same negation
+        logic from ``clauses``. Unlike in :func:`sat_one`, an empty list (or
+        ``None``) may be used to solve without assumptions.
+    :type assumption_lists: List[List[:class:`int <python:int>`]]
+
+    :returns: A list holding, for each list of assumptions in order, either a
+        list of ints representing the terms of a solution or ``None`` if no
+        solution exists under those assumptions. Every solution includes the
+        terms of any variables appearing only in assumptions.
+    :rtype: List[List[:class:`int <python:int>`] or ``None``]
+
+    :raises InvalidArgumentTypeError: If ``clauses`` is not a list of lists of
+        ints or ``assumption_lists`` is not a list of lists of ints.
+    :raises InvalidArgumentValueError: If any literal ints are equal to zero
+        or do not fit in 32 bits.
+
+    An example::
+
+        >>> from tt import picosat
+        >>> picosat.sat_batch([[1, 2], [-1, -2]], [[1], [-1], [1, 2], []])
+        [[1, -2], [-1, 2], None, [1, -2]]
+
+    """
+    try:
+        return _c_picosat.sat_batch(clauses, assumption_lists,
+                                    stats_callback=_stats_callback())
+    except TypeError as e:
+        raise InvalidArgumentTypeError(str(e))
+    except ValueError as e:
+        raise InvalidArgumentValueError(str(e))
+
+
+def failed_assumptions(clauses, assumptions, minimal=False):
+    """Find which assumptions make the specified clauses unsatisfiable.
+
+    When the clauses cannot be satisfied under the assumptions, PicoSAT can
+    tell which of the assumptions it used to prove so (the *failed*
+    assumptions), without needing to try out subsets of the assumptions. The
+    clauses remain unsatisfiable under the failed assumptions alone::
+
+        >>> from tt import picosat
+        >>> clauses = [[1, 2], [-1, 3], [2, -3]]
+        >>> picosat.failed_assumptions(clauses, [4, -2, 5])
+        [-2]
+        >>> picosat.sat_one(clauses, assumptions=[-2]) is None
+        True
+
+    The failed assumptions are not necessarily minimal, so pass
+    ``minimal=True`` to have them reduced until dropping any one of them
+    would make the clauses satisfiable. This takes a further solve for each
+    failed assumption.
+
+    :param clauses: CNF (AND of ORs) clauses; positive integers represent
+        non-negated terms and negative integers represent negated terms. The
+        clauses may also be packed into a buffer (see :func:`pack_clauses`).
+    :type clauses: List[List[:class:`int <python:int>`]] or buffer
+
+    :param assumptions: Assumed terms; same negation logic from ``clauses``
+        applies here.
+    :type assumptions: List[:class:`int <python:int>`]
+
+    :param minimal: Whether to reduce the failed assumptions to a minimal
+        set.
+    :type minimal: :class:`bool <python:bool>`, optional
+
+    :returns: If no solution exists under the assumptions, a list of the
+        failed assumptions, in no particular order; it is empty if the
+        clauses are unsatisfiable without any assumptions. Otherwise,
+        ``None``.
+    :rtype: List[:class:`int <python:int>`] or ``None``
+
+    :raises InvalidArgumentTypeError: If ``clauses`` is not a list of lists of
+        ints or ``assumptions`` is not a list of ints.
+    :raises InvalidArgumentValueError: If ``assumptions`` is empty or any
+        literal ints are equal to zero or do not fit in 32 bits.
+
+    Here's an example where some assumptions fail only together::
+
+        >>> picosat.failed_assumptions([[1, 2, 3]], [-1, -2, 4, -3])
+        [-1, -2, -3]
+        >>> picosat.failed_assumptions([[1, 2, 3]], [-1, 2]) is None
+        True
+
     """
+    if not isinstance(assumptions, list):
+        raise InvalidArgumentTypeError(
+            'assumptions must be a list of non-zero ints')
+
     try:
-        return _c_picosat.sat_all(clauses, assumptions=assumptions)
+        return _c_picosat.failed_assumptions(clauses, assumptions,
+                                             minimal=minimal,
+                                             stats_callback=_stats_callback())
     except TypeError as e:
         raise InvalidArgumentTypeError(str(e))
     except ValueError as e:
         raise InvalidArgumentValueError(str(e))
+
+
+def pack_clauses(clauses):
+    """Pack clauses into a flat buffer of literals.
+
+    Every function of this module taking clauses (other than :func:`count`)
+    also accepts them packed into any object supporting the buffer protocol,
+    such as an :class:`array <python:array.array>`, :class:`bytes
+    <python:bytes>`, :class:`memoryview <python:memoryview>`, or NumPy
+    ``int32`` array. A packed buffer holds native 32-bit signed int literals,
+    with each clause terminated by a zero, as in the DIMACS format. Buffers
+    are read without creating a Python object per literal and without holding
+    the GIL, which makes loading very large sets of clauses cheaper and lets
+    other threads run in the meantime.
+
+    :param clauses: CNF (AND of ORs) clauses; positive integers represent
+        non-negated terms and negative integers represent negated terms.
+    :type clauses: Iterable[Iterable[:class:`int <python:int>`]]
+
+    :returns: The packed clauses.
+    :rtype: :class:`array <python:array.array>`
+
+    :raises InvalidArgumentTypeError: If any literals are not ints.
+    :raises InvalidArgumentValueError: If any clause is empty, or any literal
+        ints are equal to zero or do not fit in 32 bits.
+
+    Here's an example::
+
+        >>> from tt import picosat
+        >>> packed = picosat.pack_clauses([[1, -2], [2, 3]])
+        >>> packed
+        array('i', [1, -2, 0, 2, 3, 0])
+        >>> picosat.sat_one(packed, assumptions=[-1])
+        [-1, -2, 3]
+
+    """
+    packed = array('i')
+    for clause in clauses:
+        start = len(packed)
+        try:
+            packed.extend(clause)
+        except TypeError:
+            raise InvalidArgumentTypeError('All literals expected to be ints')
+        except OverflowError:
+            raise InvalidArgumentValueError(
+                'All literals must fit in 32 bits')
+
+        if len(packed) == start:
+            raise InvalidArgumentValueError('clause must be non-empty')
+        elif 0 in packed[start:]:
+            raise InvalidArgumentValueError('All literals must be non-zero')
+        packed.append(0)
+
+    return packed
+
+
+def count(clauses, assumptions=None):
+    """Count the solutions that satisfy the specified clauses and assumptions.
+
+    Solutions are counted over every variable from ``1`` up to the largest
+    variable in the clauses or assumptions, just as they are enumerated by
+    :func:`sat_all`, so that this returns the number of solutions
+    :func:`sat_all` would yield; it does so without enumerating them, making
+    it practical for clauses with far too many solutions to enumerate. This
+    method doesn't use PicoSAT itself, but takes the same arguments as the
+    other functions of this module.
+
+    :param clauses: CNF (AND of ORs) clauses; positive integers represent
+        non-negated terms and negative integers represent negated terms.
+    :type clauses: List[List[:class:`int <python:int>`]]
+
+    :param assumptions: Assumed terms; same negation logic from ``clauses``
+        applies here. Note that assumptions *cannot* be an empty list; leave it
+        as ``None`` if there are no assumptions to include.
+    :type assumptions: List[:class:`int <python:int>`]
+
+    :returns: The number of satisfying solutions.
+    :rtype: :class:`int <python:int>`
+
+    :raises InvalidArgumentTypeError: If ``clauses`` is not a list of lists of
+        ints or ``assumptions`` is not a list of ints.
+    :raises InvalidArgumentValueError: If any literal ints are equal to zero
+        or do not fit in 32 bits.
+
+    Here's the count of the solutions from the :func:`sat_all` example::
+
+        >>> from tt import picosat
+        >>> picosat.count([[1], [2, 3, 4], [2, 3]])
+        6
+        >>> picosat.count([[1], [2, 3, 4], [2, 3]], assumptions=[-3])
+        2
+
+    Counting remains quick for clauses with many solutions::
+
+        >>> picosat.count([[i, i + 1] for i in range(1, 100, 2)])
+        717897987691852588770249
+
+    """
+    if not isinstance(clauses, list):
+        raise InvalidArgumentTypeError(
+            'clauses must be a list of lists of non-zero ints')
+    elif not clauses:
+        raise InvalidArgumentValueError('clauses must be non-empty')
+
+    for clause in clauses:
+        if not isinstance(clause, list):
+            raise InvalidArgumentTypeError(
+                'clause must be a list of non-zero ints')
+        elif not clause:
+            raise InvalidArgumentValueError('clause must be non-empty')
+        _assert_literals(clause)
+
+    all_clauses = clauses
+    if assumptions is not None:
+        if not isinstance(assumptions, list):
+            raise InvalidArgumentTypeError(
+                'assumptions must be a list of non-zero ints')
+        elif not assumptions:
+            raise InvalidArgumentValueError('assumptions must be non-empty')
+        _assert_literals(assumptions)
+        all_clauses = clauses + [[assumption] for assumption in assumptions]
+
+    num_vars = max(abs(lit) for clause in all_clauses for lit in clause)
+    return count_models(all_clauses, num_vars)
+
+
+class SolverStats(namedtuple('SolverStats', [
+        'variables', 'clauses', 'decisions', 'propagations', 'seconds',
+        'max_bytes_allocated'])):
+
+    """The statistics of a solve, as passed to each stats hook.
+
+    The fields of these named tuples are:
+
+    * ``variables``: The number of variables known to PicoSAT.
+    * ``clauses``: The number of clauses added to PicoSAT, including any
+      added by this module (such as those blocking the solutions already
+      found by :func:`sat_all`).
+    * ``decisions``: The number of decisions PicoSAT made.
+    * ``propagations``: The number of propagations PicoSAT made.
+    * ``seconds``: The (wall clock) time PicoSAT spent solving.
+    * ``max_bytes_allocated``: The most memory PicoSAT had allocated at once.
+
+    See :func:`add_stats_hook` for which solves these describe.
+
+    """
+
+    __slots__ = ()
+
+
+def add_stats_hook(hook):
+    """Register a function to be called with the statistics of every solve.
+
+    Once registered, the hook is called with a :class:`SolverStats` after
+    every solve made through this module, whether directly or by methods of
+    :class:`BooleanExpression <tt.expressions.bexpr.BooleanExpression>`:
+
+    * :func:`sat_one` reports once it has solved its clauses.
+    * :func:`sat_all` reports the totals of the whole enumeration once its
+      iterator stops, be it by running out of solutions or by raising an
+      error. Enumerations abandoned before then are not reported.
+    * :func:`sat_batch` reports the totals of the whole batch.
+    * :func:`failed_assumptions` reports the totals of its solves, including
+      any made to minimize the failed assumptions.
+    * :func:`Solver.solve` reports each call on its own, though
+      ``max_bytes_allocated`` covers the whole life of the solver.
+
+    Hooks are called in the thread that made the solve, in the order they
+    were registered; an error raised by a hook is raised from the solve in
+    place of its result. This is meant for feeding metrics, such as to find
+    out why some solves take far longer than others::
+
+        >>> from tt import picosat
+        >>> def print_stats(stats):
+        ...     print('{} vars, {} clauses, {} decisions'.format(
+        ...         stats.variables, stats.clauses, stats.decisions))
+        ...
+        >>> picosat.add_stats_hook(print_stats)
+        >>> picosat.sat_one([[1, 2], [-1, 3], [2, -3]])
+        3 vars, 3 clauses, 2 decisions
+        [-1, 2, -3]
+        >>> picosat.remove_stats_hook(print_stats)
+
+    :param hook: The function to call with each solve's statistics.
+    :type hook: Callable[[:class:`SolverStats`], None]
+
+    :raises InvalidArgumentTypeError: If ``hook`` is not callable.
+
+    """
+    global _stats_hooks
+
+    if not callable(hook):
+        raise InvalidArgumentTypeError('`hook` must be callable')
+
+    _stats_hooks = _stats_hooks + (hook,)
+
+
+def remove_stats_hook(hook):
+    """Unregister a function registered with :func:`add_stats_hook`.
+
+    :param hook: The function to no longer call with solve statistics. If it
+        was registered more than once, only its latest registration is
+        removed.
+    :type hook: Callable[[:class:`SolverStats`], None]
+
+    :raises InvalidArgumentValueError: If ``hook`` is not registered.
+
+    """
+    global _stats_hooks
+
+    for i in reversed(range(len(_stats_hooks))):
+        if _stats_hooks[i] == hook:
+            _stats_hooks = _stats_hooks[:i] + _stats_hooks[i + 1:]
+            return
+
+    raise InvalidArgumentValueError('`hook` is not a registered stats hook')
+
+
+def _stats_callback():
+    """Get the callback for the extension to report solve statistics to, or
+    ``None`` if there are no hooks to pass them on to.
+    """
+    return _report_stats if _stats_hooks else None
+
+
+def _report_stats(raw_stats):
+    """Pass the tuple of statistics reported by the extension to each hook."""
+    stats = SolverStats(*raw_stats)
+    for hook in _stats_hooks:
+        hook(stats)
+
+
+def _assert_literals(literals):
+    """Assert that a list contains only non-zero int literals."""
+    for literal in literals:
+        if not isinstance(literal, int):
+            raise InvalidArgumentTypeError('All literals expected to be ints')
+        elif not literal:
+            raise InvalidArgumentValueError('All literals must be non-zero')
+        elif not -2**31 < literal < 2**31:
+            raise InvalidArgumentValueError(
+                'All literals must be within the range of int32, excluding '
+                'its minimum')
+
+
+class Solver(object):
+
+    """An incremental SAT solver session.
+
+    Unlike :func:`sat_one` and :func:`sat_all`, which build and tear down a
+    new PicoSAT instance on every call, a solver keeps a single instance
+    alive, so that clauses only need to be added once and anything the solver
+    learns while solving carries over to later calls. Clauses can be added
+    between calls to :func:`solve`, and each call can be made under its own
+    assumptions::
+
+        >>> from tt import picosat
+        >>> solver = picosat.Solver()
+        >>> solver.add_clauses([[1, 2], [-1, 3]])
+        >>> solver.solve(assumptions=[1])
+        True
+        >>> solver.model()
+        [1, 2, 3]
+        >>> solver.solve(assumptions=[1, -3])
+        False
+        >>> solver.add_clause([-2])
+        >>> solver.solve()
+        True
+        >>> solver.model()
+        [1, -2, 3]
+
+    Clauses can also be added temporarily, by adding them within a context
+    opened with :func:`push` and discarding them with :func:`pop`::
+
+        >>> solver.push()
+        4
+        >>> solver.add_clause([-1])
+        >>> solver.solve()
+        False
+        >>> solver.pop()
+        >>> solver.solve()
+        True
+
+    Contexts are implemented with *activation literals*: each clause added in
+    a context is extended with the negation of a new variable, which is
+    assumed to be true while the context is open and permanently set false
+    when it is popped. Since these variables share indices with those of your
+    clauses, any new variables needed after a call to :func:`push` should be
+    obtained from :func:`new_var`, rather than by incrementing the largest
+    variable index used so far. Activation variables never appear in models.
+
+    Solving releases the GIL, so other threads may run while a solver is
+    solving; but a solver can only do one thing at a time, so any use of it
+    from another thread before the solve finishes (including closing it)
+    raises :class:`SolverInUseError <tt.errors.state.SolverInUseError>`.
+    Threads sharing a solver should take turns with a lock of their own.
+
+    A solver holds memory outside of Python until it is closed with
+    :func:`close`, which also happens when a solver is used as a context
+    manager::
+
+        >>> with picosat.Solver() as solver:
+        ...     solver.add_clauses([[1], [-1, -2]])
+        ...     solver.solve() and solver.model()
+        ...
+        [1, -2]
+
+    """
+
+    def __init__(self):
+        self._solver = _c_picosat.Solver()
+        self._closed = False
+        self._contexts = []
+        self._activation_vars = set()
+        self._assumptions = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def closed(self):
+        """Whether this solver has been closed.
+
+        :type: :class:`bool <python:bool>`
+
+        """
+        return self._closed
+
+    @property
+    def num_contexts(self):
+        """The number of contexts currently pushed onto this solver.
+
+        :type: :class:`int <python:int>`
+
+        """
+        return len(self._contexts)
+
+    def add_clause(self, clause):
+        """Add a clause to this solver.
+
+        If any contexts have been pushed, the clause will be removed when the
+        innermost of them is popped.
+
+        :param clause: A clause of literals; positive integers represent
+            non-negated terms and negative integers represent negated terms.
+        :type clause: List[:class:`int <python:int>`]
+
+        :raises AlreadyClosedSolverError: If this solver has been closed.
+        :raises InvalidArgumentTypeError: If ``clause`` is not a list of ints.
+        :raises InvalidArgumentValueError: If ``clause`` is empty or any
+            literal ints are equal to zero or do not fit in 32 bits.
+
+        """
+        self._assert_open()
+        try:
+            self._solver.add_clause(clause, activation=self._activation())
+        except TypeError as e:
+            raise InvalidArgumentTypeError(str(e))
+        except ValueError as e:
+            raise InvalidArgumentValueError(str(e))
+
+    def add_clauses(self, clauses):
+        """Add several clauses to this solver.
+
+        Every clause is checked before any are added, so if an invalid clause
+        is encountered, none of the clauses will have been added.
+
+        :param clauses: CNF (AND of ORs) clauses, each of the form accepted by
+            :func:`add_clause`, or a buffer of packed clauses (see
+            :func:`pack_clauses`).
+        :type clauses: List[List[:class:`int <python:int>`]] or buffer
+
+        :raises AlreadyClosedSolverError: If this solver has been closed.
+        :raises InvalidArgumentTypeError: If ``clauses`` is not a list of lists
+            of ints.
+        :raises InvalidArgumentValueError: If any clause is empty or any
+            literal ints are equal to zero or do not fit in 32 bits.
+
+        """
+        self._assert_open()
+        try:
+            self._solver.add_clauses(clauses, activation=self._activation())
+        except TypeError as e:
+            raise InvalidArgumentTypeError(str(e))
+        except ValueError as e:
+            raise InvalidArgumentValueError(str(e))
+
+    def assume(self, *literals):
+        """Assume literals to be true for the next call to :func:`solve`.
+
+        As in PicoSAT, assumptions only last for a single call to
+        :func:`solve`, after which they are cleared.
+
+        :param literals: The literals to assume.
+        :type literals: :class:`int <python:int>`
+
+        :raises AlreadyClosedSolverError: If this solver has been closed.
+
+        """
+        self._assert_open()
+        self._assumptions.extend(literals)
+
+    def solve(self, assumptions=None, decision_limit=None,
+              propagation_limit=None, timeout=None):
+        """Check whether this solver's clauses can be satisfied.
+
+        :param assumptions: Literals to assume to be true for this call only,
+            in addition to any passed to :func:`assume` since the last call.
+        :type assumptions: List[:class:`int <python:int>`], optional
+
+        :param decision_limit: The most decisions PicoSAT may make in this
+            call, including those to assume each assumed literal.
+        :type decision_limit: :class:`int <python:int>`, optional
+
+        :param propagation_limit: The most propagations PicoSAT may make in
+            this call.
+        :type propagation_limit: :class:`int <python:int>`, optional
+
+        :param timeout: The most seconds PicoSAT may spend in this call,
+            which is only checked every 1024 decisions.
+        :type timeout: :class:`float <python:float>`, optional
+
+        :returns: Whether the clauses are satisfiable under the assumptions.
+        :rtype: :class:`bool <python:bool>`
+
+        :raises AlreadyClosedSolverError: If this solver has been closed.
+        :raises InvalidArgumentTypeError: If ``assumptions`` is not a list of
+            ints, or any limit is not a number.
+        :raises InvalidArgumentValueError: If any assumed literals are equal
+            to zero or do not fit in 32 bits, or any limit is negative.
+        :raises SolverLimitError: If a limit is reached before it is known
+            whether the clauses are satisfiable. The solver remains usable.
+
+        """
+        self._assert_open()
+
+        all_assumptions = self._assumptions + self._contexts
+        self._assumptions = []
+        if assumptions is not None:
+            if not isinstance(assumptions, list):
+                raise InvalidArgumentTypeError(
+                    'assumptions must be a list of non-zero ints')
+            all_assumptions = assumptions + all_assumptions
+
+        try:
+            result = self._solver.solve(assumptions=all_assumptions or None,
+                                        decision_limit=decision_limit,
+                                        propagation_limit=propagation_limit,
+                                        timeout=timeout,
+                                        stats_callback=_stats_callback())
+        except TypeError as e:
+            raise InvalidArgumentTypeError(str(e))
+        except ValueError as e:
+            raise InvalidArgumentValueError(str(e))
+
+        if result == _UNKNOWN:
+            raise SolverLimitError(
+                'PicoSAT reached a limit before finding a result')
+        return result == _SATISFIABLE
+
+    def model(self):
+        """Get the solution found by the last call to :func:`solve`.
+
+        :returns: The literal of each variable in the solution, or ``None`` if
+            the last call to :func:`solve` did not find one or clauses or
+            variables have been added since.
+        :rtype: List[:class:`int <python:int>`] or ``None``
+
+        :raises AlreadyClosedSolverError: If this solver has been closed.
+
+        """
+        self._assert_open()
+        model = self._solver.model()
+        if model is not None and self._activation_vars:
+            model = [lit for lit in model
+                     if abs(lit) not in self._activation_vars]
+        return model
+
+    def new_var(self):
+        """Allocate a new variable, one past the largest in use.
+
+        :returns: The index of the new variable.
+        :rtype: :class:`int <python:int>`
+
+        :raises AlreadyClosedSolverError: If this solver has been closed.
+
+        """
+        self._assert_open()
+        return self._solver.new_var()
+
+    def push(self):
+        """Open a new context, to which subsequently added clauses belong.
+
+        :returns: The activation variable of the new context.
+        :rtype: :class:`int <python:int>`
+
+        :raises AlreadyClosedSolverError: If this solver has been closed.
+
+        """
+        self._assert_open()
+        activation = self._solver.new_var()
+        self._activation_vars.add(activation)
+        self._contexts.append(activation)
+        return activation
+
+    def pop(self):
+        """Close the innermost context, discarding the clauses added in it.
+
+        :raises AlreadyClosedSolverError: If this solver has been closed.
+        :raises RequiresSolverContextError: If no context is open.
+
+        """
+        self._assert_open()
+        if not self._contexts:
+            raise RequiresSolverContextError(
+                'There is no pushed context to pop')
+
+        # with its activation variable false, the context's clauses are all
+        # satisfied, and PicoSAT will eventually garbage collect them
+        self._solver.add_clause([-self._contexts[-1]])
+        self._contexts.pop()
+
+    def close(self):
+        """Release this solver's PicoSAT instance.
+
+        Closing an already-closed solver has no effect.
+
+        :raises SolverInUseError: If another thread is solving with this
+            solver.
+
+        """
+        if not self._closed:
+            self._solver.close()
+            self._closed = True
+
+    def _activation(self):
+        """Get the activation variable of the innermost context, if any."""
+        return self._contexts[-1] if self._contexts else 0
+
+    def _assert_open(self):
+        """Raise an ``AlreadyClosedSolverError`` if this solver is closed."""
+        if self._closed:
+            raise AlreadyClosedSolverError('Cannot use a closed solver')
@@ -1,3 +1,5 @@
 """Tools for working with truth tables."""
 
+from .multi_output_truth_table import MultiOutputTruthTable  # noqa
+from .sparse_truth_table import SparseTruthTable  # noqa
 from .truth_table import TruthTable  # noqa
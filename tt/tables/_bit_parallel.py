@@ -0,0 +1,118 @@
+"""Bit-parallel evaluation of expression trees over all rows at once.
+
+Rather than evaluating a tree once per row, :class:`BitParallelEvaluator`
+evaluates each node of a tree once over the whole table, representing the
+node's value on every row as an int in plane layout (see
+:mod:`tt.tables._bitplanes`), so that a single bitwise operation on ints
+computes an operator's results for all rows.
+
+Structurally identical subtrees are only evaluated once, even when they appear
+in different trees evaluated by the same evaluator.
+
+"""
+
+from tt.definitions import (
+    TT_AND_OP,
+    TT_IMPL_OP,
+    TT_NAND_OP,
+    TT_NOR_OP,
+    TT_NOT_OP,
+    TT_OR_OP,
+    TT_XNOR_OP,
+    TT_XOR_OP)
+from tt.trees import (
+    BinaryOperatorExpressionTreeNode,
+    OperandExpressionTreeNode)
+
+from ._bitplanes import (
+    all_rows_mask,
+    row_bit_mask)
+
+
+# functions of the rows of each operand and the mask of all rows
+_PLANE_OPS = {
+    TT_NOT_OP: lambda a, b, mask: ~a & mask,
+    TT_AND_OP: lambda a, b, mask: a & b,
+    TT_NAND_OP: lambda a, b, mask: ~(a & b) & mask,
+    TT_OR_OP: lambda a, b, mask: a | b,
+    TT_NOR_OP: lambda a, b, mask: ~(a | b) & mask,
+    TT_XOR_OP: lambda a, b, mask: a ^ b,
+    TT_XNOR_OP: lambda a, b, mask: ~(a ^ b) & mask,
+    TT_IMPL_OP: lambda a, b, mask: (~a | b) & mask,
+}
+
+
+class BitParallelEvaluator(object):
+
+    """An evaluator of expression trees over every row of a table.
+
+    :param ordering: The symbols of the table, where the first symbol is the
+        most significant bit of a row index.
+    :type ordering: List[:class:`str <python:str>`]
+
+    """
+
+    def __init__(self, ordering):
+        num_symbols = len(ordering)
+        self._num_rows = 2**num_symbols
+        self._mask = all_rows_mask(self._num_rows)
+        self._symbol_bits = {symbol: num_symbols - 1 - pos
+                             for pos, symbol in enumerate(ordering)}
+
+        # nodes are keyed by their operand or by their operator and the ids
+        # of their children, so equal subtrees map to the same id
+        self._ids = {}
+        self._values = []
+
+    @property
+    def num_unique_nodes(self):
+        """The number of distinct subtrees evaluated so far.
+
+        :type: :class:`int <python:int>`
+
+        """
+        return len(self._values)
+
+    def evaluate(self, tree):
+        """Evaluate a tree, returning an int of the rows on which it is true.
+
+        :param tree: The root of the expression tree to evaluate.
+        :type tree: :class:`ExpressionTreeNode
+            <tt.trees.tree_node.ExpressionTreeNode>`
+
+        :rtype: :class:`int <python:int>`
+
+        """
+        return self._values[self._node_id(tree)]
+
+    def _node_id(self, node):
+        """Recursively evaluate a node and its children, returning its id."""
+        if isinstance(node, OperandExpressionTreeNode):
+            key = node.symbol_name
+            if key in self._ids:
+                return self._ids[key]
+            elif key == '0':
+                value = 0
+            elif key == '1':
+                value = self._mask
+            else:
+                value = row_bit_mask(self._symbol_bits[key], self._num_rows)
+        else:
+            l_id = self._node_id(node.l_child)
+            if isinstance(node, BinaryOperatorExpressionTreeNode):
+                r_id = self._node_id(node.r_child)
+            else:
+                r_id = None
+
+            key = (node.operator, l_id, r_id)
+            if key in self._ids:
+                return self._ids[key]
+
+            value = _PLANE_OPS[node.operator](
+                self._values[l_id],
+                None if r_id is None else self._values[r_id],
+                self._mask)
+
+        node_id = self._ids[key] = len(self._values)
+        self._values.append(value)
+        return node_id
@@ -0,0 +1,241 @@
+"""Helpers for packed, one-bit-per-row planes of table data.
+
+Tables store their results in two planes of equal size, where bit ``i`` of a
+plane (bit ``i % 8`` of byte ``i // 8``) corresponds to row ``i`` of the
+table:
+
+* the *known* plane has a bit set for each row holding a definite Boolean
+  result; and
+* the *values* plane holds that result for known rows, while for the
+  remaining rows a set bit marks a don't care and a clear bit marks a row
+  that has not been filled yet.
+
+Planes can be any writable bytes-like object supporting item access, which
+allows both in-memory ``bytearray`` and memory-mapped storage. Word-level
+operations over entire planes are performed by converting them to Python
+:class:`int <python:int>` objects, on which bit ``i`` again represents row
+``i``.
+
+"""
+
+import sys
+
+from tt.errors import (
+    InvalidArgumentTypeError,
+    InvalidArgumentValueError)
+
+
+def num_plane_bytes(num_rows):
+    """Get the number of bytes needed for a plane of the specified rows."""
+    return (num_rows + 7) // 8
+
+
+def new_plane(num_rows):
+    """Make a new, zeroed in-memory plane for the specified rows."""
+    return bytearray(num_plane_bytes(num_rows))
+
+
+def get_bit(plane, i):
+    """Get the bit (as ``0`` or ``1``) for row ``i`` of a plane."""
+    return (plane[i >> 3] >> (i & 7)) & 1
+
+
+def set_bit(plane, i):
+    """Set the bit for row ``i`` of a plane."""
+    plane[i >> 3] |= 1 << (i & 7)
+
+
+def plane_to_int(plane):
+    """Convert a plane to an int, where bit ``i`` represents row ``i``."""
+    return int.from_bytes(plane, 'little')
+
+
+def int_to_plane_bytes(x, num_rows):
+    """Convert an int to the bytes of a plane of the specified rows."""
+    return (x & all_rows_mask(num_rows)).to_bytes(
+        num_plane_bytes(num_rows), 'little')
+
+
+def all_rows_mask(num_rows):
+    """Get an int mask with a bit set for each of the specified rows."""
+    return (1 << num_rows) - 1
+
+
+try:
+    popcount = int.bit_count
+except AttributeError:
+    def popcount(x):
+        """Count the set bits of a non-negative int."""
+        return bin(x).count('1')
+
+
+def row_bit_mask(bit, num_rows):
+    """Get an int mask of the rows whose index has the specified bit set."""
+    half_period = 1 << bit
+    mask = ((1 << half_period) - 1) << half_period
+    period = 2 * half_period
+    while period < num_rows:
+        mask |= mask << period
+        period *= 2
+    return mask & all_rows_mask(num_rows)
+
+
+def cofactors_differ(values, known, bit, num_rows):
+    """Whether the result depends on the specified bit of the row index.
+
+    This is the case if any two known rows whose indices differ only in that
+    bit have different values.
+
+    """
+    shift = 1 << bit
+    low_rows = all_rows_mask(num_rows) & ~row_bit_mask(bit, num_rows)
+    return bool(((values >> shift) ^ values) & known & (known >> shift) &
+                low_rows)
+
+
+def swap_row_bits(x, a, b, num_rows):
+    """Re-index the rows of an int by swapping bits ``a`` and ``b`` of each
+    row index, where ``a < b``.
+
+    This is done with a single delta swap over the whole int, exchanging each
+    row whose index has bit ``a`` set and bit ``b`` clear with its partner
+    that has bit ``a`` clear and bit ``b`` set.
+
+    """
+    shift = (1 << b) - (1 << a)
+    mask = row_bit_mask(a, num_rows) & ~row_bit_mask(b, num_rows)
+    delta = (x ^ (x >> shift)) & mask
+    return x ^ delta ^ (delta << shift)
+
+
+def reorder_rows(x, num_rows, from_ordering, to_ordering):
+    """Re-index the rows of an int from one symbol ordering to another.
+
+    :param x: The int of rows, where row indices are formed from the values of
+        the symbols in ``from_ordering``, with the first symbol as the most
+        significant bit.
+    :type x: :class:`int <python:int>`
+
+    :param num_rows: The number of rows in ``x``.
+    :type num_rows: :class:`int <python:int>`
+
+    :param from_ordering: The ordering of the symbols indexing ``x``.
+    :type from_ordering: List[:class:`str <python:str>`]
+
+    :param to_ordering: A permutation of ``from_ordering``.
+    :type to_ordering: List[:class:`str <python:str>`]
+
+    :returns: An int of the same rows, indexed by ``to_ordering``.
+    :rtype: :class:`int <python:int>`
+
+    """
+    # symbols by the bit of the row index they occupy, least significant first
+    current = list(reversed(from_ordering))
+    target = list(reversed(to_ordering))
+    for bit, symbol in enumerate(target):
+        if current[bit] != symbol:
+            other_bit = current.index(symbol)
+            x = swap_row_bits(x, bit, other_bit, num_rows)
+            current[bit], current[other_bit] = symbol, current[bit]
+    return x
+
+
+# maps each byte to the byte with its bit order reversed
+_REVERSED_BITS_TABLE = bytes(int('{:08b}'.format(i)[::-1], 2)
+                             for i in range(256))
+
+
+def natural_num_rows(rows):
+    """Get the number of rows described by a packed source of row bits.
+
+    :param rows: A source of row bits, as accepted by :func:`rows_to_int`.
+
+    :returns: The number of rows implied by the source itself, or ``None``
+        for sources that do not carry a length (i.e., ints) or are not of a
+        supported type.
+    :rtype: :class:`int <python:int>` or ``None``
+
+    """
+    if isinstance(rows, int):
+        return None
+
+    numpy = sys.modules.get('numpy')
+    if numpy is not None and isinstance(rows, numpy.ndarray):
+        return rows.size
+    elif _is_bitarray(rows):
+        return len(rows)
+
+    try:
+        return memoryview(rows).nbytes * 8
+    except TypeError:
+        return None
+
+
+def rows_to_int(rows, num_rows):
+    """Convert a packed source of row bits to an int.
+
+    :param rows: The source of row bits. Ints and bytes-like objects are
+        interpreted as already being in plane layout (i.e., bit ``i`` of the
+        int or bit ``i % 8`` of byte ``i // 8`` represents row ``i``), while
+        NumPy arrays and bitarrays must hold one element per row.
+    :type rows: :class:`int <python:int>`, bytes-like object, ``bitarray``, or
+        ``numpy.ndarray``
+
+    :param num_rows: The number of rows that ``rows`` is expected to hold.
+    :type num_rows: :class:`int <python:int>`
+
+    :returns: An int where bit ``i`` represents row ``i``.
+    :rtype: :class:`int <python:int>`
+
+    :raises InvalidArgumentTypeError: If ``rows`` is not one of the supported
+        types.
+    :raises InvalidArgumentValueError: If the size of ``rows`` does not match
+        ``num_rows``.
+
+    """
+    if isinstance(rows, bool):
+        raise InvalidArgumentTypeError('Packed rows cannot be a bool')
+    elif isinstance(rows, int):
+        if rows < 0 or rows.bit_length() > num_rows:
+            raise InvalidArgumentValueError(
+                'Packed int rows must be non-negative and fit within '
+                '{} bits'.format(num_rows))
+        return rows
+
+    numpy = sys.modules.get('numpy')
+    if numpy is not None and isinstance(rows, numpy.ndarray):
+        if rows.size != num_rows:
+            raise InvalidArgumentValueError(
+                'Expected an array of {} rows'.format(num_rows))
+        return int.from_bytes(
+            numpy.packbits(rows.ravel().astype(bool, copy=False),
+                           bitorder='little').tobytes(),
+            'little')
+    elif _is_bitarray(rows):
+        if len(rows) != num_rows:
+            raise InvalidArgumentValueError(
+                'Expected a bitarray of {} rows'.format(num_rows))
+        packed = rows.tobytes()
+        if rows.endian() == 'big':
+            packed = packed.translate(_REVERSED_BITS_TABLE)
+        return int.from_bytes(packed, 'little') & all_rows_mask(num_rows)
+
+    try:
+        view = memoryview(rows)
+    except TypeError:
+        raise InvalidArgumentTypeError(
+            'Packed rows must be an int, bytes-like object, bitarray, or '
+            'NumPy array')
+
+    if view.nbytes != num_plane_bytes(num_rows):
+        raise InvalidArgumentValueError(
+            'Expected {} bytes of packed rows'.format(
+                num_plane_bytes(num_rows)))
+
+    return int.from_bytes(view, 'little') & all_rows_mask(num_rows)
+
+
+def _is_bitarray(rows):
+    """Whether an object looks like an instance of ``bitarray.bitarray``."""
+    return (type(rows).__module__.split('.')[0] == 'bitarray' and
+            hasattr(rows, 'endian') and hasattr(rows, 'tobytes'))
@@ -0,0 +1,139 @@
+"""Incremental evaluation of expression trees in Gray code order.
+
+When the rows of a table are visited in Gray code order, exactly one input
+changes between consecutive rows. Rather than re-evaluating an entire
+expression tree for each row, :class:`GrayCodeEvaluator` caches the value of
+every node of the tree and, when an input flips, only re-computes the nodes
+on the paths from that input's leaves up to the root.
+
+"""
+
+from tt.trees import (
+    BinaryOperatorExpressionTreeNode,
+    OperandExpressionTreeNode)
+
+
+class GrayCodeEvaluator(object):
+
+    """An incremental evaluator of an expression tree.
+
+    :param tree: The root of the expression tree to evaluate.
+    :type tree: :class:`ExpressionTreeNode
+        <tt.trees.tree_node.ExpressionTreeNode>`
+
+    :param ordering: The symbols of the tree, where the position of each
+        symbol in this list is used to refer to it when flipping inputs.
+    :type ordering: List[:class:`str <python:str>`]
+
+    """
+
+    def __init__(self, tree, ordering):
+        # nodes are numbered in post-order, so children always precede their
+        # parents; each operator node is stored as (index, eval_func, left
+        # child index, right child index or None)
+        self._values = []
+        self._operators = []
+        self._leaves = {symbol: [] for symbol in ordering}
+        parents = []
+        self._root = self._add_node(tree, parents)
+
+        # the operator nodes to re-compute when each symbol flips, in order
+        operators_by_index = {op[0]: op for op in self._operators}
+        self._paths = []
+        for symbol in ordering:
+            dirty = set()
+            for leaf in self._leaves[symbol]:
+                node = parents[leaf]
+                while node is not None and node not in dirty:
+                    dirty.add(node)
+                    node = parents[node]
+            self._paths.append([operators_by_index[node]
+                                for node in sorted(dirty)])
+
+        self._leaves = [self._leaves[symbol] for symbol in ordering]
+        self._inputs = [False] * len(ordering)
+
+    def reset(self, inputs):
+        """Fully evaluate the tree for a new set of inputs.
+
+        :param inputs: The value of each symbol, in the evaluator's ordering.
+        :type inputs: List[:class:`bool <python:bool>`]
+
+        :returns: The value of the tree.
+        :rtype: :class:`bool <python:bool>`
+
+        """
+        values = self._values
+        self._inputs = [bool(value) for value in inputs]
+        for value, leaves in zip(self._inputs, self._leaves):
+            for leaf in leaves:
+                values[leaf] = value
+
+        for i, eval_func, l_child, r_child in self._operators:
+            if r_child is None:
+                values[i] = eval_func(values[l_child])
+            else:
+                values[i] = eval_func(values[l_child], values[r_child])
+
+        return bool(values[self._root])
+
+    def flip(self, pos):
+        """Flip one input, re-computing only the nodes it affects.
+
+        :param pos: The position in the evaluator's ordering of the symbol to
+            flip.
+        :type pos: :class:`int <python:int>`
+
+        :returns: The new value of the tree.
+        :rtype: :class:`bool <python:bool>`
+
+        """
+        values = self._values
+        value = self._inputs[pos] = not self._inputs[pos]
+        for leaf in self._leaves[pos]:
+            values[leaf] = value
+
+        for i, eval_func, l_child, r_child in self._paths[pos]:
+            if r_child is None:
+                values[i] = eval_func(values[l_child])
+            else:
+                values[i] = eval_func(values[l_child], values[r_child])
+
+        return bool(values[self._root])
+
+    def _add_node(self, node, parents):
+        """Recursively number a node and its children, returning its index."""
+        if isinstance(node, OperandExpressionTreeNode):
+            i = len(self._values)
+            self._values.append(node.symbol_name == '1')
+            parents.append(None)
+            if node.symbol_name not in ('0', '1'):
+                self._leaves[node.symbol_name].append(i)
+            return i
+
+        l_child = self._add_node(node.l_child, parents)
+        if isinstance(node, BinaryOperatorExpressionTreeNode):
+            r_child = self._add_node(node.r_child, parents)
+        else:
+            r_child = None
+
+        i = len(self._values)
+        self._values.append(False)
+        parents.append(None)
+        parents[l_child] = i
+        if r_child is not None:
+            parents[r_child] = i
+        self._operators.append(
+            (i, node.operator.eval_func, l_child, r_child))
+        return i
+
+
+def iter_gray_code_flips(num_bits):
+    """Iterate over the bit flipped at each step of a Gray code sequence.
+
+    The sequence visits all ``2**num_bits`` values starting from zero, so
+    ``2**num_bits - 1`` flips are yielded; bit ``0`` flips most often.
+
+    """
+    for step in range(1, 2**num_bits):
+        yield (step & -step).bit_length() - 1
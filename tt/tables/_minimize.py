@@ -0,0 +1,375 @@
+"""Two-level (sum-of-products) minimization of packed truth tables.
+
+Functions are described by ints of rows (see :mod:`tt.tables._bitplanes`):
+an on-set of rows that must be covered, and a don't care set of rows that may
+optionally be covered. Product terms are represented as *cubes*, which are
+``(mask, value)`` pairs of ints over the bits of a row index: a set bit in
+``mask`` means the corresponding symbol appears as a literal in the term, with
+its polarity given by the same bit of ``value``. A cube therefore covers each
+row ``r`` for which ``r & mask == value``.
+
+Two minimizers are provided:
+
+* :func:`minimize_exact`, which computes all prime implicants with the
+  Quine-McCluskey method and selects a minimum cover of them (the problem
+  solved by Petrick's method) with a branch and bound search; and
+* :func:`minimize_heuristic`, which follows the expand, irredundant, and
+  reduce loop of the Espresso heuristic, working directly on rows rather
+  than ever enumerating all prime implicants.
+
+Both minimizers return a list of cubes, which are compared first by their
+number and then by their total number of literals.
+
+"""
+
+from ._bitplanes import (
+    all_rows_mask,
+    popcount,
+    row_bit_mask)
+
+
+# the number of times the heuristic's reduce/expand/irredundant loop will be
+# re-run without finding a cheaper cover before giving up
+_MAX_HEURISTIC_PASSES = 3
+
+
+def minimize_exact(on_set, dc_set, num_vars):
+    """Find a minimum cover of a function.
+
+    :param on_set: The rows on which the function is true.
+    :type on_set: :class:`int <python:int>`
+
+    :param dc_set: The rows on which the function's value does not matter.
+    :type dc_set: :class:`int <python:int>`
+
+    :param num_vars: The number of bits in a row index.
+    :type num_vars: :class:`int <python:int>`
+
+    :returns: The cubes of a minimum cover of ``on_set``.
+    :rtype: List[Tuple[:class:`int <python:int>`, :class:`int <python:int>`]]
+
+    """
+    if not on_set:
+        return []
+
+    primes = _prime_implicants(on_set | dc_set, num_vars)
+    prime_rows = [cube_rows(cube, num_vars) & on_set for cube in primes]
+
+    # essential primes are the only primes covering some on-set row
+    chosen = set()
+    covered = 0
+    once = twice = 0
+    for rows in prime_rows:
+        twice |= once & rows
+        once |= rows
+    uniquely_covered = once & ~twice
+    for i, rows in enumerate(prime_rows):
+        if rows & uniquely_covered:
+            chosen.add(i)
+            covered |= rows
+
+    remaining = on_set & ~covered
+    if remaining:
+        chosen.update(_min_cover(primes, prime_rows, remaining))
+
+    return [primes[i] for i in sorted(chosen)]
+
+
+def minimize_heuristic(on_set, dc_set, num_vars):
+    """Find a near-minimum cover of a function.
+
+    This takes the same arguments and returns the same type as
+    :func:`minimize_exact`, but each cube of the returned cover is only
+    guaranteed to be a prime implicant, and the cover is only guaranteed to
+    be irredundant (i.e., no cube can be dropped from it).
+
+    """
+    if not on_set:
+        return []
+
+    off_set = all_rows_mask(1 << num_vars) & ~(on_set | dc_set)
+
+    # seed the cover by expanding each on-set row not yet covered
+    cover = []
+    uncovered = on_set
+    while uncovered:
+        row = (uncovered & -uncovered).bit_length() - 1
+        cube, rows = _expand((all_rows_mask(num_vars), row), 1 << row,
+                             off_set, on_set)
+        cover.append((cube, rows))
+        uncovered &= ~rows
+
+    cover = _irredundant(cover, on_set)
+    best = cover
+    passes_without_improvement = 0
+    while passes_without_improvement < _MAX_HEURISTIC_PASSES:
+        cover = _reduce(cover, on_set, num_vars)
+        cover = _expand_cover(cover, off_set, on_set)
+        cover = _irredundant(cover, on_set)
+        if _cover_cost(cover) < _cover_cost(best):
+            best = cover
+            passes_without_improvement = 0
+        else:
+            passes_without_improvement += 1
+
+    return [cube for cube, _ in best]
+
+
+def cube_rows(cube, num_vars):
+    """Get an int of the rows covered by a cube."""
+    mask, value = cube
+    rows = 1 << value
+    for bit in range(num_vars):
+        if not mask & (1 << bit):
+            rows |= rows << (1 << bit)
+    return rows
+
+
+def cube_cost(cube):
+    """Get the number of literals in a cube."""
+    return popcount(cube[0])
+
+
+def _cover_cost(cover):
+    """Get the cost of a cover of ``(cube, rows)`` pairs."""
+    return len(cover), sum(cube_cost(cube) for cube, _ in cover)
+
+
+def _prime_implicants(rows, num_vars):
+    """Get all prime implicants of a set of rows via Quine-McCluskey."""
+    full_mask = all_rows_mask(num_vars)
+    cubes = set()
+    remaining = rows
+    while remaining:
+        row = (remaining & -remaining).bit_length() - 1
+        cubes.add((full_mask, row))
+        remaining &= remaining - 1
+
+    primes = []
+    while cubes:
+        merged = set()
+        combined = set()
+        for mask, value in cubes:
+            bits = mask & ~value
+            while bits:
+                bit = bits & -bits
+                bits ^= bit
+                partner = (mask, value | bit)
+                if partner in cubes:
+                    merged.add((mask & ~bit, value))
+                    combined.add((mask, value))
+                    combined.add(partner)
+        primes.extend(cubes - combined)
+        cubes = merged
+
+    return sorted(primes, key=lambda cube: (cube_cost(cube), cube))
+
+
+def _min_cover(primes, prime_rows, remaining):
+    """Select the cheapest set of primes covering the remaining rows.
+
+    This is the selection made by Petrick's method, but rather than
+    multiplying out a product of sums of primes (which quickly becomes
+    intractable), the cheapest cover is found with a branch and bound search
+    that repeatedly takes essential primes, discards dominated primes, and
+    branches on the primes covering the row with the fewest options.
+
+    :returns: The indices of the selected primes.
+    :rtype: List[:class:`int <python:int>`]
+
+    """
+    candidates = [(popcount(prime[0]), rows, i)
+                  for i, (prime, rows) in enumerate(zip(primes, prime_rows))
+                  if rows & remaining]
+    best = [None, None]
+
+    def search(remaining, candidates, chosen, cost):
+        chosen = list(chosen)
+        while remaining:
+            candidates = _undominated(
+                [(c, rows & remaining, i) for c, rows, i in candidates
+                 if rows & remaining])
+
+            # take any primes that are the only cover of some row
+            once = twice = 0
+            for _, rows, _ in candidates:
+                twice |= once & rows
+                once |= rows
+            essential_rows = once & ~twice
+            if not essential_rows:
+                break
+
+            for c, rows, i in candidates:
+                if rows & essential_rows:
+                    chosen.append(i)
+                    cost = (cost[0] + 1, cost[1] + c)
+                    remaining &= ~rows
+
+        if not remaining:
+            if best[0] is None or cost < best[0]:
+                best[:] = cost, chosen
+            return
+
+        # rows that share no prime each need a distinct prime of their own
+        bound = 0
+        blocked = 0
+        min_literals = min(c for c, _, _ in candidates)
+        rows_left = remaining
+        while rows_left:
+            row_bit = rows_left & -rows_left
+            rows_left ^= row_bit
+            if not row_bit & blocked:
+                bound += 1
+                for _, rows, _ in candidates:
+                    if rows & row_bit:
+                        blocked |= rows
+        if best[0] is not None and (cost[0] + bound,
+                                    cost[1] + bound * min_literals) >= best[0]:
+            return
+
+        # branch on the row with the fewest covering primes
+        branch_row = min(
+            _iter_bits(remaining),
+            key=lambda row_bit: sum(1 for _, rows, _ in candidates
+                                    if rows & row_bit))
+        branches = sorted(
+            (cand for cand in candidates if cand[1] & branch_row),
+            key=lambda cand: (-popcount(cand[1]), cand[0]))
+        for c, rows, i in branches:
+            search(remaining & ~rows, candidates, chosen + [i],
+                   (cost[0] + 1, cost[1] + c))
+
+    search(remaining, candidates, [], (0, 0))
+    return best[1]
+
+
+def _undominated(candidates):
+    """Drop candidate primes whose rows are covered by a no-costlier prime."""
+    candidates = sorted(candidates,
+                        key=lambda cand: (-popcount(cand[1]), cand[0]))
+    kept = []
+    for cand in candidates:
+        cost, rows, _ = cand
+        if not any(rows & ~other_rows == 0 and other_cost <= cost
+                   for other_cost, other_rows, _ in kept):
+            kept.append(cand)
+    return kept
+
+
+def _iter_bits(x):
+    """Iterate over the set bits of an int, as single-bit ints."""
+    while x:
+        bit = x & -x
+        x ^= bit
+        yield bit
+
+
+def _expand(cube, rows, off_set, target):
+    """Greedily expand a cube into a prime implicant.
+
+    Literals are dropped one at a time, each time choosing the literal whose
+    removal newly covers the most ``target`` rows without covering any
+    ``off_set`` rows.
+
+    :returns: A tuple of the expanded cube and its rows.
+
+    """
+    mask, value = cube
+    while True:
+        best = None
+        best_gain = -1
+        bits = mask
+        while bits:
+            bit = bits & -bits
+            bits ^= bit
+            shift = 1 << (bit.bit_length() - 1)
+            if value & bit:
+                new_rows = rows | (rows >> shift)
+            else:
+                new_rows = rows | (rows << shift)
+
+            if new_rows & off_set:
+                continue
+
+            gain = popcount(new_rows & ~rows & target)
+            if gain > best_gain:
+                best, best_gain = (bit, new_rows), gain
+
+        if best is None:
+            return (mask, value), rows
+
+        bit, rows = best
+        mask &= ~bit
+        value &= ~bit
+
+
+def _expand_cover(cover, off_set, on_set):
+    """Expand each cube of a cover, dropping cubes that become covered."""
+    # expanding the smallest cubes first gives them the most freedom
+    cover = sorted(cover, key=lambda item: popcount(item[1]))
+    expanded = []
+    covered = 0
+    for cube, rows in cover:
+        if not rows & on_set & ~covered:
+            continue
+
+        cube, rows = _expand(cube, rows, off_set, on_set & ~covered)
+        expanded.append((cube, rows))
+        covered |= rows
+
+    return expanded
+
+
+def _irredundant(cover, on_set):
+    """Drop cubes from a cover whose on-set rows are covered by others."""
+    # try dropping the cubes with the fewest literals last
+    cover = sorted(cover, key=lambda item: -cube_cost(item[0]))
+    suffix_covers = _suffix_covers(cover)
+    kept = []
+    kept_rows = 0
+    for i, (cube, rows) in enumerate(cover):
+        if rows & on_set & ~(kept_rows | suffix_covers[i + 1]):
+            kept.append((cube, rows))
+            kept_rows |= rows
+
+    return kept
+
+
+def _reduce(cover, on_set, num_vars):
+    """Shrink each cube of a cover to the rows that only it covers."""
+    # reducing the largest cubes first frees up the most room for expansion
+    cover = sorted(cover, key=lambda item: -popcount(item[1]))
+    suffix_covers = _suffix_covers(cover)
+    bit_masks = [row_bit_mask(bit, 1 << num_vars) for bit in range(num_vars)]
+    reduced = []
+    prefix_cover = 0
+    for i, (cube, rows) in enumerate(cover):
+        essential_rows = (rows & on_set &
+                          ~(prefix_cover | suffix_covers[i + 1]))
+        if essential_rows:
+            cube = _supercube(essential_rows, bit_masks)
+            rows = cube_rows(cube, num_vars)
+            reduced.append((cube, rows))
+            prefix_cover |= rows
+
+    return reduced
+
+
+def _supercube(rows, bit_masks):
+    """Get the smallest cube covering a non-empty set of rows."""
+    mask = value = 0
+    for bit, bit_mask in enumerate(bit_masks):
+        if not rows & ~bit_mask:
+            mask |= 1 << bit
+            value |= 1 << bit
+        elif not rows & bit_mask:
+            mask |= 1 << bit
+    return mask, value
+
+
+def _suffix_covers(cover):
+    """Get the rows covered by each suffix of a cover of ``(cube, rows)``."""
+    suffix_covers = [0] * (len(cover) + 1)
+    for i in range(len(cover) - 1, -1, -1):
+        suffix_covers[i] = suffix_covers[i + 1] | cover[i][1]
+    return suffix_covers
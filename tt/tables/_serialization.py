@@ -0,0 +1,157 @@
+"""The binary layout shared by on-disk and serialized truth tables.
+
+A serialized table is a fixed-size header, followed by the table's ordering
+and (optionally) the raw string of its expression, padded to an 8-byte
+boundary and followed by the table's known and values planes (see
+:mod:`tt.tables._bitplanes`). The planes may be compressed as a single zlib
+stream, in which case the table cannot be memory-mapped.
+
+"""
+
+import struct
+import zlib
+
+from tt.errors import InvalidArgumentValueError
+
+from ._bitplanes import num_plane_bytes
+
+
+MAGIC = b'TTBL'
+FORMAT_VERSION = 1
+
+FLAG_HAS_EXPR = 0x01
+FLAG_HAS_DONT_CARES = 0x02
+FLAG_COMPRESSED = 0x04
+
+_HEADER_STRUCT = struct.Struct('<4sBBHII')
+_ALIGNMENT = 8
+
+
+def pack_header(ordering, expr_str, flags=0):
+    """Pack the header of a serialized table, including alignment padding.
+
+    :param ordering: The table's ordering.
+    :type ordering: List[:class:`str <python:str>`]
+
+    :param expr_str: The raw expression of the table, or ``None``.
+    :type expr_str: :class:`str <python:str>`
+
+    :param flags: Any extra flags to set in the header.
+    :type flags: :class:`int <python:int>`
+
+    :returns: The packed header; its length is a multiple of 8.
+    :rtype: :class:`bytes <python:bytes>`
+
+    """
+    ordering_bytes = ' '.join(ordering).encode('utf-8')
+    if expr_str is None:
+        expr_bytes = b''
+    else:
+        expr_bytes = expr_str.encode('utf-8')
+        flags |= FLAG_HAS_EXPR
+
+    header = (_HEADER_STRUCT.pack(MAGIC, FORMAT_VERSION, flags, len(ordering),
+                                  len(ordering_bytes), len(expr_bytes)) +
+              ordering_bytes + expr_bytes)
+    return header + b'\0' * (-len(header) % _ALIGNMENT)
+
+
+def unpack_header(buf):
+    """Unpack the header at the start of a serialized table.
+
+    :param buf: The bytes-like object holding the serialized table.
+
+    :returns: A tuple of the table's ordering, raw expression string (or
+        ``None``), header flags, and the offset at which the planes begin.
+    :rtype: Tuple[List[:class:`str <python:str>`], :class:`str <python:str>`,
+        :class:`int <python:int>`, :class:`int <python:int>`]
+
+    :raises InvalidArgumentValueError: If ``buf`` does not hold a valid
+        serialized table header.
+
+    """
+    if len(buf) < _HEADER_STRUCT.size:
+        raise InvalidArgumentValueError('Truncated truth table header')
+
+    magic, version, flags, num_symbols, ordering_len, expr_len = \
+        _HEADER_STRUCT.unpack_from(buf)
+    if magic != MAGIC:
+        raise InvalidArgumentValueError('Not a serialized truth table')
+    elif version != FORMAT_VERSION:
+        raise InvalidArgumentValueError(
+            'Unsupported truth table format version {}'.format(version))
+
+    offset = _HEADER_STRUCT.size
+    end = offset + ordering_len + expr_len
+    if len(buf) < end:
+        raise InvalidArgumentValueError('Truncated truth table header')
+
+    ordering = bytes(buf[offset:offset + ordering_len]).decode('utf-8').split()
+    if len(ordering) != num_symbols:
+        raise InvalidArgumentValueError('Corrupt truth table ordering')
+
+    if flags & FLAG_HAS_EXPR:
+        expr_str = bytes(buf[offset + ordering_len:end]).decode('utf-8')
+    else:
+        expr_str = None
+
+    return ordering, expr_str, flags, end + (-end % _ALIGNMENT)
+
+
+def pack_planes(known, values, compress=False):
+    """Pack the planes of a serialized table.
+
+    :param known: The known plane of the table.
+    :param values: The values plane of the table.
+
+    :param compress: Whether to compress the planes.
+    :type compress: :class:`bool <python:bool>`
+
+    :returns: The packed planes.
+    :rtype: :class:`bytes <python:bytes>`
+
+    """
+    if compress:
+        compressor = zlib.compressobj()
+        return (compressor.compress(known) + compressor.compress(values) +
+                compressor.flush())
+    else:
+        return bytes(known) + bytes(values)
+
+
+def unpack_planes(buf, offset, num_rows, flags):
+    """Unpack copies of the planes of a serialized table.
+
+    :param buf: The bytes-like object holding the serialized table.
+
+    :param offset: The offset of the planes within ``buf``, as returned by
+        :func:`unpack_header`.
+    :type offset: :class:`int <python:int>`
+
+    :param num_rows: The number of rows in the table.
+    :type num_rows: :class:`int <python:int>`
+
+    :param flags: The header flags, as returned by :func:`unpack_header`.
+    :type flags: :class:`int <python:int>`
+
+    :returns: A tuple of the known and values planes.
+    :rtype: Tuple[:class:`bytearray <python:bytearray>`,
+        :class:`bytearray <python:bytearray>`]
+
+    :raises InvalidArgumentValueError: If the planes are corrupt or truncated.
+
+    """
+    num_bytes = num_plane_bytes(num_rows)
+    planes = memoryview(buf).cast('B')[offset:]
+    if flags & FLAG_COMPRESSED:
+        try:
+            planes = memoryview(zlib.decompress(planes))
+        except zlib.error:
+            raise InvalidArgumentValueError(
+                'Corrupt compressed truth table planes')
+
+    if len(planes) != 2*num_bytes:
+        raise InvalidArgumentValueError(
+            'Truth table planes do not match the table size')
+
+    return bytearray(planes[:num_bytes]), bytearray(planes[num_bytes:])
@@ -0,0 +1,346 @@
+"""Implementation of a truth table with several outputs."""
+
+import io
+import itertools
+
+from tt._assertions import assert_iterable_contains_all_expr_symbols
+from tt.definitions import boolean_variables_factory
+from tt.errors import (
+    InvalidArgumentTypeError,
+    InvalidArgumentValueError,
+    NoEvaluationVariationError)
+from tt.expressions import BooleanExpression
+
+from ._bit_parallel import BitParallelEvaluator
+from ._bitplanes import (
+    all_rows_mask,
+    int_to_plane_bytes,
+    plane_to_int)
+from .truth_table import TruthTable
+
+
+_WRITE_FORMATS = ('grid', 'csv', 'tsv')
+_WRITE_CHUNK_SIZE = 4096
+_DEFAULT_CELL_PADDING = 1
+
+
+class MultiOutputTruthTable(object):
+
+    """A truth table of several expressions over the same inputs.
+
+    Each output of the table is the result of one expression, and all outputs
+    share the table's ordering of input symbols. Rather than filling a
+    separate :class:`TruthTable <tt.tables.truth_table.TruthTable>` for each
+    expression, the inputs are enumerated only once: every distinct subtree
+    of the expressions is evaluated a single time over all rows with bitwise
+    operations on packed rows, so subexpressions shared between outputs are
+    never re-computed. The results of each output are stored as one packed
+    plane.
+
+    Here's a half adder::
+
+        >>> from tt import MultiOutputTruthTable
+        >>> t = MultiOutputTruthTable(['A xor B', 'A and B'])
+        >>> print(t)
+        +---+---+---------+---------+
+        | A | B | A xor B | A and B |
+        +---+---+---------+---------+
+        | 0 | 0 |    0    |    0    |
+        +---+---+---------+---------+
+        | 0 | 1 |    1    |    0    |
+        +---+---+---------+---------+
+        | 1 | 0 |    1    |    0    |
+        +---+---+---------+---------+
+        | 1 | 1 |    0    |    1    |
+        +---+---+---------+---------+
+
+    Outputs need not depend on every input symbol::
+
+        >>> t = MultiOutputTruthTable(['A or B', 'not C'],
+        ...                           output_names=['f', 'g'])
+        >>> t.ordering
+        ['A', 'B', 'C']
+        >>> t[3]
+        (True, False)
+        >>> t.output_table('g').results
+        [True, False, True, False, True, False, True, False]
+
+    :param exprs: The expressions of the table's outputs.
+    :type exprs: List[:class:`str <python:str>` or :class:`BooleanExpression\
+        <tt.expressions.bexpr.BooleanExpression>`]
+
+    :param ordering: An optional list of symbol names in the order they should
+        appear in the table; if omitted, symbols are ordered by their first
+        appearance in the expressions. Every symbol of every expression must
+        appear in this list.
+    :type ordering: List[:class:`str <python:str>`], optional
+
+    :param output_names: Optional names for the outputs, used as column
+        headers when writing the table and to refer to outputs; if omitted,
+        each output is named by its expression's string.
+    :type output_names: List[:class:`str <python:str>`], optional
+
+    :raises DuplicateSymbolError: If ``ordering`` contains duplicate symbols.
+    :raises ExtraSymbolError: If a symbol not present in any expression is
+        passed into the ``ordering`` list.
+    :raises MissingSymbolError: If a symbol present in an expression is
+        omitted from the ``ordering`` list.
+    :raises InvalidArgumentTypeError: If an unexpected parameter type is
+        encountered.
+    :raises InvalidArgumentValueError: If ``exprs`` is empty, or
+        ``output_names`` is not a list of distinct names, one per expression.
+    :raises NoEvaluationVariationError: If the expressions are composed only
+        of constant values.
+
+    """
+
+    def __init__(self, exprs, ordering=None, output_names=None):
+        if isinstance(exprs, (str, BooleanExpression)) or \
+                not isinstance(exprs, (list, tuple)):
+            raise InvalidArgumentTypeError(
+                '`exprs` must be a list of str or BooleanExpression')
+        elif not exprs:
+            raise InvalidArgumentValueError('`exprs` must be non-empty')
+
+        self._exprs = []
+        for expr in exprs:
+            if isinstance(expr, str):
+                expr = BooleanExpression(expr)
+            elif not isinstance(expr, BooleanExpression):
+                raise InvalidArgumentTypeError(
+                    '`exprs` must be a list of str or BooleanExpression')
+            self._exprs.append(expr)
+
+        symbols = []
+        for expr in self._exprs:
+            symbols.extend(s for s in expr.symbols if s not in symbols)
+
+        if ordering is None:
+            self._ordering = symbols
+        else:
+            assert_iterable_contains_all_expr_symbols(ordering, set(symbols))
+            self._ordering = ordering
+
+        if not self._ordering:
+            raise NoEvaluationVariationError(
+                'These expressions are composed only of constant values')
+
+        if output_names is None:
+            self._output_names = [str(expr) for expr in self._exprs]
+        elif (not isinstance(output_names, list) or
+                not all(isinstance(name, str) for name in output_names)):
+            raise InvalidArgumentTypeError(
+                '`output_names` must be a list of str')
+        elif len(output_names) != len(self._exprs):
+            raise InvalidArgumentValueError(
+                '`output_names` must contain one name per expression')
+        elif len(set(output_names)) != len(output_names):
+            raise InvalidArgumentValueError(
+                '`output_names` must not contain duplicate names')
+        else:
+            self._output_names = output_names
+
+        self._num_rows = 2**len(self._ordering)
+        self._symbol_vals_factory = boolean_variables_factory(self._ordering)
+
+        evaluator = BitParallelEvaluator(self._ordering)
+        self._planes = [
+            bytearray(int_to_plane_bytes(evaluator.evaluate(expr.tree),
+                                         self._num_rows))
+            for expr in self._exprs]
+
+    def __str__(self):
+        buf = io.StringIO()
+        self.write(buf)
+        return buf.getvalue().rstrip('\n')
+
+    def __iter__(self):
+        _input_combos = TruthTable.input_combos(len(self._ordering))
+        for i, combo in enumerate(_input_combos):
+            yield self._symbol_vals_factory._make(combo), self._results_at(i)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._num_rows
+        if not 0 <= i < self._num_rows:
+            raise IndexError('MultiOutputTruthTable index out of range')
+
+        return self._results_at(i)
+
+    @property
+    def exprs(self):
+        """The expressions of this table's outputs.
+
+        :type: List[:class:`BooleanExpression
+            <tt.expressions.bexpr.BooleanExpression>`]
+
+        """
+        return self._exprs
+
+    @property
+    def ordering(self):
+        """The order in which the input symbols appear in the table.
+
+        :type: List[:class:`str <python:str>`]
+
+        """
+        return self._ordering
+
+    @property
+    def output_names(self):
+        """The names of this table's outputs.
+
+        :type: List[:class:`str <python:str>`]
+
+        """
+        return self._output_names
+
+    def output_table(self, output):
+        """Get a full :class:`TruthTable <tt.tables.truth_table.TruthTable>`
+        of a single output.
+
+        The returned table has this table's ordering. It is given the output's
+        expression only if that expression contains every symbol of the
+        ordering, as is required of any table built from an expression.
+
+        :param output: The index or name of the output.
+        :type output: :class:`int <python:int>` or :class:`str <python:str>`
+
+        :returns: A full table of the output's results.
+        :rtype: :class:`TruthTable <tt.tables.truth_table.TruthTable>`
+
+        :raises InvalidArgumentTypeError: If ``output`` is neither an int nor
+            a str.
+        :raises InvalidArgumentValueError: If there is no such output.
+
+        An example::
+
+            >>> from tt import MultiOutputTruthTable
+            >>> t = MultiOutputTruthTable(['A -> B', 'A or B'])
+            >>> print(t.output_table(1))
+            +---+---+---+
+            | A | B |   |
+            +---+---+---+
+            | 0 | 0 | 0 |
+            +---+---+---+
+            | 0 | 1 | 1 |
+            +---+---+---+
+            | 1 | 0 | 1 |
+            +---+---+---+
+            | 1 | 1 | 1 |
+            +---+---+---+
+
+        """
+        index = self._output_index(output)
+        expr = self._exprs[index]
+        if set(expr.symbols) != set(self._ordering):
+            expr = None
+
+        ones = plane_to_int(self._planes[index])
+        zeros = all_rows_mask(self._num_rows) & ~ones
+        return TruthTable._from_rows(list(self._ordering), expr, ones, zeros)
+
+    def write(self, fp, format='grid'):
+        """Stream the rows of this table, with every output, to a file-like
+        object.
+
+        As with :func:`TruthTable.write
+        <tt.tables.truth_table.TruthTable.write>`, only a small batch of
+        formatted rows is held in memory at once.
+
+        :param fp: The file-like object to write to; only its ``write`` method
+            is used.
+        :type fp: text file-like object
+
+        :param format: The output format; one of ``'grid'`` (the same layout
+            produced by ``__str__``), ``'csv'``, or ``'tsv'``.
+        :type format: :class:`str <python:str>`, optional
+
+        :raises InvalidArgumentValueError: If ``format`` is not one of the
+            supported formats.
+
+        An example::
+
+            >>> import sys
+            >>> from tt import MultiOutputTruthTable
+            >>> t = MultiOutputTruthTable(['A nand B', 'A nor B'],
+            ...                           output_names=['nand', 'nor'])
+            >>> t.write(sys.stdout, format='csv')
+            A,B,nand,nor
+            0,0,1,1
+            0,1,1,0
+            1,0,1,0
+            1,1,0,0
+
+        """
+        if format not in _WRITE_FORMATS:
+            raise InvalidArgumentValueError(
+                '`format` must be one of ' +
+                ', '.join('"{}"'.format(f) for f in _WRITE_FORMATS))
+
+        headers = list(self._ordering) + self._output_names
+        if format == 'grid':
+            col_widths = [2 * _DEFAULT_CELL_PADDING + len(header)
+                          for header in headers]
+            row_sep = '+' + '+'.join('-' * w for w in col_widths) + '+'
+            cells = [(_center('0', width) + '|', _center('1', width) + '|')
+                     for width in col_widths]
+            row_start = '|'
+            line_end = '\n' + row_sep + '\n'
+
+            fp.write(row_sep + '\n|' +
+                     ''.join(_center(header, width) + '|'
+                             for header, width in zip(headers, col_widths)) +
+                     line_end)
+        else:
+            delimiter = ',' if format == 'csv' else '\t'
+            cells = [('0' + delimiter, '1' + delimiter) for _ in headers]
+            cells[-1] = ('0', '1')
+            row_start = ''
+            line_end = '\n'
+
+            fp.write(delimiter.join(headers) + '\n')
+
+        input_cells = cells[:len(self._ordering)]
+        output_cells = cells[len(self._ordering):]
+        chunk = []
+        for i, row_cells in enumerate(itertools.product(*input_cells)):
+            chunk.append(row_start)
+            chunk.extend(row_cells)
+            for plane, cell in zip(self._planes, output_cells):
+                chunk.append(cell[(plane[i >> 3] >> (i & 7)) & 1])
+            chunk.append(line_end)
+            if len(chunk) >= _WRITE_CHUNK_SIZE:
+                fp.write(''.join(chunk))
+                chunk.clear()
+
+        fp.write(''.join(chunk))
+
+    def _output_index(self, output):
+        """Get the index of an output from its index or name."""
+        if isinstance(output, str):
+            if output not in self._output_names:
+                raise InvalidArgumentValueError(
+                    'No output named "{}"'.format(output))
+            return self._output_names.index(output)
+        elif not isinstance(output, int) or isinstance(output, bool):
+            raise InvalidArgumentTypeError(
+                '`output` must be an int index or a str name')
+
+        if not -len(self._exprs) <= output < len(self._exprs):
+            raise InvalidArgumentValueError(
+                'No output with index {}'.format(output))
+        return output % len(self._exprs)
+
+    def _results_at(self, i):
+        """Get a tuple of the results of each output for row ``i``."""
+        return tuple(bool((plane[i >> 3] >> (i & 7)) & 1)
+                     for plane in self._planes)
+
+
+def _center(item, width):
+    """Center a str in a cell of the specified width."""
+    total_pad_len = width - len(item)
+    left_pad_len = total_pad_len // 2
+    return (left_pad_len * ' ' + item +
+            (total_pad_len - left_pad_len) * ' ')
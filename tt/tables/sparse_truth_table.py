@@ -0,0 +1,401 @@
+"""Implementation of a truth table storing only its true rows."""
+
+from tt._assertions import assert_iterable_contains_all_expr_symbols
+from tt.definitions import (
+    boolean_variables_factory,
+    is_valid_identifier)
+from tt.errors import (
+    ConflictingArgumentsError,
+    InvalidArgumentTypeError,
+    InvalidArgumentValueError,
+    InvalidIdentifierError,
+    NoEvaluationVariationError,
+    RequiredArgumentError,
+    RequiresFullTableError)
+from tt.expressions import BooleanExpression
+
+from ._bitplanes import (
+    all_rows_mask,
+    plane_to_int)
+from .truth_table import TruthTable
+
+
+_MAX_DENSE_SYMBOLS = 24
+
+
+class SparseTruthTable(object):
+
+    """A truth table that stores only the rows on which it is true.
+
+    Rather than holding a result for every one of its ``2**n`` rows, a sparse
+    table holds the set of its *minterms*: the indices of its true rows, using
+    the same row numbering as :class:`TruthTable
+    <tt.tables.truth_table.TruthTable>` (where the first symbol of the
+    ordering is the most significant bit of a row index). This makes sparse
+    tables practical for functions of many symbols that are true on
+    relatively few rows, for which a full table would be far too large to
+    build.
+
+    When built from an expression, a sparse table's minterms are found via
+    :func:`sat_all <tt.expressions.bexpr.BooleanExpression.sat_all>`, rather
+    than by evaluating the expression on every row::
+
+        >>> from tt import SparseTruthTable
+        >>> terms = ['x{}'.format(i) for i in range(40)]
+        >>> t = SparseTruthTable('(' + ' and '.join(terms) + ') or (' +
+        ...                      'not x0 and not x1 and ' +
+        ...                      ' and '.join(terms[2:]) + ')')
+        >>> t.count_true()
+        2
+        >>> t[2**40 - 1]
+        True
+        >>> t[2**38 - 1]
+        True
+        >>> t[0]
+        False
+
+    Sparse tables can also be built directly from their minterms::
+
+        >>> t = SparseTruthTable(minterms=[1, 2], ordering=['A', 'B'])
+        >>> for inputs in t:
+        ...     print(inputs)
+        ...
+        A=0, B=1
+        A=1, B=0
+        >>> t.equivalent_to('A xor B')
+        True
+
+    :param expr: The expression with which to populate this table.
+    :type expr: :class:`str <python:str>` or :class:`BooleanExpression\
+        <tt.expressions.bexpr.BooleanExpression>`
+
+    :param minterms: The indices of the table's true rows.
+    :type minterms: Iterable[:class:`int <python:int>`]
+
+    :param ordering: The symbols of the table; this must be specified along
+        with ``minterms``. If omitted when building a table from an
+        expression, the ordering of symbols in the table will match that of
+        the symbols' appearance in the expression.
+    :type ordering: List[:class:`str <python:str>`], optional
+
+    :raises ConflictingArgumentsError: If both ``expr`` and ``minterms`` are
+        specified.
+    :raises DuplicateSymbolError: If ``ordering`` contains duplicate symbols.
+    :raises ExtraSymbolError: If a symbol not present in the expression is
+        passed into the ``ordering`` list.
+    :raises MissingSymbolError: If a symbol present in the expression is
+        omitted from the ``ordering`` list.
+    :raises InvalidArgumentTypeError: If an unexpected parameter type is
+        encountered.
+    :raises InvalidArgumentValueError: If ``ordering`` is empty, or a minterm
+        is out of range for the table.
+    :raises InvalidIdentifierError: If any symbol names specified in
+        ``ordering`` are not valid identifiers.
+    :raises NoEvaluationVariationError: If an expression without any symbols
+        is specified.
+    :raises RequiredArgumentError: If neither ``expr`` nor ``minterms`` are
+        specified, or ``minterms`` are specified without ``ordering``.
+
+    """
+
+    def __init__(self, expr=None, minterms=None, ordering=None):
+        if expr is not None and minterms is not None:
+            raise ConflictingArgumentsError(
+                '`expr` and `minterms` are mutually exclusive arguments')
+        elif expr is None and minterms is None:
+            raise RequiredArgumentError(
+                'Must specify either `expr` or `minterms`')
+        elif expr is not None:
+            self._init_from_expression(expr, ordering)
+        else:
+            self._init_from_minterms(minterms, ordering)
+
+        self._num_rows = 2**len(self._ordering)
+        self._sorted_minterms = sorted(self._minterms)
+        self._symbol_vals_factory = boolean_variables_factory(self._ordering)
+
+    def _init_from_expression(self, expr, ordering):
+        if isinstance(expr, str):
+            self._expr = BooleanExpression(expr)
+        elif isinstance(expr, BooleanExpression):
+            self._expr = expr
+        else:
+            raise InvalidArgumentTypeError(
+                'Arg `expr` must be of type `str` or `BooleanExpression`')
+
+        if ordering is None:
+            self._ordering = self._expr.symbols
+        else:
+            assert_iterable_contains_all_expr_symbols(
+                ordering, set(self._expr.symbols))
+            self._ordering = ordering
+
+        if not self._ordering:
+            raise NoEvaluationVariationError(
+                'This expression is composed only of constant values')
+
+        # packed solutions are the indices of rows ordered as the expression's
+        # symbols, so their bits are moved if the ordering differs
+        masks = self._expr.sat_all(format='int')
+        if self._ordering == self._expr.symbols:
+            self._minterms = frozenset(masks)
+            return
+
+        num_symbols = len(self._ordering)
+        moves = [(num_symbols - 1 - pos,
+                  num_symbols - 1 - self._ordering.index(symbol))
+                 for pos, symbol in enumerate(self._expr.symbols)]
+        self._minterms = frozenset(
+            sum(1 << to_bit for from_bit, to_bit in moves
+                if (mask >> from_bit) & 1)
+            for mask in masks)
+
+    def _init_from_minterms(self, minterms, ordering):
+        if ordering is None:
+            raise RequiredArgumentError(
+                'Must specify `ordering` when passing `minterms`')
+        elif not isinstance(ordering, list):
+            raise InvalidArgumentTypeError('`ordering` must be a list')
+        elif not all(isinstance(elt, str) for elt in ordering):
+            raise InvalidArgumentTypeError(
+                '`ordering` must only contain strings')
+        elif not ordering:
+            raise InvalidArgumentValueError(
+                'If specifying `ordering`, it must be non-empty')
+
+        for symbol_name in ordering:
+            if not is_valid_identifier(symbol_name):
+                raise InvalidIdentifierError(
+                    '"{}" in ordering is not a valid symbol name'.format(
+                        symbol_name),
+                    None, None)
+        assert_iterable_contains_all_expr_symbols(ordering, set(ordering))
+
+        try:
+            minterms = frozenset(minterms)
+        except TypeError:
+            raise InvalidArgumentTypeError(
+                '`minterms` must be an iterable of ints')
+
+        num_rows = 2**len(ordering)
+        for minterm in minterms:
+            if not isinstance(minterm, int) or isinstance(minterm, bool):
+                raise InvalidArgumentTypeError(
+                    '`minterms` must be an iterable of ints')
+            elif not 0 <= minterm < num_rows:
+                raise InvalidArgumentValueError(
+                    'Minterm {} is out of range for a table of {} '
+                    'symbols'.format(minterm, len(ordering)))
+
+        self._expr = None
+        self._ordering = ordering
+        self._minterms = minterms
+
+    @property
+    def expr(self):
+        """The ``BooleanExpression`` used to fill this table, if any.
+
+        :type: :class:`BooleanExpression
+            <tt.expressions.bexpr.BooleanExpression>` or ``None``
+
+        """
+        return self._expr
+
+    @property
+    def ordering(self):
+        """The order in which the symbols should appear in the table.
+
+        :type: List[:class:`str <python:str>`]
+
+        """
+        return self._ordering
+
+    @property
+    def minterms(self):
+        """The indices of the true rows of this table, in ascending order.
+
+        :type: List[:class:`int <python:int>`]
+
+        .. code-block:: python
+
+            >>> from tt import SparseTruthTable
+            >>> SparseTruthTable('A or B').minterms
+            [1, 2, 3]
+
+        """
+        return list(self._sorted_minterms)
+
+    def __iter__(self):
+        for minterm in self._sorted_minterms:
+            yield self._row_inputs(minterm)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._num_rows
+        if not 0 <= i < self._num_rows:
+            raise IndexError('SparseTruthTable index out of range')
+
+        return i in self._minterms
+
+    def count_true(self):
+        """Count the rows of this table that are true.
+
+        :returns: The number of true rows.
+        :rtype: :class:`int <python:int>`
+
+        """
+        return len(self._minterms)
+
+    def equivalent_to(self, other, align=False):
+        """Return whether this table is equivalent to another source of truth.
+
+        As with :func:`TruthTable.equivalent_to
+        <tt.tables.truth_table.TruthTable.equivalent_to>`, rows are compared
+        by position unless ``align`` is set, in which case they are matched up
+        by the values of their symbols. Sparse tables have no don't cares, so
+        a full table being compared to one must not have any either.
+
+        :param other: The other source of truth with which to compare logical
+            equivalence.
+        :type other: :class:`SparseTruthTable`, :class:`TruthTable
+            <tt.tables.truth_table.TruthTable>`, :class:`str <python:str>`,
+            or :class:`BooleanExpression
+            <tt.expressions.bexpr.BooleanExpression>`
+
+        :param align: Whether to match up the rows of this table and ``other``
+            by symbol name, rather than by position.
+        :type align: :class:`bool <python:bool>`, optional
+
+        :returns: Whether ``other`` is logically equivalent to this table.
+        :rtype: :class:`bool <python:bool>`
+
+        :raises InvalidArgumentTypeError: If the ``other`` argument is not one
+            of the acceptable types.
+        :raises RequiresFullTableError: If ``other`` is a table that is not
+            full.
+        :raises ExtraSymbolError: If ``align`` is set and ``other`` has
+            symbols not present in this table.
+        :raises MissingSymbolError: If ``align`` is set and ``other`` is
+            missing symbols present in this table.
+
+        An example::
+
+            >>> from tt import SparseTruthTable, TruthTable
+            >>> t = SparseTruthTable('A and not B')
+            >>> t.equivalent_to(TruthTable('A and not B'))
+            True
+            >>> t.equivalent_to('not B and A')
+            False
+            >>> t.equivalent_to('not B and A', align=True)
+            True
+
+        """
+        if isinstance(other, (str, BooleanExpression)):
+            if isinstance(other, str):
+                other = BooleanExpression(other)
+
+            if align:
+                assert_iterable_contains_all_expr_symbols(
+                    other.symbols, set(self._ordering))
+                return self._minterms == SparseTruthTable(
+                    other, ordering=self._ordering)._minterms
+
+            other = SparseTruthTable(other)
+        elif not isinstance(other, (SparseTruthTable, TruthTable)):
+            raise InvalidArgumentTypeError(
+                'other must be a SparseTruthTable, TruthTable, '
+                'BooleanExpression, or str')
+
+        if isinstance(other, TruthTable) and not other.is_full:
+            raise RequiresFullTableError(
+                'Equivalence can only be checked on full truth tables')
+
+        if align:
+            assert_iterable_contains_all_expr_symbols(
+                other.ordering, set(self._ordering))
+        elif len(other.ordering) != len(self._ordering):
+            return False
+
+        if isinstance(other, TruthTable):
+            if align:
+                other = other.reorder(self._ordering)
+
+            known = plane_to_int(other._known)
+            values = plane_to_int(other._values)
+            if known != all_rows_mask(self._num_rows):
+                # the other table has don't cares
+                return False
+
+            return (len(self._minterms) == other.count_true() and
+                    all((values >> minterm) & 1
+                        for minterm in self._minterms))
+
+        if align and list(other.ordering) != list(self._ordering):
+            other_minterms = {self._remap_row(minterm, other.ordering)
+                              for minterm in other._minterms}
+        else:
+            other_minterms = other._minterms
+
+        return self._minterms == other_minterms
+
+    def to_truth_table(self, max_symbols=_MAX_DENSE_SYMBOLS):
+        """Convert this table to a full :class:`TruthTable
+        <tt.tables.truth_table.TruthTable>`.
+
+        :param max_symbols: The largest number of symbols for which to allow
+            the conversion, as a guard against building enormous tables.
+        :type max_symbols: :class:`int <python:int>`, optional
+
+        :returns: A full table with the same ordering, results, and
+            expression as this one.
+        :rtype: :class:`TruthTable <tt.tables.truth_table.TruthTable>`
+
+        :raises InvalidArgumentValueError: If this table has more than
+            ``max_symbols`` symbols.
+
+        An example::
+
+            >>> from tt import SparseTruthTable
+            >>> t = SparseTruthTable(minterms=[0, 3], ordering=['A', 'B'])
+            >>> print(t.to_truth_table())
+            +---+---+---+
+            | A | B |   |
+            +---+---+---+
+            | 0 | 0 | 1 |
+            +---+---+---+
+            | 0 | 1 | 0 |
+            +---+---+---+
+            | 1 | 0 | 0 |
+            +---+---+---+
+            | 1 | 1 | 1 |
+            +---+---+---+
+
+        """
+        if len(self._ordering) > max_symbols:
+            raise InvalidArgumentValueError(
+                'Cannot convert a table of {} symbols to a full table; at '
+                'most {} are allowed'.format(len(self._ordering), max_symbols))
+
+        ones = 0
+        for minterm in self._minterms:
+            ones |= 1 << minterm
+        zeros = all_rows_mask(self._num_rows) & ~ones
+        return TruthTable._from_rows(
+            list(self._ordering), self._expr, ones, zeros)
+
+    def _row_inputs(self, row):
+        """Get the symbol values of a row, as a namedtuple-like object."""
+        num_symbols = len(self._ordering)
+        return self._symbol_vals_factory._make(
+            bool((row >> (num_symbols - 1 - pos)) & 1)
+            for pos in range(num_symbols))
+
+    def _remap_row(self, row, from_ordering):
+        """Map a row index under another ordering to one under ours."""
+        num_symbols = len(self._ordering)
+        positions = {symbol: pos for pos, symbol in enumerate(self._ordering)}
+        new_row = 0
+        for from_pos, symbol in enumerate(from_ordering):
+            if (row >> (num_symbols - 1 - from_pos)) & 1:
+                new_row |= 1 << (num_symbols - 1 - positions[symbol])
+        return new_row
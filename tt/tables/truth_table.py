@@ -2,7 +2,11 @@
 
 from __future__ import division
 
+import io
 import itertools
+import mmap
+import os
+import time
 
 from math import log
 from string import ascii_uppercase as ALPHABET
@@ -28,9 +32,52 @@ from tt.errors import (
     RequiresFullTableError)
 from tt.expressions import BooleanExpression
 
+from ._bitplanes import (
+    all_rows_mask,
+    cofactors_differ,
+    get_bit,
+    int_to_plane_bytes,
+    natural_num_rows,
+    new_plane,
+    num_plane_bytes,
+    plane_to_int,
+    popcount,
+    reorder_rows,
+    row_bit_mask,
+    rows_to_int,
+    set_bit)
+from ._gray_code import (
+    GrayCodeEvaluator,
+    iter_gray_code_flips)
+from ._minimize import (
+    minimize_exact,
+    minimize_heuristic)
+from ._serialization import (
+    FLAG_COMPRESSED,
+    FLAG_HAS_DONT_CARES,
+    pack_header,
+    pack_planes,
+    unpack_header,
+    unpack_planes)
+
 
 _DEFAULT_CELL_PADDING = 1
 
+_WRITE_FORMATS = ('grid', 'csv', 'tsv', 'bits')
+_WRITE_CHUNK_SIZE = 4096
+
+_FILL_BATCH_SIZE = 1024
+_FILL_CHECKPOINT_SECONDS = 30.0
+
+_MINIMIZE_METHODS = ('auto', 'exact', 'heuristic')
+_MAX_AUTO_EXACT_SYMBOLS = 8
+
+# results indexed by (known bit << 1) | (values bit) of a row
+_RESULT_CODES = (None, DONT_CARE_VALUE, False, True)
+
+_KNOWN_TRANS = str.maketrans('01' + DONT_CARE_VALUE, '110')
+_VALUES_TRANS = str.maketrans('01' + DONT_CARE_VALUE, '011')
+
 
 class TruthTable(object):
 
@@ -100,8 +147,10 @@ class TruthTable(object):
     :param from_values: A string of 1's, 0's, and x's representing the values
         to be stored in the table; the length of this string must be a power
         of 2 and is the complete set of values (in sequential order) to be
-        stored in table.
-    :type from_values: :class:`str <python:str>`
+        stored in table. For machine-generated values, packed forms are also
+        accepted (see below).
+    :type from_values: :class:`str <python:str>`, :class:`int <python:int>`,
+        bytes-like object, ``bitarray``, or ``numpy.ndarray``
 
     :param fill_all: A flag indicating whether the entirety of the table should
         be filled on initialization; defaults to ``True``.
@@ -112,9 +161,78 @@ class TruthTable(object):
         that of the symbols' appearance in the original expression.
     :type ordering: List[:class:`str <python:str>`], optional
 
+    :param backing_file: The path of a file in which to store this table's
+        results, rather than in memory. The file will be created (or
+        truncated, if it already exists) and memory-mapped; see
+        :func:`from_file` for re-opening it.
+    :type backing_file: :class:`str <python:str>`, optional
+
+    :param num_values: The number of values held in a packed ``from_values``
+        argument. If omitted, it is taken from the length of ``ordering`` or,
+        failing that, from the size of ``from_values`` itself.
+    :type num_values: :class:`int <python:int>`, optional
+
+    :param dont_cares: The rows of a packed ``from_values`` argument that hold
+        don't cares, packed in the same way as ``from_values``.
+    :type dont_cares: :class:`int <python:int>`, bytes-like object,
+        ``bitarray``, or ``numpy.ndarray``, optional
+
+    :param support_only: Whether to build the table only over the symbols on
+        which ``expr`` actually depends (see :func:`BooleanExpression.support
+        <tt.expressions.bexpr.BooleanExpression.support>`); each other symbol
+        halves the size of the table without changing its results. If set,
+        the table's expression has its vacuous symbols replaced with ``0``.
+    :type support_only: :class:`bool <python:bool>`, optional
+
+    Packed values are ingested without creating any per-row Python objects.
+    An int or bytes-like object of ``from_values`` is interpreted with row
+    ``i`` of the table in bit ``i`` of the int, or in bit ``i % 8`` of byte
+    ``i // 8``::
+
+        >>> t = TruthTable(from_values=0b0110, num_values=4)
+        >>> t.results
+        [False, True, True, False]
+        >>> t = TruthTable(from_values=b'\\x96', dont_cares=b'\\x01')
+        >>> t.results
+        ['x', True, True, False, True, False, False, True]
+
+    NumPy arrays and bitarrays hold one element per row, where non-zero
+    elements are true. Support for NumPy arrays is optional and requires
+    NumPy to be installed.
+
+    Full tables with the same ordering can be combined with the ``&``, ``|``,
+    ``^`` and ``~`` operators, which work directly on the tables' packed
+    results rather than re-evaluating any expressions. Don't cares propagate
+    through these operators only where they affect the result::
+
+        >>> t1 = TruthTable(from_values='01x1')
+        >>> t2 = TruthTable(from_values='0011')
+        >>> (t1 & t2).results
+        [False, False, 'x', True]
+        >>> (t1 | t2).results
+        [False, True, True, True]
+        >>> (~t1).results
+        [True, False, 'x', False]
+        >>> (TruthTable('A and B') ^ TruthTable('A or B')).expr
+        <BooleanExpression "(A and B) xor (A or B)">
+
+    Tables whose orderings differ can first be brought into line with
+    :func:`reorder`.
+
+    Symbols that do not affect an expression's results can be left out of
+    its table::
+
+        >>> t = TruthTable('(A and B) or (A and not B) or C',
+        ...                support_only=True)
+        >>> t.ordering
+        ['A', 'C']
+        >>> t.expr
+        <BooleanExpression "(A and 0) or (A and not 0) or C">
+
     :raises ConflictingArgumentsError: If both ``expr`` and ``from_values`` are
         specified in the initalization; a table can only be instantiated from
-        one or the other.
+        one or the other. Also raised if ``support_only`` is set along with
+        ``from_values``.
     :raises DuplicateSymbolError: If multiple symbols of the same name are
         passed into the ``ordering`` list.
     :raises ExtraSymbolError: If a symbol not present in the expression is
@@ -129,31 +247,46 @@ class TruthTable(object):
     :raises InvalidIdentifierError: If any symbol names specified in
         ``ordering`` are not valid identifiers.
     :raises NoEvaluationVariationError: If an expression without any unqiue
-        symbols (i.e., one merely composed of constant operands) is specified.
+        symbols (i.e., one merely composed of constant operands) is specified,
+        or if ``support_only`` is set for an expression whose value does not
+        depend on any of its symbols.
     :raises RequiredArgumentError: If neither the ``expr`` or ``from_values``
         arguments are specified.
 
     """
 
     def __init__(self, expr=None, from_values=None, fill_all=True,
-                 ordering=None):
+                 ordering=None, backing_file=None, num_values=None,
+                 dont_cares=None, support_only=False):
         if expr is not None and from_values is not None:
             raise ConflictingArgumentsError(
                 '`expr` and `from_values` are mutually exclusive arguments')
         elif expr is None and from_values is None:
             raise RequiredArgumentError(
                 'Must specify either `expr` or `from_values`')
+        elif from_values is not None and support_only:
+            raise ConflictingArgumentsError(
+                '`support_only` can only be used along with `expr`')
 
         self._num_filled_slots = 0
+        self._backing_file = None
+        self._mmap = None
 
         if expr is not None:
-            self._init_from_expression(expr, fill_all, ordering)
+            self._init_from_expression(expr, ordering, support_only)
         else:
-            self._init_from_values(from_values, ordering)
+            self._init_from_values(from_values, ordering, num_values,
+                                   dont_cares)
 
         self._symbol_vals_factory = boolean_variables_factory(self._ordering)
 
-    def _init_from_expression(self, expr, fill_all, ordering):
+        if backing_file is not None:
+            self._map_to_new_file(backing_file)
+
+        if expr is not None and fill_all:
+            self.fill()
+
+    def _init_from_expression(self, expr, ordering, support_only):
         if isinstance(expr, str):
             self._expr = BooleanExpression(expr)
         elif isinstance(expr, BooleanExpression):
@@ -169,29 +302,61 @@ class TruthTable(object):
                 ordering, set(self._expr.symbols))
             self._ordering = ordering
 
+        if support_only:
+            support = set(self._expr.support())
+            vacuous = {symbol: 0 for symbol in self._expr.symbols
+                       if symbol not in support}
+            if vacuous:
+                self._expr = self._expr.restrict(**vacuous)
+                self._ordering = [symbol for symbol in self._ordering
+                                  if symbol in support]
+
         if not self._ordering:
             raise NoEvaluationVariationError(
                 'This expression is composed only of constant values')
 
-        self._results = [None for _ in range(2**len(self._ordering))]
-        if fill_all:
-            self.fill()
+        self._num_rows = 2**len(self._ordering)
+        self._known = new_plane(self._num_rows)
+        self._values = new_plane(self._num_rows)
 
-    def _init_from_values(self, from_values, ordering):
+    def _init_from_values(self, from_values, ordering, num_values,
+                          dont_cares):
         if isinstance(from_values, str):
             valid = {'0', '1', DONT_CARE_VALUE}
-            if not from_values:
+            if num_values is not None or dont_cares is not None:
+                raise ConflictingArgumentsError(
+                    '`num_values` and `dont_cares` cannot be specified with '
+                    'a string of `from_values`')
+            elif not from_values:
                 raise InvalidArgumentValueError(
                     'Cannot specify an empty string')
-            elif not all(value in valid for value in from_values):
+            elif not set(from_values) <= valid:
                 raise InvalidBooleanValueError(
                     'Invalid Boolean/don\'t care value specified')
-        else:
-            raise InvalidArgumentTypeError(
-                '`from_values` must either be a string or list of strings')
 
-        num_values = len(from_values)
-        if (num_values & (num_values - 1)) != 0:
+            num_values = len(from_values)
+        elif num_values is None:
+            if isinstance(ordering, list):
+                num_values = 2**len(ordering)
+            else:
+                num_values = natural_num_rows(from_values)
+
+            if num_values is None:
+                if (isinstance(from_values, int) and
+                        not isinstance(from_values, bool)):
+                    raise RequiredArgumentError(
+                        'Must specify `num_values` or `ordering` when '
+                        'passing an int as `from_values`')
+                raise InvalidArgumentTypeError(
+                    '`from_values` must be a string, int, bytes-like '
+                    'object, bitarray, or NumPy array')
+        elif (not isinstance(num_values, int) or
+                isinstance(num_values, bool)):
+            raise InvalidArgumentTypeError('`num_values` must be an int')
+
+        if num_values < 1:
+            raise InvalidArgumentValueError('Cannot specify zero values')
+        elif (num_values & (num_values - 1)) != 0:
             # assert that number of input values is a power of 2
             raise InvalidArgumentValueError(
                 'Must specify a number of input values that is a power of 2')
@@ -233,9 +398,50 @@ class TruthTable(object):
 
         self._expr = None
 
-        bool_dict = {'0': False, '1': True, DONT_CARE_VALUE: DONT_CARE_VALUE}
-        self._results = [bool_dict[v] for v in from_values]
-        self._num_filled_slots = len(self._results)
+        if isinstance(from_values, str):
+            # the first value is the least significant bit of each plane
+            known = int(from_values.translate(_KNOWN_TRANS)[::-1], 2)
+            values = int(from_values.translate(_VALUES_TRANS)[::-1], 2)
+        else:
+            values = rows_to_int(from_values, num_values)
+            dont_cares_mask = (0 if dont_cares is None else
+                               rows_to_int(dont_cares, num_values))
+            known = all_rows_mask(num_values) & ~dont_cares_mask
+            values |= dont_cares_mask
+
+        self._num_rows = num_values
+        self._known = bytearray(int_to_plane_bytes(known, num_values))
+        self._values = bytearray(int_to_plane_bytes(values, num_values))
+        self._num_filled_slots = num_values
+
+    def _map_to_new_file(self, path):
+        """Move this table's planes into a new memory-mapped file."""
+        expr_str = None if self._expr is None else self._expr.raw_expr
+        with open(path, 'w+b') as f:
+            f.write(pack_header(self._ordering, expr_str,
+                                self._header_flags()))
+            f.write(self._known)
+            f.write(self._values)
+            f.flush()
+            mm = mmap.mmap(f.fileno(), 0)
+
+        self._map_planes(mm, path)
+
+    def _map_planes(self, mm, path):
+        """Point this table's planes into a memory-mapped table file."""
+        _, _, _, offset = unpack_header(mm)
+        num_bytes = num_plane_bytes(self._num_rows)
+        if len(mm) < offset + 2*num_bytes:
+            mm.close()
+            raise InvalidArgumentValueError('Truncated truth table file')
+
+        self._mmap = mm
+        self._mmap_view = memoryview(mm)
+        self._known = self._mmap_view[offset:offset + num_bytes]
+        self._values = self._mmap_view[offset + num_bytes:
+                                       offset + 2*num_bytes]
+        self._backing_file = path
+        self._num_filled_slots = self._count_filled_slots()
 
     @property
     def expr(self):
@@ -310,7 +516,8 @@ class TruthTable(object):
             <class 'tt.errors.state.AlreadyFullTableError'>
 
         """
-        return self._num_filled_slots == len(self._results)
+        self._sync_filled_slots()
+        return self._num_filled_slots == self._num_rows
 
     @property
     def results(self):
@@ -346,50 +553,70 @@ class TruthTable(object):
             [True, 'x', 'x', False]
 
         """
-        return self._results
+        return list(self._iter_results())
 
-    def __str__(self):
-        col_widths = self._get_col_widths()
-        row_sep = self._get_row_sep(col_widths)
+    @property
+    def backing_file(self):
+        """The path of the file in which this table is stored, if any.
 
-        filled_row_count = 0
-        rows = []
-        rows.append(row_sep)
-        rows.append(self._get_as_table_row(self._ordering + [' '], col_widths))
-        rows.append(row_sep)
+        This attribute will be ``None`` for tables stored in memory.
 
-        _input_combos = TruthTable.input_combos(len(self._ordering))
-        for i, inputs in enumerate(_input_combos):
-            result = self._results[i]
-            if result is None:
-                continue
-            elif result == DONT_CARE_VALUE:
-                result_str = result
-            else:
-                result_str = str(int(result))
+        :type: :class:`str <python:str>`
 
-            item_strs = [str(int(val)) for val in inputs]
-            item_strs.append(result_str)
-            rows.append(self._get_as_table_row(item_strs, col_widths))
-            rows.append(row_sep)
-            filled_row_count += 1
+        """
+        return self._backing_file
 
-        if not filled_row_count:
-            return 'Empty!'
-        else:
-            return '\n'.join(rows)
+    def __str__(self):
+        buf = io.StringIO()
+        self.write(buf)
+        return buf.getvalue().rstrip('\n')
 
     def __iter__(self):
         _input_combos = TruthTable.input_combos(len(self._ordering))
-        for i, combo in enumerate(_input_combos):
-            result = self._results[i]
+        for combo, result in zip(_input_combos, self._iter_results()):
             if result is not None:
                 yield self._symbol_vals_factory._make(combo), result
 
     def __getitem__(self, i):
-        return self._results[i]
+        if isinstance(i, slice):
+            return [self._result_at(j) for j in
+                    range(*i.indices(self._num_rows))]
 
-    def equivalent_to(self, other):
+        if i < 0:
+            i += self._num_rows
+        if not 0 <= i < self._num_rows:
+            raise IndexError('TruthTable index out of range')
+
+        return self._result_at(i)
+
+    def __and__(self, other):
+        return self._combine(other, 'and', lambda k1, v1, k2, v2: (
+            (k1 & v1) & (k2 & v2), (k1 & ~v1) | (k2 & ~v2)))
+
+    def __or__(self, other):
+        return self._combine(other, 'or', lambda k1, v1, k2, v2: (
+            (k1 & v1) | (k2 & v2), (k1 & ~v1) & (k2 & ~v2)))
+
+    def __xor__(self, other):
+        return self._combine(other, 'xor', lambda k1, v1, k2, v2: (
+            k1 & k2 & (v1 ^ v2), k1 & k2 & ~(v1 ^ v2)))
+
+    def __invert__(self):
+        self._assert_full('Only full tables can be inverted')
+        known = plane_to_int(self._known)
+        values = plane_to_int(self._values)
+        expr = (None if self._expr is None else
+                BooleanExpression('not (' + self._expr.raw_expr + ')'))
+        return TruthTable._from_rows(self._ordering, expr,
+                                     known & ~values, known & values)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def equivalent_to(self, other, align=False, counterexample=False):
         """Return whether this table is equivalent to another source of truth.
 
         :param other: The other source of truth with which to compare logical
@@ -397,19 +624,36 @@ class TruthTable(object):
         :type other: :class:`TruthTable`, :class:`str <python:str>`, or
             :class:`BooleanExpression <tt.expressions.bexpr.BooleanExpression>`
 
+        :param align: Whether to match up the rows of this table and ``other``
+            by symbol name, rather than by position.
+        :type align: :class:`bool <python:bool>`, optional
+
+        :param counterexample: Whether to also return the first row of this
+            table on which ``other`` differs.
+        :type counterexample: :class:`bool <python:bool>`, optional
+
         :returns: True if the other expression is logically equivalent to this
-            one, otherwise False.
-        :rtype: :class:`bool <python:bool>`
+            one, otherwise False. If ``counterexample`` is set, a tuple of this
+            result and the inputs of the first differing row is returned
+            instead; the inputs are ``None`` if the tables are equivalent or
+            differ in size.
+        :rtype: :class:`bool <python:bool>` or Tuple[:class:`bool
+            <python:bool>`, :func:`namedtuple <python:collections.namedtuple>`]
 
         :raises InvalidArgumentTypeError: If the ``other`` argument is not one
             of the acceptable types.
         :raises RequiresFullTableError: If either the calling table or other
             source of truth represents an unfilled table.
+        :raises ExtraSymbolError: If ``align`` is set and ``other`` has
+            symbols not present in this table.
+        :raises MissingSymbolError: If ``align`` is set and ``other`` is
+            missing symbols present in this table.
 
         It is important to note that the concept of equivalence employed here
-        is only concerned with the corresponding outputs between this table
-        and the other provided source of truth. For example, the ordering of
-        symbols is not taken into consideration when computing equivalence::
+        is, by default, only concerned with the corresponding outputs between
+        this table and the other provided source of truth. For example, the
+        ordering of symbols is not taken into consideration when computing
+        equivalence::
 
             >>> from tt import TruthTable
             >>> t1 = TruthTable('op1 or op2')
@@ -419,6 +663,27 @@ class TruthTable(object):
             >>> t2.equivalent_to(t1)
             True
 
+        To instead compare the functions computed by two tables, ``align`` can
+        be used to match up rows by the values of their symbols::
+
+            >>> from tt import TruthTable
+            >>> t1 = TruthTable('A and not B')
+            >>> t2 = TruthTable('A and not B', ordering=['B', 'A'])
+            >>> t1.equivalent_to(t2)
+            False
+            >>> t1.equivalent_to(t2, align=True)
+            True
+
+        A row on which two tables differ can be retrieved with
+        ``counterexample``::
+
+            >>> from tt import TruthTable
+            >>> t = TruthTable('A or B')
+            >>> t.equivalent_to('A xor B', counterexample=True)
+            (False, <BooleanValues [A=1, B=1]>)
+            >>> t.equivalent_to('B or A', align=True, counterexample=True)
+            (True, None)
+
         Another area of possible ambiguity here is the role of the don't care
         value in equivalence. When comparing tables, don't cares in the caller
         will allow for any corresponding value in ``other``, but the reverse is
@@ -449,8 +714,20 @@ class TruthTable(object):
         """
         if isinstance(other, TruthTable):
             other_table = other
+            if align:
+                assert_iterable_contains_all_expr_symbols(
+                    other_table._ordering, set(self._ordering))
         elif isinstance(other, (str, BooleanExpression)):
-            other_table = TruthTable(other)
+            if isinstance(other, str):
+                other = BooleanExpression(other)
+
+            if align:
+                # build the other table directly in our ordering
+                assert_iterable_contains_all_expr_symbols(
+                    other.symbols, set(self._ordering))
+                other_table = TruthTable(other, ordering=self._ordering)
+            else:
+                other_table = TruthTable(other)
         else:
             raise InvalidArgumentTypeError(
                 'other must be a BooleanExpression, TruthTable, or str')
@@ -459,18 +736,34 @@ class TruthTable(object):
             raise RequiresFullTableError(
                 'Equivalence can only be checked on full truth tables')
 
-        if other is self:
-            return True
-        elif len(other_table.results) != len(self._results):
-            return False
-
-        for i, result in enumerate(self._results):
-            if result == DONT_CARE_VALUE:
-                continue
-            elif other_table[i] != result:
-                return False
-
-        return True
+        if other_table._num_rows != self._num_rows:
+            return (False, None) if counterexample else False
+        elif other is self:
+            diff = 0
+        else:
+            known = plane_to_int(self._known)
+            other_known = plane_to_int(other_table._known)
+            other_values = plane_to_int(other_table._values)
+            if align and other_table._ordering != self._ordering:
+                other_known, other_values = (
+                    reorder_rows(x, self._num_rows, other_table._ordering,
+                                 self._ordering)
+                    for x in (other_known, other_values))
+
+            # rows where we have a definite result that other does not match
+            diff = known & ((plane_to_int(self._values) ^ other_values) |
+                            ~other_known)
+
+        if not counterexample:
+            return not diff
+        elif not diff:
+            return True, None
+
+        row = (diff & -diff).bit_length() - 1
+        num_symbols = len(self._ordering)
+        return False, self._symbol_vals_factory._make(
+            bool((row >> (num_symbols - 1 - i)) & 1)
+            for i in range(num_symbols))
 
     def fill(self, **kwargs):
         """Fill the table with results, based on values specified by kwargs.
@@ -514,28 +807,662 @@ class TruthTable(object):
             | 1 | 1 | 1 |
             +---+---+---+
 
+        To report progress on, checkpoint, or cancel a fill, see
+        :func:`fill_with_progress`.
+
+        """
+        self.fill_with_progress(constraints=kwargs)
+
+    def fill_with_progress(self, constraints=None, progress=None,
+                           checkpoint=None, cancel=None):
+        """Fill the table with results, reporting progress along the way.
+
+        This is :func:`fill`, with extra options for long-running fills.
+        Since those options would otherwise clash with symbols of the same
+        names, the symbol values filtering which entries are filled are
+        passed as a dict instead of as keyword args.
+
+        :param constraints: Symbol values filtering which entries in the table
+            are filled, as would be passed to :func:`fill` as keyword args.
+        :type constraints: Dict[:class:`str <python:str>`, :class:`bool
+            <python:bool>`], optional
+
+        :param progress: A function to periodically call with the number of
+            rows of the requested region that have been filled so far, the
+            total number of rows in the region, and the rate (in rows per
+            second) at which rows are being evaluated. It is also called once
+            the fill stops.
+        :type progress: Callable[[:class:`int <python:int>`, :class:`int
+            <python:int>`, :class:`float <python:float>`], ``None``],
+            optional
+
+        :param checkpoint: The path of a file in which to periodically save
+            the filled rows of this table. If the file already exists, rows
+            filled in a previous call (e.g., one that was interrupted) are
+            loaded from it before filling resumes. The file holds a
+            serialized table (see :func:`to_bytes`), and is always written in
+            full once the fill stops.
+        :type checkpoint: :class:`str <python:str>`, optional
+
+        :param cancel: An object whose ``is_set`` method returns whether the
+            fill should stop early, such as a :class:`threading.Event
+            <python:threading.Event>`. The fill stops between rows, leaving
+            the table partially filled and consistent, and can be resumed by
+            calling this method again.
+        :type cancel: :class:`threading.Event <python:threading.Event>`,
+            optional
+
+        :raises AlreadyFullTableError: If the table is already full when this
+            method is called.
+        :raises ExtraSymbolError: If a symbol not in the expression is passed
+            in ``constraints``.
+        :raises InvalidArgumentValueError: If ``checkpoint`` holds a table
+            with a different ordering or expression than this one.
+        :raises InvalidBooleanValueError: If a non-Boolean value is passed
+            as a value in ``constraints``.
+
+        Here, a fill reports its progress, is cancelled, and is resumed from a
+        checkpoint::
+
+            >>> import os, tempfile, threading
+            >>> from tt import TruthTable
+            >>> path = os.path.join(tempfile.mkdtemp(), 'fill.ckpt')
+            >>> cancel = threading.Event()
+            >>> def on_progress(done, total, rate):
+            ...     print(done, 'of', total)
+            ...     cancel.set()
+            ...
+            >>> expr = ' and '.join('ABCDEFGHIJK')
+            >>> t = TruthTable(expr, fill_all=False)
+            >>> t.fill_with_progress(progress=on_progress, checkpoint=path,
+            ...                      cancel=cancel)
+            1024 of 2048
+            >>> t.is_full
+            False
+            >>> t = TruthTable(expr, fill_all=False)
+            >>> t.fill_with_progress(progress=on_progress, checkpoint=path)
+            1024 of 2048
+            2048 of 2048
+            >>> t.is_full
+            True
+
         """
         if self.is_full:
             raise AlreadyFullTableError('Cannot fill an already-full table')
 
-        assert_all_valid_keys(kwargs, set(self._ordering))
+        if constraints is None:
+            constraints = {}
+        assert_all_valid_keys(constraints, set(self._ordering))
+
+        # convert all constraint values to bools
+        restrictions = {k: bool(v) for k, v in constraints.items()}
+
+        if checkpoint is not None and os.path.exists(checkpoint):
+            self._load_checkpoint(checkpoint)
+
+        # only visit the rows matching the restrictions, in Gray code order
+        # over the unrestricted symbols so that only one input changes (and
+        # only part of the expression needs re-evaluating) between rows
+        num_symbols = len(self._ordering)
+        row = 0
+        free_symbols = []
+        for pos in reversed(range(num_symbols)):
+            weight = 1 << (num_symbols - 1 - pos)
+            symbol = self._ordering[pos]
+            if symbol not in restrictions:
+                free_symbols.append((pos, weight))
+            elif restrictions[symbol]:
+                row |= weight
+
+        num_region_rows = 2**(num_symbols - len(restrictions))
+        num_done = num_evaluated = 0
+        start_time = last_checkpoint_time = time.time()
+
+        last_reported = None
+
+        def report():
+            if progress is not None:
+                elapsed = time.time() - start_time
+                rate = num_evaluated / elapsed if elapsed > 0 else 0.0
+                progress(num_done, num_region_rows, rate)
+
+        evaluator = GrayCodeEvaluator(self._expr.tree, self._ordering)
+        result = evaluator.reset(
+            [restrictions.get(symbol, False) for symbol in self._ordering])
+        flips = itertools.chain(
+            (None,), iter_gray_code_flips(len(free_symbols)))
+
+        known, values = self._known, self._values
+        for flip in flips:
+            if not num_done % _FILL_BATCH_SIZE:
+                if (checkpoint is not None and time.time() -
+                        last_checkpoint_time >= _FILL_CHECKPOINT_SECONDS):
+                    self._save_checkpoint(checkpoint)
+                    last_checkpoint_time = time.time()
+
+                if num_done:
+                    report()
+                    last_reported = num_done
+
+                if cancel is not None and cancel.is_set():
+                    break
+
+            if flip is not None:
+                pos, weight = free_symbols[flip]
+                row ^= weight
+                result = evaluator.flip(pos)
+
+            num_done += 1
+            if get_bit(known, row) or get_bit(values, row):
+                continue
 
-        # convert all kwarg values to bools
-        restrictions = {k: bool(v) for k, v in kwargs.items()}
+            if result:
+                set_bit(values, row)
+            set_bit(known, row)
+            self._num_filled_slots += 1
+            num_evaluated += 1
 
-        # I think the restriction of inputs can be greatly optimized by
-        # pre-computing the ranges of indices for which the inputs will
-        # be valid
-        _input_combos = TruthTable.input_combos(len(self._ordering))
+        if checkpoint is not None:
+            self._save_checkpoint(checkpoint)
+        if num_done != last_reported:
+            report()
+
+    def count_true(self):
+        """Count the rows of this table holding a true result.
+
+        This and the other counting methods below operate on the packed
+        results of the table with population counts, so they are suitable for
+        tables with many millions of rows. Rows that have not yet been filled
+        are not counted by any of them.
+
+        :returns: The number of true rows.
+        :rtype: :class:`int <python:int>`
+
+        An example::
+
+            >>> from tt import TruthTable
+            >>> t = TruthTable(from_values='01x1x000')
+            >>> t.count_true(), t.count_false(), t.count_dont_care()
+            (2, 4, 2)
+
+        """
+        return popcount(plane_to_int(self._known) &
+                        plane_to_int(self._values))
+
+    def count_false(self):
+        """Count the rows of this table holding a false result.
+
+        :returns: The number of false rows.
+        :rtype: :class:`int <python:int>`
+
+        """
+        return popcount(plane_to_int(self._known) &
+                        ~plane_to_int(self._values))
 
-        for i, input_combo in enumerate(_input_combos):
-            if self._results[i] is not None:
+    def count_dont_care(self):
+        """Count the rows of this table holding a don't care.
+
+        :returns: The number of don't care rows.
+        :rtype: :class:`int <python:int>`
+
+        """
+        return popcount(plane_to_int(self._values) &
+                        ~plane_to_int(self._known))
+
+    def cofactor_counts(self, symbol):
+        """Count the true rows of each cofactor of this table on a symbol.
+
+        The cofactors of a table on a symbol are the halves of the table in
+        which that symbol is false and true, respectively.
+
+        :param symbol: The symbol on which to split this table.
+        :type symbol: :class:`str <python:str>`
+
+        :returns: A tuple of the number of true rows where ``symbol`` is false
+            and the number of true rows where ``symbol`` is true.
+        :rtype: Tuple[:class:`int <python:int>`, :class:`int <python:int>`]
+
+        :raises ExtraSymbolError: If ``symbol`` is not in this table's
+            ordering.
+
+        An example::
+
+            >>> from tt import TruthTable
+            >>> t = TruthTable('A or (B and C)')
+            >>> t.cofactor_counts('A')
+            (1, 4)
+            >>> t.cofactor_counts('C')
+            (2, 3)
+
+        """
+        true_rows = plane_to_int(self._known) & plane_to_int(self._values)
+        symbol_rows = row_bit_mask(self._symbol_bit(symbol), self._num_rows)
+        return (popcount(true_rows & ~symbol_rows),
+                popcount(true_rows & symbol_rows))
+
+    def influence(self):
+        """Compute the influence of each symbol on this table's results.
+
+        The influence of a symbol is the fraction of rows of the table for
+        which flipping the value of that symbol flips the result. Pairs of
+        rows where either result is a don't care are not counted as flips.
+
+        :returns: A dict mapping each symbol in this table's ordering to its
+            influence, in the range 0 to 1.
+        :rtype: Dict[:class:`str <python:str>`, :class:`float <python:float>`]
+
+        :raises RequiresFullTableError: If this table is not full.
+
+        An example::
+
+            >>> from tt import TruthTable
+            >>> t = TruthTable('A or (B and C)')
+            >>> t.influence()
+            {'A': 0.75, 'B': 0.25, 'C': 0.25}
+            >>> TruthTable('A xor B xor C').influence()
+            {'A': 1.0, 'B': 1.0, 'C': 1.0}
+
+        """
+        self._assert_full('Influence can only be computed on full tables')
+
+        known = plane_to_int(self._known)
+        values = plane_to_int(self._values)
+        true_rows = known & values
+        false_rows = known & ~values
+
+        influences = {}
+        for symbol in self._ordering:
+            bit = self._symbol_bit(symbol)
+            shift = 1 << bit
+            # only look at the partner of each row with the symbol false
+            low_rows = ~row_bit_mask(bit, self._num_rows)
+            flips = low_rows & ((true_rows & (false_rows >> shift)) |
+                                (false_rows & (true_rows >> shift)))
+            influences[symbol] = 2 * popcount(flips) / self._num_rows
+
+        return influences
+
+    def support(self):
+        """Get the symbols on which this table's results actually depend.
+
+        A symbol is in the support of a table if flipping its value flips the
+        result of at least one row; symbols that are not (sometimes called
+        *vacuous* symbols) could be dropped from the table without losing any
+        information. As with :func:`influence`, pairs of rows where either
+        result is a don't care are not counted as flips.
+
+        :returns: The symbols in the support of this table, in the order they
+            appear in this table's ordering.
+        :rtype: List[:class:`str <python:str>`]
+
+        :raises RequiresFullTableError: If this table is not full.
+
+        An example::
+
+            >>> from tt import TruthTable
+            >>> t = TruthTable('A or (B and not B) or (C -> C)')
+            >>> t.support()
+            []
+            >>> TruthTable('(A and B) or (A and not B) or C').support()
+            ['A', 'C']
+
+        """
+        self._assert_full('Support can only be computed on full tables')
+
+        known = plane_to_int(self._known)
+        values = plane_to_int(self._values)
+        return [symbol for symbol in self._ordering
+                if cofactors_differ(values, known, self._symbol_bit(symbol),
+                                    self._num_rows)]
+
+    def reorder(self, new_ordering):
+        """Get a copy of this table with its symbols in a new ordering.
+
+        The rows of the new table are permuted directly from the packed
+        results of this table, without re-evaluating its expression. Rows of
+        this table that have not been filled remain unfilled in the new one.
+
+        :param new_ordering: A permutation of this table's ordering.
+        :type new_ordering: List[:class:`str <python:str>`]
+
+        :returns: The reordered table, stored in memory.
+        :rtype: :class:`TruthTable`
+
+        :raises DuplicateSymbolError: If ``new_ordering`` repeats a symbol.
+        :raises ExtraSymbolError: If ``new_ordering`` has symbols not present
+            in this table.
+        :raises MissingSymbolError: If ``new_ordering`` is missing symbols
+            present in this table.
+
+        A simple example::
+
+            >>> from tt import TruthTable
+            >>> t = TruthTable('A and not B')
+            >>> t.results
+            [False, False, True, False]
+            >>> t2 = t.reorder(['B', 'A'])
+            >>> t2.ordering, t2.results
+            (['B', 'A'], [False, True, False, False])
+            >>> t2.equivalent_to('A and not B', align=True)
+            True
+
+        """
+        new_ordering = list(new_ordering)
+        assert_iterable_contains_all_expr_symbols(
+            new_ordering, set(self._ordering))
+
+        known, values = (
+            reorder_rows(plane_to_int(plane), self._num_rows, self._ordering,
+                         new_ordering)
+            for plane in (self._known, self._values))
+        return TruthTable._from_planes(new_ordering, self._expr, known,
+                                       values)
+
+    def minimize(self, method='auto'):
+        """Find a minimal sum-of-products expression for this table.
+
+        Rows holding don't cares are treated as free to be either ``0`` or
+        ``1``, whichever leads to a simpler expression. Expressions are
+        compared first by their number of terms and then by their total
+        number of literals.
+
+        :param method: The minimization algorithm; one of ``'exact'`` (the
+            Quine-McCluskey method, followed by Petrick's method for covering
+            the table), ``'heuristic'`` (an Espresso-style heuristic), or
+            ``'auto'`` (the exact method for tables of up to 8 symbols, and
+            the heuristic method for larger tables). The runtime of the exact
+            method grows exponentially with the size of the table, while the
+            heuristic method is fast but not guaranteed to find a minimum.
+        :type method: :class:`str <python:str>`, optional
+
+        :returns: An expression in disjunctive normal form that agrees with
+            this table on every row that is not a don't care. Its symbols
+            are a subset of this table's ordering.
+        :rtype: :class:`BooleanExpression
+            <tt.expressions.bexpr.BooleanExpression>`
+
+        :raises InvalidArgumentValueError: If ``method`` is not one of the
+            supported methods.
+        :raises RequiresFullTableError: If this table is not full.
+
+        Here's a simple example, where don't cares allow for dropping a
+        symbol entirely::
+
+            >>> from tt import TruthTable
+            >>> t = TruthTable(from_values='0001x1x1')
+            >>> t.minimize()
+            <BooleanExpression "A or (B and C)">
+            >>> t = TruthTable(from_values='01xx0x1x')
+            >>> t.minimize()
+            <BooleanExpression "B or C">
+
+        Constant tables give constant expressions::
+
+            >>> from tt import TruthTable
+            >>> TruthTable(from_values='xx00').minimize()
+            <BooleanExpression "0">
+            >>> TruthTable(from_values='1x11').minimize()
+            <BooleanExpression "1">
+
+        """
+        if method not in _MINIMIZE_METHODS:
+            raise InvalidArgumentValueError(
+                '`method` must be one of ' +
+                ', '.join('"{}"'.format(m) for m in _MINIMIZE_METHODS))
+
+        if not self.is_full:
+            raise RequiresFullTableError(
+                'Only full tables can be minimized')
+
+        num_symbols = len(self._ordering)
+        if method == 'auto':
+            method = ('exact' if num_symbols <= _MAX_AUTO_EXACT_SYMBOLS else
+                      'heuristic')
+        minimizer = (minimize_exact if method == 'exact' else
+                     minimize_heuristic)
+
+        known = plane_to_int(self._known)
+        values = plane_to_int(self._values)
+        cubes = minimizer(known & values, values & ~known, num_symbols)
+
+        if not cubes:
+            return BooleanExpression('0')
+
+        terms = []
+        for mask, value in sorted(cubes, key=self._cube_sort_key):
+            literals = []
+            for i, symbol in enumerate(self._ordering):
+                bit = 1 << (num_symbols - 1 - i)
+                if mask & bit:
+                    literals.append(
+                        symbol if value & bit else 'not ' + symbol)
+            terms.append(literals)
+
+        if not terms[0]:
+            return BooleanExpression('1')
+        elif len(terms) == 1:
+            return BooleanExpression(' and '.join(terms[0]))
+
+        return BooleanExpression(' or '.join(
+            ' and '.join(literals) if len(literals) == 1 else
+            '(' + ' and '.join(literals) + ')'
+            for literals in terms))
+
+    def flush(self):
+        """Flush any changes to this table to its backing file.
+
+        This is a no-op for tables stored in memory.
+
+        """
+        if self._mmap is not None:
+            self._mmap.flush()
+
+    def close(self):
+        """Release the backing file of this table, if it has one.
+
+        A table stored in a backing file cannot be used after it is closed.
+        This is a no-op for tables stored in memory. Tables can also be used
+        as context managers, closing them on exit::
+
+            >>> import os, tempfile
+            >>> from tt import TruthTable
+            >>> path = os.path.join(tempfile.mkdtemp(), 'table.tt')
+            >>> with TruthTable('A nand B', backing_file=path) as t:
+            ...     t.results
+            ...
+            [True, True, True, False]
+            >>> with TruthTable.from_file(path) as t:
+            ...     t.expr, t.results
+            ...
+            (<BooleanExpression "A nand B">, [True, True, True, False])
+
+        """
+        if self._mmap is None:
+            return
+
+        self._known.release()
+        self._values.release()
+        self._mmap_view.release()
+        self._mmap.close()
+        self._mmap = None
+
+    def write(self, fp, format='grid'):
+        """Stream the rows of this table to a file-like object.
+
+        Unlike building the ``__str__`` representation of a table, this method
+        never holds more than a small, fixed-size batch of formatted rows in
+        memory at once, making it suitable for dumping very large tables.
+
+        :param fp: The file-like object to write to; only its ``write`` method
+            is used.
+        :type fp: text file-like object
+
+        :param format: The output format; one of ``'grid'`` (the same layout
+            produced by ``__str__``), ``'csv'``, ``'tsv'``, or ``'bits'`` (the
+            table's results as a single string of 0's, 1's and x's, as would
+            be accepted by the ``from_values`` initialization argument).
+        :type format: :class:`str <python:str>`, optional
+
+        :raises InvalidArgumentValueError: If ``format`` is not one of the
+            supported formats.
+        :raises RequiresFullTableError: If the ``'bits'`` format is requested
+            for a table that is not full.
+
+        In the ``'csv'`` and ``'tsv'`` formats, the result column is headed
+        by the table's expression, or by ``result`` for tables built from
+        values. Unfilled rows are skipped in all but the ``'bits'``
+        format::
+
+            >>> import sys
+            >>> from tt import TruthTable
+            >>> t = TruthTable('A and B', fill_all=False)
+            >>> t.fill(A=1)
+            >>> t.write(sys.stdout, format='csv')
+            A,B,A and B
+            1,0,0
+            1,1,1
+            >>> t.fill()
+            >>> t.write(sys.stdout, format='bits')
+            0001
+
+        """
+        if format not in _WRITE_FORMATS:
+            raise InvalidArgumentValueError(
+                '`format` must be one of ' +
+                ', '.join('"{}"'.format(f) for f in _WRITE_FORMATS))
+
+        result_strs = {True: '1', False: '0', DONT_CARE_VALUE: DONT_CARE_VALUE}
+
+        if format == 'bits':
+            if not self.is_full:
+                raise RequiresFullTableError(
+                    'The bits format can only be written for full tables')
+
+            chunk = []
+            for result in self._iter_results():
+                chunk.append(result_strs[result])
+                if len(chunk) >= _WRITE_CHUNK_SIZE:
+                    fp.write(''.join(chunk))
+                    chunk.clear()
+            chunk.append('\n')
+            fp.write(''.join(chunk))
+            return
+
+        if format == 'grid':
+            self._sync_filled_slots()
+            if not self._num_filled_slots:
+                fp.write('Empty!\n')
+                return
+
+            col_widths = self._get_col_widths()
+            row_sep = self._get_row_sep(col_widths)
+            line_end = '|\n' + row_sep + '\n'
+
+            # each cell string includes its trailing column separator
+            cells = [
+                (self._get_as_table_row(['0'], [width])[1:],
+                 self._get_as_table_row(['1'], [width])[1:])
+                for width in col_widths[:-1]]
+            result_width = col_widths[-1]
+            result_strs = {
+                k: self._get_as_table_row([v], [result_width])[1:-1]
+                for k, v in result_strs.items()}
+
+            fp.write(row_sep + '\n' +
+                     self._get_as_table_row(self._ordering + [' '],
+                                            col_widths) +
+                     '\n' + row_sep + '\n')
+            row_start = '|'
+        else:
+            delimiter = ',' if format == 'csv' else '\t'
+            cells = [('0' + delimiter, '1' + delimiter)
+                     for _ in self._ordering]
+            line_end = '\n'
+
+            if self._expr is None:
+                result_header = 'result'
+            else:
+                # normalize the spacing the expression was written with
+                result_header = ' '.join(self._expr.raw_expr.split())
+            fp.write(delimiter.join(self._ordering + [result_header]) + '\n')
+            row_start = ''
+
+        chunk = []
+        row_cells = itertools.product(*cells)
+        for input_cells, result in zip(row_cells, self._iter_results()):
+            if result is None:
                 continue
 
-            input_dict = dict(zip(self._ordering, input_combo))
-            if all(input_dict[k] == v for k, v in restrictions.items()):
-                self._results[i] = self._expr.evaluate_unchecked(**input_dict)
-                self._num_filled_slots += 1
+            chunk.append(row_start)
+            chunk.extend(input_cells)
+            chunk.append(result_strs[result])
+            chunk.append(line_end)
+            if len(chunk) >= _WRITE_CHUNK_SIZE:
+                fp.write(''.join(chunk))
+                chunk.clear()
+
+        fp.write(''.join(chunk))
+
+    def to_bytes(self, compress=False):
+        """Serialize this table to a compact binary form.
+
+        The serialized form packs each row of the table into two bits, and so
+        is roughly 1/8 the size of the table's ``'bits'`` format output (see
+        :func:`write`). It shares its layout with the files created via the
+        ``backing_file`` initialization argument, and records the table's
+        ordering and expression (if it has one) along with any filled rows.
+
+        :param compress: Whether to zlib-compress the table's rows. Compressed
+            tables are often much smaller, but cannot be opened with
+            :func:`from_file`.
+        :type compress: :class:`bool <python:bool>`, optional
+
+        :returns: The serialized table, which can be loaded with
+            :func:`from_bytes`.
+        :rtype: :class:`bytes <python:bytes>`
+
+        An example round trip::
+
+            >>> from tt import TruthTable
+            >>> t = TruthTable('A or B')
+            >>> data = t.to_bytes()
+            >>> len(data)
+            34
+            >>> t2 = TruthTable.from_bytes(data)
+            >>> t2.expr, t2.results
+            (<BooleanExpression "A or B">, [False, True, True, True])
+
+        """
+        flags = self._header_flags()
+        if compress:
+            flags |= FLAG_COMPRESSED
+
+        expr_str = None if self._expr is None else self._expr.raw_expr
+        return (pack_header(self._ordering, expr_str, flags) +
+                pack_planes(self._known, self._values, compress))
+
+    def to_hex(self, compress=False):
+        """Serialize this table to a string of hex digits.
+
+        This is the hex encoding of :func:`to_bytes`, for use where binary
+        data is inconvenient (e.g., in JSON documents or on the command line).
+
+        :param compress: Whether to zlib-compress the table's rows.
+        :type compress: :class:`bool <python:bool>`, optional
+
+        :returns: The serialized table, which can be loaded with
+            :func:`from_hex`.
+        :rtype: :class:`str <python:str>`
+
+        An example round trip::
+
+            >>> from tt import TruthTable
+            >>> t = TruthTable(from_values='0x1x')
+            >>> TruthTable.from_hex(t.to_hex()).results
+            [False, 'x', True, 'x']
+
+        """
+        return self.to_bytes(compress).hex()
 
     @staticmethod
     def input_combos(combo_len):
@@ -596,6 +1523,269 @@ class TruthTable(object):
         symbol_pool = (''.join(elts) for elts in symbol_product)
         return list(itertools.islice(symbol_pool, num_symbols))
 
+    @classmethod
+    def from_file(cls, path):
+        """Re-open a table stored in a memory-mapped file.
+
+        The table's results are read from (and filled into) the file in place,
+        so re-opening a table does not require any re-computation or copying
+        of its results. This also allows multiple processes to work on the
+        same table at once.
+
+        :param path: The path of a file created through the ``backing_file``
+            initialization argument, or holding the uncompressed output of
+            :func:`to_bytes`.
+        :type path: :class:`str <python:str>`
+
+        :returns: The table stored in the file.
+        :rtype: :class:`TruthTable`
+
+        :raises InvalidArgumentValueError: If the file does not hold a valid,
+            uncompressed table.
+
+        Here's an example of filling one table across two handles to its
+        file, as could be done from separate processes::
+
+            >>> import os, tempfile
+            >>> from tt import TruthTable
+            >>> path = os.path.join(tempfile.mkdtemp(), 'table.tt')
+            >>> t1 = TruthTable('A and (B or C or D)', fill_all=False,
+            ...                 backing_file=path)
+            >>> t2 = TruthTable.from_file(path)
+            >>> t1.fill(A=0)
+            >>> t2.fill(A=1)
+            >>> t1.is_full
+            True
+            >>> t1.results == TruthTable('A and (B or C or D)').results
+            True
+            >>> t1.close()
+            >>> t2.close()
+
+        When filling a table from several processes, restrict each process
+        to a disjoint region of at least 8 consecutive rows (i.e., only
+        restrict symbols at the front of the table's ordering while leaving
+        at least 3 symbols unrestricted), as rows in the same byte of the file
+        cannot be safely filled concurrently.
+
+        """
+        with open(path, 'r+b') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0)
+            except ValueError:
+                raise InvalidArgumentValueError('Cannot map an empty file')
+
+        try:
+            ordering, expr_str, flags, _ = unpack_header(mm)
+            if flags & FLAG_COMPRESSED:
+                raise InvalidArgumentValueError(
+                    'Compressed tables cannot be memory-mapped')
+        except Exception:
+            mm.close()
+            raise
+
+        table = cls._from_header(ordering, expr_str)
+        table._map_planes(mm, path)
+        return table
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Load a table serialized with :func:`to_bytes`.
+
+        :param data: The serialized table.
+        :type data: bytes-like object
+
+        :returns: The deserialized table.
+        :rtype: :class:`TruthTable`
+
+        :raises InvalidArgumentTypeError: If ``data`` is not a bytes-like
+            object.
+        :raises InvalidArgumentValueError: If ``data`` does not hold a valid
+            serialized table.
+
+        """
+        try:
+            view = memoryview(data).cast('B')
+        except TypeError:
+            raise InvalidArgumentTypeError('`data` must be bytes-like')
+
+        ordering, expr_str, flags, offset = unpack_header(view)
+        table = cls._from_header(ordering, expr_str)
+        table._known, table._values = unpack_planes(
+            view, offset, table._num_rows, flags)
+        table._num_filled_slots = table._count_filled_slots()
+        return table
+
+    @classmethod
+    def from_hex(cls, hex_str):
+        """Load a table serialized with :func:`to_hex`.
+
+        :param hex_str: The hex-encoded serialized table.
+        :type hex_str: :class:`str <python:str>`
+
+        :returns: The deserialized table.
+        :rtype: :class:`TruthTable`
+
+        :raises InvalidArgumentTypeError: If ``hex_str`` is not a string.
+        :raises InvalidArgumentValueError: If ``hex_str`` does not hold a
+            valid hex-encoded table.
+
+        """
+        if not isinstance(hex_str, str):
+            raise InvalidArgumentTypeError('`hex_str` must be a string')
+
+        try:
+            data = bytes.fromhex(hex_str)
+        except ValueError:
+            raise InvalidArgumentValueError('`hex_str` is not valid hex')
+
+        return cls.from_bytes(data)
+
+    @classmethod
+    def _from_header(cls, ordering, expr_str):
+        """Make a table without planes from the contents of a header."""
+        table = cls.__new__(cls)
+        table._ordering = ordering
+        table._expr = (None if expr_str is None else
+                       BooleanExpression(expr_str))
+        table._num_rows = 2**len(ordering)
+        table._num_filled_slots = 0
+        table._symbol_vals_factory = boolean_variables_factory(ordering)
+        table._backing_file = None
+        table._mmap = None
+        return table
+
+    def _header_flags(self):
+        """Get the serialization header flags describing this table."""
+        dont_cares = (plane_to_int(self._values) &
+                      ~plane_to_int(self._known))
+        return FLAG_HAS_DONT_CARES if dont_cares else 0
+
+    @classmethod
+    def _from_planes(cls, ordering, expr, known, values):
+        """Make an in-memory table from ints of its known and values planes."""
+        table = cls._from_header(ordering, None)
+        table._expr = expr
+        table._known = bytearray(int_to_plane_bytes(known, table._num_rows))
+        table._values = bytearray(
+            int_to_plane_bytes(values, table._num_rows))
+        table._num_filled_slots = table._count_filled_slots()
+        return table
+
+    @classmethod
+    def _from_rows(cls, ordering, expr, ones, zeros):
+        """Make a full in-memory table from ints of its true and false rows.
+
+        Rows that are neither true nor false are taken as don't cares.
+
+        """
+        known = ones | zeros
+        dont_cares = all_rows_mask(2**len(ordering)) & ~known
+        return cls._from_planes(ordering, expr, known, ones | dont_cares)
+
+    def _assert_full(self, msg):
+        """Raise a ``RequiresFullTableError`` if this table is not full."""
+        if not self.is_full:
+            raise RequiresFullTableError(msg)
+
+    def _combine(self, other, operator, combine_rows):
+        """Combine this table with another through a binary operator.
+
+        :param combine_rows: A function taking the known and values ints of
+            both tables and returning ints of the true and false rows of the
+            combined table.
+
+        """
+        if not isinstance(other, TruthTable):
+            return NotImplemented
+
+        self._assert_full('Only full tables can be combined')
+        other._assert_full('Only full tables can be combined')
+        if list(self._ordering) != list(other._ordering):
+            raise InvalidArgumentValueError(
+                'Only tables with the same ordering can be combined; use '
+                '`reorder` to align them first')
+
+        if self._expr is None or other._expr is None:
+            expr = None
+        else:
+            expr = BooleanExpression('({}) {} ({})'.format(
+                self._expr.raw_expr, operator, other._expr.raw_expr))
+
+        ones, zeros = combine_rows(
+            plane_to_int(self._known), plane_to_int(self._values),
+            plane_to_int(other._known), plane_to_int(other._values))
+        return TruthTable._from_rows(self._ordering, expr, ones, zeros)
+
+    def _symbol_bit(self, symbol):
+        """Get the bit of the row index holding the value of a symbol."""
+        try:
+            i = self._ordering.index(symbol)
+        except ValueError:
+            raise ExtraSymbolError(
+                '"{}" is not a symbol in this table'.format(symbol))
+        return len(self._ordering) - 1 - i
+
+    def _save_checkpoint(self, path):
+        """Atomically write the serialized contents of this table to a file."""
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(self.to_bytes())
+        os.replace(tmp_path, path)
+
+    def _load_checkpoint(self, path):
+        """Merge the filled rows saved in a checkpoint file into this table."""
+        with open(path, 'rb') as f:
+            saved = TruthTable.from_bytes(f.read())
+
+        if list(saved._ordering) != list(self._ordering) or (
+                saved._expr is not None and self._expr is not None and
+                saved._expr.raw_expr != self._expr.raw_expr):
+            raise InvalidArgumentValueError(
+                'Checkpoint file "{}" holds a different table'.format(path))
+
+        self._known[:] = int_to_plane_bytes(
+            plane_to_int(self._known) | plane_to_int(saved._known),
+            self._num_rows)
+        self._values[:] = int_to_plane_bytes(
+            plane_to_int(self._values) | plane_to_int(saved._values),
+            self._num_rows)
+        self._num_filled_slots = self._count_filled_slots()
+
+    def _cube_sort_key(self, cube):
+        """Sort key for ordering the terms of a minimized expression."""
+        mask, value = cube
+        num_symbols = len(self._ordering)
+        key = []
+        for i in range(num_symbols):
+            bit = 1 << (num_symbols - 1 - i)
+            key.append((not mask & bit, bool(value & bit)))
+        return key
+
+    def _count_filled_slots(self):
+        """Count the filled rows of this table from its planes."""
+        return popcount(plane_to_int(self._known) |
+                        plane_to_int(self._values))
+
+    def _sync_filled_slots(self):
+        """Account for rows filled into a shared backing file elsewhere."""
+        if self._mmap is not None:
+            self._num_filled_slots = self._count_filled_slots()
+
+    def _result_at(self, i):
+        """Get the result stored in row ``i`` of this table."""
+        code = (get_bit(self._known, i) << 1) | get_bit(self._values, i)
+        return _RESULT_CODES[code]
+
+    def _iter_results(self):
+        """Iterate over the results stored in each row of this table."""
+        # row counts are powers of 2, so only a table with a single byte per
+        # plane can have a partially used byte
+        bit_range = range(min(8, self._num_rows))
+        for k, v in zip(self._known, self._values):
+            for bit in bit_range:
+                yield _RESULT_CODES[(((k >> bit) & 1) << 1) |
+                                    ((v >> bit) & 1)]
+
     def _get_as_table_row(self, items, col_widths):
         """Convert an iterable to a row in the table ``__str__``.
 
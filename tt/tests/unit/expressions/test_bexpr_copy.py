@@ -0,0 +1,44 @@
+"""Tests for copying expressions."""
+
+import copy
+import unittest
+
+from tt.expressions import BooleanExpression
+from tt.tables import TruthTable
+
+
+class TestExpressionCopy(unittest.TestCase):
+
+    def test_deepcopy(self):
+        """Test deep copying an expression."""
+        b = BooleanExpression('A and B')
+        b_copy = copy.deepcopy(b)
+        self.assertEqual('A and B', str(b_copy))
+        self.assertEqual(['A', 'B'], b_copy.symbols)
+        self.assertEqual({'A': True, 'B': True},
+                         b_copy.sat_one()._asdict())
+
+    def test_copies_after_incremental_solves(self):
+        """Test copying an expression that has a persistent solver."""
+        b = BooleanExpression('A or B')
+        self.assertIsNotNone(b.sat_one(incremental=True))
+
+        b_copy = copy.copy(b)
+        self.assertIsNotNone(b_copy.sat_one(incremental=True))
+
+        b_copy = copy.deepcopy(b)
+        with b_copy.constrain(A=0):
+            self.assertEqual({'A': False, 'B': True},
+                             b_copy.sat_one(incremental=True)._asdict())
+
+        # the original keeps its own solver
+        with b.constrain(B=0):
+            self.assertEqual({'A': True, 'B': False},
+                             b.sat_one(incremental=True)._asdict())
+
+    def test_deepcopy_truth_table(self):
+        """Test deep copying a truth table, which holds an expression."""
+        t = TruthTable('A or B')
+        t_copy = copy.deepcopy(t)
+        self.assertEqual([False, True, True, True], t_copy.results)
+        self.assertEqual('A or B', str(t_copy.expr))
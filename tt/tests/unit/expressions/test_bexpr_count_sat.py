@@ -0,0 +1,72 @@
+"""Tests for expression count_sat functionality."""
+
+from tt.errors import (
+    InvalidArgumentValueError,
+    NoEvaluationVariationError)
+from tt.expressions import BooleanExpression as be
+
+from ._helpers import ExpressionTestCase
+
+
+class TestExpressionCountSat(ExpressionTestCase):
+
+    def assert_counts_match_sat_all(self, b):
+        """Assert that each method's count is the number of sat_all results."""
+        expected = sum(1 for _ in b.sat_all())
+        for method in ('auto', 'table', 'sat'):
+            self.assertEqual(expected, b.count_sat(method=method))
+
+    def test_only_constants_exprs_cause_exception(self):
+        """Test that expressions of only constants cause exceptions."""
+        with self.assertRaises(NoEvaluationVariationError):
+            be('1 or 0').count_sat()
+
+    def test_invalid_method(self):
+        """Test that an unknown method causes an exception."""
+        with self.assertRaises(InvalidArgumentValueError):
+            be('A').count_sat(method='enumerate')
+
+    def test_counts_match_sat_all(self):
+        """Test counts of a few expressions against enumerated solutions."""
+        for expr in ('A', 'not A', 'A xor B xor C xor D',
+                     '(A -> B) and (B -> C) and (C -> D) and (D -> A)',
+                     '(A nand B) xnor (C nor (D or 0))',
+                     'A and (B or not B) and (C or 1)',
+                     '(A or B) and not (A or B)'):
+            self.assert_counts_match_sat_all(be(expr))
+
+    def test_constrained_counts_match_sat_all(self):
+        """Test counts under constraints against enumerated solutions."""
+        b = be('(A xor B) or (C and D and not E)')
+        with b.constrain(A=1):
+            self.assert_counts_match_sat_all(b)
+            with b.constrain(B=1, E=0):
+                self.assert_counts_match_sat_all(b)
+        with b.constrain(A=0, B=0, C=0, D=1, E=0):
+            self.assertEqual(0, b.count_sat(method='sat'))
+        with b.constrain(A=0, B=0, C=1, D=1, E=0):
+            self.assertEqual(1, b.count_sat(method='table'))
+
+    def test_many_symbols(self):
+        """Test counting solutions of an expression of many symbols."""
+        # a chain of 61 symbols, where adjacent symbols cannot both be false
+        terms = ['(x{} or x{})'.format(i, i + 1) for i in range(60)]
+        b = be(' and '.join(terms))
+
+        # the number of such chains of n symbols is a Fibonacci number
+        a, c = 1, 2
+        for _ in range(61):
+            a, c = c, a + c
+        self.assertEqual(a, b.count_sat())
+
+        with b.constrain(x0=0):
+            # x1 is forced to 1, leaving a free chain of 59 symbols
+            a, c = 1, 2
+            for _ in range(59):
+                a, c = c, a + c
+            self.assertEqual(a, b.count_sat())
+
+    def test_long_implication_chain(self):
+        """Test counting solutions of a chain too deep to recurse through."""
+        terms = ['(x{} -> x{})'.format(i, i + 1) for i in range(600)]
+        self.assertEqual(602, be(' and '.join(terms)).count_sat())
@@ -1,5 +1,7 @@
 """Tests for different expression forms."""
 
+from tt.expressions import BooleanExpression
+
 from ._helpers import ExpressionTestCase
 
 
@@ -38,3 +40,14 @@ class TestBooleanExpressionForms(ExpressionTestCase):
         self.assert_not_dnf('~(A and B) or (C and D)')
         self.assert_not_dnf('(A and B) or ~(C and D)')
         self.assert_not_dnf('(A and B) or (A and (B or C))')
+
+    def test_cnf_size(self):
+        """Test the size of the CNF clauses handed to the solver."""
+        self.assertEqual((1, 1), BooleanExpression('A').cnf_size)
+        self.assertEqual((3, 2), BooleanExpression('(A or B) and C').cnf_size)
+        self.assertEqual((2, 2), BooleanExpression('A xor B').cnf_size)
+        self.assertEqual((2, 1), BooleanExpression('A or 1').cnf_size)
+
+        b = BooleanExpression('(A or B) and (not A or C)')
+        with b.constrain(A=1):
+            self.assertEqual((3, 2), b.cnf_size)
@@ -1,7 +1,12 @@
 """Tests for expression sat_all functionality."""
 
-from tt.errors import NoEvaluationVariationError
+from tt.errors import (
+    InvalidArgumentTypeError,
+    InvalidArgumentValueError,
+    NoEvaluationVariationError,
+    SolverLimitError)
 from tt.expressions import BooleanExpression as be
+from tt.tables import TruthTable
 
 from ._helpers import ExpressionTestCase
 
@@ -101,3 +106,149 @@ class TestExpressionSatAll(ExpressionTestCase):
         with be('A or B or C or D').constrain(A=0, B=0, C=0, D=0) as b:
             res = list(str(sol) for sol in b.sat_all())
         self.assertEqual(0, len(res))
+
+    def test_clause_encoding_reused_across_calls(self):
+        """Test that the CNF encoding is computed once and left unmodified."""
+        b = be('(A xor B) and (C or 0) and (B -> C)')
+        encoding = b._to_picosat_clauses_and_mappings()
+        clauses = [list(clause) for clause in encoding[0]]
+        constant_assumptions = list(encoding[1])
+
+        expected = [str(sol) for sol in b.sat_all()]
+        for _ in range(2):
+            with b.constrain(A=1):
+                self.assertEqual(['A=1, B=0, C=1'],
+                                 [str(sol) for sol in b.sat_all()])
+                self.assertEqual('A=1, B=0, C=1', str(b.sat_one()))
+            self.assertEqual(expected, [str(sol) for sol in b.sat_all()])
+
+        self.assertIs(encoding, b._to_picosat_clauses_and_mappings())
+        self.assertEqual(clauses, encoding[0])
+        self.assertEqual(constant_assumptions, encoding[1])
+
+    def test_constants_do_not_duplicate_solutions(self):
+        """Test that variables of constants are projected away."""
+        b = be('(A or 0) and (B or 1) and (C nand 0)')
+        res = [str(sol) for sol in b.sat_all()]
+        self.assertEqual(4, len(res))
+        self.assertEqual(4, len(set(res)))
+        self.assertTrue(all(sol.startswith('A=1') for sol in res))
+
+    def test_packed_formats_match_truth_table_rows(self):
+        """Test that packed solutions are the true rows of the truth table."""
+        b = be('(A xor B) or (C and not D) or (E -> (A nand F))')
+        t = TruthTable(b)
+        rows = sorted(i for i, result in enumerate(t.results) if result)
+
+        self.assertEqual(rows, sorted(b.sat_all(format='int')))
+        self.assertEqual(
+            ['{:06b}'.format(i) for i in rows],
+            sorted(b.sat_all(format='bits')))
+        self.assertEqual(
+            [bytes([i]) for i in rows], sorted(b.sat_all(format='bytes')))
+
+        chunks = list(b.sat_all(format='bytes', chunk_size=10))
+        self.assertEqual(-(-len(rows) // 10), len(chunks))
+        self.assertEqual(rows, sorted(b''.join(chunks)))
+
+        for chunk_size in (2**40, 2**63 - 1):
+            chunks = list(b.sat_all(format='bytes', chunk_size=chunk_size))
+            self.assertEqual(1, len(chunks))
+            self.assertEqual(rows, sorted(chunks[0]))
+
+    def test_packed_formats_follow_values(self):
+        """Test that packed solutions match the default format's values."""
+        b = be('(A or 0) and (B or 1) and (C nand 0) and (D -> A)')
+        with b.constrain(C=0):
+            values = ['{:d}{:d}{:d}{:d}'.format(*sol) for sol in b.sat_all()]
+            self.assertEqual(values, list(b.sat_all(format='bits')))
+            self.assertEqual([int(bits, 2) for bits in values],
+                             list(b.sat_all(format='int')))
+
+    def test_packed_formats_all_symbols_constrained(self):
+        """Test packing the solution when all symbols are constrained."""
+        b = be('A or B')
+        with b.constrain(A=1, B=0):
+            self.assertEqual([2], list(b.sat_all(format='int')))
+            self.assertEqual(['10'], list(b.sat_all(format='bits')))
+            self.assertEqual([b'\x02'], list(b.sat_all(format='bytes')))
+            self.assertEqual(
+                [b'\x02'], list(b.sat_all(format='bytes', chunk_size=2)))
+        with b.constrain(A=0, B=0):
+            self.assertEqual([], list(b.sat_all(format='int')))
+
+    def test_packed_formats_many_symbols(self):
+        """Test packing solutions of symbols spanning several bytes."""
+        b = be(' and '.join('(x{} -> x{})'.format(i, i + 1)
+                            for i in range(20)))
+        masks = list(b.sat_all(format='int'))
+        self.assertEqual(22, len(masks))
+        self.assertEqual({2**i - 1 for i in range(22)}, set(masks))
+        self.assertEqual(sorted(mask.to_bytes(3, 'big') for mask in masks),
+                         sorted(b.sat_all(format='bytes')))
+
+    def test_symbols_dropped_from_clauses(self):
+        """Test solutions of symbols the expression does not depend on."""
+        # D xor D is always false, so D is dropped in converting to CNF
+        b = be('(A and (((D xor D) or not (A)) nand E))')
+        t = TruthTable(b)
+        rows = sorted(i for i, result in enumerate(t.results) if result)
+
+        self.assertEqual(rows, sorted(b.sat_all(format='int')))
+        self.assertEqual(['{:03b}'.format(i) for i in rows],
+                         sorted(b.sat_all(format='bits')))
+        self.assertEqual(rows, sorted(b''.join(b.sat_all(format='bytes'))))
+        chunks = list(b.sat_all(format='bytes', chunk_size=3))
+        self.assertEqual([3, 1], [len(chunk) for chunk in chunks])
+        self.assertEqual(rows, sorted(b''.join(chunks)))
+        self.assertEqual(
+            ['{:03b}'.format(i) for i in rows],
+            sorted('{:d}{:d}{:d}'.format(*sol) for sol in b.sat_all()))
+        self.assertEqual(len(rows), b.count_sat())
+
+        with b.constrain(D=1):
+            self.assertEqual([6, 7], sorted(b.sat_all(format='int')))
+            self.assertEqual(['A=1, D=1, E=0', 'A=1, D=1, E=1'],
+                             sorted(str(sol) for sol in b.sat_all()))
+
+        # with every symbol dropped, only the constants remain
+        b = be('(A xor A) or 1')
+        self.assertEqual([0, 1], sorted(b.sat_all(format='int')))
+        self.assertEqual(['A=0', 'A=1'],
+                         sorted(str(sol) for sol in b.sat_all()))
+        self.assertEqual([], list(be('(A xor A) and 0').sat_all(
+            format='int')))
+
+    def test_invalid_format(self):
+        """Test an error is raised for invalid formats and chunk sizes."""
+        b = be('A or B')
+        with self.assertRaises(InvalidArgumentValueError):
+            next(b.sat_all(format='lits'))
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            next(b.sat_all(format='bytes', chunk_size=1.0))
+
+        with self.assertRaises(InvalidArgumentValueError):
+            next(b.sat_all(format='bytes', chunk_size=0))
+
+        with self.assertRaises(InvalidArgumentValueError):
+            next(b.sat_all(format='bytes', chunk_size=2**63))
+
+        with self.assertRaises(InvalidArgumentValueError):
+            next(b.sat_all(format='bits', chunk_size=2))
+
+    def test_solver_limits(self):
+        """Test limits on finding each solution."""
+        b = be('A or B or C')
+        self.assertEqual(7, len(list(b.sat_all(decision_limit=3,
+                                               propagation_limit=10**6,
+                                               timeout=60))))
+
+        for format in ('values', 'int', 'bytes'):
+            it = b.sat_all(format=format, decision_limit=0)
+            with self.assertRaises(SolverLimitError):
+                next(it)
+            self.assertEqual([], list(it))
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            next(b.sat_all(decision_limit='0'))
@@ -1,6 +1,9 @@
 """Tests for expression sat_one functionality."""
 
-from tt.errors import NoEvaluationVariationError
+from tt.errors import (
+    InvalidArgumentValueError,
+    NoEvaluationVariationError,
+    SolverLimitError)
 from tt.expressions import BooleanExpression as be
 
 from ._helpers import ExpressionTestCase
@@ -83,3 +86,42 @@ class TestExpressionSatOne(ExpressionTestCase):
             with b.constrain(C=1):
                 res = b.sat_one()
                 self.assertEqual('A=0, B=1, C=1, D=1', str(res))
+
+    def test_incremental_matches_non_incremental(self):
+        """Test incremental solves under changing constraints."""
+        b = be('(A xor B) and (B -> (C nand D)) and (A or 1)')
+        for a in (0, 1):
+            for d in (0, 1):
+                with b.constrain(A=a, D=d):
+                    self.assertEqual(str(b.sat_one()),
+                                     str(b.sat_one(incremental=True)))
+
+        self.assertIsNotNone(b.sat_one(incremental=True))
+
+    def test_incremental_unsat(self):
+        """Test an incremental solve of an unsatisfiable constraint."""
+        b = be('A and (B or 0)')
+        with b.constrain(B=0):
+            self.assertIsNone(b.sat_one(incremental=True))
+        self.assertEqual('A=1, B=1', str(b.sat_one(incremental=True)))
+
+    def test_solver_limits(self):
+        """Test reaching and not reaching limits on the solver."""
+        b = be('(A or B) and (not A or C) and (B or not C)')
+        for incremental in (False, True):
+            with self.assertRaises(SolverLimitError):
+                b.sat_one(incremental=incremental, decision_limit=0)
+            self.assertEqual(
+                str(b.sat_one()),
+                str(b.sat_one(incremental=incremental, decision_limit=10,
+                              propagation_limit=10**6, timeout=60)))
+
+        # this unsatisfiable result is known without any decisions
+        self.assertIsNone(be('A and B and not A').sat_one(decision_limit=0))
+
+    def test_invalid_solver_limits(self):
+        """Test an error is raised for invalid limits."""
+        b = be('A or B')
+        for incremental in (False, True):
+            with self.assertRaises(InvalidArgumentValueError):
+                b.sat_one(incremental=incremental, timeout=-1)
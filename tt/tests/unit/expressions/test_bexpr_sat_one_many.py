@@ -0,0 +1,93 @@
+"""Tests for expression sat_one_many functionality."""
+
+from tt.errors import (
+    AlreadyConstrainedSymbolError,
+    ExtraSymbolError,
+    InvalidArgumentTypeError,
+    InvalidBooleanValueError,
+    NoEvaluationVariationError)
+from tt.expressions import BooleanExpression as be
+
+from ._helpers import ExpressionTestCase
+
+
+class TestExpressionSatOneMany(ExpressionTestCase):
+
+    def assert_solutions_valid(self, b, constraint_dicts, results):
+        """Assert each result satisfies b under its constraints, or that no
+        solution exists when it is None."""
+        self.assertEqual(len(constraint_dicts), len(results))
+        for constraint_dict, result in zip(constraint_dicts, results):
+            with b.constrain(**constraint_dict):
+                if result is None:
+                    self.assertIsNone(b.sat_one())
+                    continue
+
+            self.assertTrue(b.evaluate(**result._asdict()))
+            for symbol, value in constraint_dict.items():
+                self.assertEqual(bool(value), getattr(result, symbol))
+
+    def test_matches_constrained_sat_one(self):
+        """Test solutions under several sets of constraints."""
+        b = be('(A xor B) and (B -> (C nand D)) and (E or 0)')
+        constraint_dicts = [{'A': 0}, {'B': 1, 'C': 1}, {'A': 1, 'B': 1},
+                            {'B': 1, 'C': 1, 'D': 1}, {'E': 0},
+                            {'A': 1, 'B': 0, 'C': 1, 'D': 1, 'E': 1}]
+        results = b.sat_one_many(constraint_dicts)
+        self.assert_solutions_valid(b, constraint_dicts, results)
+        self.assertEqual([True, True, False, False, False, True],
+                         [result is not None for result in results])
+
+    def test_empty_dicts_and_lists(self):
+        """Test solving without any constraints, or without any dicts."""
+        b = be('A and not B')
+        self.assertEqual([], b.sat_one_many([]))
+        self.assertEqual(['A=1, B=0', 'A=1, B=0'],
+                         [str(r) for r in b.sat_one_many([{}, {}])])
+
+    def test_combined_with_context_constraints(self):
+        """Test that dicts are combined with constrain() constraints."""
+        b = be('(A or B) and (C or D)')
+        with b.constrain(A=0, C=0):
+            results = b.sat_one_many([{'B': 1}, {'D': 0}, {'B': 1, 'D': 1}])
+            self.assertEqual('A=0, B=1, C=0, D=1', str(results[0]))
+            self.assertIsNone(results[1])
+            self.assertEqual('A=0, B=1, C=0, D=1', str(results[2]))
+
+            with self.assertRaises(AlreadyConstrainedSymbolError):
+                b.sat_one_many([{'B': 1}, {'A': 1}])
+
+    def test_symbols_dropped_from_clauses(self):
+        """Test constraining symbols the expression does not depend on."""
+        # D xor D is always false, so D is dropped in converting to CNF
+        b = be('(A and (((D xor D) or not (A)) nand E))')
+        constraint_dicts = [{'D': 1}, {'D': 0, 'E': 1}, {'A': 0, 'D': 1}]
+        results = b.sat_one_many(constraint_dicts)
+        self.assert_solutions_valid(b, constraint_dicts, results)
+        self.assertEqual([True, True, False],
+                         [result is not None for result in results])
+
+        with b.constrain(D=1):
+            self.assertEqual('A=1, D=1, E=0', str(b.sat_one()))
+            self.assertEqual('A=1, D=1, E=0',
+                             str(b.sat_one(incremental=True)))
+            self.assertEqual('A=1, D=1, E=1',
+                             str(b.sat_one_many([{'E': 1}])[0]))
+
+    def test_invalid_arguments(self):
+        """Test that invalid constraint dicts cause exceptions."""
+        b = be('A or B')
+        with self.assertRaises(InvalidArgumentTypeError):
+            b.sat_one_many({'A': 1})
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            b.sat_one_many([{'A': 1}, ['B']])
+
+        with self.assertRaises(ExtraSymbolError):
+            b.sat_one_many([{'C': 1}])
+
+        with self.assertRaises(InvalidBooleanValueError):
+            b.sat_one_many([{'A': 2}])
+
+        with self.assertRaises(NoEvaluationVariationError):
+            be('0 or 1').sat_one_many([{}])
@@ -0,0 +1,85 @@
+"""Tests for expression support and restriction functionality."""
+
+import itertools
+
+from tt.errors import (
+    ExtraSymbolError,
+    InvalidArgumentValueError,
+    InvalidBooleanValueError)
+from tt.expressions import BooleanExpression as be
+
+from ._helpers import ExpressionTestCase
+
+
+class TestExpressionSupport(ExpressionTestCase):
+
+    def helper_test_support(self, expr, expected_support):
+        """Helper to check the support found by every method."""
+        b = be(expr)
+        for method in ('auto', 'table', 'sat'):
+            self.assertEqual(expected_support, b.support(method=method),
+                             msg='Method: ' + method)
+
+    def test_all_symbols_in_support(self):
+        """Test an expression depending on all of its symbols."""
+        self.helper_test_support('A xor B xor C', ['A', 'B', 'C'])
+
+    def test_vacuous_symbols(self):
+        """Test expressions with symbols that do not affect them."""
+        self.helper_test_support('A or (B and not B)', ['A'])
+        self.helper_test_support('(A and B) or (A and not B) or C',
+                                 ['A', 'C'])
+        self.helper_test_support('(C -> C) and (A nand A)', ['A'])
+
+    def test_constant_functions(self):
+        """Test expressions whose values never change."""
+        self.helper_test_support('A or not A', [])
+        self.helper_test_support('(A xor B) and (A iff B)', [])
+        self.helper_test_support('1 and 0', [])
+
+    def test_support_matches_brute_force(self):
+        """Test the support against flipping symbols on every row."""
+        for expr in ('(A -> B) nor (C xnor (A and D))',
+                     '(A or B) and (A or not B) and (C or D)',
+                     'A nand (B nor (C xor (B or not B)))'):
+            b = be(expr)
+            expected = []
+            for symbol in b.symbols:
+                others = [s for s in b.symbols if s != symbol]
+                for values in itertools.product((0, 1), repeat=len(others)):
+                    inputs = dict(zip(others, values))
+                    if (b.evaluate(**dict(inputs, **{symbol: 0})) !=
+                            b.evaluate(**dict(inputs, **{symbol: 1}))):
+                        expected.append(symbol)
+                        break
+
+            self.helper_test_support(expr, expected)
+
+    def test_many_symbols(self):
+        """Test the SAT method on an expression of many symbols."""
+        terms = ['x{}'.format(i) for i in range(100)]
+        b = be(' and '.join(terms) + ' or (y and (z or not z) and not y)')
+        self.assertEqual(terms, b.support())
+
+    def test_invalid_method(self):
+        """Test passing an unsupported method."""
+        with self.assertRaises(InvalidArgumentValueError):
+            be('A or B').support(method='bdd')
+
+    def test_restrict(self):
+        """Test replacing symbols with constants."""
+        b = be('(A or B) and not C')
+
+        self.assertEqual('(1 or B) and not C', str(b.restrict(A=1)))
+        self.assertEqual(['B'], b.restrict(A=0, C=False).symbols)
+        self.assertEqual('(A or B) and not C', str(b))
+
+    def test_restrict_exceptions(self):
+        """Test invalid restrictions."""
+        b = be('A or B')
+
+        with self.assertRaises(ExtraSymbolError):
+            b.restrict(C=1)
+
+        with self.assertRaises(InvalidBooleanValueError):
+            b.restrict(A=2)
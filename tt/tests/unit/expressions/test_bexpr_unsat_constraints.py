@@ -0,0 +1,96 @@
+"""Tests for expression unsat_constraints functionality."""
+
+import itertools
+
+from tt.errors import NoEvaluationVariationError
+from tt.expressions import BooleanExpression as be
+
+from ._helpers import ExpressionTestCase
+
+
+class TestExpressionUnsatConstraints(ExpressionTestCase):
+
+    def assert_unsat_under(self, b, constraints):
+        """Assert that b has no solution under the specified constraints."""
+        if constraints:
+            with b.constrain(**constraints):
+                self.assertIsNone(b.sat_one())
+        else:
+            self.assertIsNone(b.sat_one())
+
+    def test_satisfiable(self):
+        """Test that satisfiable expressions have no unsat constraints."""
+        b = be('(A or B) and (B -> C)')
+        self.assertIsNone(b.unsat_constraints())
+        with b.constrain(A=0, C=1):
+            self.assertIsNone(b.unsat_constraints())
+            self.assertIsNone(b.unsat_constraints(minimal=True))
+
+    def test_single_culprit(self):
+        """Test finding a single responsible constraint."""
+        b = be('(A or B) and (B -> C) and (C -> D)')
+        with b.constrain(A=1, B=1, D=0):
+            self.assertEqual({'B': 1, 'D': 0}, b.unsat_constraints())
+            self.assertEqual({'B': 1, 'D': 0},
+                             b.unsat_constraints(minimal=True))
+
+    def test_all_constraints_unsat(self):
+        """Test that the constraints found are responsible, exhaustively."""
+        b = be('(A or B or C) and (A -> D) and (B -> D) and (C -> D)')
+        for values in itertools.product((None, 0, 1), repeat=4):
+            constraints = {symbol: value for symbol, value in
+                           zip(b.symbols, values) if value is not None}
+            if not constraints:
+                continue
+
+            with b.constrain(**constraints):
+                satisfiable = b.sat_one() is not None
+                found = b.unsat_constraints()
+                minimal = b.unsat_constraints(minimal=True)
+
+            if satisfiable:
+                self.assertIsNone(found)
+                self.assertIsNone(minimal)
+                continue
+
+            self.assertLessEqual(minimal.items(), found.items())
+            self.assertLessEqual(found.items(), constraints.items())
+            self.assert_unsat_under(b, found)
+            self.assert_unsat_under(b, minimal)
+
+            # dropping any of the minimal constraints allows a solution
+            for symbol in minimal:
+                rest = {other: value for other, value in minimal.items()
+                        if other != symbol}
+                if rest:
+                    with b.constrain(**rest):
+                        self.assertIsNotNone(b.sat_one())
+                else:
+                    self.assertIsNotNone(b.sat_one())
+
+    def test_order_follows_symbols(self):
+        """Test that responsible constraints follow the symbols' order."""
+        b = be('A or B or C')
+        with b.constrain(C=0, A=0, B=0):
+            self.assertEqual(['A', 'B', 'C'], list(b.unsat_constraints()))
+
+    def test_constants(self):
+        """Test that constants are never reported as constraints."""
+        b = be('(A or 0) and (B or 1) and C')
+        with b.constrain(A=0, B=0, C=1):
+            self.assertEqual({'A': 0}, b.unsat_constraints())
+
+        with be('A and 0 and B').constrain(B=1) as b:
+            self.assertEqual({}, b.unsat_constraints())
+            self.assertEqual({}, b.unsat_constraints(minimal=True))
+
+    def test_unsatisfiable_without_constraints(self):
+        """Test expressions with no solution under any constraints."""
+        self.assertEqual({}, be('A and not A').unsat_constraints())
+        with be('A and not A and B').constrain(B=1) as b:
+            self.assertEqual({}, b.unsat_constraints())
+
+    def test_only_constants(self):
+        """Test an expression of only constants."""
+        with self.assertRaises(NoEvaluationVariationError):
+            be('1 and 0').unsat_constraints()
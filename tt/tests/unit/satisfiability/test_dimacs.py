@@ -0,0 +1,242 @@
+"""Tests for reading and writing clauses in the DIMACS CNF format."""
+
+import io
+import os
+import tempfile
+import unittest
+
+from array import array
+
+from tt.errors import (
+    DimacsFormatError,
+    InvalidArgumentTypeError,
+    InvalidArgumentValueError,
+    NoEvaluationVariationError)
+from tt.expressions import BooleanExpression
+from tt.satisfiability import dimacs
+from tt.satisfiability.picosat import sat_all
+
+
+class TestDimacs(unittest.TestCase):
+
+    clauses = [[1, -3], [2, 3, -1], [-2], [4, 1]]
+
+    def _dumps(self, *args, **kwargs):
+        with io.StringIO() as fp:
+            dimacs.dump(*args, fp=fp, **kwargs)
+            return fp.getvalue()
+
+    def _loads(self, text):
+        return dimacs.load(io.StringIO(text))
+
+    def test_dump(self):
+        """Test writing clauses."""
+        self.assertEqual(
+            'c first\n'
+            'c\n'
+            'p cnf 5 4\n'
+            '1 -3 0\n'
+            '2 3 -1 0\n'
+            '-2 0\n'
+            '4 1 0\n',
+            self._dumps(self.clauses, num_vars=5, comments=['first', '']))
+
+    def test_dump_no_clauses(self):
+        """Test writing an empty set of clauses."""
+        self.assertEqual('p cnf 0 0\n', self._dumps([]))
+
+    def test_dump_many_clauses(self):
+        """Test writing more clauses than are written in a single chunk."""
+        clauses = [[i, -(i + 1)] for i in range(1, 3000)]
+        cnf = self._loads(self._dumps(clauses))
+        self.assertEqual(clauses, list(cnf.iter_clauses()))
+
+    def test_dump_invalid(self):
+        """Test writing invalid clauses and arguments."""
+        with self.assertRaises(InvalidArgumentValueError):
+            self._dumps([[1], []])
+        with self.assertRaises(InvalidArgumentValueError):
+            self._dumps([[1, 0]])
+        with self.assertRaises(InvalidArgumentTypeError):
+            self._dumps([['1']])
+        with self.assertRaises(InvalidArgumentValueError):
+            self._dumps([[1, 5]], num_vars=4)
+        with self.assertRaises(InvalidArgumentTypeError):
+            self._dumps([[1]], num_vars='1')
+        with self.assertRaises(InvalidArgumentValueError):
+            self._dumps([[1]], comments=['two\nlines'])
+        with self.assertRaises(InvalidArgumentValueError):
+            self._dumps(array('i', [1, 2]))
+        with self.assertRaises(InvalidArgumentValueError):
+            self._dumps(array('i', [1, 0, 0]))
+
+    def test_round_trip_text(self):
+        """Test reading back written clauses from a text stream."""
+        text = self._dumps(self.clauses, comments=['a comment'])
+        cnf = self._loads(text)
+        self.assertEqual(4, cnf.num_vars)
+        self.assertEqual(4, cnf.num_clauses)
+        self.assertEqual(['a comment'], cnf.comments)
+        self.assertEqual(self.clauses, list(cnf.iter_clauses()))
+        self.assertEqual(text, self._dumps(cnf))
+
+    def test_round_trip_file(self):
+        """Test reading back written clauses from files on disk."""
+        fd, path = tempfile.mkstemp(suffix='.cnf')
+        try:
+            with os.fdopen(fd, 'w') as fp:
+                dimacs.dump(self.clauses, fp, num_vars=6)
+
+            for mode in ('rb', 'r'):
+                with open(path, mode) as fp:
+                    cnf = dimacs.load(fp)
+                self.assertEqual(6, cnf.num_vars)
+                self.assertEqual(self.clauses, list(cnf.iter_clauses()))
+        finally:
+            os.remove(path)
+
+    def test_load_empty_file(self):
+        """Test reading an empty file on disk."""
+        with tempfile.TemporaryFile() as fp:
+            with self.assertRaises(DimacsFormatError):
+                dimacs.load(fp)
+
+    def test_load_binary_stream(self):
+        """Test reading from a binary stream not backed by a file."""
+        cnf = dimacs.load(io.BytesIO(b'p cnf 2 1\n1 -2 0\n'))
+        self.assertEqual([[1, -2]], list(cnf.iter_clauses()))
+
+    def test_load_free_form(self):
+        """Test reading clauses spanning lines and sharing lines."""
+        cnf = self._loads(
+            'c leading comment\n'
+            '\n'
+            '  p  cnf  3  3 \n'
+            '1 -2\n'
+            '  3 0 -1 0 2\n'
+            'c interleaved comment\n'
+            '0\n'
+            '%\n'
+            '0\n'
+            'trailing text\n')
+        self.assertEqual(3, cnf.num_vars)
+        self.assertEqual([[1, -2, 3], [-1], [2]], list(cnf.iter_clauses()))
+        self.assertEqual(['leading comment', 'interleaved comment'],
+                         cnf.comments)
+
+    def test_load_feeds_solver(self):
+        """Test passing loaded clauses straight to the solver."""
+        cnf = self._loads('p cnf 3 2\n1 2 0\n-1 0\n')
+        self.assertEqual([[-1, 2]], list(sat_all(cnf.clauses)))
+
+    def test_load_invalid(self):
+        """Test reading files that are not valid DIMACS CNF."""
+        for text in ('',
+                     'c only a comment\n',
+                     '1 2 0\np cnf 2 1\n',
+                     'p cnf 2 1\np cnf 2 1\n1 2 0\n',
+                     'p cnf 2\n1 2 0\n',
+                     'p dnf 2 1\n1 2 0\n',
+                     'p cnf -2 1\n1 2 0\n',
+                     'p cnf 2 1\n1 a 0\n',
+                     'p cnf 2 1\n1 2.0 0\n',
+                     'p cnf 2 1\n1 2\n',
+                     'p cnf 2 2\n1 2 0\n0\n',
+                     'p cnf 2 2\n1 2 0\n',
+                     'p cnf 2 1\n1 2 0\n-1 0\n',
+                     'p cnf 2 1\n1 3 0\n',
+                     'p cnf 9999999999 1\n1 99999999999 0\n'):
+            with self.assertRaises(DimacsFormatError, msg=repr(text)):
+                self._loads(text)
+
+        with self.assertRaises(DimacsFormatError):
+            dimacs.load(io.BytesIO(b'p cnf 1 1\n\xff 0\n'))
+
+    def test_symbol_names(self):
+        """Test parsing symbol names from comments."""
+        cnf = self._loads(
+            'c symbol 1 A\n'
+            'c symbol 2 not_a_keyword\n'
+            'c symbol 3 xor\n'
+            'c symbol 4 for\n'
+            'c symbol 5 A\n'
+            'c symbol 1 B\n'
+            'c symbol 6 C\n'
+            'c symbol 9 D\n'
+            'c symbol -2 E\n'
+            'c symbol 6 C extra\n'
+            'p cnf 6 1\n1 2 3 4 5 6 0\n')
+        self.assertEqual({1: 'A', 2: 'not_a_keyword', 6: 'C'},
+                         cnf.symbol_names)
+
+    def test_to_expression(self):
+        """Test converting clauses into an equivalent expression."""
+        cnf = dimacs.DimacsCnf(self.clauses, comments=['symbol 4 x1'])
+        b = cnf.to_expression()
+        self.assertEqual(['x1_', 'x3', 'x2', 'x1'], b.symbols)
+        self.assertTrue(b.is_cnf)
+
+        index_of = {'x1_': 1, 'x2': 2, 'x3': 3, 'x1': 4}
+        solutions = sorted(
+            sorted((index_of[symbol] * (1 if val else -1)
+                    for symbol, val in solution._asdict().items()), key=abs)
+            for solution in b.sat_all())
+        self.assertEqual(sorted(sat_all(self.clauses)), solutions)
+
+    def test_to_expression_is_balanced(self):
+        """Test that the expression's tree grows logarithmically in depth."""
+        clauses = [list(range(1, 65))] * 64
+        b = dimacs.DimacsCnf(clauses).to_expression()
+
+        def depth(node):
+            if node is None:
+                return 0
+            return 1 + max(depth(node.l_child), depth(node.r_child))
+
+        self.assertEqual(13, depth(b.tree))
+
+    def test_to_expression_no_clauses(self):
+        """Test converting an empty set of clauses into an expression."""
+        with self.assertRaises(InvalidArgumentValueError):
+            dimacs.DimacsCnf([]).to_expression()
+
+    def test_expression_to_dimacs(self):
+        """Test writing expressions, reading them back as expressions."""
+        for expr in ('A or B',
+                     '(A xor B) and (C -> not D)',
+                     'A and (B or 0) and (C or 1)',
+                     'not (A nand B) or (C iff D) or E'):
+            b = BooleanExpression(expr)
+            with io.StringIO() as fp:
+                b.to_dimacs(fp)
+                fp.seek(0)
+                cnf = dimacs.load(fp)
+
+            self.assertEqual(len(b.symbols), cnf.num_vars)
+            self.assertEqual(dict(enumerate(b.symbols, start=1)),
+                             cnf.symbol_names)
+
+            # symbols simplified away by constants are free
+            loaded = cnf.to_expression()
+            num_free = len(b.symbols) - len(loaded.symbols)
+            self.assertEqual(b.count_sat(), loaded.count_sat() << num_free)
+            for solution in b.sat_all():
+                values = solution._asdict()
+                self.assertTrue(loaded.evaluate(**{
+                    symbol: values[symbol] for symbol in loaded.symbols}))
+
+    def test_expression_to_dimacs_constants(self):
+        """Test writing expressions simplified to constants by constants."""
+        with io.StringIO() as fp:
+            BooleanExpression('A or 1').to_dimacs(fp)
+            self.assertEqual('c symbol 1 A\np cnf 1 0\n', fp.getvalue())
+
+        with io.StringIO() as fp:
+            BooleanExpression('(A or B) and 0').to_dimacs(fp)
+            fp.seek(0)
+            cnf = dimacs.load(fp)
+        self.assertEqual(2, cnf.num_vars)
+        self.assertEqual([], list(sat_all(cnf.clauses)))
+
+        with self.assertRaises(NoEvaluationVariationError):
+            BooleanExpression('1 and 0').to_dimacs(io.StringIO())
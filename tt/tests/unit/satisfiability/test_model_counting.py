@@ -0,0 +1,94 @@
+"""Tests for exact model counting of CNF clauses."""
+
+import itertools
+import random
+import unittest
+
+from tt.errors import (
+    InvalidArgumentTypeError,
+    InvalidArgumentValueError)
+from tt.satisfiability._model_counting import count_models
+from tt.satisfiability.picosat import (
+    count,
+    sat_all)
+
+
+def _brute_force_count(clauses, num_vars):
+    """Count models by checking every assignment."""
+    return sum(
+        all(any((lit > 0) == values[abs(lit) - 1] for lit in clause)
+            for clause in clauses)
+        for values in itertools.product((False, True), repeat=num_vars))
+
+
+class TestModelCounting(unittest.TestCase):
+
+    def test_random_clauses_match_brute_force(self):
+        """Test counts of random clauses against brute force counts."""
+        rng = random.Random(0)
+        for _ in range(300):
+            num_vars = rng.randint(1, 8)
+            clauses = [[rng.choice((1, -1)) * rng.randint(1, num_vars)
+                        for _ in range(rng.randint(1, 3))]
+                       for _ in range(rng.randint(0, 12))]
+            self.assertEqual(_brute_force_count(clauses, num_vars),
+                             count_models(clauses, num_vars),
+                             msg=str(clauses))
+
+    def test_free_and_tautological_variables(self):
+        """Test variables not constrained by any clause."""
+        self.assertEqual(8, count_models([], 3))
+        self.assertEqual(16, count_models([[1, -1], [2, 3, -2]], 4))
+        self.assertEqual(4, count_models([[2]], 3))
+
+    def test_unsatisfiable(self):
+        """Test clauses with no models."""
+        self.assertEqual(0, count_models([[1], [-1, 2], [-2]], 2))
+        self.assertEqual(0, count_models([[1, 2], [-1, 2], [1, -2],
+                                          [-1, -2]], 5))
+
+    def test_independent_components(self):
+        """Test clauses made of many independent parts."""
+        clauses = [[i, i + 1] for i in range(1, 200, 2)]
+        self.assertEqual(3**100, count_models(clauses, 200))
+
+    def test_long_implication_chain(self):
+        """Test clauses too deep to search recursively."""
+        # each variable implies the next, so a model is all false up to some
+        # variable and all true from there
+        clauses = [[-i, i + 1] for i in range(1, 700)]
+        self.assertEqual(701, count_models(clauses, 700))
+        self.assertEqual(701, count(clauses))
+
+    def test_picosat_count_matches_sat_all(self):
+        """Test that picosat.count counts the solutions sat_all yields."""
+        for clauses, assumptions in (([[1], [2, 3, 4], [2, 3]], None),
+                                     ([[1], [2, 3, 4], [2, 3]], [-3]),
+                                     ([[1, -5], [3]], [-1]),
+                                     ([[1, 2], [-1, -2]], [1, 2])):
+            self.assertEqual(
+                sum(1 for _ in sat_all(clauses, assumptions=assumptions)),
+                count(clauses, assumptions=assumptions))
+
+    def test_picosat_count_invalid_arguments(self):
+        """Test that invalid clauses or assumptions cause exceptions."""
+        with self.assertRaises(InvalidArgumentTypeError):
+            count(([1, 2],))
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            count([[1, 'string']])
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            count([[1, 2]], assumptions=[1.0])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            count([])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            count([[1], []])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            count([[1, 0]])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            count([[1, 2]], assumptions=[])
@@ -6,7 +6,10 @@ from tt.errors import (
     InvalidArgumentTypeError,
     InvalidArgumentValueError)
 from tt.satisfiability.picosat import (
+    count,
+    failed_assumptions,
     sat_all,
+    sat_batch,
     sat_one,
     VERSION)
 
@@ -182,3 +185,251 @@ class TestPicosat(unittest.TestCase):
 
         with self.assertRaises(InvalidArgumentValueError):
             sat_all([[1, -2], [-1]], assumptions=[1, 2, 3, 0])
+
+    def test_sat_all_projected_solutions_found_once(self):
+        """Test that projected solutions only differ in projected vars."""
+        # 3 is a free variable, doubling the number of full solutions
+        clauses = [[1, 2], [-1, -2], [3, -3], [2, 4]]
+        self.assertEqual(6, len(list(sat_all(clauses))))
+
+        res = list(sat_all(clauses, project=[2, 1]))
+        self.assertEqual(2, len(res))
+        self.assertIn([2, -1], res)
+        self.assertIn([-2, 1], res)
+
+    def test_sat_all_projected_with_assumptions(self):
+        """Test combining projection with assumptions."""
+        res = list(sat_all([[1, 2, 3]], assumptions=[-1], project=[1, 3]))
+        self.assertEqual(2, len(res))
+        self.assertIn([-1, 3], res)
+        self.assertIn([-1, -3], res)
+
+    def test_sat_all_invalid_project(self):
+        """Test an error is raised for invalid projection variables."""
+        with self.assertRaises(InvalidArgumentTypeError):
+            sat_all([[1, 2]], project=(1,))
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            sat_all([[1, 2]], project=[1, 'string'])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            sat_all([[1, 2]], project=[])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            sat_all([[1, 2]], project=[-1])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            sat_all([[1, 2]], project=[3])
+
+    def test_sat_all_packed_formats_match_lits(self):
+        """Test that packed solutions hold the same values as literals."""
+        clauses = [[1, 2], [-1, -2], [3, -3], [2, 4]]
+        for project in (None, [4, 2, 1], [3]):
+            lits = list(sat_all(clauses, project=project))
+            masks = [sum(1 << (len(sol) - 1 - i)
+                         for i, lit in enumerate(sol) if lit > 0)
+                     for sol in lits]
+            self.assertEqual(
+                masks, list(sat_all(clauses, project=project, format='int')))
+            self.assertEqual(
+                [mask.to_bytes(1, 'big') for mask in masks],
+                list(sat_all(clauses, project=project, format='bytes')))
+
+    def test_sat_all_packed_formats_many_variables(self):
+        """Test packing solutions of variables spanning several bytes."""
+        clauses = [[i, -(i + 1)] for i in range(1, 70)] + [[35], [-36]]
+        ints = list(sat_all(clauses, format='int'))
+        self.assertEqual([2**70 - 2**35], ints)
+        self.assertEqual(
+            [mask.to_bytes(9, 'big') for mask in ints],
+            list(sat_all(clauses, format='bytes')))
+
+    def test_sat_all_bytes_chunks(self):
+        """Test packing several solutions into each chunk."""
+        clauses = [[1, 2, 3, 4], [-1, -2]]
+        expected = b''.join(sat_all(clauses, format='bytes'))
+        self.assertEqual(11, len(expected))
+        for chunk_size in (1, 5, 11, 12):
+            chunks = list(sat_all(clauses, format='bytes',
+                                  chunk_size=chunk_size))
+            self.assertEqual(-(-11 // chunk_size), len(chunks))
+            self.assertEqual(expected, b''.join(chunks))
+
+        self.assertEqual(
+            [], list(sat_all([[1], [-1]], format='bytes', chunk_size=4)))
+
+    def test_sat_all_bytes_huge_chunks(self):
+        """Test chunk sizes far larger than the number of solutions."""
+        for chunk_size in (10**9, 2**40, 2**63 - 1):
+            chunks = list(sat_all([[1, 2]], format='bytes',
+                                  chunk_size=chunk_size))
+            self.assertEqual(1, len(chunks))
+            self.assertEqual([1, 2, 3], sorted(chunks[0]))
+
+        # the chunk grows past its initial size to hold every solution
+        clauses = [list(range(1, 13))]
+        expected = b''.join(sat_all(clauses, format='bytes'))
+        self.assertEqual(2 * (2**12 - 1), len(expected))
+        self.assertEqual(
+            [expected],
+            list(sat_all(clauses, format='bytes', chunk_size=2**40)))
+
+    def test_sat_all_bytes_chunks_keep_assumptions(self):
+        """Test that later chunks still obey the assumptions."""
+        it = sat_all([[1, 2, 3]], assumptions=[-1], format='bytes',
+                     chunk_size=2)
+        self.assertEqual([b'\x03\x02', b'\x01'], list(it))
+        self.assertEqual([], list(it))
+
+        it = sat_all([[1, 2, 3]], assumptions=[-1, -2])
+        self.assertEqual([[-1, -2, 3]], list(it))
+        self.assertEqual([], list(it))
+
+    def test_sat_all_invalid_format(self):
+        """Test an error is raised for invalid formats and chunk sizes."""
+        with self.assertRaises(InvalidArgumentTypeError):
+            sat_all([[1, 2]], format=None)
+
+        with self.assertRaises(InvalidArgumentValueError):
+            sat_all([[1, 2]], format='bits')
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            sat_all([[1, 2]], format='bytes', chunk_size='2')
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            sat_all([[1, 2]], format='bytes', chunk_size=True)
+
+        with self.assertRaises(InvalidArgumentValueError):
+            sat_all([[1, 2]], format='bytes', chunk_size=0)
+
+        with self.assertRaises(InvalidArgumentValueError):
+            sat_all([[1, 2]], format='bytes', chunk_size=2**63)
+
+        with self.assertRaises(InvalidArgumentValueError):
+            sat_all([[1, 2]], format='int', chunk_size=2)
+
+        with self.assertRaises(InvalidArgumentValueError):
+            sat_all([[1, 2]], chunk_size=2)
+
+    def test_sat_batch_matches_sat_one(self):
+        """Test that batched solves agree with individual solves."""
+        clauses = [[1, 2, 3], [-1, -2], [-2, -3], [1, -3]]
+        assumption_lists = [[1], [2], [-1], [-1, -2], [3], [-1, 3], [2, -1]]
+        results = sat_batch(clauses, assumption_lists)
+
+        self.assertEqual(len(assumption_lists), len(results))
+        for assumptions, result in zip(assumption_lists, results):
+            expected = sat_one(clauses, assumptions=assumptions)
+            if expected is None:
+                self.assertIsNone(result)
+            else:
+                self.assertIsNotNone(result)
+                self.assertTrue(set(assumptions) <= set(result))
+                self.assertTrue(all(set(clause) & set(result)
+                                    for clause in clauses))
+
+    def test_sat_batch_empty_and_new_variable_assumptions(self):
+        """Test assumption lists without assumptions or with new variables."""
+        self.assertEqual([], sat_batch([[1]], []))
+        self.assertEqual([[1], [1]], sat_batch([[1]], [[], None]))
+        self.assertEqual([[1, -2, 3], None],
+                         sat_batch([[1]], [[3, -2], [-1, 3]]))
+
+    def test_out_of_range_literals(self):
+        """Test that literals which do not fit in an int raise errors."""
+        for literal in (2**32 + 1, 2**31, -2**31, 2**100):
+            with self.assertRaises(InvalidArgumentValueError):
+                sat_one([[1], [literal]])
+            with self.assertRaises(InvalidArgumentValueError):
+                sat_one([[1]], assumptions=[literal])
+            with self.assertRaises(InvalidArgumentValueError):
+                sat_all([[1, literal]])
+            with self.assertRaises(InvalidArgumentValueError):
+                count([[1, literal]])
+
+    def test_sat_batch_invalid_arguments(self):
+        """Test that invalid arguments to sat_batch raise errors."""
+        with self.assertRaises(InvalidArgumentTypeError):
+            sat_batch([[1]], [1])
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            sat_batch([[1]], ([1],))
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            sat_batch([[1]], [[1], [2, 'string']])
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            sat_batch([[1, 'string']], [[1]])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            sat_batch([[1]], [[1], [0]])
+
+        # literals must not be truncated to fit in an int
+        for literal in (2**32 + 1, 2**31, -2**31, 2**100):
+            with self.assertRaises(InvalidArgumentValueError):
+                sat_batch([[1]], [[1], [literal]])
+            with self.assertRaises(InvalidArgumentValueError):
+                sat_batch([[1], [literal]], [[1]])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            sat_batch([], [[1]])
+
+    def test_failed_assumptions(self):
+        """Test finding the assumptions that make clauses unsatisfiable."""
+        clauses = [[1, 2], [-1, 3], [2, -3]]
+        self.assertIsNone(failed_assumptions(clauses, [1, 4]))
+
+        failed = failed_assumptions(clauses, [4, -2, 5])
+        self.assertEqual([-2], failed)
+
+        failed = failed_assumptions(clauses, [-1, -2, 4, -3])
+        self.assertTrue(set(failed) <= {-1, -2, -3})
+        self.assertIsNone(sat_one(clauses, assumptions=failed))
+
+        # the clauses alone are unsatisfiable
+        self.assertEqual([], failed_assumptions([[1], [-1]], [2]))
+
+    def test_failed_assumptions_minimal(self):
+        """Test minimizing the failed assumptions."""
+        clauses = [[1, 2, 3], [-1, 4], [-2, 4], [-3, 4]]
+        assumptions = [-1, -3, -4]
+        self.assertEqual({-1, -3, -4},
+                         set(failed_assumptions(clauses, assumptions)))
+
+        failed = failed_assumptions(clauses, assumptions, minimal=True)
+        self.assertEqual([-4], failed)
+
+        # dropping any of a minimal set makes the clauses satisfiable
+        failed = failed_assumptions([[1, 2, 3]], [-1, -2, 4, -3],
+                                    minimal=True)
+        self.assertEqual({-1, -2, -3}, set(failed))
+        for literal in failed:
+            rest = [other for other in failed if other != literal]
+            self.assertIsNotNone(sat_one([[1, 2, 3]], assumptions=rest))
+
+    def test_failed_assumptions_invalid_arguments(self):
+        """Test that invalid arguments to failed_assumptions raise errors."""
+        with self.assertRaises(InvalidArgumentTypeError):
+            failed_assumptions([[1]], None)
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            failed_assumptions([[1]], [1, 'string'])
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            failed_assumptions([[1, 'string']], [1])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            failed_assumptions([[1]], [])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            failed_assumptions([[1]], [0])
+
+        # literals must not be truncated to fit in an int
+        for literal in (2**32 + 1, 2**31, -2**31, 2**100):
+            with self.assertRaises(InvalidArgumentValueError):
+                failed_assumptions([[literal]], [-1])
+            with self.assertRaises(InvalidArgumentValueError):
+                failed_assumptions([[1]], [-1, literal])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            failed_assumptions([], [1])
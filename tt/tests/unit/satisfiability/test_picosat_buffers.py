@@ -0,0 +1,91 @@
+"""Tests for passing packed clause buffers to the PicoSAT extension."""
+
+import struct
+import unittest
+
+from array import array
+
+from tt.errors import (
+    InvalidArgumentTypeError,
+    InvalidArgumentValueError)
+from tt.satisfiability.picosat import (
+    pack_clauses,
+    sat_all,
+    sat_batch,
+    sat_one,
+    Solver)
+
+
+class TestPicosatBuffers(unittest.TestCase):
+
+    clauses = [[1, 2, 3], [-1, -2], [-2, -3], [1, -3]]
+
+    def test_pack_clauses(self):
+        """Test packing clauses into a zero-terminated array."""
+        self.assertEqual(array('i', [1, 2, 3, 0, -1, -2, 0, -2, -3, 0,
+                                     1, -3, 0]),
+                         pack_clauses(self.clauses))
+        self.assertEqual(array('i'), pack_clauses([]))
+
+    def test_buffer_types_match_lists(self):
+        """Test that each buffer type gives the same results as lists."""
+        packed = pack_clauses(self.clauses)
+        for buf in (packed, packed.tobytes(), bytearray(packed.tobytes()),
+                    memoryview(packed), memoryview(packed.tobytes())):
+            self.assertEqual(sat_one(self.clauses), sat_one(buf))
+            self.assertEqual(sat_one(self.clauses, assumptions=[-1]),
+                             sat_one(buf, assumptions=[-1]))
+            self.assertEqual(list(sat_all(self.clauses)),
+                             list(sat_all(buf)))
+            self.assertEqual(sat_batch(self.clauses, [[2], [3], [-1, 3]]),
+                             sat_batch(buf, [[2], [3], [-1, 3]]))
+
+    def test_unaligned_buffer(self):
+        """Test reading a buffer not aligned to its literals."""
+        data = struct.pack('=B5i', 0, 1, 0, -1, 2, 0)
+        self.assertEqual([1, 2], sat_one(memoryview(data)[1:]))
+
+    def test_solver_add_clauses(self):
+        """Test adding a buffer to a solver, within pushed contexts."""
+        s = Solver()
+        s.add_clauses(pack_clauses([[1, 2]]))
+        s.push()
+        s.add_clauses(pack_clauses([[-1], [-2]]))
+        self.assertFalse(s.solve())
+        s.pop()
+        s.add_clauses(b'')
+        self.assertTrue(s.solve())
+
+    def test_invalid_buffers(self):
+        """Test that invalid buffers raise errors."""
+        with self.assertRaises(InvalidArgumentTypeError):
+            sat_one(array('h', [1, 0]))
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            sat_one(array('d', [1.0, 0.0]))
+
+        for buf in (array('i'), array('i', [1, 2]), array('i', [0, 1, 0]),
+                    array('i', [1, 0, 0]), array('i', [-2**31, 0]),
+                    b'\x01\x00\x00'):
+            with self.assertRaises(InvalidArgumentValueError):
+                sat_one(buf)
+
+        s = Solver()
+        with self.assertRaises(InvalidArgumentValueError):
+            s.add_clauses(array('i', [1, 0, 2]))
+        self.assertTrue(s.solve())
+        self.assertEqual([], s.model())
+
+    def test_pack_clauses_invalid_clauses(self):
+        """Test that invalid clauses cannot be packed."""
+        with self.assertRaises(InvalidArgumentTypeError):
+            pack_clauses([[1, 'string']])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            pack_clauses([[1], []])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            pack_clauses([[1, 0, 2]])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            pack_clauses([[2**40]])
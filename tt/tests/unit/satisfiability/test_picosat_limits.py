@@ -0,0 +1,185 @@
+"""Tests for limiting the decisions, propagations, and time of PicoSAT."""
+
+import threading
+import time
+import unittest
+
+from tt.errors import (
+    InvalidArgumentTypeError,
+    InvalidArgumentValueError,
+    SolverInUseError,
+    SolverLimitError)
+from tt.satisfiability.picosat import (
+    sat_all,
+    sat_one,
+    Solver)
+
+
+def _pigeonhole_clauses(num_holes):
+    """Get the clauses of placing one more pigeon than holes into the holes,
+    which are unsatisfiable but hard for PicoSAT to refute.
+    """
+    def var(pigeon, hole):
+        return pigeon * num_holes + hole + 1
+
+    clauses = [[var(p, h) for h in range(num_holes)]
+               for p in range(num_holes + 1)]
+    for h in range(num_holes):
+        for p in range(num_holes + 1):
+            for q in range(p + 1, num_holes + 1):
+                clauses.append([-var(p, h), -var(q, h)])
+    return clauses
+
+
+class TestPicosatLimits(unittest.TestCase):
+
+    # requires decisions, as unit propagation alone cannot satisfy it
+    clauses = [[1, 2], [-1, 3], [2, -3]]
+
+    # has three solutions, only the first of which PicoSAT finds with a
+    # single decision
+    limited_clauses = [[2, 3], [-1, -2], [-1]]
+
+    def test_sat_one_decision_limit(self):
+        """Test reaching and not reaching a decision limit."""
+        with self.assertRaises(SolverLimitError):
+            sat_one(self.clauses, decision_limit=0)
+
+        self.assertEqual(sat_one(self.clauses),
+                         sat_one(self.clauses, decision_limit=100))
+
+        # problems decided without any decisions are unaffected
+        self.assertEqual([1, -2], sat_one([[1], [-2]], decision_limit=0))
+        self.assertIsNone(sat_one([[1], [-1]], decision_limit=0))
+
+    def test_sat_one_propagation_limit(self):
+        """Test reaching and not reaching a propagation limit."""
+        with self.assertRaises(SolverLimitError):
+            sat_one(_pigeonhole_clauses(6), propagation_limit=100)
+
+        self.assertIsNone(sat_one(_pigeonhole_clauses(3),
+                                  propagation_limit=10**9))
+
+    def test_sat_one_timeout(self):
+        """Test that a timeout stops the solver close to its deadline."""
+        start = time.perf_counter()
+        with self.assertRaises(SolverLimitError):
+            sat_one(_pigeonhole_clauses(10), timeout=0.05)
+        self.assertLess(time.perf_counter() - start, 5)
+
+        self.assertEqual(sat_one(self.clauses),
+                         sat_one(self.clauses, timeout=60))
+
+    def test_huge_limits_are_unlimited(self):
+        """Test limits beyond what PicoSAT could reach."""
+        self.assertIsNone(sat_one(_pigeonhole_clauses(4),
+                                  decision_limit=2**100,
+                                  propagation_limit=2**100,
+                                  timeout=1e300))
+
+    def test_sat_all_limits_apply_per_solution(self):
+        """Test that limits apply afresh to finding each solution."""
+        # each solution needs a decision, but only a few
+        clauses = [[1, 2, 3, 4]]
+        self.assertEqual(15, len(list(sat_all(clauses, decision_limit=4))))
+
+        it = sat_all(clauses, decision_limit=0)
+        with self.assertRaises(SolverLimitError):
+            next(it)
+        self.assertEqual([], list(it))
+
+    def test_sat_all_limit_after_some_solutions(self):
+        """Test reaching a limit after some solutions have been found."""
+        # the first solution needs one decision, but the next needs more
+        it = sat_all(self.limited_clauses, decision_limit=1)
+        self.assertEqual([-1, -2, 3], next(it))
+        with self.assertRaises(SolverLimitError):
+            next(it)
+        self.assertEqual([], list(it))
+
+    def test_sat_all_chunk_returned_before_limit(self):
+        """Test that a partial chunk is returned before the limit error."""
+        it = sat_all(self.limited_clauses, format='bytes', chunk_size=4,
+                     decision_limit=1)
+        self.assertEqual(b'\x01', next(it))
+        with self.assertRaises(SolverLimitError):
+            next(it)
+        self.assertEqual([], list(it))
+
+        it = sat_all(self.clauses, format='bytes', chunk_size=4,
+                     decision_limit=0)
+        with self.assertRaises(SolverLimitError):
+            next(it)
+        self.assertEqual([], list(it))
+
+    def test_sat_all_from_another_thread_while_solving(self):
+        """Test that an iterator cannot be advanced by two threads at once."""
+        for kwargs in ({}, {'format': 'bytes', 'chunk_size': 4}):
+            it = sat_all(_pigeonhole_clauses(10), timeout=1, **kwargs)
+            started = threading.Event()
+            errors = []
+
+            def solve():
+                started.set()
+                try:
+                    next(it)
+                except SolverLimitError as e:
+                    errors.append(e)
+
+            thread = threading.Thread(target=solve)
+            thread.start()
+            try:
+                started.wait()
+                time.sleep(0.1)
+                with self.assertRaises(SolverInUseError):
+                    next(it)
+            finally:
+                thread.join()
+
+            # the limit error came from the other thread, ending iteration
+            self.assertEqual(1, len(errors))
+            self.assertEqual([], list(it))
+
+    def test_solver_limits(self):
+        """Test that limits apply to single calls of a persistent solver."""
+        with Solver() as solver:
+            solver.add_clauses(self.clauses)
+            with self.assertRaises(SolverLimitError):
+                solver.solve(decision_limit=0)
+            self.assertTrue(solver.solve())
+            self.assertTrue(solver.solve(decision_limit=100))
+
+        with Solver() as solver:
+            solver.add_clauses(_pigeonhole_clauses(6))
+            with self.assertRaises(SolverLimitError):
+                solver.solve(propagation_limit=100)
+
+        with Solver() as solver:
+            solver.add_clauses(_pigeonhole_clauses(9))
+            with self.assertRaises(SolverLimitError):
+                solver.solve(timeout=0)
+
+    def test_invalid_limits(self):
+        """Test an error is raised for invalid limits."""
+        for func in (sat_one, sat_all, Solver().solve):
+            args = () if func.__name__ == 'solve' else (self.clauses,)
+            for kwargs in ({'decision_limit': '1'},
+                           {'decision_limit': 1.0},
+                           {'decision_limit': True},
+                           {'propagation_limit': '1'},
+                           {'propagation_limit': False},
+                           {'timeout': '1'},
+                           {'timeout': True},
+                           {'timeout': 1j}):
+                with self.assertRaises(InvalidArgumentTypeError,
+                                       msg=repr(kwargs)):
+                    func(*args, **kwargs)
+
+            for kwargs in ({'decision_limit': -1},
+                           {'propagation_limit': -1},
+                           {'propagation_limit': -2**100},
+                           {'timeout': -0.5},
+                           {'timeout': float('nan')}):
+                with self.assertRaises(InvalidArgumentValueError,
+                                       msg=repr(kwargs)):
+                    func(*args, **kwargs)
@@ -0,0 +1,294 @@
+"""Tests for persistent PicoSAT solver sessions."""
+
+import threading
+import time
+import unittest
+
+from array import array
+
+from tt.errors import (
+    AlreadyClosedSolverError,
+    InvalidArgumentTypeError,
+    InvalidArgumentValueError,
+    RequiresSolverContextError,
+    SolverInUseError,
+    SolverLimitError)
+from tt.expressions import BooleanExpression
+from tt.satisfiability.picosat import Solver
+
+
+def _pigeonhole_clauses(num_holes):
+    """Get the clauses of placing one more pigeon than holes into the holes,
+    which are unsatisfiable but hard for PicoSAT to refute.
+    """
+    def var(pigeon, hole):
+        return pigeon * num_holes + hole + 1
+
+    clauses = [[var(p, h) for h in range(num_holes)]
+               for p in range(num_holes + 1)]
+    for h in range(num_holes):
+        for p in range(num_holes + 1):
+            for q in range(p + 1, num_holes + 1):
+                clauses.append([-var(p, h), -var(q, h)])
+    return clauses
+
+
+class TestPicosatSolver(unittest.TestCase):
+
+    def test_solve_and_model(self):
+        """Test solving clauses added over several calls."""
+        with Solver() as s:
+            s.add_clause([1, 2])
+            self.assertTrue(s.solve())
+            s.add_clauses([[-1], [-2, 3]])
+            self.assertTrue(s.solve())
+            self.assertEqual([-1, 2, 3], s.model())
+            s.add_clause([-3])
+            self.assertFalse(s.solve())
+            self.assertIsNone(s.model())
+
+    def test_assumptions_only_last_one_solve(self):
+        """Test that assumptions hold only for a single solve."""
+        s = Solver()
+        s.add_clauses([[1, 2], [-1, -2]])
+        self.assertFalse(s.solve(assumptions=[1, 2]))
+        self.assertTrue(s.solve())
+
+        s.assume(-1)
+        self.assertTrue(s.solve(assumptions=[-2]) is False)
+        self.assertTrue(s.solve(assumptions=[-2]))
+        self.assertEqual([1, -2], s.model())
+        s.close()
+
+    def test_push_and_pop(self):
+        """Test retracting clauses added within pushed contexts."""
+        s = Solver()
+        s.add_clause([1, 2])
+        s.push()
+        s.add_clause([-1])
+        s.push()
+        s.add_clause([-2])
+        self.assertEqual(2, s.num_contexts)
+        self.assertFalse(s.solve())
+
+        s.pop()
+        self.assertTrue(s.solve())
+        self.assertEqual([-1, 2], s.model())
+
+        s.pop()
+        s.add_clause([-2])
+        self.assertTrue(s.solve())
+        self.assertEqual([1, -2], s.model())
+        self.assertEqual(0, s.num_contexts)
+
+        with self.assertRaises(RequiresSolverContextError):
+            s.pop()
+
+    def test_model_omits_activation_vars(self):
+        """Test that activation literals are not part of models."""
+        s = Solver()
+        s.add_clause([1])
+        s.push()
+        var = s.new_var()
+        s.add_clause([var])
+        self.assertTrue(s.solve())
+        self.assertEqual([1, var], s.model())
+
+    def test_model_after_solver_changes(self):
+        """Test that no model is reported once the solver has changed."""
+        mutations = [
+            lambda s: s.add_clause([2]),
+            lambda s: s.add_clauses([[2]]),
+            lambda s: s.add_clauses(array('i', [2, 0])),
+            lambda s: s.new_var(),
+            lambda s: s.push(),
+            lambda s: s.pop()]
+        for mutate in mutations:
+            with Solver() as s:
+                s.add_clause([1])
+                s.push()
+                self.assertTrue(s.solve())
+                self.assertEqual([1], s.model())
+                mutate(s)
+                self.assertIsNone(s.model())
+                self.assertTrue(s.solve())
+                self.assertIsNotNone(s.model())
+
+    def test_model_after_failed_change(self):
+        """Test that an invalid clause leaves the last model in place."""
+        with Solver() as s:
+            s.add_clause([1])
+            self.assertTrue(s.solve())
+            with self.assertRaises(InvalidArgumentValueError):
+                s.add_clauses([[2], [0]])
+            self.assertEqual([1], s.model())
+
+    def test_closed_solver(self):
+        """Test that using a closed solver raises an exception."""
+        with Solver() as s:
+            s.add_clause([1])
+        self.assertTrue(s.closed)
+        s.close()
+
+        with self.assertRaises(AlreadyClosedSolverError):
+            s.add_clause([1])
+
+        with self.assertRaises(AlreadyClosedSolverError):
+            s.solve()
+
+        with self.assertRaises(AlreadyClosedSolverError):
+            s.push()
+
+    def test_invalid_clauses_leave_solver_unchanged(self):
+        """Test that invalid clauses are rejected before any are added."""
+        s = Solver()
+        s.add_clause([1])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            s.add_clauses([[-1], [0]])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            s.add_clause([])
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            s.add_clauses([[-1], ['2']])
+
+        # literals must not be truncated to fit in an int
+        for literal in (2**32 + 1, 2**31, -2**31, 2**100):
+            with self.assertRaises(InvalidArgumentValueError):
+                s.add_clause([literal])
+            with self.assertRaises(InvalidArgumentValueError):
+                s.add_clauses([[-1], [literal]])
+            with self.assertRaises(InvalidArgumentValueError):
+                s.solve(assumptions=[literal])
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            s.solve(assumptions=[1.0])
+
+        self.assertTrue(s.solve())
+        self.assertEqual([1], s.model())
+
+    def test_use_from_another_thread_while_solving(self):
+        """Test that a solver cannot be used by other threads mid-solve."""
+        s = Solver()
+        s.add_clauses(_pigeonhole_clauses(10))
+        errors = []
+
+        def solve():
+            try:
+                s.solve(timeout=1)
+            except SolverLimitError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=solve)
+        thread.start()
+        try:
+            # wait for the solve to start, without touching the instance
+            deadline = time.monotonic() + 10
+            while True:
+                self.assertLess(time.monotonic(), deadline)
+                try:
+                    s.model()
+                except SolverInUseError:
+                    break
+                time.sleep(0.001)
+
+            with self.assertRaises(SolverInUseError):
+                s.close()
+            with self.assertRaises(SolverInUseError):
+                s.add_clause([1])
+            with self.assertRaises(SolverInUseError):
+                s.add_clauses([[1]])
+            with self.assertRaises(SolverInUseError):
+                s.solve()
+            with self.assertRaises(SolverInUseError):
+                s.new_var()
+            self.assertFalse(s.closed)
+        finally:
+            thread.join()
+
+        self.assertEqual(1, len(errors))
+        s.add_clause([1])
+        with self.assertRaises(SolverLimitError):
+            s.solve(decision_limit=0)
+        s.close()
+        self.assertTrue(s.closed)
+
+    def test_use_from_another_thread_while_adding_buffer(self):
+        """Test that a solver cannot be used by other threads mid-add."""
+        s = Solver()
+        clauses = array('i', [1, 2, 0]) * 3000000
+
+        thread = threading.Thread(target=s.add_clauses, args=(clauses,))
+        thread.start()
+        try:
+            # wait for the add to start, without touching the instance
+            deadline = time.monotonic() + 10
+            while True:
+                self.assertLess(time.monotonic(), deadline)
+                try:
+                    s.model()
+                except SolverInUseError:
+                    break
+                time.sleep(0.001)
+
+            with self.assertRaises(SolverInUseError):
+                s.close()
+            with self.assertRaises(SolverInUseError):
+                s.add_clauses(clauses)
+            with self.assertRaises(SolverInUseError):
+                s.solve()
+        finally:
+            thread.join()
+
+        self.assertFalse(s.closed)
+        self.assertTrue(s.solve())
+        s.close()
+
+    def test_shared_between_threads(self):
+        """Test that threads sharing a solver never use it at once."""
+        s = Solver()
+        s.add_clauses(_pigeonhole_clauses(5))
+        unexpected = []
+
+        def work(i):
+            for j in range(20):
+                try:
+                    if j % 2:
+                        s.add_clause([i * 100 + j + 1000, -(i + 1)])
+                    else:
+                        self.assertFalse(s.solve())
+                except SolverInUseError:
+                    pass
+                except Exception as e:
+                    unexpected.append(e)
+
+        threads = [threading.Thread(target=work, args=(i,))
+                   for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], unexpected)
+        self.assertFalse(s.solve())
+        s.close()
+
+    def test_expression_incremental_solves_between_threads(self):
+        """Test incremental solves of one expression from several threads."""
+        b = BooleanExpression('(A or B) and (not A or C) and (B or not C)')
+        results = []
+
+        def work():
+            for _ in range(50):
+                results.append(b.sat_one(incremental=True))
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(400, len(results))
+        for result in results:
+            self.assertTrue(b.evaluate(**result._asdict()))
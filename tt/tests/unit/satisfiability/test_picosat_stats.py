@@ -0,0 +1,198 @@
+"""Tests for reporting the statistics of PicoSAT solves to hooks."""
+
+import unittest
+
+from tt.errors import (
+    InvalidArgumentTypeError,
+    InvalidArgumentValueError,
+    SolverLimitError)
+from tt.expressions import BooleanExpression
+from tt.satisfiability.picosat import (
+    add_stats_hook,
+    failed_assumptions,
+    remove_stats_hook,
+    sat_all,
+    sat_batch,
+    sat_one,
+    Solver,
+    SolverStats)
+
+
+class _HookError(Exception):
+    pass
+
+
+class TestPicosatStats(unittest.TestCase):
+
+    # requires decisions, as unit propagation alone cannot satisfy it
+    clauses = [[1, 2], [-1, 3], [2, -3]]
+
+    def setUp(self):
+        self.reported = []
+        add_stats_hook(self.reported.append)
+
+    def tearDown(self):
+        remove_stats_hook(self.reported.append)
+
+    def assert_reported(self, num_reports=1):
+        """Assert how many solves have been reported, returning the last."""
+        self.assertEqual(num_reports, len(self.reported))
+        stats = self.reported[-1]
+        self.assertIsInstance(stats, SolverStats)
+        self.assertGreaterEqual(stats.seconds, 0)
+        self.assertGreater(stats.max_bytes_allocated, 0)
+        return stats
+
+    def test_sat_one(self):
+        """Test the statistics reported by sat_one."""
+        sat_one(self.clauses)
+        stats = self.assert_reported()
+        self.assertEqual(3, stats.variables)
+        self.assertEqual(3, stats.clauses)
+        self.assertGreater(stats.decisions, 0)
+        self.assertGreater(stats.propagations, 0)
+
+        self.assertIsNone(sat_one([[1], [-1]]))
+        stats = self.assert_reported(2)
+        self.assertEqual(0, stats.decisions)
+
+    def test_sat_one_limit_reached(self):
+        """Test that solves stopped by a limit are still reported."""
+        with self.assertRaises(SolverLimitError):
+            sat_one(self.clauses, decision_limit=0)
+        self.assertEqual(0, self.assert_reported().decisions)
+
+    def test_sat_all(self):
+        """Test that sat_all reports the whole enumeration once it stops."""
+        it = sat_all(self.clauses)
+        self.assertEqual(3, len(list(it)))
+        stats = self.assert_reported()
+        self.assertEqual(3, stats.variables)
+        self.assertGreater(stats.clauses, 3)
+
+        # iterating again does not report again
+        self.assertEqual([], list(it))
+        self.assert_reported()
+
+        # nor does an enumeration abandoned before it stops
+        next(sat_all(self.clauses))
+        self.assert_reported()
+
+    def test_sat_all_chunks(self):
+        """Test that chunked sat_all reports the whole enumeration."""
+        chunks = list(sat_all([[1, 2, 3, 4]], format='bytes', chunk_size=4))
+        self.assertEqual(4, len(chunks))
+        self.assertEqual(4, self.assert_reported().variables)
+
+    def test_sat_all_limit_reached(self):
+        """Test that sat_all reports an enumeration stopped by a limit."""
+        it = sat_all(self.clauses, decision_limit=0)
+        with self.assertRaises(SolverLimitError):
+            next(it)
+        self.assert_reported()
+
+    def test_sat_batch(self):
+        """Test that sat_batch reports the whole batch."""
+        sat_batch(self.clauses, [[1], [-1], [-2]])
+        self.assertEqual(3, self.assert_reported().variables)
+
+    def test_failed_assumptions(self):
+        """Test that failed_assumptions reports its solves."""
+        failed_assumptions(self.clauses, [-2], minimal=True)
+        self.assertEqual(3, self.assert_reported().variables)
+
+    def test_solver(self):
+        """Test that each solve of a solver is reported on its own."""
+        with Solver() as solver:
+            solver.add_clauses(self.clauses)
+            self.assertTrue(solver.solve())
+            first = self.assert_reported()
+            self.assertGreater(first.decisions, 0)
+
+            self.assertTrue(solver.solve(assumptions=[1]))
+            self.assertEqual(3, self.assert_reported(2).variables)
+
+            solver.add_clause([-2])
+            self.assertFalse(solver.solve())
+            self.assertEqual(4, self.assert_reported(3).clauses)
+
+    def test_expression_solves(self):
+        """Test that the solves of expressions are reported."""
+        b = BooleanExpression('(A or B) and (not A or C) and (B or not C)')
+        b.sat_one()
+        stats = self.assert_reported()
+        self.assertEqual(b.cnf_size, (stats.variables, stats.clauses))
+
+        b.sat_one(incremental=True)
+        self.assert_reported(2)
+
+        self.assertEqual(3, len(list(b.sat_all())))
+        self.assert_reported(3)
+
+        b.sat_one_many([{'A': 0}, {'A': 1}])
+        self.assert_reported(4)
+
+    def test_several_hooks(self):
+        """Test that every hook is called, in order of registration."""
+        calls = []
+
+        def first(stats):
+            calls.append('first')
+
+        def second(stats):
+            calls.append('second')
+
+        add_stats_hook(first)
+        add_stats_hook(second)
+        try:
+            sat_one(self.clauses)
+        finally:
+            remove_stats_hook(first)
+            remove_stats_hook(second)
+
+        self.assertEqual(['first', 'second'], calls)
+        self.assert_reported()
+
+        sat_one(self.clauses)
+        self.assertEqual(['first', 'second'], calls)
+        self.assert_reported(2)
+
+    def test_hook_error(self):
+        """Test that an error raised by a hook is raised from the solve."""
+        def failing_hook(stats):
+            raise _HookError()
+
+        add_stats_hook(failing_hook)
+        try:
+            with self.assertRaises(_HookError):
+                sat_one(self.clauses)
+            with self.assertRaises(_HookError):
+                sat_one(self.clauses, decision_limit=0)
+            with self.assertRaises(_HookError):
+                list(sat_all(self.clauses))
+            with self.assertRaises(_HookError):
+                list(sat_all(self.clauses, format='bytes', chunk_size=2))
+            with self.assertRaises(_HookError):
+                sat_batch(self.clauses, [[1]])
+            with self.assertRaises(_HookError):
+                failed_assumptions(self.clauses, [-2])
+            with Solver() as solver:
+                with self.assertRaises(_HookError):
+                    solver.solve()
+        finally:
+            remove_stats_hook(failing_hook)
+
+    def test_invalid_hooks(self):
+        """Test adding and removing invalid hooks."""
+        with self.assertRaises(InvalidArgumentTypeError):
+            add_stats_hook('not callable')
+        with self.assertRaises(InvalidArgumentValueError):
+            remove_stats_hook(print)
+
+
+class TestPicosatNoStatsHooks(unittest.TestCase):
+
+    def test_no_hooks(self):
+        """Test solving with no stats hooks registered."""
+        self.assertEqual([1, -2], sat_one([[1], [-2]]))
+        self.assertEqual([[1, -2]], list(sat_all([[1], [-2]])))
@@ -0,0 +1,125 @@
+"""Tests for concurrently solving many satisfiability problems."""
+
+import time
+import unittest
+
+from unittest import mock
+
+from tt.errors import (
+    AlreadyConstrainedSymbolError,
+    ExtraSymbolError,
+    InvalidArgumentTypeError,
+    InvalidArgumentValueError)
+from tt.expressions import BooleanExpression
+from tt.satisfiability import solve_many
+from tt.satisfiability.picosat import sat_one
+
+
+class TestSolveMany(unittest.TestCase):
+
+    def test_ordered_results_match_individual_solves(self):
+        """Test that results are those of solving each problem alone."""
+        exprs = ['(A or B) and (C xor D)', 'A and not A', 'A -> (B nand C)']
+        clause_sets = [[[1, 2], [-1]], [[1], [-1]], [[1, -2], [2, 3]]]
+        problems = (exprs + clause_sets +
+                    [(clauses, [-1]) for clauses in clause_sets])
+
+        expected = ([BooleanExpression(expr).sat_one() for expr in exprs] +
+                    [sat_one(clauses) for clauses in clause_sets] +
+                    [sat_one(clauses, assumptions=[-1])
+                     for clauses in clause_sets])
+        for max_workers in (None, 1, 4):
+            self.assertEqual(expected,
+                             solve_many(problems, max_workers=max_workers))
+
+    def test_unordered_results(self):
+        """Test retrieving results as they are completed."""
+        problems = [[[i], [i + 1, -i]] for i in range(1, 50)]
+        results = dict(solve_many(problems, max_workers=4, ordered=False))
+
+        self.assertEqual(set(range(49)), set(results))
+        for i, result in results.items():
+            self.assertEqual(sat_one(problems[i]), result)
+
+    def test_unordered_stopped_early(self):
+        """Test that unsolved problems are abandoned when iteration stops."""
+        solved = []
+
+        def slow_sat_one(clauses):
+            time.sleep(0.01)
+            solved.append(clauses)
+            return sat_one(clauses)
+
+        problems = [[[i]] for i in range(1, 101)]
+        with mock.patch('tt.satisfiability.picosat.sat_one', slow_sat_one):
+            for i, result in solve_many(problems, max_workers=1,
+                                        ordered=False):
+                self.assertEqual([i + 1], result)
+                break
+
+        self.assertLess(len(solved), len(problems))
+
+    def test_constraints_snapshot(self):
+        """Test that expressions are solved under their constraints at the
+        time of the call, even if they change while solving."""
+        b = BooleanExpression('A xor B')
+        with b.constrain(A=1):
+            results = solve_many([b, b], ordered=False)
+        with b.constrain(A=0):
+            self.assertEqual(['A=0, B=1'], [str(r) for r in solve_many([b])])
+
+        self.assertEqual(['A=1, B=0', 'A=1, B=0'],
+                         [str(r) for _, r in results])
+
+    def test_same_expression_many_times(self):
+        """Test solving one expression under many constraints at once."""
+        b = BooleanExpression(' and '.join(
+            '(x{} or not x{})'.format(i, i + 1) for i in range(30)))
+        constraint_dicts = [{'x{}'.format(i): 1} for i in range(31)]
+        results = solve_many([(b, d) for d in constraint_dicts],
+                             max_workers=8)
+
+        self.assertEqual(31, len(results))
+        for constraint_dict, result in zip(constraint_dicts, results):
+            with b.constrain(**constraint_dict):
+                self.assertEqual(b.sat_one(), result)
+
+    def test_constraint_dicts_added_to_constraints(self):
+        """Test that dicts of constraints add to current constraints."""
+        b = BooleanExpression('(A or B) and (C or D)')
+        with b.constrain(A=0):
+            results = solve_many([(b, {'C': 0}), (b, {'B': 0}), (b, {})])
+            self.assertEqual('A=0, B=1, C=0, D=1', str(results[0]))
+            self.assertIsNone(results[1])
+            self.assertEqual(b.sat_one(), results[2])
+
+            with self.assertRaises(AlreadyConstrainedSymbolError):
+                solve_many([(b, {'A': 1})])
+
+        with self.assertRaises(ExtraSymbolError):
+            solve_many([('A or B', {'C': 1})])
+
+    def test_errors_raised_on_retrieval(self):
+        """Test that errors from solving are raised from solve_many."""
+        with self.assertRaises(InvalidArgumentValueError):
+            solve_many([[[1]], [[0]]])
+
+    def test_invalid_arguments(self):
+        """Test invalid problems and options."""
+        with self.assertRaises(InvalidArgumentTypeError):
+            solve_many(('A or B',))
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            solve_many(['A or B', 1])
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            solve_many([([[1]],)])
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            solve_many([(1, {})])
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            solve_many(['A'], max_workers=1.5)
+
+        with self.assertRaises(InvalidArgumentValueError):
+            solve_many(['A'], max_workers=0)
@@ -0,0 +1,69 @@
+"""Tests for the Tseitin encoding of expression trees."""
+
+import itertools
+import unittest
+
+from tt import picosat
+from tt.expressions import BooleanExpression as be
+from tt.satisfiability._tseitin import TseitinEncoder
+
+
+class TestTseitinEncoder(unittest.TestCase):
+
+    def helper_test_encoding(self, expr):
+        """Helper to check an encoding against evaluation on every row."""
+        b = be(expr)
+        encoder = TseitinEncoder()
+        literals = {symbol: encoder.new_var() for symbol in b.symbols}
+        out = encoder.encode(b.tree, literals)
+
+        for values in itertools.product((0, 1), repeat=len(b.symbols)):
+            expected = b.evaluate(**dict(zip(b.symbols, values)))
+            if isinstance(out, bool):
+                self.assertEqual(expected, out)
+                continue
+
+            assumptions = [literals[symbol] if value else -literals[symbol]
+                           for symbol, value in zip(b.symbols, values)]
+            assumptions.append(out if expected else -out)
+            clauses = encoder.clauses or [[out, -out]]
+            self.assertIsNotNone(
+                picosat.sat_one(clauses, assumptions=assumptions),
+                msg='{} for {}'.format(expr, values))
+
+            assumptions[-1] = -assumptions[-1]
+            self.assertIsNone(
+                picosat.sat_one(clauses, assumptions=assumptions),
+                msg='{} for {}'.format(expr, values))
+
+    def test_operators(self):
+        """Test encoding each operator."""
+        for operator in ('and', 'nand', 'or', 'nor', 'xor', 'xnor', '->'):
+            self.helper_test_encoding('A {} B'.format(operator))
+
+        self.helper_test_encoding('not A')
+
+    def test_nested_expressions(self):
+        """Test encoding nested expressions."""
+        self.helper_test_encoding('(A -> B) nor (C xnor (A and D))')
+        self.helper_test_encoding('(A or B) and (A or not B) and (C or D)')
+
+    def test_constant_folding(self):
+        """Test that constants are folded away."""
+        self.helper_test_encoding('(A and 0) or (B xor 1)')
+        self.helper_test_encoding('A or not A')
+
+        encoder = TseitinEncoder()
+        self.assertIs(True, encoder.encode(be('A or not A').tree, {'A': 1}))
+        self.assertEqual([], encoder.clauses)
+
+    def test_shared_gates(self):
+        """Test that identical subtrees share one encoding."""
+        encoder = TseitinEncoder()
+        literals = {'A': encoder.new_var(), 'B': encoder.new_var()}
+        first = encoder.encode(be('A and B').tree, literals)
+        num_clauses = len(encoder.clauses)
+        second = encoder.encode(be('B and A').tree, literals)
+
+        self.assertEqual(first, second)
+        self.assertEqual(num_clauses, len(encoder.clauses))
@@ -0,0 +1,154 @@
+"""Tests for multi-output truth tables."""
+
+import io
+
+from tt.errors import (
+    ExtraSymbolError,
+    InvalidArgumentTypeError,
+    InvalidArgumentValueError,
+    MissingSymbolError,
+    NoEvaluationVariationError)
+from tt.expressions import BooleanExpression
+from tt.tables import MultiOutputTruthTable, TruthTable
+from tt.tables._bit_parallel import BitParallelEvaluator
+
+from ._helpers import TruthTableTestCase
+
+
+class TestMultiOutputTruthTable(TruthTableTestCase):
+
+    def test_outputs_match_truth_tables(self):
+        """Test that each output matches a separately filled table."""
+        exprs = ['A xor B xor C', '(A and B) or (C and (A xor B))',
+                 'A -> (B nand C)', 'not (A nor C) xnor B']
+        ordering = ['C', 'A', 'B']
+        t = MultiOutputTruthTable(exprs, ordering=ordering)
+
+        for i, expr in enumerate(exprs):
+            self.assertEqual(TruthTable(expr, ordering=ordering).results,
+                             t.output_table(i).results)
+
+    def test_default_ordering(self):
+        """Test that symbols are ordered by their first appearance."""
+        t = MultiOutputTruthTable(['B and C', 'A or C', 'D'])
+        self.assertEqual(['B', 'C', 'A', 'D'], t.ordering)
+
+    def test_constant_outputs(self):
+        """Test outputs that are constant over the inputs."""
+        t = MultiOutputTruthTable(['A', '0', 'A or 1'])
+        self.assertEqual([(False, False, True), (True, False, True)],
+                         [t[0], t[1]])
+
+    def test_shared_subtrees_evaluated_once(self):
+        """Test that equal subtrees across outputs share one evaluation."""
+        evaluator = BitParallelEvaluator(['A', 'B', 'C'])
+        evaluator.evaluate(BooleanExpression('(A and B) or C').tree)
+        num_nodes = evaluator.num_unique_nodes
+        evaluator.evaluate(BooleanExpression('(A and B) xor C').tree)
+        self.assertEqual(num_nodes + 1, evaluator.num_unique_nodes)
+
+    def test_iter_and_getitem(self):
+        """Test iterating over and indexing into the table's rows."""
+        t = MultiOutputTruthTable(['A and B', 'A or B'])
+        rows = list(t)
+
+        self.assertEqual(4, len(rows))
+        inputs, results = rows[2]
+        self.assertEqual((True, False), tuple(inputs))
+        self.assertEqual(['A', 'B'], list(inputs._fields))
+        self.assertEqual((False, True), results)
+        self.assertEqual((True, True), t[-1])
+
+        with self.assertRaises(IndexError):
+            t[4]
+
+    def test_output_table_by_name(self):
+        """Test getting output tables by name and index."""
+        t = MultiOutputTruthTable(['A and B', 'A or B'],
+                                  output_names=['f', 'g'])
+
+        self.assertEqual([False, True, True, True],
+                         t.output_table('g').results)
+        self.assertEqual(t.output_table(0).results,
+                         t.output_table('f').results)
+        self.assertEqual(t.output_table(-1).results,
+                         t.output_table('g').results)
+
+        with self.assertRaises(InvalidArgumentValueError):
+            t.output_table('h')
+
+        with self.assertRaises(InvalidArgumentValueError):
+            t.output_table(2)
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            t.output_table(1.0)
+
+    def test_output_table_expr(self):
+        """Test that output tables only keep exprs over all symbols."""
+        t = MultiOutputTruthTable(['A and B', 'not A'])
+
+        self.assertEqual('A and B', str(t.output_table(0).expr))
+        self.assertIsNone(t.output_table(1).expr)
+        self.assertEqual(['A', 'B'], t.output_table(1).ordering)
+
+    def test_write_formats(self):
+        """Test the combined csv and tsv exports."""
+        t = MultiOutputTruthTable(['A and B', 'not A'],
+                                  output_names=['f', 'g'])
+
+        buf = io.StringIO()
+        t.write(buf, format='csv')
+        self.assertEqual('A,B,f,g\n'
+                         '0,0,0,1\n'
+                         '0,1,0,1\n'
+                         '1,0,0,0\n'
+                         '1,1,1,0\n', buf.getvalue())
+
+        buf = io.StringIO()
+        t.write(buf, format='tsv')
+        self.assertEqual('A\tB\tf\tg\n0\t0\t0\t1\n',
+                         buf.getvalue()[:16])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            t.write(buf, format='bits')
+
+    def test_large_write_is_chunked(self):
+        """Test writing a table with more rows than fit in one chunk."""
+        exprs = ['A and B and C and D and E and F and G and H and I and J',
+                 'A xor J']
+        t = MultiOutputTruthTable(exprs)
+        buf = io.StringIO()
+        t.write(buf, format='csv')
+
+        lines = buf.getvalue().splitlines()
+        self.assertEqual(1 + 2**10, len(lines))
+        self.assertEqual('1,1,1,1,1,1,1,1,1,1,1,0', lines[-1])
+
+    def test_invalid_arguments(self):
+        """Test invalid initialization arguments."""
+        with self.assertRaises(InvalidArgumentTypeError):
+            MultiOutputTruthTable('A and B')
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            MultiOutputTruthTable(['A and B', 1])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            MultiOutputTruthTable([])
+
+        with self.assertRaises(NoEvaluationVariationError):
+            MultiOutputTruthTable(['0', '1 and 0'])
+
+        with self.assertRaises(MissingSymbolError):
+            MultiOutputTruthTable(['A', 'B'], ordering=['A'])
+
+        with self.assertRaises(ExtraSymbolError):
+            MultiOutputTruthTable(['A', 'B'], ordering=['A', 'B', 'C'])
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            MultiOutputTruthTable(['A', 'B'], output_names='fg')
+
+        with self.assertRaises(InvalidArgumentValueError):
+            MultiOutputTruthTable(['A', 'B'], output_names=['f'])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            MultiOutputTruthTable(['A', 'B'], output_names=['f', 'f'])
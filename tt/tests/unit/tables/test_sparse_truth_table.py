@@ -0,0 +1,211 @@
+"""Tests for sparse truth tables."""
+
+from tt.errors import (
+    ConflictingArgumentsError,
+    DuplicateSymbolError,
+    ExtraSymbolError,
+    InvalidArgumentTypeError,
+    InvalidArgumentValueError,
+    InvalidIdentifierError,
+    MissingSymbolError,
+    NoEvaluationVariationError,
+    RequiredArgumentError,
+    RequiresFullTableError)
+from tt.expressions import BooleanExpression
+from tt.tables import SparseTruthTable, TruthTable
+
+from ._helpers import TruthTableTestCase
+
+
+class TestSparseTruthTable(TruthTableTestCase):
+
+    def test_minterms_match_full_table(self):
+        """Test that minterms are the true rows of the full table."""
+        for expr in ('A or B', 'A xor B xor C', '(A -> B) and (C nor D)',
+                     'A and (B or not B)', 'A and not A'):
+            t = TruthTable(expr)
+            s = SparseTruthTable(expr)
+            self.assertEqual(
+                [i for i, result in enumerate(t.results) if result],
+                s.minterms)
+            self.assertEqual(t.ordering, s.ordering)
+
+    def test_custom_ordering(self):
+        """Test building a table from an expression with a custom ordering."""
+        s = SparseTruthTable('A and not B', ordering=['B', 'A'])
+        self.assertEqual([1], s.minterms)
+
+        expr = '(A -> B) and (C nor D) or (A and D)'
+        ordering = ['D', 'B', 'A', 'C']
+        t = TruthTable(expr, ordering=ordering)
+        s = SparseTruthTable(expr, ordering=ordering)
+        self.assertEqual(
+            [i for i, result in enumerate(t.results) if result], s.minterms)
+
+    def test_symbols_dropped_from_clauses(self):
+        """Test symbols the expression does not depend on."""
+        # D xor D is always false, so D is dropped in converting to CNF
+        expr = '(A and (((D xor D) or not (A)) nand E))'
+        for ordering in (None, ['E', 'D', 'A'], ['D', 'A', 'E']):
+            t = TruthTable(expr, ordering=ordering)
+            s = SparseTruthTable(expr, ordering=ordering)
+            self.assertEqual(
+                [i for i, result in enumerate(t.results) if result],
+                s.minterms)
+
+        self.assertEqual([0, 1], SparseTruthTable('(A xor A) or 1').minterms)
+
+    def test_many_symbols(self):
+        """Test a table far too large to fill densely."""
+        terms = ['x{}'.format(i) for i in range(64)]
+        s = SparseTruthTable(' and '.join(terms))
+        self.assertEqual(1, s.count_true())
+        self.assertTrue(s[-1])
+        self.assertFalse(s[0])
+        self.assertFalse(s[2**63])
+
+    def test_from_minterms(self):
+        """Test building a table directly from its minterms."""
+        s = SparseTruthTable(minterms=[3, 0, 3], ordering=['A', 'B'])
+        self.assertIsNone(s.expr)
+        self.assertEqual([0, 3], s.minterms)
+        self.assertEqual(2, s.count_true())
+
+    def test_getitem(self):
+        """Test indexing into a sparse table."""
+        s = SparseTruthTable('A xor B')
+        self.assertEqual([False, True, True, False],
+                         [s[i] for i in range(4)])
+        self.assertTrue(s[-2])
+
+        with self.assertRaises(IndexError):
+            s[4]
+
+        with self.assertRaises(IndexError):
+            s[-5]
+
+    def test_iter(self):
+        """Test iterating over the true rows of a table."""
+        s = SparseTruthTable('A and (B or C)')
+        rows = list(s)
+        self.assertEqual([(True, False, True), (True, True, False),
+                          (True, True, True)],
+                         [tuple(row) for row in rows])
+        self.assertEqual(['A', 'B', 'C'], list(rows[0]._fields))
+
+    def test_equivalent_to_sparse(self):
+        """Test equivalence between sparse tables."""
+        s1 = SparseTruthTable('A and not B')
+        s2 = SparseTruthTable(minterms=[2], ordering=['A', 'B'])
+        s3 = SparseTruthTable('A and not B', ordering=['B', 'A'])
+
+        self.assertTrue(s1.equivalent_to(s2))
+        self.assertFalse(s1.equivalent_to(s3))
+        self.assertTrue(s1.equivalent_to(s3, align=True))
+        self.assertTrue(s3.equivalent_to(s1, align=True))
+
+    def test_equivalent_to_truth_table(self):
+        """Test equivalence against full tables."""
+        s = SparseTruthTable('A or (B and not C)')
+
+        self.assertTrue(s.equivalent_to(TruthTable('A or (B and not C)')))
+        self.assertFalse(s.equivalent_to(TruthTable('A or B or C')))
+        self.assertTrue(s.equivalent_to(
+            TruthTable('A or (B and not C)', ordering=['C', 'A', 'B']),
+            align=True))
+        self.assertFalse(s.equivalent_to(TruthTable(from_values='0x')))
+
+    def test_equivalent_to_truth_table_with_dont_cares(self):
+        """Test that tables with don't cares are never equivalent."""
+        s = SparseTruthTable(minterms=[1], ordering=['A', 'B'])
+        self.assertFalse(s.equivalent_to(TruthTable(from_values='x100')))
+
+    def test_equivalent_to_expression(self):
+        """Test equivalence against strs and expressions."""
+        s = SparseTruthTable('A nand B')
+
+        self.assertTrue(s.equivalent_to('not (A and B)'))
+        self.assertTrue(s.equivalent_to(BooleanExpression('C nand D')))
+        self.assertFalse(s.equivalent_to('A and B'))
+        self.assertFalse(s.equivalent_to('A nand B nand C'))
+
+    def test_equivalent_to_aligned_symbol_mismatch(self):
+        """Test aligning against sources of truth with other symbols."""
+        s = SparseTruthTable('A or B')
+
+        with self.assertRaises(ExtraSymbolError):
+            s.equivalent_to('A or B or C', align=True)
+
+        with self.assertRaises(MissingSymbolError):
+            s.equivalent_to(TruthTable('A or A'), align=True)
+
+    def test_equivalent_to_invalid_types(self):
+        """Test equivalence against unsupported or unfilled values."""
+        s = SparseTruthTable('A or B')
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            s.equivalent_to(1)
+
+        with self.assertRaises(RequiresFullTableError):
+            s.equivalent_to(TruthTable('A or B', fill_all=False))
+
+    def test_to_truth_table(self):
+        """Test conversion to a full table."""
+        s = SparseTruthTable('A or (B and not C)', ordering=['C', 'B', 'A'])
+        t = s.to_truth_table()
+
+        self.assertTrue(t.is_full)
+        self.assertEqual(['C', 'B', 'A'], t.ordering)
+        self.assertEqual(s.expr, t.expr)
+        self.assertTrue(t.equivalent_to(
+            TruthTable('A or (B and not C)', ordering=['C', 'B', 'A'])))
+
+    def test_to_truth_table_too_large(self):
+        """Test refusing to convert a table with too many symbols."""
+        s = SparseTruthTable('A and B and C')
+
+        with self.assertRaises(InvalidArgumentValueError):
+            s.to_truth_table(max_symbols=2)
+
+    def test_invalid_arguments(self):
+        """Test invalid combinations of arguments."""
+        with self.assertRaises(ConflictingArgumentsError):
+            SparseTruthTable('A', minterms=[1], ordering=['A'])
+
+        with self.assertRaises(RequiredArgumentError):
+            SparseTruthTable()
+
+        with self.assertRaises(RequiredArgumentError):
+            SparseTruthTable(minterms=[1])
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            SparseTruthTable(1)
+
+        with self.assertRaises(NoEvaluationVariationError):
+            SparseTruthTable('1 or 0')
+
+    def test_invalid_minterms(self):
+        """Test invalid minterms and orderings."""
+        with self.assertRaises(InvalidArgumentValueError):
+            SparseTruthTable(minterms=[4], ordering=['A', 'B'])
+
+        with self.assertRaises(InvalidArgumentValueError):
+            SparseTruthTable(minterms=[-1], ordering=['A', 'B'])
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            SparseTruthTable(minterms=['1'], ordering=['A', 'B'])
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            SparseTruthTable(minterms=1, ordering=['A', 'B'])
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            SparseTruthTable(minterms=[1], ordering='AB')
+
+        with self.assertRaises(InvalidArgumentValueError):
+            SparseTruthTable(minterms=[], ordering=[])
+
+        with self.assertRaises(InvalidIdentifierError):
+            SparseTruthTable(minterms=[], ordering=['A', 'not'])
+
+        with self.assertRaises(DuplicateSymbolError):
+            SparseTruthTable(minterms=[], ordering=['A', 'A'])
@@ -0,0 +1,155 @@
+"""Tests for combining and reordering truth tables."""
+
+from tt.errors import (
+    DuplicateSymbolError,
+    ExtraSymbolError,
+    InvalidArgumentValueError,
+    MissingSymbolError,
+    RequiresFullTableError)
+from tt.expressions import BooleanExpression
+from tt.tables import TruthTable
+
+from ._helpers import TruthTableTestCase
+
+
+class TestTruthTableAlgebra(TruthTableTestCase):
+
+    def test_operators_match_expressions(self):
+        """Test that operators agree with combining the expressions."""
+        ordering = ['A', 'B', 'C', 'D']
+        t1 = TruthTable('A and (B or not C) or D', ordering=ordering)
+        t2 = TruthTable('(A xor D) or C and B', ordering=ordering)
+        cases = [
+            (t1 & t2, '(A and (B or not C) or D) and ((A xor D) or C and B)'),
+            (t1 | t2, '(A and (B or not C) or D) or ((A xor D) or C and B)'),
+            (t1 ^ t2, '(A and (B or not C) or D) xor ((A xor D) or C and B)'),
+            (~t1, 'not (A and (B or not C) or D)')]
+        for t, expr in cases:
+            self.assertEqual(BooleanExpression(expr), t.expr)
+            self.assertEqual(
+                TruthTable(expr, ordering=ordering).results, t.results)
+            self.assertTrue(t.is_full)
+
+    def test_operators_on_large_tables(self):
+        """Test operators on tables spanning many bytes."""
+        t1 = TruthTable('A xor B xor C xor D xor E xor F xor G xor H')
+        t2 = TruthTable('A and not H or (B and C and D and E and F and G)',
+                        ordering=t1.ordering)
+        combined = t1 & ~t2
+        expected = TruthTable(
+            '(A xor B xor C xor D xor E xor F xor G xor H) and '
+            'not (A and not H or (B and C and D and E and F and G))',
+            ordering=t1.ordering)
+        self.assertEqual(expected.results, combined.results)
+
+    def test_values_tables_have_no_expression(self):
+        """Test that combining tables without expressions gives none."""
+        t = TruthTable(from_values='0110') & TruthTable('A or B')
+        self.assertIsNone(t.expr)
+        self.assertEqual([False, True, True, False], t.results)
+
+    def test_dont_cares(self):
+        """Test that don't cares only propagate where they matter."""
+        t1 = TruthTable(from_values='x0x1x0x1')
+        t2 = TruthTable(from_values='0011xxxx')
+        self.assertEqual(
+            [False, False, 'x', True, 'x', False, 'x', 'x'],
+            (t1 & t2).results)
+        self.assertEqual(
+            ['x', False, True, True, 'x', 'x', 'x', True],
+            (t1 | t2).results)
+        self.assertEqual(
+            ['x', False, 'x', False, 'x', 'x', 'x', 'x'],
+            (t1 ^ t2).results)
+        self.assertEqual(
+            ['x', True, 'x', False, 'x', True, 'x', False],
+            (~t1).results)
+
+    def test_operands_are_unchanged(self):
+        """Test that combining tables does not modify the operands."""
+        t1 = TruthTable('A and B')
+        t2 = TruthTable('A or B')
+        t1 ^ t2
+        ~t1
+        self.assertEqual([False, False, False, True], t1.results)
+        self.assertEqual([False, True, True, True], t2.results)
+
+    def test_different_orderings(self):
+        """Test combining tables whose orderings differ."""
+        t1 = TruthTable('A and B')
+        t2 = TruthTable('A and B', ordering=['B', 'A'])
+        with self.assertRaises(InvalidArgumentValueError):
+            t1 | t2
+
+        self.assertEqual(t1.results, (t1 | t2.reorder(['A', 'B'])).results)
+
+    def test_unsupported_operand(self):
+        """Test combining a table with an object that is not a table."""
+        t = TruthTable('A and B')
+        with self.assertRaises(TypeError):
+            t & 'A or B'
+
+        with self.assertRaises(TypeError):
+            t ^ 1
+
+    def test_partially_filled_tables(self):
+        """Test that only full tables can be combined or inverted."""
+        full = TruthTable('A or B')
+        partial = TruthTable('A or B', fill_all=False)
+        partial.fill(A=1)
+        with self.assertRaises(RequiresFullTableError):
+            full & partial
+
+        with self.assertRaises(RequiresFullTableError):
+            partial | full
+
+        with self.assertRaises(RequiresFullTableError):
+            ~partial
+
+
+class TestTruthTableReorder(TruthTableTestCase):
+
+    def test_reorder_matches_new_table(self):
+        """Test that reordering matches building a table in the new order."""
+        expr = '(A and not B) or (C xor D) or (E and not A)'
+        t = TruthTable(expr)
+        for ordering in (['E', 'D', 'C', 'B', 'A'],
+                         ['C', 'A', 'E', 'B', 'D'],
+                         ['A', 'B', 'C', 'D', 'E']):
+            reordered = t.reorder(ordering)
+            self.assertEqual(ordering, reordered.ordering)
+            self.assertEqual(t.expr, reordered.expr)
+            self.assertEqual(
+                TruthTable(expr, ordering=ordering).results,
+                reordered.results)
+
+    def test_reorder_round_trip(self):
+        """Test reordering a table to another ordering and back."""
+        t = TruthTable(from_values='0x1x01101xx00101', ordering=list('WXYZ'))
+        self.assertEqual(
+            t.results,
+            t.reorder(['Z', 'X', 'W', 'Y']).reorder(list('WXYZ')).results)
+
+    def test_reorder_partially_filled_table(self):
+        """Test that unfilled rows remain unfilled when reordering."""
+        t = TruthTable('A or not B', fill_all=False)
+        t.fill(A=0)
+        reordered = t.reorder(['B', 'A'])
+        self.assertFalse(reordered.is_full)
+        self.assertEqual([True, None, False, None], reordered.results)
+        reordered.fill()
+        self.assertEqual(
+            TruthTable('A or not B', ordering=['B', 'A']).results,
+            reordered.results)
+
+    def test_reorder_invalid_orderings(self):
+        """Test reordering with orderings that are not permutations."""
+        t = TruthTable('A and B and C')
+        with self.assertRaises(DuplicateSymbolError):
+            t.reorder(['A', 'A', 'B', 'C'])
+
+        with self.assertRaises(ExtraSymbolError):
+            t.reorder(['A', 'B', 'C', 'D'])
+
+        with self.assertRaises(MissingSymbolError):
+            t.reorder(['A', 'B'])
@@ -0,0 +1,104 @@
+"""Tests for truth tables stored in memory-mapped backing files."""
+
+import os
+import shutil
+import tempfile
+
+from tt.errors import InvalidArgumentValueError
+from tt.expressions import BooleanExpression
+from tt.tables import TruthTable
+
+from ._helpers import TruthTableTestCase
+
+
+class TestTruthTableBackingFile(TruthTableTestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'table.tt')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_expr_table_round_trip(self):
+        """Test re-opening a table filled from an expression."""
+        expr = '(A nand B) or (C xor D) and E'
+        with TruthTable(expr, ordering=['E', 'D', 'C', 'B', 'A'],
+                        backing_file=self.path) as t:
+            self.assertEqual(self.path, t.backing_file)
+            expected_str = str(t)
+
+        with TruthTable.from_file(self.path) as t:
+            self.assertTrue(t.is_full)
+            self.assertEqual(BooleanExpression(expr), t.expr)
+            self.assertEqual(['E', 'D', 'C', 'B', 'A'], t.ordering)
+            self.assertEqual(expected_str, str(t))
+            self.assertTrue(t.equivalent_to(
+                TruthTable(expr, ordering=['E', 'D', 'C', 'B', 'A'])))
+
+    def test_values_table_round_trip(self):
+        """Test re-opening a table filled from values with don't cares."""
+        with TruthTable(from_values='01x10xx1', backing_file=self.path):
+            pass
+
+        with TruthTable.from_file(self.path) as t:
+            self.assertIsNone(t.expr)
+            self.assertEqual(['A', 'B', 'C'], t.ordering)
+            self.assertEqual(
+                [False, True, 'x', True, False, 'x', 'x', True], t.results)
+
+    def test_partially_filled_table_round_trip(self):
+        """Test that filled rows persist between handles of a table."""
+        t = TruthTable('A xor B xor C', fill_all=False,
+                       backing_file=self.path)
+        t.fill(A=1)
+        t.close()
+
+        t = TruthTable.from_file(self.path)
+        self.assertFalse(t.is_full)
+        self.assertEqual([None] * 4 + [True, False, False, True], t.results)
+        t.fill()
+        self.assertTrue(t.is_full)
+        self.assertTrue(t.equivalent_to('A xor B xor C'))
+        t.close()
+
+    def test_disjoint_fills_through_separate_handles(self):
+        """Test filling disjoint regions of a table through two handles."""
+        expr = 'A xor B xor C xor D xor E'
+        t1 = TruthTable(expr, fill_all=False, backing_file=self.path)
+        t2 = TruthTable.from_file(self.path)
+        t1.fill(A=1)
+        self.assertFalse(t2.is_full)
+        t2.fill(A=0)
+        t2.flush()
+        self.assertTrue(t1.is_full)
+        self.assertEqual(TruthTable(expr).results, t1.results)
+        t1.close()
+        t2.close()
+
+    def test_in_memory_table_close_is_noop(self):
+        """Test that in-memory tables are unaffected by close/flush."""
+        t = TruthTable('A and B')
+        t.flush()
+        t.close()
+        self.assertIsNone(t.backing_file)
+        self.assertEqual([False, False, False, True], t.results)
+
+    def test_from_file_invalid_contents(self):
+        """Test opening a file that does not hold a table."""
+        with open(self.path, 'wb') as f:
+            f.write(b'not a truth table, just some bytes')
+
+        with self.assertRaises(InvalidArgumentValueError):
+            TruthTable.from_file(self.path)
+
+    def test_from_file_truncated_planes(self):
+        """Test opening a table file whose planes have been truncated."""
+        with TruthTable('A and B and C and D', backing_file=self.path):
+            pass
+
+        with open(self.path, 'r+b') as f:
+            f.truncate(os.path.getsize(self.path) - 1)
+
+        with self.assertRaises(InvalidArgumentValueError):
+            TruthTable.from_file(self.path)
@@ -79,3 +79,86 @@ class TestTruhtTableEquivalence(TruthTableTestCase):
         t2 = TruthTable(from_values='1xxx')
 
         self.assertFalse(t1.equivalent_to(t2))
+
+    def test_permuted_orderings_compare_positionally(self):
+        """Test that tables are compared by position without alignment."""
+        t1 = TruthTable('A and not B')
+        t2 = TruthTable('A and not B', ordering=['B', 'A'])
+
+        self.assertFalse(t1.equivalent_to(t2))
+
+    def test_aligned_permuted_orderings(self):
+        """Test aligning tables whose orderings are permutations."""
+        expr = '(A and not B) or (C xor D) or (E and not A)'
+        t1 = TruthTable(expr)
+        for ordering in (['E', 'D', 'C', 'B', 'A'],
+                         ['C', 'A', 'E', 'B', 'D'],
+                         ['A', 'B', 'C', 'E', 'D']):
+            t2 = TruthTable(expr, ordering=ordering)
+            self.assertTrue(t1.equivalent_to(t2, align=True))
+            self.assertTrue(t2.equivalent_to(t1, align=True))
+
+    def test_aligned_unequivalent_tables(self):
+        """Test aligning tables that are not equivalent."""
+        t1 = TruthTable('A and not B')
+        t2 = TruthTable('B and not A', ordering=['B', 'A'])
+
+        self.assertTrue(t1.equivalent_to(t2))
+        self.assertFalse(t1.equivalent_to(t2, align=True))
+
+    def test_aligned_str(self):
+        """Test aligning against a str with a different symbol order."""
+        t = TruthTable('A or (B and not C)', ordering=['C', 'B', 'A'])
+
+        self.assertTrue(t.equivalent_to('(B and not C) or A', align=True))
+        self.assertFalse(t.equivalent_to('(B and not C) or A'))
+
+    def test_aligned_dont_cares(self):
+        """Test that don't cares are permuted along with results."""
+        t1 = TruthTable(from_values='0x10', ordering=['A', 'B'])
+        t2 = TruthTable(from_values='0100', ordering=['B', 'A'])
+
+        self.assertTrue(t1.equivalent_to(t2, align=True))
+        self.assertFalse(t2.equivalent_to(t1, align=True))
+
+    def test_counterexample(self):
+        """Test retrieving the first differing row."""
+        t = TruthTable('A or B or C')
+
+        result, row = t.equivalent_to('A xor B xor C', counterexample=True)
+        self.assertFalse(result)
+        self.assertEqual((False, True, True), tuple(row))
+        self.assertEqual(['A', 'B', 'C'], list(row._fields))
+
+    def test_counterexample_when_equivalent(self):
+        """Test that no counterexample is returned for equivalent tables."""
+        t = TruthTable('A or B')
+
+        self.assertEqual((True, None),
+                         t.equivalent_to('B or A', counterexample=True))
+        self.assertEqual((True, None),
+                         t.equivalent_to(t, counterexample=True))
+
+    def test_counterexample_skips_dont_cares(self):
+        """Test that rows that are don't cares in the caller are skipped."""
+        t = TruthTable(from_values='xx01')
+
+        _, row = t.equivalent_to('A or B', counterexample=True)
+        self.assertEqual((True, False), tuple(row))
+
+    def test_aligned_counterexample(self):
+        """Test that counterexamples are given in the caller's ordering."""
+        t1 = TruthTable('A and not B')
+        t2 = TruthTable('A and B', ordering=['B', 'A'])
+
+        _, row = t1.equivalent_to(t2, align=True, counterexample=True)
+        self.assertEqual(['A', 'B'], list(row._fields))
+        self.assertEqual((True, False), tuple(row))
+
+    def test_counterexample_unequally_sized_tables(self):
+        """Test that unequally sized tables give no counterexample."""
+        t1 = TruthTable(from_values='0110')
+        t2 = TruthTable(from_values='01100110')
+
+        self.assertEqual((False, None),
+                         t1.equivalent_to(t2, counterexample=True))
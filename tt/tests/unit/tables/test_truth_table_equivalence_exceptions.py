@@ -1,7 +1,9 @@
 """Test truth table equivalence exceptions."""
 
 from tt.errors import (
+    ExtraSymbolError,
     InvalidArgumentTypeError,
+    MissingSymbolError,
     RequiresFullTableError)
 from tt.tables import TruthTable
 
@@ -36,3 +38,23 @@ class TestTruthTableEquivalenceExceptions(TruthTableTestCase):
 
         with self.assertRaises(RequiresFullTableError):
             full_table.equivalent_to(partially_filled)
+
+    def test_aligned_other_has_extra_symbols(self):
+        """Test aligning with a source of truth that has extra symbols."""
+        t = TruthTable('A or B')
+
+        with self.assertRaises(ExtraSymbolError):
+            t.equivalent_to('A or B or C', align=True)
+
+        with self.assertRaises(ExtraSymbolError):
+            t.equivalent_to(TruthTable('C or B or A'), align=True)
+
+    def test_aligned_other_is_missing_symbols(self):
+        """Test aligning with a source of truth that is missing symbols."""
+        t = TruthTable('A or B or C')
+
+        with self.assertRaises(MissingSymbolError):
+            t.equivalent_to('A or B', align=True)
+
+        with self.assertRaises(MissingSymbolError):
+            t.equivalent_to(TruthTable('C or A'), align=True)
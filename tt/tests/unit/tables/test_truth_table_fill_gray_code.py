@@ -0,0 +1,65 @@
+"""Tests for filling truth tables with incremental Gray code evaluation."""
+
+import itertools
+
+from tt.expressions import BooleanExpression
+from tt.tables import TruthTable
+
+from ._helpers import TruthTableTestCase
+
+
+class TestTruthTableFillGrayCode(TruthTableTestCase):
+
+    def assert_matches_full_evaluation(self, expr, ordering=None, **kwargs):
+        """Assert that filling a table matches evaluating every row."""
+        b = BooleanExpression(expr)
+        t = TruthTable(b, fill_all=False, ordering=ordering)
+        t.fill(**kwargs)
+        ordering = t.ordering
+
+        expected = []
+        for combo in itertools.product((False, True), repeat=len(ordering)):
+            inputs = dict(zip(ordering, combo))
+            if all(inputs[k] == bool(v) for k, v in kwargs.items()):
+                expected.append(b.evaluate_unchecked(**inputs))
+            else:
+                expected.append(None)
+        self.assertEqual(expected, t.results)
+
+    def test_all_operators(self):
+        """Test an expression using each operator."""
+        self.assert_matches_full_evaluation(
+            '(A nand B) -> (C nor ~D) and (E xnor F) or (A xor not C)')
+
+    def test_repeated_symbols(self):
+        """Test an expression in which symbols appear many times."""
+        self.assert_matches_full_evaluation(
+            '(A and B) or (A and C) or (B and C) or (not A and not B and D)')
+
+    def test_constants(self):
+        """Test an expression including constant operands."""
+        self.assert_matches_full_evaluation('(A and 1) or (B and 0) or ~0')
+        self.assert_matches_full_evaluation('(A or 0) and (B xor 1)')
+
+    def test_nested_negations(self):
+        """Test chains of unary operators."""
+        self.assert_matches_full_evaluation('not not ~A or not (B and ~~C)')
+
+    def test_custom_ordering(self):
+        """Test that results land in their natural rows for any ordering."""
+        self.assert_matches_full_evaluation(
+            '(A and not B) or (C xor D) or (E and not A)',
+            ordering=['D', 'A', 'E', 'C', 'B'])
+
+    def test_restricted_fills(self):
+        """Test fills restricted to regions of the table."""
+        expr = '(A or B) and (C xor D) and not (E and A)'
+        self.assert_matches_full_evaluation(expr, A=1)
+        self.assert_matches_full_evaluation(expr, B=0, D=1)
+        self.assert_matches_full_evaluation(expr, A=1, B=0, C=1, D=0, E=1)
+
+    def test_wide_expression(self):
+        """Test a wide, shallow expression spanning many batches of rows."""
+        self.assert_matches_full_evaluation(
+            ' or '.join('({} and not {})'.format(a, b)
+                        for a, b in zip('ABCDEFGHIJK', 'BCDEFGHIJKL')))
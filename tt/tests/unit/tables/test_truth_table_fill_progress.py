@@ -0,0 +1,148 @@
+"""Tests for reporting progress, checkpointing and cancelling table fills."""
+
+import os
+import shutil
+import tempfile
+import threading
+
+from unittest import mock
+
+from tt.errors import InvalidArgumentValueError
+from tt.tables import TruthTable
+
+from ._helpers import TruthTableTestCase
+
+
+# large enough to span several batches of rows between progress reports
+EXPR = ' xor '.join('ABCDEFGHIJKL')
+
+
+class TestTruthTableFillProgress(TruthTableTestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'fill.ckpt')
+        self.reports = []
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def record_progress(self, done, total, rate):
+        self.reports.append((done, total, rate))
+
+    def test_progress_reports(self):
+        """Test that progress is reported throughout a fill."""
+        t = TruthTable(EXPR, fill_all=False)
+        t.fill_with_progress(progress=self.record_progress)
+        self.assertTrue(t.is_full)
+        self.assertEqual([1024, 2048, 3072, 4096],
+                         [done for done, _, _ in self.reports])
+        for _, total, rate in self.reports:
+            self.assertEqual(4096, total)
+            self.assertGreaterEqual(rate, 0)
+
+    def test_progress_of_restricted_fill(self):
+        """Test that progress covers only the requested region."""
+        t = TruthTable('A and B and C', fill_all=False)
+        t.fill_with_progress(constraints={'A': 1},
+                             progress=self.record_progress)
+        self.assertEqual([(4, 4)],
+                         [(done, total) for done, total, _ in self.reports])
+
+    def test_cancel_before_start(self):
+        """Test that a fill cancelled up front fills no rows."""
+        cancel = threading.Event()
+        cancel.set()
+        t = TruthTable(EXPR, fill_all=False)
+        t.fill_with_progress(progress=self.record_progress, cancel=cancel)
+        self.assertEqual([None] * 4096, t.results)
+        self.assertEqual([(0, 4096)],
+                         [(done, total) for done, total, _ in self.reports])
+
+    def test_cancel_leaves_consistent_table(self):
+        """Test that a cancelled fill can be finished by filling again."""
+        cancel = threading.Event()
+
+        def cancel_at_half(done, total, rate):
+            if done >= total // 2:
+                cancel.set()
+
+        t = TruthTable(EXPR, fill_all=False)
+        t.fill_with_progress(progress=cancel_at_half, cancel=cancel)
+        self.assertFalse(t.is_full)
+
+        expected = TruthTable(EXPR).results
+        results = t.results
+        self.assertEqual(expected[:2048], results[:2048])
+        self.assertEqual([None] * 2048, results[2048:])
+
+        t.fill()
+        self.assertEqual(expected, t.results)
+
+    def test_checkpoint_resume(self):
+        """Test resuming a cancelled fill from its checkpoint file."""
+        cancel = threading.Event()
+        t = TruthTable(EXPR, fill_all=False)
+        t.fill_with_progress(progress=lambda *_: cancel.set(),
+                             checkpoint=self.path, cancel=cancel)
+        self.assertTrue(os.path.exists(self.path))
+
+        resumed = TruthTable(EXPR, fill_all=False)
+        resumed.fill_with_progress(progress=self.record_progress,
+                                   checkpoint=self.path)
+        self.assertEqual(TruthTable(EXPR).results, resumed.results)
+
+        # the final checkpoint holds the full table
+        saved = TruthTable.from_file(self.path)
+        self.assertTrue(saved.is_full)
+        self.assertEqual(resumed.results, saved.results)
+        saved.close()
+
+    def test_checkpoint_rows_are_not_recomputed(self):
+        """Test that rows loaded from a checkpoint are used as-is."""
+        with open(self.path, 'wb') as f:
+            f.write(TruthTable(from_values='1111').to_bytes())
+
+        t = TruthTable('A and B', fill_all=False)
+        t.fill_with_progress(checkpoint=self.path)
+        self.assertEqual([True, True, True, True], t.results)
+
+    def test_periodic_checkpoints(self):
+        """Test that checkpoints are written while a fill is running."""
+        saved_counts = []
+
+        def read_checkpoint(done, total, rate):
+            with open(self.path, 'rb') as f:
+                saved = TruthTable.from_bytes(f.read())
+            saved_counts.append(saved.count_true() + saved.count_false())
+
+        with mock.patch('tt.tables.truth_table._FILL_CHECKPOINT_SECONDS', 0):
+            t = TruthTable(EXPR, fill_all=False)
+            t.fill_with_progress(progress=read_checkpoint,
+                                 checkpoint=self.path)
+
+        self.assertEqual([1024, 2048, 3072, 4096], saved_counts)
+
+    def test_checkpoint_of_different_table(self):
+        """Test resuming from a checkpoint of a different table."""
+        with open(self.path, 'wb') as f:
+            f.write(TruthTable('A or B').to_bytes())
+
+        with self.assertRaises(InvalidArgumentValueError):
+            TruthTable('A and B', fill_all=False).fill_with_progress(
+                checkpoint=self.path)
+
+        with self.assertRaises(InvalidArgumentValueError):
+            TruthTable('A or C', fill_all=False).fill_with_progress(
+                checkpoint=self.path)
+
+    def test_symbols_named_like_options(self):
+        """Test filling tables with symbols named like the fill options."""
+        for name in ('progress', 'checkpoint', 'cancel', 'constraints'):
+            t = TruthTable('{} or B'.format(name), fill_all=False)
+            t.fill(**{name: 1})
+            self.assertEqual([None, None, True, True], t.results)
+
+            t.fill_with_progress(constraints={name: 0},
+                                 progress=self.record_progress)
+            self.assertEqual([False, True, True, True], t.results)
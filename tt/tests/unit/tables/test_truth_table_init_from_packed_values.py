@@ -0,0 +1,167 @@
+"""Tests for initializing truth tables from packed values."""
+
+import unittest
+
+from array import array
+
+from tt.errors import (
+    ConflictingArgumentsError,
+    InvalidArgumentTypeError,
+    InvalidArgumentValueError,
+    MissingSymbolError,
+    RequiredArgumentError)
+from tt.tables import TruthTable
+
+from ._helpers import TruthTableTestCase
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import bitarray
+except ImportError:
+    bitarray = None
+
+
+class TestTruthTableInitFromPackedValues(TruthTableTestCase):
+
+    def test_int_with_num_values(self):
+        """Test an int of values with an explicit number of values."""
+        t = TruthTable(from_values=0b1000, num_values=4)
+        self.assertEqual(['A', 'B'], t.ordering)
+        self.assertEqual([False, False, False, True], t.results)
+        self.assertTrue(t.equivalent_to('A and B'))
+
+    def test_int_with_ordering(self):
+        """Test an int of values sized by the ordering."""
+        t = TruthTable(from_values=0b01, ordering=['op'])
+        self.assertEqual([True, False], t.results)
+
+    def test_int_with_dont_cares(self):
+        """Test an int of values with an int of don't cares."""
+        t = TruthTable(from_values=0b0110, dont_cares=0b1001, num_values=4)
+        self.assertEqual(['x', True, True, 'x'], t.results)
+        self.assertEqual(str(TruthTable(from_values='x11x')), str(t))
+
+    def test_dont_cares_override_values(self):
+        """Test that don't care rows ignore the corresponding values."""
+        t = TruthTable(from_values=0b1111, dont_cares=0b0011, num_values=4)
+        self.assertEqual(['x', 'x', True, True], t.results)
+
+    def test_bytes(self):
+        """Test a bytes object of packed values."""
+        t = TruthTable(from_values=b'\x96\x69')
+        self.assertEqual(['A', 'B', 'C', 'D'], t.ordering)
+        self.assertTrue(t.equivalent_to('A xor B xor C xor D'))
+
+    def test_bytes_fewer_than_8_rows(self):
+        """Test bytes of packed values with fewer than a byte of rows."""
+        t = TruthTable(from_values=b'\x06', num_values=4)
+        self.assertEqual([False, True, True, False], t.results)
+
+    def test_bytearray_and_memoryview(self):
+        """Test mutable and view bytes-like objects of packed values."""
+        values = bytearray(b'\x00\xf0')
+        dont_cares = memoryview(b'\x0f\x00')
+        t = TruthTable(from_values=values, dont_cares=dont_cares)
+        self.assertEqual(['x'] * 4 + [False] * 8 + [True] * 4, t.results)
+
+    def test_array_of_ints(self):
+        """Test that any buffer-protocol object is read as raw bytes."""
+        t = TruthTable(from_values=array('B', [0xff, 0x00]))
+        self.assertEqual([True] * 8 + [False] * 8, t.results)
+
+    def test_int_without_size(self):
+        """Test that an int of values requires a number of values."""
+        with self.assertRaises(RequiredArgumentError):
+            TruthTable(from_values=0b0110)
+
+    def test_int_too_large(self):
+        """Test an int with bits set beyond the number of values."""
+        with self.assertRaises(InvalidArgumentValueError):
+            TruthTable(from_values=0b10110, num_values=4)
+
+    def test_negative_int(self):
+        """Test a negative int of values."""
+        with self.assertRaises(InvalidArgumentValueError):
+            TruthTable(from_values=-1, num_values=4)
+
+    def test_bytes_size_mismatch(self):
+        """Test bytes whose length does not match the number of values."""
+        with self.assertRaises(InvalidArgumentValueError):
+            TruthTable(from_values=b'\x00\x00', num_values=8)
+
+        with self.assertRaises(InvalidArgumentValueError):
+            TruthTable(from_values=b'\x00', dont_cares=b'\x00\x00')
+
+    def test_num_values_not_power_of_2(self):
+        """Test a number of values that is not a power of 2."""
+        with self.assertRaises(InvalidArgumentValueError):
+            TruthTable(from_values=0, num_values=6)
+
+    def test_num_values_zero(self):
+        """Test a number of values of zero."""
+        with self.assertRaises(InvalidArgumentValueError):
+            TruthTable(from_values=0, num_values=0)
+
+    def test_num_values_disagrees_with_ordering(self):
+        """Test a number of values that is too large for the ordering."""
+        with self.assertRaises(MissingSymbolError):
+            TruthTable(from_values=0, num_values=8, ordering=['A', 'B'])
+
+    def test_num_values_invalid_type(self):
+        """Test passing a non-int number of values."""
+        with self.assertRaises(InvalidArgumentTypeError):
+            TruthTable(from_values=0, num_values='4')
+
+    def test_bool_values(self):
+        """Test that a bool is not accepted as packed values."""
+        with self.assertRaises(InvalidArgumentTypeError):
+            TruthTable(from_values=True, num_values=2)
+
+    def test_str_with_packed_arguments(self):
+        """Test string values combined with packed-only arguments."""
+        with self.assertRaises(ConflictingArgumentsError):
+            TruthTable(from_values='0110', dont_cares=0b0001)
+
+        with self.assertRaises(ConflictingArgumentsError):
+            TruthTable(from_values='0110', num_values=4)
+
+    def test_invalid_dont_cares_type(self):
+        """Test passing an unsupported don't cares type."""
+        with self.assertRaises(InvalidArgumentTypeError):
+            TruthTable(from_values=b'\x00', dont_cares=[0, 1])
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_numpy_bool_array(self):
+        """Test a NumPy array of bools."""
+        values = numpy.array([False, True, True, True])
+        t = TruthTable(from_values=values)
+        self.assertTrue(t.equivalent_to('A or B'))
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_numpy_uint8_array_with_dont_cares(self):
+        """Test a NumPy array of uint8 values with a don't care array."""
+        values = numpy.array([0, 1, 1, 0, 1, 0, 0, 1], dtype=numpy.uint8)
+        dont_cares = numpy.zeros(8, dtype=numpy.uint8)
+        dont_cares[7] = 1
+        t = TruthTable(from_values=values, dont_cares=dont_cares)
+        self.assertEqual(
+            [False, True, True, False, True, False, False, 'x'], t.results)
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_numpy_array_size_mismatch(self):
+        """Test a NumPy array that does not match the ordering."""
+        with self.assertRaises(InvalidArgumentValueError):
+            TruthTable(from_values=numpy.zeros(8, dtype=bool),
+                       ordering=['A', 'B'])
+
+    @unittest.skipIf(bitarray is None, 'bitarray is not installed')
+    def test_bitarrays_of_both_endians(self):
+        """Test bitarrays of both bit endians."""
+        for endian in ('big', 'little'):
+            values = bitarray.bitarray('0110', endian=endian)
+            t = TruthTable(from_values=values)
+            self.assertEqual([False, True, True, False], t.results)
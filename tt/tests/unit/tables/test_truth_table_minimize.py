@@ -0,0 +1,117 @@
+"""Tests for minimizing truth tables."""
+
+import random
+
+from tt.errors import (
+    InvalidArgumentValueError,
+    RequiresFullTableError)
+from tt.expressions import BooleanExpression
+from tt.tables import TruthTable
+
+from ._helpers import TruthTableTestCase
+
+
+class TestTruthTableMinimize(TruthTableTestCase):
+
+    def assert_minimized(self, t, expr):
+        """Assert that an expression agrees with a table's cared-for rows."""
+        self.assertTrue(set(expr.symbols) <= set(t.ordering))
+        for inputs, result in t:
+            if result == 'x':
+                continue
+
+            expr_inputs = {symbol: value for symbol, value in
+                           inputs._asdict().items() if symbol in expr.symbols}
+            self.assertEqual(result, bool(expr.evaluate(**expr_inputs)))
+
+    def num_terms_and_literals(self, expr):
+        """Count the terms and literals of a minimized expression."""
+        terms = expr.raw_expr.split(' or ')
+        return len(terms), sum(term.count(' and ') + 1 for term in terms)
+
+    def test_simple_expressions(self):
+        """Test minimizing tables built from redundant expressions."""
+        cases = [
+            ('(A and B) or (A and not B)', 'A'),
+            ('(A and B and C) or (A and B and not C) or (not A and B)', 'B'),
+            ('(A or B) and (A or not B)', 'A'),
+            ('A xor B', '(not A and B) or (A and not B)'),
+            ('(A and not B) or (A and B) or (not A and B)', 'A or B')]
+        for method in ('exact', 'heuristic', 'auto'):
+            for expr, minimized in cases:
+                self.assertEqual(BooleanExpression(minimized),
+                                 TruthTable(expr).minimize(method=method))
+
+    def test_dont_cares_are_exploited(self):
+        """Test that don't cares allow for smaller expressions."""
+        t = TruthTable(from_values='0001x1x1')
+        self.assertEqual(BooleanExpression('A or (B and C)'), t.minimize())
+
+        t = TruthTable(from_values='01xx0x1x')
+        self.assertEqual(BooleanExpression('B or C'), t.minimize())
+
+    def test_symbols_use_table_ordering(self):
+        """Test that terms are built from the table's own symbols."""
+        t = TruthTable(from_values='0111', ordering=['op', 'flag'])
+        self.assertEqual(BooleanExpression('op or flag'), t.minimize())
+
+    def test_constant_tables(self):
+        """Test minimizing tables without any rows set or without any unset."""
+        for method in ('exact', 'heuristic'):
+            self.assertEqual(
+                BooleanExpression('0'),
+                TruthTable(from_values='0000').minimize(method))
+            self.assertEqual(
+                BooleanExpression('0'),
+                TruthTable(from_values='x0x0').minimize(method))
+            self.assertEqual(
+                BooleanExpression('1'),
+                TruthTable(from_values='11x1').minimize(method))
+
+    def test_random_tables_are_covered(self):
+        """Test that minimized random tables agree with their source."""
+        rng = random.Random(0)
+        for num_symbols in range(1, 7):
+            for _ in range(10):
+                values = ''.join(rng.choice('001x')
+                                 for _ in range(2**num_symbols))
+                t = TruthTable(from_values=values)
+                for method in ('exact', 'heuristic'):
+                    self.assert_minimized(t, t.minimize(method))
+
+    def test_exact_is_no_worse_than_heuristic(self):
+        """Test that the exact method never loses to the heuristic one."""
+        rng = random.Random(1)
+        for _ in range(20):
+            values = ''.join(rng.choice('01x') for _ in range(2**5))
+            t = TruthTable(from_values=values)
+            self.assertLessEqual(
+                self.num_terms_and_literals(t.minimize('exact')),
+                self.num_terms_and_literals(t.minimize('heuristic')))
+
+    def test_exact_finds_cyclic_cover(self):
+        """Test a table whose prime implicants include no essential primes."""
+        t = TruthTable(from_values='11100111')
+        expr = t.minimize('exact')
+        self.assert_minimized(t, expr)
+        self.assertEqual((3, 6), self.num_terms_and_literals(expr))
+
+    def test_larger_table_heuristic(self):
+        """Test the heuristic method on a larger, structured table."""
+        expr = '(A and B and not C) or (D and E) or (F and not G and H and I)'
+        t = TruthTable(expr + ' or (J and K and not L)')
+        minimized = t.minimize()
+        self.assert_minimized(t, minimized)
+        self.assertEqual((4, 12), self.num_terms_and_literals(minimized))
+
+    def test_invalid_method(self):
+        """Test passing an unsupported method."""
+        with self.assertRaises(InvalidArgumentValueError):
+            TruthTable('A or B').minimize(method='fast')
+
+    def test_not_full_table(self):
+        """Test minimizing a table that is not full."""
+        t = TruthTable('A or B', fill_all=False)
+        t.fill(A=1)
+        with self.assertRaises(RequiresFullTableError):
+            t.minimize()
@@ -0,0 +1,144 @@
+"""Tests for serializing truth tables to bytes and hex."""
+
+import os
+import shutil
+import tempfile
+
+from tt.errors import (
+    InvalidArgumentTypeError,
+    InvalidArgumentValueError)
+from tt.expressions import BooleanExpression
+from tt.tables import TruthTable
+
+from ._helpers import TruthTableTestCase
+
+
+class TestTruthTableSerialization(TruthTableTestCase):
+
+    def assert_round_trips(self, t, compress=False):
+        """Assert that a table survives round trips through bytes and hex."""
+        for loaded in (TruthTable.from_bytes(t.to_bytes(compress)),
+                       TruthTable.from_hex(t.to_hex(compress))):
+            self.assertEqual(t.expr, loaded.expr)
+            self.assertEqual(t.ordering, loaded.ordering)
+            self.assertEqual(t.is_full, loaded.is_full)
+            self.assertEqual(t.results, loaded.results)
+            self.assertIsNone(loaded.backing_file)
+
+    def test_expr_table_round_trip(self):
+        """Test round trips of a table filled from an expression."""
+        t = TruthTable('(A nand B) or (C xor D) and E',
+                       ordering=['E', 'D', 'C', 'B', 'A'])
+        self.assert_round_trips(t)
+        self.assert_round_trips(t, compress=True)
+
+    def test_values_table_round_trip(self):
+        """Test round trips of a table filled from values with don't cares."""
+        t = TruthTable(from_values='01x10xx1', ordering=['op', 'a', 'b'])
+        self.assert_round_trips(t)
+        self.assert_round_trips(t, compress=True)
+
+    def test_small_table_round_trip(self):
+        """Test round trips of a table with fewer than a byte of rows."""
+        self.assert_round_trips(TruthTable('~A'))
+        self.assert_round_trips(TruthTable(from_values='x0'))
+
+    def test_partially_filled_table_round_trip(self):
+        """Test that only the filled rows of a table are serialized."""
+        t = TruthTable('A xor B xor C', fill_all=False)
+        t.fill(A=1)
+        self.assert_round_trips(t)
+
+        loaded = TruthTable.from_bytes(t.to_bytes())
+        loaded.fill()
+        self.assertTrue(loaded.is_full)
+        self.assertTrue(loaded.equivalent_to('A xor B xor C'))
+
+    def test_loaded_table_is_independent(self):
+        """Test that filling a loaded table does not touch its source."""
+        data = bytearray(TruthTable('A and B', fill_all=False).to_bytes())
+        original = bytes(data)
+        t = TruthTable.from_bytes(data)
+        t.fill()
+        self.assertEqual(original, bytes(data))
+
+    def test_size_is_two_bits_per_row(self):
+        """Test that the serialized size is dominated by two bits per row."""
+        t = TruthTable(from_values='01' * 2**11)
+        self.assertLess(len(t.to_bytes()), 2**10 + 64)
+
+    def test_compression_shrinks_regular_tables(self):
+        """Test that compressing a highly regular table shrinks it."""
+        t = TruthTable(from_values=b'\x00' * 2**10)
+        self.assertLess(len(t.to_bytes(compress=True)), len(t.to_bytes()))
+
+    def test_from_bytes_accepts_bytes_like_objects(self):
+        """Test loading from bytearray and memoryview objects."""
+        data = TruthTable('A or B').to_bytes()
+        for obj in (bytearray(data), memoryview(data)):
+            t = TruthTable.from_bytes(obj)
+            self.assertEqual(BooleanExpression('A or B'), t.expr)
+            self.assertEqual([False, True, True, True], t.results)
+
+    def test_uncompressed_bytes_can_be_memory_mapped(self):
+        """Test that written serialized tables can be opened as files."""
+        tmp_dir = tempfile.mkdtemp()
+        path = os.path.join(tmp_dir, 'table.tt')
+        try:
+            with open(path, 'wb') as f:
+                f.write(TruthTable('A nor B').to_bytes())
+
+            with TruthTable.from_file(path) as t:
+                self.assertEqual([True, False, False, False], t.results)
+
+            with open(path, 'wb') as f:
+                f.write(TruthTable('A nor B').to_bytes(compress=True))
+
+            with self.assertRaises(InvalidArgumentValueError):
+                TruthTable.from_file(path)
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def test_from_bytes_invalid_type(self):
+        """Test loading from an object that is not bytes-like."""
+        with self.assertRaises(InvalidArgumentTypeError):
+            TruthTable.from_bytes('TTBL')
+
+        with self.assertRaises(InvalidArgumentTypeError):
+            TruthTable.from_bytes(None)
+
+    def test_from_bytes_bad_magic(self):
+        """Test loading bytes that do not hold a serialized table."""
+        data = bytearray(TruthTable('A').to_bytes())
+        data[0:4] = b'NOPE'
+        with self.assertRaises(InvalidArgumentValueError):
+            TruthTable.from_bytes(data)
+
+    def test_from_bytes_unsupported_version(self):
+        """Test loading bytes with an unknown format version."""
+        data = bytearray(TruthTable('A').to_bytes())
+        data[4] = 99
+        with self.assertRaises(InvalidArgumentValueError):
+            TruthTable.from_bytes(data)
+
+    def test_from_bytes_truncated(self):
+        """Test loading truncated serialized tables."""
+        data = TruthTable('A and B and C and D').to_bytes()
+        for length in (0, 8, 20, len(data) - 1):
+            with self.assertRaises(InvalidArgumentValueError):
+                TruthTable.from_bytes(data[:length])
+
+    def test_from_bytes_corrupt_compressed_planes(self):
+        """Test loading compressed planes that fail to decompress."""
+        data = bytearray(TruthTable('A and B').to_bytes(compress=True))
+        data[-4:] = b'\xff\xff\xff\xff'
+        with self.assertRaises(InvalidArgumentValueError):
+            TruthTable.from_bytes(data)
+
+    def test_from_hex_invalid(self):
+        """Test loading invalid hex strings."""
+        with self.assertRaises(InvalidArgumentTypeError):
+            TruthTable.from_hex(b'5454424c')
+
+        with self.assertRaises(InvalidArgumentValueError):
+            TruthTable.from_hex('not hex')
@@ -0,0 +1,115 @@
+"""Tests for counting-based truth table statistics."""
+
+import itertools
+
+from tt.errors import (
+    ExtraSymbolError,
+    RequiresFullTableError)
+from tt.tables import TruthTable
+
+from ._helpers import TruthTableTestCase
+
+
+class TestTruthTableStatistics(TruthTableTestCase):
+
+    def test_counts(self):
+        """Test counting true, false, and don't care rows."""
+        t = TruthTable(from_values='01x1x000' * 4)
+        self.assertEqual(8, t.count_true())
+        self.assertEqual(16, t.count_false())
+        self.assertEqual(8, t.count_dont_care())
+
+    def test_counts_of_expression_table(self):
+        """Test counts of a table filled from an expression."""
+        t = TruthTable('A xor B xor C xor D xor E xor F xor G xor H xor I')
+        self.assertEqual(256, t.count_true())
+        self.assertEqual(256, t.count_false())
+        self.assertEqual(0, t.count_dont_care())
+
+    def test_counts_skip_unfilled_rows(self):
+        """Test that unfilled rows are not counted."""
+        t = TruthTable('A or B', fill_all=False)
+        self.assertEqual((0, 0, 0),
+                         (t.count_true(), t.count_false(),
+                          t.count_dont_care()))
+        t.fill(A=0)
+        self.assertEqual((1, 1), (t.count_true(), t.count_false()))
+
+    def test_counts_match_iteration(self):
+        """Test that counts agree with iterating over a table's rows."""
+        t = TruthTable('(A and not B) or (C xor D) or (E and not F)')
+        results = [result for _, result in t]
+        self.assertEqual(results.count(True), t.count_true())
+        self.assertEqual(results.count(False), t.count_false())
+
+    def test_cofactor_counts(self):
+        """Test counting the true rows of each cofactor."""
+        t = TruthTable('A or (B and C)')
+        self.assertEqual((1, 4), t.cofactor_counts('A'))
+        self.assertEqual((2, 3), t.cofactor_counts('B'))
+        self.assertEqual((2, 3), t.cofactor_counts('C'))
+
+    def test_cofactor_counts_match_iteration(self):
+        """Test that cofactor counts agree with iterating over rows."""
+        t = TruthTable(from_values='0x1101101x010011',
+                       ordering=['w', 'x', 'y', 'z'])
+        for symbol in t.ordering:
+            expected = [0, 0]
+            for inputs, result in t:
+                if result is True:
+                    expected[getattr(inputs, symbol)] += 1
+            self.assertEqual(tuple(expected), t.cofactor_counts(symbol))
+
+    def test_cofactor_counts_invalid_symbol(self):
+        """Test counting cofactors on a symbol not in the table."""
+        with self.assertRaises(ExtraSymbolError):
+            TruthTable('A or B').cofactor_counts('C')
+
+    def test_influence(self):
+        """Test the influence of symbols of simple functions."""
+        self.assertEqual({'A': 0.75, 'B': 0.25, 'C': 0.25},
+                         TruthTable('A or (B and C)').influence())
+        self.assertEqual({'A': 1.0, 'B': 1.0},
+                         TruthTable('A xor B').influence())
+        self.assertEqual({'A': 0.5, 'B': 0.5},
+                         TruthTable('A and B').influence())
+
+    def test_influence_of_majority(self):
+        """Test that all symbols of majority have the same influence."""
+        t = TruthTable('(A and B) or (A and C) or (B and C)')
+        self.assertEqual({'A': 0.5, 'B': 0.5, 'C': 0.5}, t.influence())
+
+    def test_influence_matches_brute_force(self):
+        """Test influence against flipping each symbol of each row."""
+        t = TruthTable('(A and not B) or (C xor D) or (E and not A)',
+                       ordering=['D', 'B', 'E', 'A', 'C'])
+        results = t.results
+        n = len(t.ordering)
+        for i, symbol in enumerate(t.ordering):
+            flips = sum(
+                1 for row in range(2**n)
+                if results[row] != results[row ^ (1 << (n - 1 - i))])
+            self.assertEqual(flips / 2**n, t.influence()[symbol])
+
+    def test_influence_ignores_dont_cares(self):
+        """Test that flips to or from don't cares are not counted."""
+        t = TruthTable(from_values='01x1')
+        self.assertEqual({'A': 0.0, 'B': 0.5}, t.influence())
+
+    def test_influence_requires_full_table(self):
+        """Test computing influence on a table that is not full."""
+        t = TruthTable('A or B', fill_all=False)
+        t.fill(B=0)
+        with self.assertRaises(RequiresFullTableError):
+            t.influence()
+
+    def test_large_table(self):
+        """Test statistics of a table of 2**20 rows."""
+        num_rows = 2**20
+        t = TruthTable(from_values=b'\x0f' * (num_rows // 8))
+        self.assertEqual(num_rows // 2, t.count_true())
+        self.assertEqual(num_rows // 2, t.count_false())
+        influence = t.influence()
+        self.assertEqual(1.0, influence[t.ordering[-3]])
+        for symbol in itertools.chain(t.ordering[:-3], t.ordering[-2:]):
+            self.assertEqual(0.0, influence[symbol])
@@ -0,0 +1,64 @@
+"""Tests for truth table support functionality."""
+
+from tt.errors import (
+    ConflictingArgumentsError,
+    NoEvaluationVariationError,
+    RequiresFullTableError)
+from tt.tables import TruthTable
+
+from ._helpers import TruthTableTestCase
+
+
+class TestTruthTableSupport(TruthTableTestCase):
+
+    def test_support(self):
+        """Test finding the symbols a table depends on."""
+        self.assertEqual(['A', 'B'], TruthTable('A xor B').support())
+        self.assertEqual(['B'], TruthTable(from_values='01010101',
+                                           ordering=['A', 'C', 'B']).support())
+        self.assertEqual([], TruthTable(from_values='1111').support())
+
+    def test_support_ignores_dont_cares(self):
+        """Test that flips to or from don't cares are not counted."""
+        self.assertEqual(['B'], TruthTable(from_values='01x1').support())
+        self.assertEqual([], TruthTable(from_values='x1x1').support())
+
+    def test_support_requires_full_table(self):
+        """Test that the support is only found for full tables."""
+        t = TruthTable('A or B', fill_all=False)
+
+        with self.assertRaises(RequiresFullTableError):
+            t.support()
+
+    def test_support_only(self):
+        """Test building a table over only the support of an expression."""
+        t = TruthTable('A or (B and not B) or (C and D)', support_only=True)
+
+        self.assertEqual(['A', 'C', 'D'], t.ordering)
+        self.assertEqual(['A', 'C', 'D'], t.expr.symbols)
+        self.assertTrue(t.equivalent_to('A or (C and D)'))
+
+    def test_support_only_with_ordering(self):
+        """Test that a custom ordering is kept, minus vacuous symbols."""
+        t = TruthTable('(A and B) or (A and not B) or C',
+                       ordering=['C', 'B', 'A'], support_only=True)
+
+        self.assertEqual(['C', 'A'], t.ordering)
+        self.assertEqual([False, True, True, True], t.results)
+
+    def test_support_only_without_vacuous_symbols(self):
+        """Test that tables without vacuous symbols are left as-is."""
+        t = TruthTable('A xor B', support_only=True)
+
+        self.assertEqual('A xor B', str(t.expr))
+        self.assertEqual(['A', 'B'], t.ordering)
+
+    def test_support_only_constant_function(self):
+        """Test that constant functions have no table over their support."""
+        with self.assertRaises(NoEvaluationVariationError):
+            TruthTable('A or not A', support_only=True)
+
+    def test_support_only_from_values(self):
+        """Test that support_only cannot be used along with from_values."""
+        with self.assertRaises(ConflictingArgumentsError):
+            TruthTable(from_values='0110', support_only=True)
@@ -0,0 +1,104 @@
+"""Tests for streaming truth tables to file-like objects."""
+
+import io
+
+from tt.errors import (
+    InvalidArgumentValueError,
+    RequiresFullTableError)
+from tt.tables import TruthTable
+
+from ._helpers import TruthTableTestCase
+
+
+class TestTruthTableWrite(TruthTableTestCase):
+
+    def helper_test_write(self, t, expected, **kwargs):
+        """Helper to compare the written output of a table."""
+        buf = io.StringIO()
+        t.write(buf, **kwargs)
+        self.assertEqual(expected, buf.getvalue())
+
+    def test_grid_matches_str(self):
+        """Test that the grid format matches the __str__ output."""
+        t = TruthTable('operand_1 nand op2 or op3')
+        self.helper_test_write(t, str(t) + '\n')
+        self.helper_test_write(t, str(t) + '\n', format='grid')
+
+    def test_grid_partially_filled(self):
+        """Test the grid format on a partially filled table."""
+        t = TruthTable('A or B', fill_all=False)
+        t.fill(B=1)
+        self.helper_test_write(
+            t,
+            '+---+---+---+\n'
+            '| A | B |   |\n'
+            '+---+---+---+\n'
+            '| 0 | 1 | 1 |\n'
+            '+---+---+---+\n'
+            '| 1 | 1 | 1 |\n'
+            '+---+---+---+\n')
+
+    def test_grid_empty(self):
+        """Test the grid format on an empty table."""
+        t = TruthTable('A or B', fill_all=False)
+        self.helper_test_write(t, 'Empty!\n')
+
+    def test_csv(self):
+        """Test the csv format on a table with don't cares."""
+        t = TruthTable(from_values='01x1', ordering=['op1', 'op2'])
+        self.helper_test_write(
+            t,
+            'op1,op2,result\n'
+            '0,0,0\n'
+            '0,1,1\n'
+            '1,0,x\n'
+            '1,1,1\n',
+            format='csv')
+
+    def test_tsv_empty(self):
+        """Test that an empty table only writes the header as tsv."""
+        t = TruthTable('A or B', fill_all=False)
+        self.helper_test_write(t, 'A\tB\tA or B\n', format='tsv')
+
+    def test_csv_header_names_expression(self):
+        """Test that the result column is headed by the expression."""
+        t = TruthTable('A  and  not B')
+        self.helper_test_write(
+            t,
+            'A,B,A and not B\n'
+            '0,0,0\n'
+            '0,1,0\n'
+            '1,0,1\n'
+            '1,1,0\n',
+            format='csv')
+
+    def test_bits(self):
+        """Test the bits format."""
+        t = TruthTable(from_values='0xx10110')
+        self.helper_test_write(t, '0xx10110\n', format='bits')
+
+    def test_bits_requires_full_table(self):
+        """Test that the bits format cannot be used for partial tables."""
+        t = TruthTable('A or B', fill_all=False)
+        t.fill(A=0)
+        with self.assertRaises(RequiresFullTableError):
+            t.write(io.StringIO(), format='bits')
+
+    def test_invalid_format(self):
+        """Test passing an unsupported format."""
+        t = TruthTable('A or B')
+        with self.assertRaises(InvalidArgumentValueError):
+            t.write(io.StringIO(), format='json')
+
+    def test_large_table_spans_multiple_chunks(self):
+        """Test that tables larger than a single write batch are intact."""
+        t = TruthTable('A xor B xor C xor D xor E xor F xor G xor H xor I '
+                       'xor J xor K xor L')
+        buf = io.StringIO()
+        t.write(buf, format='csv')
+        lines = buf.getvalue().splitlines()
+        self.assertEqual(1 + 2**12, len(lines))
+        for i, line in enumerate(lines[1:]):
+            cells = line.split(',')
+            self.assertEqual(format(i, '012b'), ''.join(cells[:-1]))
+            self.assertEqual(str(bin(i).count('1') % 2), cells[-1])
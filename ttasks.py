@@ -7,8 +7,10 @@ from __future__ import print_function
 import doctest
 import os
 import platform
+import random
 import subprocess
 import sys
+import time
 import tt
 import unittest
 
@@ -113,6 +115,90 @@ def pull_latest_win_wheels():
     print('All done!')
 
 
+def _random_cube_rows(num_symbols, rng):
+    """Get an int of the rows covered by a random product of literals."""
+    free_bits = [bit for bit in range(num_symbols) if rng.randrange(3) == 0]
+    value = rng.getrandbits(num_symbols)
+    for bit in free_bits:
+        value &= ~(1 << bit)
+
+    rows = 1 << value
+    for bit in free_bits:
+        rows |= rows << (1 << bit)
+    return rows
+
+
+def bench():
+    """Run tt benchmarks."""
+    _print_sys_info()
+
+    print('TruthTable.minimize')
+    print('-------------------')
+    print('Tables are random sums of 2n products, with 1/8 of the remaining')
+    print('rows as don\'t cares.')
+    print()
+
+    rng = random.Random(0)
+    row_format = '{:>7}  {:>9}  {:>9}  {:>5}  {:>8}'
+    print(row_format.format('symbols', 'method', 'seconds', 'terms',
+                            'literals'))
+    for num_symbols in range(8, 17, 2):
+        num_rows = 2**num_symbols
+        on_set = 0
+        for _ in range(2 * num_symbols):
+            on_set |= _random_cube_rows(num_symbols, rng)
+        dont_cares = (rng.getrandbits(num_rows) &
+                      rng.getrandbits(num_rows) &
+                      rng.getrandbits(num_rows) & ~on_set)
+        t = tt.TruthTable(from_values=on_set, dont_cares=dont_cares,
+                          num_values=num_rows)
+
+        methods = ['heuristic']
+        if num_symbols <= 12:
+            methods.append('exact')
+
+        for method in methods:
+            start = time.perf_counter()
+            expr = t.minimize(method=method)
+            elapsed = time.perf_counter() - start
+
+            terms = expr.raw_expr.split(' or ')
+            num_literals = sum(term.count(' and ') + 1 for term in terms)
+            print(row_format.format(num_symbols, method,
+                                    '{:.3f}'.format(elapsed), len(terms),
+                                    num_literals))
+
+    print()
+    print('BooleanExpression.count_sat')
+    print('---------------------------')
+    print('Expressions are chains of n symbols, where adjacent symbols cannot')
+    print('both be false; enumeration via sat_all is only timed for small n.')
+    print()
+
+    row_format = '{:>7}  {:>11}  {:>9}  {:>20}'
+    print(row_format.format('symbols', 'method', 'seconds', 'solutions'))
+    for num_symbols in (8, 12, 16, 32, 64):
+        b = tt.BooleanExpression(' and '.join(
+            '(x{} or x{})'.format(i, i + 1) for i in range(num_symbols - 1)))
+
+        methods = ['table', 'sat']
+        if num_symbols <= 16:
+            methods.append('enumerate')
+        else:
+            methods.remove('table')
+
+        for method in methods:
+            start = time.perf_counter()
+            if method == 'enumerate':
+                num_solutions = sum(1 for _ in b.sat_all())
+            else:
+                num_solutions = b.count_sat(method=method)
+            elapsed = time.perf_counter() - start
+
+            print(row_format.format(num_symbols, method,
+                                    '{:.3f}'.format(elapsed), num_solutions))
+
+
 def build_docs():
     """Build the documentation from source into HTML."""
     with _cwd(DOCS_DIR):
@@ -158,6 +244,10 @@ def test():
         tt.errors.state,
         tt.errors.symbols,
         tt.satisfiability.picosat,
+        tt.satisfiability.parallel,
+        tt.satisfiability.dimacs,
+        tt.tables.multi_output_truth_table,
+        tt.tables.sparse_truth_table,
         tt.tables.truth_table,
         tt.transformations.bexpr,
         tt.transformations.utils,
@@ -197,6 +287,7 @@ def test():
 
 
 TASKS = {
+    'bench': bench,
     'build-docs': build_docs,
     'pull-latest-win-wheels': pull_latest_win_wheels,
     'serve-docs': serve_docs,